@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Local asyncio servers used by the benchmarks. Each server runs its event
+    loop in a background thread and writes every response with a single
+    :code:`write()` call.
+"""
+
+import asyncio
+import threading
+
+from typing import Any, Callable
+
+__all__ = ["BODY", "BackgroundServer", "DelayedProtocol", "HTTP11Protocol", "ServerStats"]
+
+BODY = b'{"path": "disk:/file.txt", "type": "file"}'
+
+
+class ServerStats:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests = 0
+
+class DelayedProtocol(asyncio.Protocol):
+    def __init__(self, stats: ServerStats, delay: float, connect_delay: float) -> None:
+        self.stats = stats
+        self.delay = delay
+        self.connect_delay = connect_delay
+        self.connected_at = 0.0
+        self.transport: Any = None
+
+    def connection_made(self, transport: Any) -> None:
+        self.stats.connections += 1
+        self.transport = transport
+        self.connected_at = asyncio.get_running_loop().time()
+
+    def schedule(self, callback: Callable[..., None], *args) -> None:
+        loop = asyncio.get_running_loop()
+        when = max(loop.time(), self.connected_at + self.connect_delay) + self.delay
+
+        loop.call_at(when, callback, *args)
+
+class HTTP11Protocol(DelayedProtocol):
+    def __init__(self, stats: ServerStats, delay: float, connect_delay: float) -> None:
+        super().__init__(stats, delay, connect_delay)
+
+        self.buffer = b""
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+
+        # Only requests without a body are expected
+        while b"\r\n\r\n" in self.buffer:
+            _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+            self.stats.requests += 1
+            self.schedule(self.respond)
+
+    def respond(self) -> None:
+        if self.transport.is_closing():
+            return
+
+        self.transport.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+        )
+
+class BackgroundServer:
+    def __init__(
+        self,
+        protocol: Callable[[ServerStats, float, float], asyncio.Protocol],
+        delay: float,
+        connect_delay: float
+    ) -> None:
+        self.stats = ServerStats()
+        self.protocol = protocol
+        self.delay = delay
+        self.connect_delay = connect_delay
+        self.loop = asyncio.new_event_loop()
+        self.started = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.port = 0
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+
+        server = self.loop.run_until_complete(
+            self.loop.create_server(lambda: self.protocol(self.stats, self.delay, self.connect_delay), "127.0.0.1", 0)
+        )
+
+        self.port = server.sockets[0].getsockname()[1]
+        self.started.set()
+        self.loop.run_forever()
+
+        server.close()
+        self.loop.run_until_complete(server.wait_closed())
+
+    def __enter__(self) -> "BackgroundServer":
+        self.thread.start()
+        self.started.wait()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1/disk/resources"
+
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Compares HTTP/1.1 (with default and with sufficient pool limits) and
+    HTTP/2 (:code:`http2=True`) modes of HTTPXSession and AsyncHTTPXSession
+    against local servers that answer every request after a fixed delay.
+
+    HTTP/2 is spoken in cleartext with prior knowledge (h2c), so no TLS
+    certificates are needed. Requires the `h2` package.
+
+    Establishing a connection over loopback is almost free, so the servers
+    delay the responses on every new connection by :code:`--connect-delay`
+    milliseconds to emulate the TCP and TLS handshakes with a remote host.
+
+    Keep in mind that the bookkeeping of the httpcore connection pool grows
+    with the number of connections, so a large HTTP/1.1 pool can become
+    CPU-bound in the client, this is visible in the "pooled" results.
+
+    Usage::
+
+       python benchmarks/http2_benchmark.py --requests 1000 --concurrency 100 --delay 20 --connect-delay 30
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+
+from typing import Any, Dict, List, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+
+from yadisk.pool import PoolConfig
+from yadisk.sessions.async_httpx_session import AsyncHTTPXSession
+from yadisk.sessions.httpx_session import HTTPXSession
+
+from _servers import BODY, BackgroundServer, DelayedProtocol, HTTP11Protocol, ServerStats
+
+
+class H2Protocol(DelayedProtocol):
+    def __init__(self, stats: ServerStats, delay: float, connect_delay: float) -> None:
+        super().__init__(stats, delay, connect_delay)
+
+        self.connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+
+    def connection_made(self, transport: Any) -> None:
+        super().connection_made(transport)
+
+        self.connection.initiate_connection()
+        self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.stats.requests += 1
+                self.schedule(self.respond, event.stream_id)
+
+        self.transport.write(self.connection.data_to_send())
+
+    def respond(self, stream_id: int) -> None:
+        if self.transport.is_closing():
+            return
+
+        self.connection.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(BODY)))
+        ])
+        self.connection.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.connection.data_to_send())
+
+
+def summarize(name: str, total_time: float, latencies: List[float], connections: int) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p / 100.0 * len(latencies)))] * 1000
+
+    return {
+        "name": name,
+        "rps": len(latencies) / total_time,
+        "mean": statistics.mean(latencies) * 1000,
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "connections": connections
+    }
+
+
+def run_sync(session_kwargs: Dict[str, Any], url: str, n_requests: int, concurrency: int) -> Tuple[float, List[float]]:
+    session = HTTPXSession(**session_kwargs)
+
+    def send() -> float:
+        start = time.perf_counter()
+
+        with session.send_request("GET", url) as response:
+            response.json()
+
+        return time.perf_counter() - start
+
+    with session, ThreadPoolExecutor(concurrency) as executor:
+        start = time.perf_counter()
+        latencies = list(executor.map(lambda _: send(), range(n_requests)))
+        total_time = time.perf_counter() - start
+
+        return total_time, latencies
+
+
+async def run_async(
+    session_kwargs: Dict[str, Any],
+    url: str,
+    n_requests: int,
+    concurrency: int
+) -> Tuple[float, List[float]]:
+    session = AsyncHTTPXSession(**session_kwargs)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+
+            async with await session.send_request("GET", url) as response:
+                await response.json()
+
+            return time.perf_counter() - start
+
+    async with session:
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(send() for _ in range(n_requests)))
+        total_time = time.perf_counter() - start
+
+        return total_time, list(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP/1.1 vs HTTP/2 benchmark of the httpx sessions")
+    parser.add_argument("--requests", type=int, default=1000, help="number of requests per run")
+    parser.add_argument("--concurrency", type=int, default=100, help="number of concurrent requests")
+    parser.add_argument("--delay", type=float, default=20.0, help="server response delay in milliseconds")
+    parser.add_argument(
+        "--connect-delay", type=float, default=30.0,
+        help="additional delay of the first responses on a new connection in milliseconds"
+    )
+    args = parser.parse_args()
+
+    delay = args.delay / 1000.0
+    connect_delay = args.connect_delay / 1000.0
+    results = []
+
+    modes: List[Tuple[str, Any, Dict[str, Any]]] = [
+        ("HTTP/1.1", HTTP11Protocol, {}),
+        ("HTTP/1.1 pooled", HTTP11Protocol, {"pool_config": PoolConfig(max_connections=args.concurrency)}),
+        # http1=False enables HTTP/2 with prior knowledge over cleartext
+        ("HTTP/2", H2Protocol, {"http2": True, "http1": False})
+    ]
+
+    for version, protocol, session_kwargs in modes:
+        with BackgroundServer(protocol, delay, connect_delay) as server:
+            total_time, latencies = run_sync(session_kwargs, server.url, args.requests, args.concurrency)
+            results.append(summarize(f"HTTPXSession {version}", total_time, latencies, server.stats.connections))
+
+        with BackgroundServer(protocol, delay, connect_delay) as server:
+            total_time, latencies = asyncio.run(
+                run_async(session_kwargs, server.url, args.requests, args.concurrency)
+            )
+            results.append(
+                summarize(f"AsyncHTTPXSession {version}", total_time, latencies, server.stats.connections)
+            )
+
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"server delay {args.delay:g} ms, connect delay {args.connect_delay:g} ms\n"
+    )
+    print(f"{'session':<34} {'req/s':>8} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'conns':>6}")
+
+    for r in results:
+        print(
+            f"{r['name']:<34} {r['rps']:>8.0f} {r['mean']:>8.1f} {r['p50']:>8.1f} "
+            f"{r['p95']:>8.1f} {r['p99']:>8.1f} {r['connections']:>6}"
+        )
+
+    print("\nLatencies are in milliseconds, conns is the number of connections accepted by the server.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Microbenchmark of small GET requests sent through PycURLSession,
+    comparing a new easy handle for every request (:code:`max_idle_handles=0`)
+    with reused handles.
+
+    The requests are sent to a local keep-alive HTTP/1.1 server, so the
+    results mostly reflect the client-side overhead. The server runs in the
+    same process and competes with the client threads for the GIL.
+
+    Usage::
+
+       python benchmarks/pycurl_benchmark.py --requests 5000 --threads 1 4 16
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from yadisk.sessions.pycurl_session import PycURLSession
+
+from _servers import BackgroundServer, HTTP11Protocol
+
+
+def run(url: str, max_idle_handles: int, n_requests: int, n_threads: int) -> float:
+    with PycURLSession(max_idle_handles=max_idle_handles) as session:
+        def send(_: int) -> None:
+            with session.send_request("GET", url) as response:
+                response.json()
+
+        # Warm up the connections
+        with ThreadPoolExecutor(n_threads) as executor:
+            list(executor.map(send, range(n_threads * 4)))
+
+            start = time.perf_counter()
+            list(executor.map(send, range(n_requests)))
+
+            return n_requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Small GET throughput of PycURLSession")
+    parser.add_argument("--requests", type=int, default=5000, help="number of requests per run")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16], help="numbers of threads")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests, best of {args.repeat} runs\n")
+    print(f"{'threads':>7} {'new handles, req/s':>20} {'reused handles, req/s':>23} {'speedup':>8}")
+
+    with BackgroundServer(HTTP11Protocol, 0.0, 0.0) as server:
+        for n_threads in args.threads:
+            fresh = max(run(server.url, 0, args.requests, n_threads) for _ in range(args.repeat))
+            pooled = max(run(server.url, n_threads, args.requests, n_threads) for _ in range(args.repeat))
+
+            print(f"{n_threads:>7} {fresh:>20.0f} {pooled:>23.0f} {pooled / fresh:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
-from . import objects, exceptions, utils, types
+from . import objects, exceptions, utils, types, cache, bulk, polling, ratelimit, retry, circuit, hedging, pool, batch
 
 from ._client import Client
 from ._async_client import AsyncClient
@@ -17,7 +17,7 @@
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from ..exceptions import InvalidResponseError
+from ..exceptions import InvalidResponseError, TooManyRequestsError
 
 from ..utils import auto_retry, async_auto_retry, CaseInsensitiveDict
 from .. import settings
@@ -26,11 +26,13 @@ from .._common import is_default_timeout
 from typing import Any, Optional, Union, Type, TypeVar, TYPE_CHECKING
 from .._typing_compat import Set, Dict, Tuple, Callable, Awaitable
 import json
+from urllib.parse import urlparse
 
 if TYPE_CHECKING:  # pragma: no cover
-    from .._session import Session
-    from .._async_session import AsyncSession
+    from .._session import Session, Response
+    from .._async_session import AsyncSession, AsyncResponse
     from ..types import AnySession, HTTPMethod, JSON, TimeoutParameter
+    from ..retry import RetryPolicy
     from .._client import Client
     from .._async_client import AsyncClient
 
@@ -46,6 +48,7 @@ class APIRequest(object):
         :param headers: `dict` or `None`, additional request headers
         :param n_retries: `int`, maximum number of retries
         :param retry_interval: delay between retries in seconds
+        :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
         :param retry_on: `tuple`, additional exception classes to retry on
         :param kwargs: other arguments for :any:`Session.send_request`
 
@@ -59,6 +62,9 @@ class APIRequest(object):
         :ivar success_codes: `list`-like, list of response codes that indicate request's success
         :ivar retry_interval: `float`, delay between retries in seconds
         :ivar retry_on: `tuple`, additional exception classes to retry on
+        :ivar retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+        :ivar hedgeable: `bool`, whether the request is idempotent and can be hedged (see :any:`HedgingPolicy`)
+        :ivar response_json: parsed JSON of the last successful response, `None` before that
     """
 
     base_url: str = ""
@@ -76,6 +82,9 @@ class APIRequest(object):
     params: Dict[str, Any]
     send_kwargs: Dict[str, Any]
     retry_on: Tuple[Type[Exception], ...] = tuple()
+    retry_policy: Optional["RetryPolicy"] = None
+    hedgeable: bool = False
+    response_json: "JSON" = None
 
     session: Any
 
@@ -87,6 +96,7 @@ class APIRequest(object):
         retry_interval = kwargs.pop("retry_interval", None)
         headers = kwargs.pop("headers", {})
         retry_on = kwargs.pop("retry_on", self.retry_on)
+        retry_policy = kwargs.pop("retry_policy", None)
 
         if headers is None:
             headers = {}
@@ -119,6 +129,10 @@ class APIRequest(object):
         self.content = None
         self.params = {}
         self.retry_on = retry_on
+        self.response_json = None
+
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
 
         if not self.url:
             self.url = f"{self.base_url}/{self.path.lstrip('/')}"
@@ -153,8 +167,36 @@ class APIRequest(object):
 
         kwargs = self._prepare_send_args()
 
+        rate_limiter = yadisk.rate_limiter if yadisk is not None else None
+
+        if rate_limiter is not None:
+            rate_limiter.wait_request()
+
         session: "Session" = self.session
-        response = session.send_request(self.method, self.url, **kwargs)
+        method = self.method
+        hedging = yadisk.hedging if yadisk is not None and self.hedgeable else None
+
+        if hedging is not None:
+            response = hedging.send(
+                self.__class__.__name__, lambda: session.send_request(method, self.url, **kwargs),
+                rate_limiter, self._is_hedge_accepted
+            )
+        else:
+            response = session.send_request(method, self.url, **kwargs)
+
+        return self._process_response(response, yadisk, then)
+
+    def _is_hedge_accepted(self, response: Union["Response", "AsyncResponse"]) -> bool:
+        # Status 0 means that the request has not been sent yet (pycurl with stream=True)
+        return response.status == 0 or response.status in self.success_codes
+
+    def _process_response(
+        self,
+        response: "Response",
+        yadisk: Optional["Client"],
+        then: Callable[[Any], Any]
+    ) -> Any:
+        rate_limiter = yadisk.rate_limiter if yadisk is not None else None
 
         json: JSON = None
 
@@ -173,7 +215,12 @@ class APIRequest(object):
         success = response.status in self.success_codes
 
         if not success:
-            raise response.get_exception()
+            exception = response.get_exception()
+
+            if rate_limiter is not None:
+                rate_limiter.report(exception)
+
+            raise exception
 
         if not json_already_parsed:
             try:
@@ -181,6 +228,8 @@ class APIRequest(object):
             except ValueError:
                 pass
 
+        self.response_json = json
+
         try:
             result = self.process_json(json, yadisk=yadisk)
         except ValueError as e:
@@ -198,20 +247,40 @@ class APIRequest(object):
 
         kwargs = self._prepare_send_args()
 
-        session: "AsyncSession" = self.session
+        rate_limiter = yadisk.rate_limiter if yadisk is not None else None
+
+        if rate_limiter is not None:
+            await rate_limiter.async_wait_request()
 
-        response = await session.send_request(self.method, self.url, **kwargs)
+        session: "AsyncSession" = self.session
+        method = self.method
+        hedging = yadisk.hedging if yadisk is not None and self.hedgeable else None
+
+        if hedging is not None:
+            response = await hedging.async_send(
+                self.__class__.__name__, lambda: session.send_request(method, self.url, **kwargs),
+                rate_limiter, self._is_hedge_accepted
+            )
+        else:
+            response = await session.send_request(method, self.url, **kwargs)
 
         success = response.status in self.success_codes
 
         if not success:
-            raise await response.get_exception()
+            exception = await response.get_exception()
+
+            if rate_limiter is not None:
+                rate_limiter.report(exception)
+
+            raise exception
 
         try:
             json = await response.json()
         except ValueError:
             json = None
 
+        self.response_json = json
+
         try:
             result = self.process_json(json, yadisk=yadisk)
         except ValueError as e:
@@ -222,6 +291,23 @@ class APIRequest(object):
         else:
             return then(result)
 
+    def _get_auto_retry_kwargs(self, yadisk: Optional[Union["Client", "AsyncClient"]]) -> Dict[str, Any]:
+        retry_on = self.retry_on
+
+        # Throttled requests are retried after the rate limiter slows down
+        if yadisk is not None and yadisk.rate_limiter is not None:
+            retry_on = (*retry_on, TooManyRequestsError)
+
+        kwargs: Dict[str, Any] = {"retry_on": retry_on, "retry_policy": self.retry_policy}
+
+        if yadisk is not None and yadisk.circuit_breakers is not None:
+            key = f"{self.__class__.__name__}@{urlparse(self.url).netloc}"
+
+            kwargs["circuit_breaker"] = yadisk.circuit_breakers.get(key)
+            kwargs["retry_budget"] = yadisk.circuit_breakers.retry_budget
+
+        return kwargs
+
     def send(
         self,
         yadisk: Optional["Client"],
@@ -243,7 +329,7 @@ class APIRequest(object):
             self.n_retries,
             self.retry_interval,
             args=(yadisk, then or (lambda x: x)),
-            retry_on=self.retry_on
+            **self._get_auto_retry_kwargs(yadisk)
         )
 
     async def asend(
@@ -267,7 +353,7 @@ class APIRequest(object):
             self.n_retries,
             self.retry_interval,
             args=(yadisk, then or (lambda x: x)),
-            retry_on=self.retry_on
+            **self._get_auto_retry_kwargs(yadisk)
         )
 
     def process_json(self, js: "JSON", **kwargs) -> Any:
@@ -190,6 +190,7 @@ class GetDownloadLinkRequest(APIRequest):
 
     method = "GET"
     path = "/v1/disk/resources/download"
+    hedgeable = True
 
     def __init__(
         self,
@@ -552,6 +553,7 @@ class GetMetaRequest(APIRequest):
 
     method = "GET"
     path = "/v1/disk/resources"
+    hedgeable = True
 
     def __init__(
         self,
@@ -1059,6 +1061,7 @@ class GetPublicMetaRequest(APIRequest):
 
     method = "GET"
     path = "/v1/disk/public/resources"
+    hedgeable = True
 
     def __init__(
         self,
@@ -1239,6 +1242,7 @@ class FilesRequest(APIRequest):
 
     method = "GET"
     path = "/v1/disk/resources/files"
+    hedgeable = True
 
     def __init__(
         self,
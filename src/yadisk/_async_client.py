@@ -17,7 +17,9 @@
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
+from collections import deque
 import inspect
+import os
 from pathlib import PurePosixPath
 
 import posixpath
@@ -26,40 +28,53 @@ from urllib.parse import urlencode
 from .types import (
     AsyncFileOrPath, AsyncFileOrPathDestination, AsyncOpenFileCallback,
     AsyncSessionFactory, FileOpenMode, BinaryAsyncFileLike, AsyncSessionName,
-    OperationStatus, PublicSettings
+    OperationStatus, PollInterval, PublicSettings, TransferStatus
 )
 
 from . import settings
 from ._api import *
 from .exceptions import (
-    AsyncOperationFailedError, AsyncOperationPollingTimeoutError,
-    InvalidResponseError, ParentNotFoundError, RetriableYaDiskError, UnauthorizedError,
-    OperationNotFoundError, PathNotFoundError, WrongResourceTypeError
+    AsyncOperationFailedError, AsyncOperationPollingTimeoutError, DirectoryExistsError,
+    InvalidResponseError, ParentNotFoundError, RequestError, RetriableYaDiskError, UnauthorizedError,
+    OperationNotFoundError, PathNotFoundError, WrongResourceTypeError, YaDiskError
 )
-from .utils import auto_retry, CaseInsensitiveDict
+from .utils import async_auto_retry, CaseInsensitiveDict
 from .objects import (
     AsyncResourceLinkObject, AsyncPublicResourceLinkObject, TokenObject,
     TokenRevokeStatusObject, DiskInfoObject, AsyncResourceObject,
     AsyncOperationLinkObject, AsyncTrashResourceObject,
     AsyncPublicResourceObject, AsyncPublicResourcesListObject,
     AsyncFilesResourceListObject, AsyncLastUploadedResourceListObject,
-    DeviceCodeObject, ResourceUploadLinkObject, PublicSettingsObject, PublicAvailableSettingsObject
+    DeviceCodeObject, ResourceUploadLinkObject, PublicSettingsObject, PublicAvailableSettingsObject,
+    ResourceObject
 )
 
 from typing import Any, Optional, Union, IO, BinaryIO, Literal
-from ._typing_compat import Callable, AsyncGenerator, Awaitable, Dict, List, Type
+from ._typing_compat import (
+    Callable, AsyncGenerator, Awaitable, Deque, Dict, Generator, Iterable, List, Set, Tuple, Type
+)
 
 from ._async_session import AsyncSession
 from ._import_session import import_async_session
+from .polling import AsyncOperationPoller, _iter_poll_intervals
 
 from ._client_common import (
-    _add_spoof_user_agent_header, _apply_default_args,
-    _filter_request_kwargs, _set_authorization_header,
-    _add_authorization_header, _validate_listdir_response,
-    _validate_link_response, _validate_get_type_response
+    _AsyncCachedLinkFunction, _KnownDirectories, _RangeIgnoredError, _add_spoof_user_agent_header, _apply_default_args,
+    _async_get_link, _async_invalidating_link_on_error, _async_throttled_payload, _filter_request_kwargs,
+    _get_circuit_breaker_kwargs, _get_download_tree_fields, _get_partitions, _get_path_prefixes,
+    _get_rate_limiter_retry_on, _get_remaining_pages, _invalidate_link, _is_local_copy_up_to_date, _is_resumed_response,
+    _iter_local_tree_files, _make_not_found_error, _make_segments, _plan_meta_lookups, _report_to_rate_limiter,
+    _scan_local_tree, _set_authorization_header, _set_local_mtime, _walk_kwargs, _add_authorization_header,
+    _validate_listdir_response, _validate_link_response, _validate_get_type_response
 )
 
 from ._common import remove_path_schema
+from .bulk import TransferResult
+from .cache import LinkCache, MetaCache
+from .circuit import CircuitBreakers
+from .hedging import HedgingPolicy
+from .pool import PoolConfig
+from .ratelimit import RateLimiter
 
 _default_open_file: AsyncOpenFileCallback
 
@@ -118,8 +133,14 @@ async def _listdir(
     /,
     *,
     max_items: Optional[int] = None,
+    page_concurrency: Optional[int] = None,
+    prefetch: int = 0,
     **kwargs
 ) -> AsyncGenerator:
+    # Prefetching N pages is the same as keeping N + 1 pages in flight
+    if prefetch > 0:
+        page_concurrency = max(page_concurrency or 1, prefetch + 1)
+
     if kwargs.get("limit") is None:
         kwargs["limit"] = 500
 
@@ -156,6 +177,45 @@ async def _listdir(
     offset: int = result.embedded.offset  # type: ignore[assignment,union-attr]
     total: int = result.embedded.total  # type: ignore[assignment,union-attr]
 
+    if page_concurrency is not None and page_concurrency > 1:
+        if remaining_items is not None:
+            remaining_items -= len(result.embedded.items)  # type: ignore[union-attr,arg-type]
+
+        async def get_page(page_offset: int, page_limit: int) -> List[Any]:
+            page_kwargs = dict(kwargs)
+            page_kwargs["offset"] = page_offset
+            page_kwargs["limit"] = page_limit
+
+            page = await get_meta_function(path, _then=_validate_listdir_response, **page_kwargs)
+
+            if page.type == "file":
+                raise WrongResourceTypeError("%r is a file" % (path,))
+
+            return page.embedded.items[:page_limit]  # type: ignore[union-attr,index]
+
+        # Pages are requested concurrently, but yielded in order.
+        # At most page_concurrency pages are in flight or waiting to be consumed
+        tasks: Deque[asyncio.Future] = deque()
+
+        try:
+            for page_offset, page_limit in _get_remaining_pages(offset, limit, total, remaining_items):
+                if len(tasks) >= page_concurrency:
+                    for child in await tasks.popleft():
+                        yield child
+
+                tasks.append(asyncio.ensure_future(get_page(page_offset, page_limit)))
+
+            while tasks:
+                for child in await tasks.popleft():
+                    yield child
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return
+
     while offset + limit < total:
         if remaining_items is not None:
             remaining_items -= len(result.embedded.items)  # type: ignore[union-attr,arg-type]
@@ -182,6 +242,175 @@ async def _listdir(
         total = result.embedded.total  # type: ignore[assignment,union-attr]
 
 
+async def _paginate(
+    get_page: Callable[[int, int], Awaitable[List[Any]]],
+    offset: int,
+    limit: int,
+    *,
+    max_items: Optional[int] = None,
+    prefetch: int = 0
+) -> AsyncGenerator:
+    # Yields items of consecutive pages until there is an incomplete page or max_items is reached.
+    # If prefetch > 0, up to prefetch pages that follow the current one are requested in the background
+    def get_pages() -> Generator[Tuple[int, int], None, None]:
+        page_offset, remaining_items = offset, max_items
+
+        while remaining_items is None or remaining_items > 0:
+            # Do not query more items than necessary
+            page_limit = limit if remaining_items is None else min(remaining_items, limit)
+
+            yield page_offset, page_limit
+
+            page_offset += page_limit
+
+            if remaining_items is not None:
+                remaining_items -= page_limit
+
+    if prefetch <= 0:
+        for page_offset, page_limit in get_pages():
+            items = await get_page(page_offset, page_limit)
+
+            for item in items[:page_limit]:
+                yield item
+
+            if len(items) < page_limit:
+                break
+
+        return
+
+    pages = get_pages()
+    tasks: Deque[Tuple[asyncio.Future, int]] = deque()
+
+    try:
+        page = next(pages, None)
+
+        while page is not None or tasks:
+            # Keep the current page and up to prefetch following pages in flight
+            while page is not None and len(tasks) <= prefetch:
+                tasks.append((asyncio.ensure_future(get_page(*page)), page[1]))
+                page = next(pages, None)
+
+            task, page_limit = tasks.popleft()
+            items = await task
+
+            for item in items[:page_limit]:
+                yield item
+
+            if len(items) < page_limit:
+                break
+    finally:
+        for task, _ in tasks:
+            task.cancel()
+
+        await asyncio.gather(*(task for task, _ in tasks), return_exceptions=True)
+
+
+async def _paginate_partitioned(
+    get_page: Callable[[str, int, int], Awaitable[List[Any]]],
+    partitions: List[str],
+    limit: int,
+    *,
+    max_items: Optional[int] = None
+) -> AsyncGenerator:
+    # Every partition is paged sequentially, but different partitions are paged concurrently.
+    # Pages are yielded as soon as they arrive, so items of different partitions are interleaved
+    remaining_items = max_items
+
+    if not partitions or (remaining_items is not None and remaining_items <= 0):
+        return
+
+    pending: Dict[asyncio.Future, Tuple[str, int]] = {
+        asyncio.ensure_future(get_page(partition, 0, limit)): (partition, 0) for partition in partitions
+    }
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                partition, offset = pending.pop(task)
+                items = task.result()[:limit]
+
+                if len(items) == limit:
+                    next_offset = offset + limit
+                    next_page = asyncio.ensure_future(get_page(partition, next_offset, limit))
+                    pending[next_page] = (partition, next_offset)
+
+                if remaining_items is not None:
+                    items = items[:remaining_items]
+                    remaining_items -= len(items)
+
+                for item in items:
+                    yield item
+
+                if remaining_items is not None and remaining_items <= 0:
+                    return
+    finally:
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+WalkResult = Tuple[str, List["AsyncResourceObject"], List["AsyncResourceObject"]]
+
+
+async def _walk(
+    listdir_function: Callable[..., AsyncGenerator],
+    path: str,
+    /,
+    *,
+    max_concurrency: int = 8,
+    onerror: Optional[Callable[[Exception], Any]] = None,
+    **kwargs
+) -> AsyncGenerator[WalkResult, None]:
+    kwargs = _walk_kwargs(kwargs)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def list_directory(dirpath: str) -> WalkResult:
+        dirs, files = [], []
+
+        async with semaphore:
+            async for child in listdir_function(dirpath, **kwargs):
+                if child.type == "dir":
+                    dirs.append(child)
+                else:
+                    files.append(child)
+
+        return dirpath, dirs, files
+
+    pending: Set[asyncio.Future] = {asyncio.ensure_future(list_directory(path))}
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                try:
+                    dirpath, dirs, files = task.result()
+                except Exception as e:
+                    if onerror is None:
+                        raise
+
+                    if is_async_func(onerror):
+                        await onerror(e)
+                    else:
+                        onerror(e)
+
+                    continue
+
+                yield dirpath, dirs, files
+
+                # Subdirectories are only expanded after the caller had a chance to prune them
+                for directory in dirs:
+                    pending.add(asyncio.ensure_future(list_directory(posixpath.join(dirpath, directory.name))))
+    finally:
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def read_in_chunks(file: IO, chunk_size: int = 64 * 1024) -> Union[AsyncGenerator[str, None],
                                                                          AsyncGenerator[bytes, None]]:
     while chunk := await file.read(chunk_size):
@@ -212,6 +441,20 @@ async def _file_seek(file: Any, offset: int, whence: int = 0) -> int:
         return file.seek(offset, whence)
 
 
+async def _file_write(file: Any, data: bytes) -> int:
+    if is_async_func(file.write):
+        return await file.write(data)
+    else:
+        return file.write(data)
+
+
+async def _file_truncate(file: Any, size: int) -> int:
+    if is_async_func(file.truncate):
+        return await file.truncate(size)
+    else:
+        return file.truncate(size)
+
+
 async def _is_file_seekable(file: Any) -> bool:
     if not hasattr(file, "seekable"):
         # Assume the file is seekable if there's no way to check
@@ -236,6 +479,8 @@ class AsyncClient:
 
         * **n_retries** - `int`, maximum number of retries for a request
         * **retry_interval** - `float`, delay between retries (in seconds)
+        * **retry_policy** - :any:`RetryPolicy` or `None`, computes delays between
+          retries (takes precedence over **retry_interval**)
         * **headers** - `dict` or `None`, additional request headers
         * **timeout** - `tuple` (:code:`(<connect timeout>, <read timeout>)`) or
           `float` (specifies both connect and read timeout), request timeout
@@ -270,6 +515,22 @@ class AsyncClient:
                            reading or writing (:code:`aiofiles.open()` by default)
         :param session_factory: kept for compatibility, callable that returns an
                                 instance of :any:`AsyncSession`
+        :param link_cache: `None` or :any:`LinkCache`, if specified, upload and
+                           download links are reused by retries and repeated
+                           downloads of the same file
+        :param meta_cache: `None` or :any:`MetaCache`, if specified, results of
+                           :any:`AsyncClient.get_meta()` are cached and invalidated
+                           when this client modifies the resources
+        :param circuit_breakers: `None` or :any:`CircuitBreakers`, if specified, failing
+                                 endpoints are not retried and temporarily cut off
+        :param rate_limiter: `None` or :any:`RateLimiter`, if specified, API
+                             requests and transferred bytes are throttled, and
+                             :any:`TooManyRequestsError` is retried after slowing down
+        :param hedging: `None` or :any:`HedgingPolicy`, if specified, slow idempotent
+                        metadata requests are duplicated and the first response is used
+        :param pool_config: `None` or :any:`PoolConfig`, connection pool settings,
+                            passed to the session created by the client (can't be used
+                            together with an existing :code:`session` or :code:`session_factory`)
 
         :ivar id: `str`, application ID
         :ivar secret: `str`, application secret password
@@ -279,6 +540,13 @@ class AsyncClient:
         :ivar session: current session (:any:`AsyncSession` instance)
         :ivar open_file: async function that opens a file for reading or writing
                          (:code:`aiofiles.open()` by default)
+        :ivar link_cache: :any:`LinkCache` or `None`, cache of upload/download links
+        :ivar meta_cache: :any:`MetaCache` or `None`, cache of resource metadata
+        :ivar rate_limiter: :any:`RateLimiter` or `None`, throttles requests and transfers
+        :ivar circuit_breakers: :any:`CircuitBreakers` or `None`, circuit breakers and retry budget
+        :ivar hedging: :any:`HedgingPolicy` or `None`, hedging of idempotent metadata requests
+        :ivar operation_poller: :any:`AsyncOperationPoller`, tracks operations passed
+                                to :any:`AsyncClient.track_operation()`
 
         The following exceptions may be raised by most API requests:
 
@@ -307,6 +575,12 @@ class AsyncClient:
     default_args: Dict[str, Any]
     session: AsyncSession
     open_file: AsyncOpenFileCallback
+    link_cache: Optional[LinkCache]
+    meta_cache: Optional[MetaCache]
+    rate_limiter: Optional[RateLimiter]
+    circuit_breakers: Optional[CircuitBreakers]
+    hedging: Optional[HedgingPolicy]
+    operation_poller: AsyncOperationPoller
 
     synchronous = False
 
@@ -316,10 +590,16 @@ class AsyncClient:
         secret: str = "",
         token:  str = "",
         *,
-        default_args:    Optional[Dict[str, Any]] = None,
-        session:         Optional[Union[AsyncSession, AsyncSessionName]] = None,
-        open_file:       Optional[AsyncOpenFileCallback] = None,
-        session_factory: Optional[AsyncSessionFactory] = None
+        default_args:     Optional[Dict[str, Any]] = None,
+        session:          Optional[Union[AsyncSession, AsyncSessionName]] = None,
+        open_file:        Optional[AsyncOpenFileCallback] = None,
+        session_factory:  Optional[AsyncSessionFactory] = None,
+        link_cache:       Optional[LinkCache] = None,
+        meta_cache:       Optional[MetaCache] = None,
+        rate_limiter:     Optional[RateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedging:          Optional[HedgingPolicy] = None,
+        pool_config:      Optional[PoolConfig] = None
     ) -> None:
         self.id = id
         self.secret = secret
@@ -327,13 +607,28 @@ class AsyncClient:
         self.token = ""
 
         self.default_args = {} if default_args is None else default_args
+        self.link_cache = link_cache
+        self.meta_cache = meta_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.hedging = hedging
+        self._known_dirs = _KnownDirectories()
+        self.operation_poller = AsyncOperationPoller(self)
+
+        session_kwargs: Dict[str, Any] = {}
+
+        if pool_config is not None:
+            if (session is not None and not isinstance(session, str)) or session_factory is not None:
+                raise ValueError("pool_config can only be used when the client creates the session")
+
+            session_kwargs["pool_config"] = pool_config
 
         if session is None:
             if session_factory is not None:
                 session = session_factory()
             else:
                 try:
-                    session = import_async_session("httpx")()
+                    session = import_async_session("httpx")(**session_kwargs)
                 except ModuleNotFoundError as e:
                     if e.name == "httpx":
                         raise ModuleNotFoundError(
@@ -343,7 +638,7 @@ class AsyncClient:
                     else:
                         raise
         elif isinstance(session, str):
-            session = import_async_session(session)()
+            session = import_async_session(session)(**session_kwargs)
 
         self.session = session
 
@@ -362,23 +657,32 @@ class AsyncClient:
 
     async def close(self) -> None:
         """
-            Closes the session.
+            Closes the session and stops :any:`AsyncClient.operation_poller`.
             Do not call this method while there are other active threads using this object.
 
             This method can also be called implicitly by using the `async with`
             statement.
         """
 
+        await self.operation_poller.close()
         await self.session.close()
 
+    def _invalidate_meta(self, *paths: str) -> None:
+        if self.meta_cache is None:
+            return
+
+        for path in paths:
+            self.meta_cache.invalidate(path)
+
     async def _maybe_wait(
         self,
         request_class: Type[APIRequest],
         /,
         *args,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         **kwargs
     ) -> Any:
         request = request_class(self.session, *args, **kwargs)
@@ -399,6 +703,7 @@ class AsyncClient:
                     await response.wait(
                         poll_interval=poll_interval,
                         poll_timeout=poll_timeout,
+                        resource_size=resource_size,
                         **kwargs
                     )
                 except RetriableYaDiskError as e:
@@ -577,6 +882,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -604,6 +910,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -641,6 +948,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -676,6 +984,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -714,6 +1023,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -752,6 +1062,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -787,6 +1098,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -807,7 +1119,37 @@ class AsyncClient:
         # This is for internal error handling
         _then = kwargs.pop("_then", None)
 
-        return await GetMetaRequest(self.session, path, **kwargs).asend(yadisk=self, then=_then)
+        if self.meta_cache is None:
+            return await GetMetaRequest(self.session, path, **kwargs).asend(yadisk=self, then=_then)
+
+        hit, resource_json = self.meta_cache.get(path, kwargs)
+
+        if hit:
+            if resource_json is None:
+                raise _make_not_found_error(path)
+
+            result = AsyncResourceObject(resource_json, yadisk=self)
+
+            if _then is None:
+                return result
+
+            if asyncio.iscoroutinefunction(_then):
+                return await _then(result)
+
+            return _then(result)
+
+        request = GetMetaRequest(self.session, path, **kwargs)
+
+        # _then() runs within the retry scope of the request, same as without the cache
+        try:
+            return await request.asend(yadisk=self, then=_then)
+        except PathNotFoundError:
+            self.meta_cache.put(path, kwargs, None)
+            raise
+        finally:
+            # The response is cached even if it was rejected by _then()
+            if request.response_json is not None:
+                self.meta_cache.put(path, kwargs, request.response_json)
 
     async def exists(self, path: str, /, **kwargs) -> bool:
         """
@@ -818,6 +1160,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -830,6 +1173,148 @@ class AsyncClient:
 
         return await _exists(self.get_meta, path, **kwargs)
 
+    async def get_meta_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        **kwargs
+    ) -> List[Union["AsyncResourceObject", YaDiskError]]:
+        """
+            Get meta information about multiple files/directories at once.
+
+            Repeated paths are only requested once, the lookups are done
+            concurrently (as separate tasks). Errors do not interrupt the other lookups,
+            instead, the exception is put in place of the result.
+
+            If :code:`fields` is specified and at least :code:`sibling_threshold`
+            of the paths share the same parent directory, they are looked up by a
+            single :any:`AsyncClient.listdir()` of the parent instead. Listed children
+            don't contain their own children (:code:`embedded`), which is why
+            this requires :code:`fields` to be specified.
+
+            :param paths: iterable of paths to the resources
+            :param max_concurrency: `int`, maximum number of concurrent requests
+            :param sibling_threshold: `int` or `None`, minimum number of paths with a
+                                      common parent to list the parent instead,
+                                      `None` disables listing
+            :param fields: list of keys to be included in the response
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :returns: `list` of :any:`AsyncResourceObject` or :any:`YaDiskError` (e.g.,
+                      :any:`PathNotFoundError`), in the order of :code:`paths`
+        """
+
+        if kwargs.get("fields") is None:
+            sibling_threshold = None
+
+        normalized, individual, batches = _plan_meta_lookups(paths, sibling_threshold)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: Dict[str, Union["AsyncResourceObject", YaDiskError]] = {}
+
+        async def get_one(path: str) -> None:
+            async with semaphore:
+                try:
+                    results[path] = await self.get_meta(path, **kwargs)
+                except YaDiskError as e:
+                    results[path] = e
+
+        async def get_siblings(parent: str, children: List[str]) -> None:
+            remaining = {posixpath.basename(child): child for child in children}
+
+            async with semaphore:
+                try:
+                    async for child in self.listdir(parent, **_walk_kwargs(kwargs)):
+                        path = remaining.pop(child.name, None)  # type: ignore[arg-type]
+
+                        if path is not None:
+                            results[path] = child
+
+                        if not remaining:
+                            break
+                except PathNotFoundError as e:
+                    # The parent doesn't exist, so its children don't either
+                    for path in remaining.values():
+                        results[path] = e
+
+                    return
+                except YaDiskError:
+                    # E.g., the parent is a file, look up the children individually
+                    pass
+                else:
+                    for path in remaining.values():
+                        results[path] = _make_not_found_error(path)
+
+                    return
+
+            await asyncio.gather(*(get_one(path) for path in remaining.values()))
+
+        await asyncio.gather(
+            *(get_one(path) for path in individual),
+            *(get_siblings(parent, children) for parent, children in batches.items())
+        )
+
+        return [results[path] for path in normalized]
+
+    async def exists_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        **kwargs
+    ) -> List[Union[bool, YaDiskError]]:
+        """
+            Check whether multiple paths exist, see :any:`AsyncClient.get_meta_many()`.
+
+            :param paths: iterable of paths to the resources
+            :param max_concurrency: `int`, maximum number of concurrent requests
+            :param sibling_threshold: `int` or `None`, minimum number of paths with a
+                                      common parent to list the parent instead,
+                                      `None` disables listing
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :returns: `list` of `bool` or :any:`YaDiskError` (if the existence
+                      could not be determined), in the order of :code:`paths`
+        """
+
+        results = await self.get_meta_many(
+            paths, max_concurrency=max_concurrency, sibling_threshold=sibling_threshold,
+            fields=["type"], **kwargs
+        )
+
+        exists: List[Union[bool, YaDiskError]] = []
+
+        for result in results:
+            if isinstance(result, PathNotFoundError):
+                exists.append(False)
+            elif isinstance(result, YaDiskError):
+                exists.append(result)
+            else:
+                exists.append(True)
+
+        return exists
+
     async def get_type(self, path: str, /, **kwargs) -> str:
         """
             Get resource type.
@@ -839,6 +1324,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -861,6 +1347,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -885,6 +1372,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -911,6 +1399,10 @@ class AsyncClient:
 
             :param path: path to the directory
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param page_concurrency: `int` or `None`, if greater than 1, the pages
+                                     following the first one are requested concurrently
+                                     (at most :code:`page_concurrency` at a time), the
+                                     items are still returned in order
             :param limit: number of children resources to be included in the response
             :param offset: number of children resources to be skipped in the response
             :param preview_size: size of the file preview
@@ -920,6 +1412,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -935,6 +1428,54 @@ class AsyncClient:
         async for file in _listdir(self.get_meta, path, **kwargs):
             yield file
 
+    async def walk(self, path: str, /, **kwargs) -> AsyncGenerator[WalkResult, None]:
+        """
+            Recursively walk the directory tree, similar to :any:`os.walk`.
+
+            For every directory (starting from `path` itself) yields a tuple
+            :code:`(dirpath, dirs, files)`, where :code:`dirs` and :code:`files`
+            are lists of :any:`AsyncResourceObject` for subdirectories and files.
+            Paths of subdirectories are obtained by joining :code:`dirpath`
+            and their names.
+
+            Directories are listed concurrently by a bounded number of tasks,
+            so they are yielded in the order their listings complete, though
+            each directory is always yielded before its subdirectories.
+            Subdirectories are only listed after their parent has been yielded,
+            so the caller can remove entries from :code:`dirs` in-place to skip them.
+
+            :param path: path to the top directory
+            :param max_concurrency: `int`, maximum number of directories
+                                    being listed at the same time (8 by default)
+            :param onerror: `None` or a regular or async function that takes an
+                            exception, if specified, it is called when a directory
+                            could not be listed and the directory is skipped,
+                            otherwise the exception is raised
+            :param limit: number of children resources to be queried in one request
+            :param page_concurrency: `int` or `None`, number of pages of a single
+                                     directory to be requested concurrently, see :any:`AsyncClient.listdir()`
+            :param fields: list of keys to be included in each child resource,
+                           :code:`name` and :code:`type` are always included
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises PathNotFoundError: resource was not found on Disk
+            :raises ForbiddenError: application doesn't have enough rights for this request
+            :raises WrongResourceTypeError: resource is not a directory
+
+            :returns: async generator of :code:`(dirpath, dirs, files)` tuples
+        """
+
+        async for result in _walk(self.listdir, path, **kwargs):
+            yield result
+
     async def get_upload_link(
         self,
         path: str,
@@ -954,6 +1495,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1010,6 +1552,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1088,12 +1631,17 @@ class AsyncClient:
                 else:
                     n_retries, n_retries_for_upload_link = 0, n_retries
 
+            # Whether the link of the last attempt was taken from the cache
+            link_cached = False
+
             async def attempt() -> None:
+                nonlocal link_cached
+
                 temp_kwargs = dict(kwargs)
                 temp_kwargs["n_retries"] = n_retries_for_upload_link
                 temp_kwargs["retry_interval"] = 0.0
 
-                link = await get_upload_link_function(dst_path, **temp_kwargs)
+                link, link_cached = await _async_get_link(get_upload_link_function, dst_path, **temp_kwargs)
 
                 # session.get() doesn't accept some of the passed parameters
                 _filter_request_kwargs(temp_kwargs)
@@ -1120,13 +1668,25 @@ class AsyncClient:
                 else:
                     data = generator_factory()
 
+                if self.rate_limiter is not None and self.rate_limiter.bytes is not None:
+                    data = _async_throttled_payload(data, self.rate_limiter)
+
                 settings.logger.info(f"uploading file to {dst_path} at {link}")
 
                 async with await session.send_request("PUT", link, data=data, **temp_kwargs) as response:
                     if response.status != 201:
-                        raise await response.get_exception()
+                        raise _report_to_rate_limiter(self.rate_limiter, await response.get_exception())
 
-            await auto_retry(attempt, n_retries, retry_interval)
+                # Upload links can't be used more than once
+                _invalidate_link(get_upload_link_function, dst_path)
+
+            await async_auto_retry(
+                _async_invalidating_link_on_error(attempt, get_upload_link_function, dst_path, lambda: link_cached),
+                n_retries, retry_interval,
+                retry_on=_get_rate_limiter_retry_on(self.rate_limiter),
+                retry_policy=kwargs.get("retry_policy"),
+                **_get_circuit_breaker_kwargs(self.circuit_breakers, "upload")
+            )
         finally:
             if close_file and file is not None:
                 await file.close()
@@ -1152,6 +1712,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1169,9 +1730,154 @@ class AsyncClient:
 
         _apply_default_args(kwargs, self.default_args)
 
-        await self._upload(self.get_upload_link, path_or_file, dst_path, **kwargs)
+        get_upload_link: Callable[..., Awaitable[str]] = self.get_upload_link
+
+        if self.link_cache is not None:
+            get_upload_link = _AsyncCachedLinkFunction(
+                self.get_upload_link, self.link_cache, "upload", kwargs.get("overwrite", False)
+            )
+
+        try:
+            await self._upload(get_upload_link, path_or_file, dst_path, **kwargs)
+        finally:
+            self._invalidate_meta(dst_path)
+
+        if self.link_cache is not None:
+            # The file has changed, its download link might be outdated now
+            self.link_cache.invalidate(dst_path, operation="download")
         return AsyncResourceLinkObject.from_path(dst_path, yadisk=self)
 
+    async def upload_tree(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        overwrite: bool = False,
+        **kwargs
+    ) -> List[TransferResult]:
+        """
+            Upload a local directory tree to Disk.
+
+            Each remote directory is created exactly once (an existing directory
+            is not considered an error) and only after its parent, files are
+            uploaded as soon as their directory exists. Directories are
+            created and files are uploaded concurrently as separate tasks.
+
+            A failed upload doesn't stop the others, errors are reported in the
+            returned list instead. If a directory could not be created, all the
+            files inside of it are reported as failed with the same error.
+
+            :param local_dir: path to the local directory
+            :param remote_dir: path to the destination directory on Disk,
+                               it is created (recursively) if it doesn't exist
+            :param max_workers: `int`, maximum number of concurrent requests
+            :param overwrite: `bool`, if `True`, existing files will be overwritten,
+                              otherwise they are reported as failed
+            :param spoof_user_agent: `bool`, if `True` (default), the `User-Agent` header
+                will be set to a special value, which should allow bypassing of
+                Yandex.Disk's upload speed limit
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises NotADirectoryError: :code:`local_dir` is not a directory
+
+            :returns: `list` of :any:`TransferResult`, one for each local file
+        """
+
+        _apply_default_args(kwargs, self.default_args)
+
+        # Scanning a large tree can take a while, so it's done in a separate thread
+        tree = await asyncio.get_running_loop().run_in_executor(None, _scan_local_tree, local_dir)
+
+        mkdir_kwargs = dict(kwargs)
+        mkdir_kwargs.pop("spoof_user_agent", None)
+
+        kwargs["overwrite"] = overwrite
+
+        get_upload_link: Callable[..., Awaitable[str]] = self.get_upload_link
+
+        if self.link_cache is not None:
+            get_upload_link = _AsyncCachedLinkFunction(self.get_upload_link, self.link_cache, "upload", overwrite)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        def get_local_path(relpath: str) -> str:
+            return os.path.join(local_dir, *relpath.split("/"))
+
+        def get_remote_path(relpath: str) -> str:
+            return posixpath.join(remote_dir, relpath) if relpath else remote_dir
+
+        async def create_directory(relpath: str) -> None:
+            async with semaphore:
+                try:
+                    if relpath:
+                        await self.mkdir(get_remote_path(relpath), **mkdir_kwargs)
+                    else:
+                        await self.makedirs(remote_dir, **mkdir_kwargs)
+                except DirectoryExistsError:
+                    pass
+
+        async def upload_file(relpath: str) -> None:
+            remote_path = get_remote_path(relpath)
+
+            async with semaphore:
+                try:
+                    await self._upload(get_upload_link, get_local_path(relpath), remote_path, **kwargs)
+                finally:
+                    self._invalidate_meta(remote_path)
+
+            if self.link_cache is not None:
+                self.link_cache.invalidate(remote_path, operation="download")
+
+        results: Dict[str, TransferResult] = {}
+
+        def report(relpath: str, error: Optional[BaseException]) -> None:
+            results[relpath] = TransferResult(
+                get_local_path(relpath), get_remote_path(relpath),
+                "uploaded" if error is None else "failed", error
+            )
+
+        # Maps tasks to relative paths and whether the path is a directory
+        pending: Dict[asyncio.Future, Tuple[str, bool]] = {asyncio.ensure_future(create_directory("")): ("", True)}
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    relpath, is_dir = pending.pop(task)
+                    error = task.exception()
+
+                    if not is_dir:
+                        report(relpath, error)
+                    elif error is not None:
+                        for file_relpath in _iter_local_tree_files(tree, relpath):
+                            report(file_relpath, error)
+                    else:
+                        subdirs, files = tree[relpath]
+
+                        for subdir in subdirs:
+                            pending[asyncio.ensure_future(create_directory(subdir))] = (subdir, True)
+
+                        for file_relpath in files:
+                            pending[asyncio.ensure_future(upload_file(file_relpath))] = (file_relpath, False)
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [results[relpath] for relpath in _iter_local_tree_files(tree)]
+
     async def upload_by_link(self,
                              file_or_path: AsyncFileOrPath,
                              link: str, /, **kwargs) -> None:
@@ -1186,6 +1892,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1210,6 +1917,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1280,34 +1988,258 @@ class AsyncClient:
                 close_file = False
                 file = file_or_path
 
-            if await _is_file_seekable(file):
+            file_seekable = await _is_file_seekable(file)
+
+            if file_seekable:
                 file_position = await _file_tell(file)
             else:
                 n_retries, n_retries_for_download_link = 0, n_retries
 
+            # Number of bytes successfully written by previous attempts,
+            # retries continue from this point using range requests
+            written = 0
+
+            # Set to False if the server returned a wrong range
+            resume_enabled = True
+
+            # Whether the link of the last attempt was taken from the cache
+            link_cached = False
+
             async def attempt() -> None:
+                nonlocal written, resume_enabled, link_cached
+
                 temp_kwargs = dict(kwargs)
                 temp_kwargs["n_retries"] = n_retries_for_download_link
                 temp_kwargs["retry_interval"] = 0.0
-                link = await get_download_link_function(src_path, **temp_kwargs)
+                link, link_cached = await _async_get_link(get_download_link_function, src_path, **temp_kwargs)
 
                 # session.get() doesn't accept some of the passed parameters
                 _filter_request_kwargs(temp_kwargs)
 
                 temp_kwargs.setdefault("stream", True)
 
-                if await _is_file_seekable(file):
-                    await _file_seek(file, file_position)
+                resuming = written > 0 and resume_enabled and file_seekable
+
+                if not resuming:
+                    written = 0
 
-                settings.logger.info(f"downloading file {src_path} from {link}")
+                if file_seekable:
+                    await _file_seek(file, file_position + written)
+
+                if resuming:
+                    temp_kwargs["headers"] = CaseInsensitiveDict(temp_kwargs.get("headers") or {})
+                    temp_kwargs["headers"]["Range"] = f"bytes={written}-"
+
+                    settings.logger.info(f"resuming download of file {src_path} from {link} at byte {written}")
+                else:
+                    settings.logger.info(f"downloading file {src_path} from {link}")
 
                 async with await session.send_request("GET", link, **temp_kwargs) as response:
-                    if response.status != 200:
-                        raise await response.get_exception()
+                    if resuming and _is_resumed_response(response.status, response.headers, written):
+                        pass
+                    elif response.status == 200:
+                        if resuming:
+                            settings.logger.info("server ignored the Range header, restarting the download")
+
+                            await _file_seek(file, file_position)
+                            written = 0
+                    elif response.status == 206:
+                        resume_enabled = False
+                        raise RequestError("Server returned an unexpected range, restarting the download")
+                    else:
+                        raise _report_to_rate_limiter(self.rate_limiter, await response.get_exception())
+
+                    async def consume(chunk: bytes) -> None:
+                        nonlocal written
+
+                        if self.rate_limiter is not None:
+                            await self.rate_limiter.async_wait_bytes(len(chunk))
+
+                        await _file_write(file, chunk)
+                        written += len(chunk)
 
-                    await response.download(file.write)
+                    await response.download(consume)
 
-            return await auto_retry(attempt, n_retries, retry_interval)
+            return await async_auto_retry(
+                _async_invalidating_link_on_error(attempt, get_download_link_function, src_path, lambda: link_cached),
+                n_retries, retry_interval,
+                retry_on=_get_rate_limiter_retry_on(self.rate_limiter),
+                retry_policy=kwargs.get("retry_policy"),
+                **_get_circuit_breaker_kwargs(self.circuit_breakers, "download")
+            )
+        finally:
+            if close_file and file is not None:
+                await file.close()
+
+    async def _download_segmented(
+        self,
+        get_download_link_function: Callable[..., Awaitable[str]],
+        src_path: str,
+        file_or_path: AsyncFileOrPathDestination,
+        size: int,
+        /,
+        *,
+        parallel_segments: int,
+        segment_size: Optional[int] = None,
+        max_in_flight_bytes: Optional[int] = None,
+        retry_cached_link: bool = True,
+        **kwargs
+    ) -> None:
+        if segment_size is None:
+            segment_size = settings.DEFAULT_DOWNLOAD_SEGMENT_SIZE
+
+        segments = _make_segments(size, segment_size)
+
+        # Every running segment has up to segment_size bytes requested but not yet written
+        if max_in_flight_bytes is not None:
+            parallel_segments = min(parallel_segments, max(1, max_in_flight_bytes // segment_size))
+
+        n_retries = kwargs.get("n_retries")
+
+        if n_retries is None:
+            n_retries = settings.DEFAULT_N_RETRIES
+
+        retry_interval = kwargs.get("retry_interval")
+
+        if retry_interval is None:
+            retry_interval = settings.DEFAULT_RETRY_INTERVAL
+
+        retry_policy = kwargs.get("retry_policy")
+
+        timeout = kwargs.get("timeout", ...)
+
+        if timeout is ...:
+            timeout = settings.DEFAULT_TIMEOUT
+
+        kwargs["timeout"] = timeout
+
+        file: Any = None
+        close_file = False
+
+        session = self.session
+
+        try:
+            if isinstance(file_or_path, (str, bytes)):
+                close_file = True
+                file = await self.open_file(file_or_path, "wb")
+            else:
+                close_file = False
+                file = file_or_path
+
+            # Segments can only be written at arbitrary offsets into seekable files
+            if len(segments) < 2 or parallel_segments < 2 or not await _is_file_seekable(file):
+                return await self._download(get_download_link_function, src_path, file, **kwargs)
+
+            file_position = await _file_tell(file)
+
+            link, link_cached = await _async_get_link(get_download_link_function, src_path, **kwargs)
+
+            # Preallocate the destination file, but never shrink it
+            if await _file_seek(file, 0, 2) < file_position + size and hasattr(file, "truncate"):
+                try:
+                    await _file_truncate(file, file_position + size)
+                except OSError:
+                    pass
+
+            file_lock = asyncio.Lock()
+            semaphore = asyncio.Semaphore(parallel_segments)
+
+            request_kwargs = dict(kwargs)
+
+            # session.get() doesn't accept some of the passed parameters
+            _filter_request_kwargs(request_kwargs)
+
+            request_kwargs.setdefault("stream", True)
+
+            async def download_segment(start: int, end: int) -> None:
+                async def attempt() -> None:
+                    temp_kwargs = dict(request_kwargs)
+                    temp_kwargs["headers"] = CaseInsensitiveDict(temp_kwargs.get("headers") or {})
+                    temp_kwargs["headers"]["Range"] = f"bytes={start}-{end}"
+
+                    position = file_position + start
+
+                    async def consume(chunk: bytes) -> None:
+                        nonlocal position
+
+                        if self.rate_limiter is not None:
+                            await self.rate_limiter.async_wait_bytes(len(chunk))
+
+                        if response.status not in (0, 206):
+                            return
+
+                        async with file_lock:
+                            await _file_seek(file, position)
+                            await _file_write(file, chunk)
+
+                        position += len(chunk)
+
+                    async with await session.send_request("GET", link, **temp_kwargs) as response:
+                        if response.status == 200:
+                            raise _RangeIgnoredError(msg="Server ignored the Range header")
+                        elif response.status not in (0, 206):
+                            raise _report_to_rate_limiter(self.rate_limiter, await response.get_exception())
+
+                        await response.download(consume)
+
+                    received = position - file_position - start
+
+                    if received != end - start + 1:
+                        raise RequestError(f"Incomplete segment: expected {end - start + 1} bytes, got {received}")
+
+                async with semaphore:
+                    await async_auto_retry(
+                        attempt, n_retries, retry_interval,
+                        retry_on=_get_rate_limiter_retry_on(self.rate_limiter),
+                        retry_policy=retry_policy,
+                        **_get_circuit_breaker_kwargs(self.circuit_breakers, "download")
+                    )
+
+            settings.logger.info(
+                f"downloading file {src_path} from {link} in {len(segments)} segments, "
+                f"using {parallel_segments} parallel connections"
+            )
+
+            tasks = [asyncio.ensure_future(download_segment(start, end)) for start, end in segments]
+
+            range_ignored = link_expired = False
+
+            try:
+                await asyncio.gather(*tasks)
+            except _RangeIgnoredError:
+                range_ignored = True
+            except YaDiskError as e:
+                if not _invalidate_link(get_download_link_function, src_path, e, link_cached and retry_cached_link):
+                    raise
+
+                link_expired = True
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+                # Make sure nothing writes to the file after this point
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            if range_ignored:
+                settings.logger.info("range requests are not supported, falling back to a regular download")
+
+                async def get_link(*args, **kwargs) -> str:
+                    return link
+
+                await _file_seek(file, file_position)
+                await self._download(get_link, src_path, file, **kwargs)
+            elif link_expired:
+                settings.logger.info("cached download link is no longer valid, requesting a new one")
+
+                await _file_seek(file, file_position)
+                await self._download_segmented(
+                    get_download_link_function, src_path, file, size,
+                    parallel_segments=parallel_segments,
+                    segment_size=segment_size,
+                    max_in_flight_bytes=max_in_flight_bytes,
+                    retry_cached_link=False,
+                    **kwargs
+                )
         finally:
             if close_file and file is not None:
                 await file.close()
@@ -1322,12 +2254,26 @@ class AsyncClient:
         """
             Download the file.
 
+            If :code:`parallel_segments` is greater than 1, the file is split
+            into segments of :code:`segment_size` bytes, which are downloaded
+            concurrently (using HTTP range requests) and written directly at
+            their offsets in the destination file.
+            This requires an extra request to get the size of the file and a
+            seekable destination, otherwise a regular download is performed.
+
             :param src_path: source path
             :param path_or_file: destination path or file-like object
+            :param parallel_segments: `int` or `None`, maximum number of segments
+                                      to be downloaded concurrently
+            :param segment_size: `int` or `None`, size of a single segment in bytes
+                                 (:any:`settings.DEFAULT_DOWNLOAD_SEGMENT_SIZE` by default)
+            :param max_in_flight_bytes: `int` or `None`, limits the total size of
+                                        segments being downloaded at the same time
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1342,7 +2288,30 @@ class AsyncClient:
 
         _apply_default_args(kwargs, self.default_args)
 
-        await self._download(self.get_download_link, src_path, path_or_file, **kwargs)
+        parallel_segments = kwargs.pop("parallel_segments", None)
+        segment_size = kwargs.pop("segment_size", None)
+        max_in_flight_bytes = kwargs.pop("max_in_flight_bytes", None)
+
+        get_download_link: Callable[..., Awaitable[str]] = self.get_download_link
+
+        if self.link_cache is not None:
+            get_download_link = _AsyncCachedLinkFunction(self.get_download_link, self.link_cache, "download")
+
+        if parallel_segments is not None and parallel_segments > 1:
+            resource = await self.get_meta(src_path, fields=["type", "size"], **kwargs)
+
+            if resource.type == "file" and resource.size is not None:
+                await self._download_segmented(
+                    get_download_link, src_path, path_or_file, resource.size,
+                    parallel_segments=parallel_segments,
+                    segment_size=segment_size,
+                    max_in_flight_bytes=max_in_flight_bytes,
+                    **kwargs
+                )
+
+                return AsyncResourceLinkObject.from_path(src_path, yadisk=self)
+
+        await self._download(get_download_link, src_path, path_or_file, **kwargs)
         return AsyncResourceLinkObject.from_path(src_path, yadisk=self)
 
     async def download_by_link(
@@ -1361,6 +2330,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1374,6 +2344,202 @@ class AsyncClient:
 
         await self._download(get_link, "", file_or_path, **kwargs)
 
+    async def download_resource(
+        self,
+        resource: ResourceObject,
+        file_or_path: AsyncFileOrPathDestination,
+        /,
+        **kwargs
+    ) -> AsyncResourceLinkObject:
+        """
+            Download a file described by a :any:`ResourceObject`, e.g., one
+            returned by :any:`AsyncClient.listdir()` or :any:`AsyncClient.get_files()`.
+
+            If the resource contains a download link (the :code:`file` attribute),
+            the file is downloaded directly from it, without requesting a new link.
+            A new link is only requested if that one turns out to be expired
+            (or if there is no link at all).
+
+            :param resource: :any:`ResourceObject` of the file to download,
+                             its :code:`path` is used to obtain a new link
+            :param file_or_path: destination path or file-like object
+            :param parallel_segments: `int` or `None`, see :any:`AsyncClient.download()`,
+                                      :code:`size` of the resource is used if available
+            :param segment_size: `int` or `None`, see :any:`AsyncClient.download()`
+            :param max_in_flight_bytes: `int` or `None`, see :any:`AsyncClient.download()`
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises PathNotFoundError: resource was not found on Disk
+            :raises ForbiddenError: application doesn't have enough rights for this request
+            :raises ResourceIsLockedError: resource is locked by another request
+            :raises ValueError: the resource has neither a path nor a download link
+
+            :returns: :any:`AsyncResourceLinkObject`, link to the source resource
+        """
+
+        if resource.path is None:
+            if resource.file is None:
+                raise ValueError("ResourceObject doesn't have a path")
+
+            # There is no way to obtain a new link
+            await self.download_by_link(resource.file, file_or_path, **kwargs)
+
+            return AsyncResourceLinkObject.from_path(resource.path, yadisk=self)
+
+        if resource.file is None:
+            return await self.download(resource.path, file_or_path, **kwargs)
+
+        _apply_default_args(kwargs, self.default_args)
+
+        parallel_segments = kwargs.pop("parallel_segments", None)
+        segment_size = kwargs.pop("segment_size", None)
+        max_in_flight_bytes = kwargs.pop("max_in_flight_bytes", None)
+
+        # The embedded link is treated as a cached one: it is used first and
+        # dropped in favor of a new link if the server rejects it as expired
+        embedded_links = LinkCache(max_size=1)
+        embedded_links.put(resource.path, False, "download", resource.file)
+
+        get_download_link = _AsyncCachedLinkFunction(self.get_download_link, embedded_links, "download")
+
+        if parallel_segments is not None and parallel_segments > 1 and resource.size is not None:
+            await self._download_segmented(
+                get_download_link, resource.path, file_or_path, resource.size,
+                parallel_segments=parallel_segments,
+                segment_size=segment_size,
+                max_in_flight_bytes=max_in_flight_bytes,
+                **kwargs
+            )
+        else:
+            await self._download(get_download_link, resource.path, file_or_path, **kwargs)
+
+        return AsyncResourceLinkObject.from_path(resource.path, yadisk=self)
+
+    async def download_tree(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        check_md5: bool = False,
+        **kwargs
+    ) -> List[TransferResult]:
+        """
+            Download a directory tree from Disk.
+
+            The remote tree is walked with :any:`AsyncClient.walk()`, local
+            directories are created as they are discovered and files are
+            downloaded concurrently as separate tasks. A file is skipped if
+            a local copy with the same size and modification time (or MD5 hash,
+            if :code:`check_md5` is `True`) already exists. The modification time
+            of every downloaded file is set to the one reported by the API.
+
+            A failed download doesn't stop the others, errors are reported in
+            the returned list instead. Errors while listing directories are raised.
+
+            :param remote_dir: path to the directory on Disk
+            :param local_dir: path to the local destination directory,
+                              it is created if it doesn't exist
+            :param max_workers: `int`, maximum number of concurrent downloads
+                                (and directory listings)
+            :param check_md5: `bool`, compare MD5 hashes of existing local files
+                              instead of their modification time
+            :param fields: list of keys to be included in the directory listings,
+                           fields needed by this method are always included
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises PathNotFoundError: resource was not found on Disk
+            :raises ForbiddenError: application doesn't have enough rights for this request
+            :raises WrongResourceTypeError: resource is not a directory
+
+            :returns: `list` of :any:`TransferResult`, one for each remote file
+        """
+
+        _apply_default_args(kwargs, self.default_args)
+
+        # Only used for listing directories, downloads don't need it
+        fields = _get_download_tree_fields(kwargs.pop("fields", None))
+
+        get_download_link: Callable[..., Awaitable[str]] = self.get_download_link
+
+        if self.link_cache is not None:
+            get_download_link = _AsyncCachedLinkFunction(self.get_download_link, self.link_cache, "download")
+
+        semaphore = asyncio.Semaphore(max_workers)
+        loop = asyncio.get_running_loop()
+
+        async def download_file(resource: AsyncResourceObject, remote_path: str, local_path: str) -> TransferStatus:
+            async with semaphore:
+                # Computing MD5 of a large file can take a while, so it's done in a separate thread
+                if await loop.run_in_executor(None, _is_local_copy_up_to_date, local_path, resource, check_md5):
+                    return "skipped"
+
+                await self._download(get_download_link, remote_path, local_path, **kwargs)
+
+            _set_local_mtime(local_path, resource)
+
+            return "downloaded"
+
+        local_paths = {remote_dir: local_dir}
+        tasks: List[Tuple[asyncio.Future, str, str]] = []
+
+        try:
+            tree = self.walk(
+                remote_dir, max_concurrency=max_workers,
+                fields=fields, **kwargs
+            )
+
+            async for dirpath, dirs, files in tree:
+                local_dirpath = local_paths.pop(dirpath)
+                os.makedirs(local_dirpath, exist_ok=True)
+
+                for directory in dirs:
+                    local_dirname = os.path.join(local_dirpath, directory.name)
+                    local_paths[posixpath.join(dirpath, directory.name)] = local_dirname
+
+                for file in files:
+                    remote_path = posixpath.join(dirpath, file.name)
+                    local_path = os.path.join(local_dirpath, file.name)
+
+                    tasks.append(
+                        (asyncio.ensure_future(download_file(file, remote_path, local_path)), local_path, remote_path)
+                    )
+
+            await asyncio.gather(*(task for task, _, _ in tasks), return_exceptions=True)
+        finally:
+            # Only has an effect if walking the tree has failed
+            for task, _, _ in tasks:
+                task.cancel()
+
+            await asyncio.gather(*(task for task, _, _ in tasks), return_exceptions=True)
+
+        results = []
+
+        for task, local_path, remote_path in tasks:
+            error = task.exception()
+            status: TransferStatus = "failed" if error is not None else task.result()
+
+            results.append(TransferResult(local_path, remote_path, status, error))
+
+        return results
+
     async def remove(
         self,
         path: str,
@@ -1390,13 +2556,15 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1423,7 +2591,12 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await self._maybe_wait(DeleteRequest, path, **kwargs)
+        self._known_dirs.discard(path)
+
+        try:
+            return await self._maybe_wait(DeleteRequest, path, **kwargs)
+        finally:
+            self._invalidate_meta(path)
 
     async def mkdir(self, path: str, /, **kwargs) -> AsyncResourceLinkObject:
         """
@@ -1435,6 +2608,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1457,19 +2631,39 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await MkdirRequest(self.session, path, **kwargs).asend(yadisk=self)
+        try:
+            result = await MkdirRequest(self.session, path, **kwargs).asend(yadisk=self)
+        except DirectoryExistsError:
+            self._known_dirs.add(path)
+            raise
+        finally:
+            self._invalidate_meta(path)
+
+        self._known_dirs.add(path)
+
+        return result
 
     async def makedirs(self, path: str, /, **kwargs) -> AsyncResourceLinkObject:
         """
             Create a new directory at `path`. If its parent directory doesn't
             exist it will also be created recursively.
 
+            The client remembers directories that it has created or found to
+            exist. If the parent directory is missing, the deepest existing
+            ancestor is located with a binary search over the path depth and
+            only the missing directories are created. Intermediate directories
+            that are concurrently created by someone else are not treated as
+            an error.
+
             :param path: path to the directory to be created
+            :param exist_ok: `bool`, if `True`, do not raise :any:`DirectoryExistsError`
+                             when `path` already exists
             :param fields: list of keys to be included in the response
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1483,27 +2677,61 @@ class AsyncClient:
             :returns: :any:`AsyncResourceLinkObject`
         """
 
-        while True:
+        exist_ok = kwargs.pop("exist_ok", False)
+
+        async def create_target() -> AsyncResourceLinkObject:
             try:
                 return await self.mkdir(path, **kwargs)
-            except ParentNotFoundError as e:
-                # We first have to remove the schema, otherwise posixpath.split()
-                # may treat it as part of the path
-                schema, path_without_schema = remove_path_schema(path)
+            except DirectoryExistsError:
+                if not exist_ok:
+                    raise
 
-                # Extract the parent directory
-                head, tail = posixpath.split(path_without_schema)
-                head = head.strip("/")
+                return AsyncResourceLinkObject.from_path(path, yadisk=self)
 
-                if head == "":
-                    # We should never find ourselves in this situation
-                    raise e from None
+        prefixes = _get_path_prefixes(path)
+        target = len(prefixes) - 1
+
+        # Index of the deepest directory that is known to exist
+        lo = self._known_dirs.get_deepest(prefixes[:-1])
+
+        try:
+            return await create_target()
+        except ParentNotFoundError as e:
+            error = e
+
+        # Index of the deepest directory that is known to be missing
+        hi = target - 1
+
+        while hi > lo + 1 or hi <= lo:
+            if hi <= lo:
+                if lo == 0:
+                    raise error
+
+                # Some of the remembered directories have been removed since then
+                self._known_dirs.forget(prefixes[1:lo + 1])
+                lo = 0
+                continue
+
+            mid = (lo + hi) // 2
+
+            try:
+                await self.mkdir(prefixes[mid], **kwargs)
+            except DirectoryExistsError:
+                pass
+            except ParentNotFoundError as e:
+                error, hi = e, mid - 1
+                continue
 
-                # Restore the schema
-                if schema:
-                    head = f"{schema}:/{head}"
+            lo = mid
 
-                await self.makedirs(head, **kwargs)
+        for i in range(hi, target):
+            try:
+                await self.mkdir(prefixes[i], **kwargs)
+            except DirectoryExistsError:
+                # Another worker has created it in the meantime
+                pass
+
+        return await create_target()
 
     async def check_token(self, token: Optional[str] = None, /, **kwargs) -> bool:
         """
@@ -1514,6 +2742,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1557,6 +2786,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1592,6 +2822,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1623,13 +2854,17 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1658,7 +2893,12 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await self._maybe_wait(CopyRequest, src_path, dst_path, **kwargs)
+        self._known_dirs.discard(dst_path)
+
+        try:
+            return await self._maybe_wait(CopyRequest, src_path, dst_path, **kwargs)
+        finally:
+            self._invalidate_meta(dst_path)
 
     async def restore_trash(
         self,
@@ -1676,13 +2916,15 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1709,9 +2951,16 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await self._maybe_wait(
-            RestoreTrashRequest, path, dst_path=dst_path, **kwargs
-        )
+        try:
+            return await self._maybe_wait(
+                RestoreTrashRequest, path, dst_path=dst_path, **kwargs
+            )
+        finally:
+            if dst_path is not None:
+                self._invalidate_meta(dst_path)
+            elif self.meta_cache is not None:
+                # The original location of the trash resource is unknown
+                self.meta_cache.clear()
 
     async def move(
         self,
@@ -1729,13 +2978,17 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1762,7 +3015,13 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await self._maybe_wait(MoveRequest, src_path, dst_path, **kwargs)
+        self._known_dirs.discard(src_path)
+        self._known_dirs.discard(dst_path)
+
+        try:
+            return await self._maybe_wait(MoveRequest, src_path, dst_path, **kwargs)
+        finally:
+            self._invalidate_meta(src_path, dst_path)
 
     async def rename(
         self,
@@ -1781,13 +3040,17 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1840,13 +3103,15 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1887,6 +3152,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1907,7 +3173,10 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await PublishRequest(self.session, path, **kwargs).asend(yadisk=self)
+        try:
+            return await PublishRequest(self.session, path, **kwargs).asend(yadisk=self)
+        finally:
+            self._invalidate_meta(path)
 
     async def unpublish(self, path: str, /, **kwargs) -> AsyncResourceLinkObject:
         """
@@ -1921,6 +3190,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1941,7 +3211,10 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await UnpublishRequest(self.session, path, **kwargs).asend(yadisk=self)
+        try:
+            return await UnpublishRequest(self.session, path, **kwargs).asend(yadisk=self)
+        finally:
+            self._invalidate_meta(path)
 
     async def get_public_settings(self, path: str, /, **kwargs) -> PublicSettingsObject:
         """
@@ -1954,6 +3227,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1984,6 +3258,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2015,6 +3290,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2055,13 +3331,15 @@ class AsyncClient:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2089,7 +3367,16 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await self._maybe_wait(SaveToDiskRequest, public_key, **kwargs)
+        save_path = kwargs.get("save_path")
+
+        try:
+            return await self._maybe_wait(SaveToDiskRequest, public_key, **kwargs)
+        finally:
+            if save_path is not None:
+                self._invalidate_meta(save_path)
+            elif self.meta_cache is not None:
+                # The resource is saved to the downloads directory, its path is unknown
+                self.meta_cache.clear()
 
     async def get_public_meta(self, public_key: str, /, **kwargs) -> "AsyncPublicResourceObject":
         """
@@ -2109,6 +3396,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2145,6 +3433,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2171,6 +3460,10 @@ class AsyncClient:
                          By specifying the key of the published folder in `public_key`,
                          you can request contents of any nested folder.
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param page_concurrency: `int` or `None`, if greater than 1, the pages
+                                     following the first one are requested concurrently
+                                     (at most :code:`page_concurrency` at a time), the
+                                     items are still returned in order
             :param limit: number of children resources to be included in the response
             :param offset: number of children resources to be skipped in the response
             :param preview_size: size of the file preview
@@ -2180,6 +3473,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2205,6 +3499,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2228,6 +3523,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2253,6 +3549,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2279,6 +3576,13 @@ class AsyncClient:
 
             :param path: path to the directory in the trash bin
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param page_concurrency: `int` or `None`, if greater than 1, the pages
+                                     following the first one are requested concurrently
+                                     (at most :code:`page_concurrency` at a time), the
+                                     items are still returned in order
+            :param prefetch: `int`, number of pages to request in the background
+                             ahead of the one currently being consumed (in a separate task),
+                             `0` disables prefetching
             :param limit: number of children resources to be included in the response
             :param offset: number of children resources to be skipped in the response
             :param preview_size: size of the file preview
@@ -2288,6 +3592,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2312,6 +3617,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2334,6 +3640,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2358,6 +3665,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2387,6 +3695,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2411,12 +3720,16 @@ class AsyncClient:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
         **kwargs
     ) -> AsyncGenerator[AsyncPublicResourceObject, None]:
         """
             Get a list of all public resources.
 
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param prefetch: `int`, number of pages to request in the background
+                             ahead of the one currently being consumed (in a separate task),
+                             `0` disables prefetching
             :param offset: offset from the beginning of the list
             :param limit: maximum number of elements in the list
             :param preview_size: size of the file preview
@@ -2427,6 +3740,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2443,35 +3757,20 @@ class AsyncClient:
             :returns: async generator of :any:`AsyncPublicResourceObject`
         """
 
-        if kwargs.get("offset") is None:
-            kwargs["offset"] = 0
-
-        if kwargs.get("limit") is None:
-            kwargs["limit"] = 100
+        offset = kwargs.pop("offset", None)
+        limit = kwargs.pop("limit", None)
 
-        remaining_items = max_items
+        if offset is None:
+            offset = 0
 
-        while True:
-            # Do not query more items than necessary
-            if remaining_items is not None:
-                kwargs["limit"] = min(remaining_items, kwargs["limit"])
+        if limit is None:
+            limit = 100
 
-            files = (await self.get_public_resources(**kwargs)).items or []
-            file_count = len(files)
+        async def get_page(offset: int, limit: int) -> List["AsyncPublicResourceObject"]:
+            return (await self.get_public_resources(offset=offset, limit=limit, **kwargs)).items or []
 
-            for i in files[:remaining_items]:
-                yield i
-
-            if remaining_items is not None:
-                remaining_items -= file_count
-
-                if remaining_items <= 0:
-                    break
-
-            if file_count < kwargs["limit"]:
-                break
-
-            kwargs["offset"] += kwargs["limit"]
+        async for resource in _paginate(get_page, offset, limit, max_items=max_items, prefetch=prefetch):
+            yield resource
 
     async def patch(self, path: str, properties: dict, /, **kwargs) -> "AsyncResourceObject":
         """
@@ -2484,6 +3783,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2504,7 +3804,10 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await PatchRequest(self.session, path, properties, **kwargs).asend(yadisk=self)
+        try:
+            return await PatchRequest(self.session, path, properties, **kwargs).asend(yadisk=self)
+        finally:
+            self._invalidate_meta(path)
 
     async def _get_files_some(self, **kwargs) -> List["AsyncResourceObject"]:
         def validate_response(response: "AsyncFilesResourceListObject") -> "AsyncFilesResourceListObject":
@@ -2525,6 +3828,8 @@ class AsyncClient:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
+        parallel_partitions: bool = False,
         **kwargs
     ) -> AsyncGenerator["AsyncResourceObject", None]:
         """
@@ -2532,8 +3837,18 @@ class AsyncClient:
 
             :param offset: offset from the beginning of the list
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param prefetch: `int`, number of pages to request in the background
+                             ahead of the one currently being consumed (in a separate task),
+                             `0` disables prefetching
             :param limit: number of list elements to be included in each response
             :param media_type: type of files to include in the list
+            :param parallel_partitions: `bool`, if `True`, the listing is split into
+                                        disjoint partitions by media type (:code:`media_type`
+                                        or :any:`settings.FILE_MEDIA_TYPES`), which are paged
+                                        concurrently (as concurrent tasks). Items of different partitions
+                                        are interleaved, :code:`sort` only applies within a
+                                        partition, :code:`prefetch` is ignored and :code:`offset`
+                                        is not supported
             :param sort: `str`, field to be used as a key to sort children resources
             :param preview_size: size of the file preview
             :param preview_crop: `bool`, cut the preview to the size specified in the `preview_size`
@@ -2542,6 +3857,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2560,35 +3876,34 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        if kwargs.get("offset") is None:
-            kwargs["offset"] = 0
+        offset = kwargs.pop("offset", None)
+        limit = kwargs.pop("limit", None)
 
-        if kwargs.get("limit") is None:
-            kwargs["limit"] = 200
+        if offset is None:
+            offset = 0
 
-        remaining_items = max_items
+        if limit is None:
+            limit = 200
 
-        while True:
-            # Do not query more items than necessary
-            if remaining_items is not None:
-                kwargs["limit"] = min(remaining_items, kwargs["limit"])
+        if parallel_partitions:
+            if offset:
+                raise ValueError("offset cannot be used together with parallel_partitions")
 
-            files = await self._get_files_some(**kwargs)
-            file_count = len(files)
+            partitions = _get_partitions(kwargs.pop("media_type", None))
 
-            for file in files[:remaining_items]:
-                yield file
+            async def get_partition_page(media_type: str, offset: int, limit: int) -> List["AsyncResourceObject"]:
+                return await self._get_files_some(media_type=media_type, offset=offset, limit=limit, **kwargs)
 
-            if remaining_items is not None:
-                remaining_items -= file_count
+            async for file in _paginate_partitioned(get_partition_page, partitions, limit, max_items=max_items):
+                yield file
 
-                if remaining_items <= 0:
-                    break
+            return
 
-            if file_count < kwargs["limit"]:
-                break
+        async def get_page(offset: int, limit: int) -> List["AsyncResourceObject"]:
+            return await self._get_files_some(offset=offset, limit=limit, **kwargs)
 
-            kwargs["offset"] += kwargs["limit"]
+        async for file in _paginate(get_page, offset, limit, max_items=max_items, prefetch=prefetch):
+            yield file
 
     async def get_last_uploaded(self, **kwargs) -> List["AsyncResourceObject"]:
         """
@@ -2603,6 +3918,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2652,13 +3968,15 @@ class AsyncClient:
             :param disable_redirects: `bool`, forbid redirects
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float`, `tuple` or `None`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2687,7 +4005,10 @@ class AsyncClient:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return await self._maybe_wait(UploadURLRequest, url, path, **kwargs)
+        try:
+            return await self._maybe_wait(UploadURLRequest, url, path, **kwargs)
+        finally:
+            self._invalidate_meta(path)
 
     async def get_public_download_link(self, public_key: str, /, **kwargs) -> str:
         """
@@ -2699,6 +4020,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2742,6 +4064,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2770,6 +4093,7 @@ class AsyncClient:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2797,13 +4121,68 @@ class AsyncClient:
             ).asend(yadisk=self)
         ).status
 
+    def track_operation(
+        self,
+        operation: Union[str, AsyncOperationLinkObject, AsyncResourceLinkObject, None],
+        /,
+        *,
+        poll_timeout: Optional[float] = None,
+        **kwargs
+    ) -> "asyncio.Future[None]":
+        """
+            Track an asynchronous operation without blocking the calling task.
+            All tracked operations are polled by :any:`AsyncClient.operation_poller`,
+            with the interval between status queries growing over time.
+            Must be called from a running event loop.
+
+            This is meant to be used with methods like :any:`AsyncClient.copy()`,
+            :any:`AsyncClient.move()` and :any:`AsyncClient.remove()`, called with
+            :code:`wait=False`, so that many operations can be waited for at once.
+
+            :param operation: ID of the operation, a link or an object returned
+                              by one of the methods above. If it's not an
+                              operation link (the request completed synchronously),
+                              an already resolved future is returned
+            :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout)
+            :param timeout: `float`, `tuple` or `None`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
+            :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :returns: :any:`asyncio.Future`, resolves to `None` when the
+                      operation succeeds, otherwise fails with
+                      :any:`AsyncOperationFailedError`,
+                      :any:`AsyncOperationPollingTimeoutError`,
+                      :any:`OperationNotFoundError`, etc.
+        """
+
+        if isinstance(operation, AsyncOperationLinkObject):
+            if operation.href is None:
+                raise ValueError("OperationLinkObject has no link")
+
+            operation = operation.href
+
+        if not isinstance(operation, str):
+            future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            future.set_result(None)
+
+            return future
+
+        return self.operation_poller.submit(operation, poll_timeout=poll_timeout, **kwargs)
+
     async def wait_for_operation(
         self,
         operation_id: str,
         /,
         *,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         **kwargs
     ) -> None:
         """
@@ -2811,13 +4190,17 @@ class AsyncClient:
             exception is raised. Waiting is performed by calling :any:`asyncio.sleep`.
 
             :param operation_id: ID of the operation or a link
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2830,9 +4213,11 @@ class AsyncClient:
                                                        (when `poll_timeout` is not `None`)
         """
 
+        intervals = _iter_poll_intervals(poll_interval, resource_size)
+
         async def poll() -> None:
             while (status := await self.get_operation_status(operation_id, **kwargs)) == "in-progress":
-                await asyncio.sleep(poll_interval)
+                await asyncio.sleep(next(intervals))
 
             if status != "success":
                 raise AsyncOperationFailedError("Asynchronous operation failed")
@@ -16,21 +16,31 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 from typing import Optional, Any, Union, Literal, overload
-from ._typing_compat import Dict, AsyncGenerator, Iterable, List, Tuple, Type
-
+from ._typing_compat import Callable, Dict, AsyncGenerator, Iterable, List, Tuple, Type
+
+from .bulk import TransferResult
+from .cache import LinkCache, MetaCache
+from .exceptions import YaDiskError
+from .polling import AsyncOperationPoller
+from .circuit import CircuitBreakers
+from .hedging import HedgingPolicy
+from .pool import PoolConfig
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .objects import (
     DeviceCodeObject, TokenObject, TokenRevokeStatusObject,
     DiskInfoObject, AsyncResourceObject, AsyncResourceLinkObject,
     AsyncOperationLinkObject, AsyncTrashResourceObject, AsyncPublicResourceObject,
     AsyncPublicResourcesListObject, AsyncPublicResourceLinkObject,
-    ResourceUploadLinkObject, PublicAvailableSettingsObject, PublicSettingsObject
+    ResourceUploadLinkObject, PublicAvailableSettingsObject, PublicSettingsObject, ResourceObject
 )
 
 from .types import (
     AsyncFileOrPath, AsyncFileOrPathDestination, Headers, OperationStatus, AsyncSession,
     AsyncSessionName, AsyncSessionFactory, AsyncOpenFileCallback, TimeoutParameter,
-    PublicSettings
+    PollInterval, PublicSettings
 )
 
 __all__ = ["AsyncClient"]
@@ -43,6 +53,12 @@ class AsyncClient:
     default_args: Dict[str, Any]
     session: AsyncSession
     open_file: AsyncOpenFileCallback
+    link_cache: Optional[LinkCache]
+    meta_cache: Optional[MetaCache]
+    rate_limiter: Optional[RateLimiter]
+    circuit_breakers: Optional[CircuitBreakers]
+    hedging: Optional[HedgingPolicy]
+    operation_poller: AsyncOperationPoller
 
     synchronous = False
 
@@ -52,10 +68,16 @@ class AsyncClient:
         secret: str = "",
         token:  str = "",
         *,
-        default_args:    Optional[Dict[str, Any]] = None,
-        session:         Optional[Union[AsyncSession, AsyncSessionName]] = None,
-        open_file:       Optional[AsyncOpenFileCallback] = None,
-        session_factory: Optional[AsyncSessionFactory] = None
+        default_args:     Optional[Dict[str, Any]] = None,
+        session:          Optional[Union[AsyncSession, AsyncSessionName]] = None,
+        open_file:        Optional[AsyncOpenFileCallback] = None,
+        session_factory:  Optional[AsyncSessionFactory] = None,
+        link_cache:       Optional[LinkCache] = None,
+        meta_cache:       Optional[MetaCache] = None,
+        rate_limiter:     Optional[RateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedging:          Optional[HedgingPolicy] = None,
+        pool_config:      Optional[PoolConfig] = None
     ) -> None:
         ...
 
@@ -106,6 +128,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -124,6 +147,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -142,6 +166,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -158,6 +183,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -174,6 +200,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -190,6 +217,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -206,6 +234,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -228,6 +257,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -244,6 +274,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -251,6 +282,50 @@ class AsyncClient:
     ) -> bool:
         ...
 
+    async def get_meta_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        preview_size: Optional[str] = None,
+        preview_crop: Optional[bool] = None,
+        sort: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[Union[AsyncResourceObject, YaDiskError]]:
+        ...
+
+    async def exists_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[Union[bool, YaDiskError]]:
+        ...
+
     async def get_type(
         self,
         path: str,
@@ -260,6 +335,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -276,6 +352,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -292,6 +369,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -305,6 +383,7 @@ class AsyncClient:
         /,
         *,
         max_items: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -315,6 +394,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -324,6 +404,33 @@ class AsyncClient:
         # an async generator, rather than a simple async function
         yield AsyncResourceObject()
 
+    async def walk(
+        self,
+        path: str,
+        /,
+        *,
+        max_concurrency: int = 8,
+        onerror: Optional[Callable[[Exception], Any]] = None,
+        limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        preview_size: Optional[str] = None,
+        preview_crop: Optional[bool] = None,
+        sort: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncGenerator[Tuple[str, List[AsyncResourceObject], List[AsyncResourceObject]], None]:
+        # This line here is needed so that the type checker knows that this is
+        # an async generator, rather than a simple async function
+        yield "", [], []
+
     async def get_upload_link(
         self,
         path: str,
@@ -335,6 +442,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -354,6 +462,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -373,6 +482,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -380,6 +490,27 @@ class AsyncClient:
     ) -> AsyncResourceLinkObject:
         ...
 
+    async def upload_tree(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        overwrite: bool = False,
+        spoof_user_agent: bool = True,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[TransferResult]:
+        ...
+
     async def upload_by_link(
         self,
         file_or_path: AsyncFileOrPath,
@@ -390,6 +521,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -406,6 +538,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -419,10 +552,14 @@ class AsyncClient:
         file_or_path: AsyncFileOrPathDestination,
         /,
         *,
+        parallel_segments: Optional[int] = None,
+        segment_size: Optional[int] = None,
+        max_in_flight_bytes: Optional[int] = None,
         headers: Optional[Headers] = None,
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -440,6 +577,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -447,6 +585,47 @@ class AsyncClient:
     ) -> None:
         ...
 
+    async def download_resource(
+        self,
+        resource: ResourceObject,
+        file_or_path: AsyncFileOrPathDestination,
+        /,
+        *,
+        parallel_segments: Optional[int] = None,
+        segment_size: Optional[int] = None,
+        max_in_flight_bytes: Optional[int] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncResourceLinkObject:
+        ...
+
+    async def download_tree(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        check_md5: bool = False,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[TransferResult]:
+        ...
+
     @overload
     async def remove(
         self,
@@ -454,7 +633,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         md5: Optional[str] = None,
         force_async: Literal[True],
@@ -463,6 +642,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -477,7 +657,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         md5: Optional[str] = None,
         force_async: bool = False,
@@ -486,6 +666,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -503,6 +684,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -520,6 +702,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -542,6 +725,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -558,6 +742,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -573,8 +758,9 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -582,6 +768,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -597,8 +784,9 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -606,6 +794,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -621,7 +810,7 @@ class AsyncClient:
         dst_path: Optional[str] = None,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: Literal[True],
@@ -630,6 +819,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -645,7 +835,7 @@ class AsyncClient:
         dst_path: Optional[str] = None,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: bool = False,
@@ -654,6 +844,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -669,8 +860,9 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -678,6 +870,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -693,8 +886,9 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -702,6 +896,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -717,8 +912,9 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -726,6 +922,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -741,8 +938,9 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -750,6 +948,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -764,7 +963,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -772,6 +971,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -786,7 +986,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -794,6 +994,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -812,6 +1013,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -829,6 +1031,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -845,6 +1048,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -860,6 +1064,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -876,6 +1081,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -890,7 +1096,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         name: Optional[str] = None,
         path: Optional[str] = None,
@@ -901,6 +1107,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -915,7 +1122,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         name: Optional[str] = None,
         path: Optional[str] = None,
@@ -926,6 +1133,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -949,6 +1157,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -972,6 +1181,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -986,6 +1196,7 @@ class AsyncClient:
         *,
         path: Optional[str] = None,
         max_items: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -996,6 +1207,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1015,6 +1227,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1032,6 +1245,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1049,6 +1263,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1063,6 +1278,8 @@ class AsyncClient:
         *,
         limit: Optional[int] = None,
         max_items: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        prefetch: int = 0,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
         preview_crop: Optional[bool] = None,
@@ -1072,6 +1289,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1090,6 +1308,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1106,6 +1325,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1122,6 +1342,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1142,6 +1363,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1153,6 +1375,7 @@ class AsyncClient:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -1163,6 +1386,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1181,6 +1405,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1192,6 +1417,8 @@ class AsyncClient:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
+        parallel_partitions: bool = False,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         media_type: Optional[Union[str, Iterable[str]]] = None,
@@ -1203,6 +1430,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1224,6 +1452,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1237,7 +1466,7 @@ class AsyncClient:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         disable_redirects: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1245,6 +1474,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1261,6 +1491,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1279,6 +1510,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1294,6 +1526,7 @@ class AsyncClient:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1301,17 +1534,37 @@ class AsyncClient:
     ) -> OperationStatus:
         ...
 
+    def track_operation(
+        self,
+        operation: Union[str, AsyncOperationLinkObject, AsyncResourceLinkObject, None],
+        /,
+        *,
+        poll_timeout: Optional[float] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        aiohttp_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> asyncio.Future[None]:
+        ...
+
     async def wait_for_operation(
         self,
         operation_id: str,
         /,
         *,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         headers: Optional[Headers] = None,
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -22,7 +22,8 @@ from .types import (
     AsyncConsumeCallback, JSON, HTTPMethod, AsyncPayload, Headers, TimeoutParameter
 )
 from .objects import ErrorObject
-from .utils import get_exception
+from .utils import CaseInsensitiveDict, get_exception
+from .pool import PoolStats
 
 if TYPE_CHECKING:  # pragma: no cover
     from .exceptions import YaDiskError
@@ -38,16 +39,19 @@ class AsyncResponse:
         derived from :any:`YaDiskError`.
 
         :ivar status: `int`, HTTP status code
+        :ivar headers: :any:`CaseInsensitiveDict`, response headers
     """
 
     _Self = TypeVar("_Self", bound="AsyncResponse")
 
     status: int
+    headers: CaseInsensitiveDict
 
     def __init__(self) -> None:
         """Constructs an :any:`AsyncResponse` object."""
 
         self.status = 0
+        self.headers = CaseInsensitiveDict()
 
     async def json(self) -> JSON:
         """
@@ -156,6 +160,17 @@ class AsyncSession:
         """
         raise NotImplementedError
 
+    def get_pool_stats(self) -> PoolStats:
+        """
+            Returns statistics of the connection pool.
+
+            .. note::
+               This is an abstract method that needs to be implemented.
+
+            :returns: :any:`PoolStats`
+        """
+        raise NotImplementedError
+
     async def close(self) -> None:
         """
             Closes the session.
@@ -16,17 +16,21 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+import os
 from pathlib import PurePosixPath
 import posixpath
+import threading
 import time
 from urllib.parse import urlencode
 
 from ._api import *
 
 from .exceptions import (
-    AsyncOperationFailedError, AsyncOperationPollingTimeoutError, ParentNotFoundError,
-    PathNotFoundError, RetriableYaDiskError, UnauthorizedError,
-    OperationNotFoundError, InvalidResponseError, WrongResourceTypeError
+    AsyncOperationFailedError, AsyncOperationPollingTimeoutError, DirectoryExistsError, ParentNotFoundError,
+    PathNotFoundError, RequestError, RetriableYaDiskError, UnauthorizedError,
+    OperationNotFoundError, InvalidResponseError, WrongResourceTypeError, YaDiskError
 )
 
 from .utils import auto_retry, CaseInsensitiveDict
@@ -36,29 +40,40 @@ from .objects import (
     SyncLastUploadedResourceListObject, SyncOperationLinkObject,
     SyncPublicResourceObject, SyncPublicResourcesListObject, DiskInfoObject,
     TokenObject, TokenRevokeStatusObject, DeviceCodeObject, ResourceUploadLinkObject,
-    PublicSettingsObject, PublicAvailableSettingsObject
+    PublicSettingsObject, PublicAvailableSettingsObject, ResourceObject
 )
 
 from ._session import Session
 from ._import_session import import_session
+from .polling import OperationPoller, _iter_poll_intervals
 
 from . import settings
 
 from typing import Any, Optional, Union, Literal
-from ._typing_compat import Callable, Generator, Dict, List, Type
+from ._typing_compat import Callable, Deque, Generator, Dict, Iterable, List, Set, Tuple, Type
 from .types import (
-    OpenFileCallback, FileOrPath, FileOrPathDestination, OperationStatus, PublicSettings,
-    SessionFactory, SessionName
+    OpenFileCallback, FileOrPath, FileOrPathDestination, OperationStatus, PollInterval,
+    PublicSettings, SessionFactory, SessionName, TransferStatus
 )
 
 from ._client_common import (
-    _add_spoof_user_agent_header, _apply_default_args, _filter_request_kwargs,
-    _read_file_as_generator, _set_authorization_header,
-    _add_authorization_header, _validate_listdir_response,
-    _validate_link_response, _validate_get_type_response
+    _CachedLinkFunction, _KnownDirectories, _RangeIgnoredError, _add_spoof_user_agent_header, _apply_default_args,
+    _filter_request_kwargs, _get_circuit_breaker_kwargs, _get_download_tree_fields, _get_link, _get_partitions,
+    _get_path_prefixes, _get_rate_limiter_retry_on, _get_remaining_pages, _invalidate_link, _invalidating_link_on_error,
+    _is_local_copy_up_to_date, _is_resumed_response, _iter_local_tree_files, _make_not_found_error, _make_segments,
+    _plan_meta_lookups, _read_file_as_generator, _report_to_rate_limiter, _scan_local_tree, _set_authorization_header,
+    _set_local_mtime, _add_authorization_header, _throttled_payload, _validate_listdir_response,
+    _validate_link_response, _validate_get_type_response, _walk_kwargs
 )
 
 from ._common import remove_path_schema
+from .batch import Batch
+from .bulk import TransferResult
+from .cache import LinkCache, MetaCache
+from .circuit import CircuitBreakers
+from .hedging import HedgingPolicy
+from .pool import PoolConfig
+from .ratelimit import RateLimiter
 
 __all__ = ["Client"]
 
@@ -105,8 +120,14 @@ def _listdir(
     /,
     *,
     max_items: Optional[int] = None,
+    page_concurrency: Optional[int] = None,
+    prefetch: int = 0,
     **kwargs
 ) -> Generator[Any, None, None]:
+    # Prefetching N pages is the same as keeping N + 1 pages in flight
+    if prefetch > 0:
+        page_concurrency = max(page_concurrency or 1, prefetch + 1)
+
     if kwargs.get("limit") is None:
         kwargs["limit"] = 500
 
@@ -142,6 +163,42 @@ def _listdir(
     offset: int = result.embedded.offset  # type: ignore[assignment,union-attr]
     total: int = result.embedded.total  # type: ignore[assignment,union-attr]
 
+    if page_concurrency is not None and page_concurrency > 1:
+        if remaining_items is not None:
+            remaining_items -= len(result.embedded.items)  # type: ignore[union-attr,arg-type]
+
+        def get_page(page_offset: int, page_limit: int) -> List[Any]:
+            page_kwargs = dict(kwargs)
+            page_kwargs["offset"] = page_offset
+            page_kwargs["limit"] = page_limit
+
+            page = get_meta_function(path, _then=_validate_listdir_response, **page_kwargs)
+
+            if page.type == "file":
+                raise WrongResourceTypeError("%r is a file" % (path,))
+
+            return page.embedded.items[:page_limit]  # type: ignore[union-attr,index]
+
+        # Pages are requested concurrently, but yielded in order.
+        # At most page_concurrency pages are in flight or waiting to be consumed
+        with ThreadPoolExecutor(max_workers=page_concurrency) as executor:
+            futures: Deque[Future] = deque()
+
+            try:
+                for page_offset, page_limit in _get_remaining_pages(offset, limit, total, remaining_items):
+                    if len(futures) >= page_concurrency:
+                        yield from futures.popleft().result()
+
+                    futures.append(executor.submit(get_page, page_offset, page_limit))
+
+                while futures:
+                    yield from futures.popleft().result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return
+
     while offset + limit < total:
         if remaining_items is not None:
             remaining_items -= len(result.embedded.items)  # type: ignore[union-attr,arg-type]
@@ -167,6 +224,164 @@ def _listdir(
         total = result.embedded.total  # type: ignore[assignment,union-attr]
 
 
+def _paginate(
+    get_page: Callable[[int, int], List[Any]],
+    offset: int,
+    limit: int,
+    *,
+    max_items: Optional[int] = None,
+    prefetch: int = 0
+) -> Generator[Any, None, None]:
+    # Yields items of consecutive pages until there is an incomplete page or max_items is reached.
+    # If prefetch > 0, up to prefetch pages that follow the current one are requested in the background
+    def get_pages() -> Generator[Tuple[int, int], None, None]:
+        page_offset, remaining_items = offset, max_items
+
+        while remaining_items is None or remaining_items > 0:
+            # Do not query more items than necessary
+            page_limit = limit if remaining_items is None else min(remaining_items, limit)
+
+            yield page_offset, page_limit
+
+            page_offset += page_limit
+
+            if remaining_items is not None:
+                remaining_items -= page_limit
+
+    if prefetch <= 0:
+        for page_offset, page_limit in get_pages():
+            items = get_page(page_offset, page_limit)
+
+            yield from items[:page_limit]
+
+            if len(items) < page_limit:
+                break
+
+        return
+
+    pages = get_pages()
+
+    with ThreadPoolExecutor(max_workers=prefetch + 1) as executor:
+        futures: Deque[Tuple[Future, int]] = deque()
+
+        try:
+            page = next(pages, None)
+
+            while page is not None or futures:
+                # Keep the current page and up to prefetch following pages in flight
+                while page is not None and len(futures) <= prefetch:
+                    futures.append((executor.submit(get_page, *page), page[1]))
+                    page = next(pages, None)
+
+                future, page_limit = futures.popleft()
+                items = future.result()
+
+                yield from items[:page_limit]
+
+                if len(items) < page_limit:
+                    break
+        finally:
+            for future, _ in futures:
+                future.cancel()
+
+
+def _paginate_partitioned(
+    get_page: Callable[[str, int, int], List[Any]],
+    partitions: List[str],
+    limit: int,
+    *,
+    max_items: Optional[int] = None
+) -> Generator[Any, None, None]:
+    # Every partition is paged sequentially, but different partitions are paged concurrently.
+    # Pages are yielded as soon as they arrive, so items of different partitions are interleaved
+    remaining_items = max_items
+
+    if not partitions or (remaining_items is not None and remaining_items <= 0):
+        return
+
+    with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+        pending: Dict[Future, Tuple[str, int]] = {
+            executor.submit(get_page, partition, 0, limit): (partition, 0) for partition in partitions
+        }
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    partition, offset = pending.pop(future)
+                    items = future.result()[:limit]
+
+                    if len(items) == limit:
+                        next_offset = offset + limit
+                        next_page = executor.submit(get_page, partition, next_offset, limit)
+                        pending[next_page] = (partition, next_offset)
+
+                    if remaining_items is not None:
+                        items = items[:remaining_items]
+                        remaining_items -= len(items)
+
+                    yield from items
+
+                    if remaining_items is not None and remaining_items <= 0:
+                        return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+WalkResult = Tuple[str, List["SyncResourceObject"], List["SyncResourceObject"]]
+
+
+def _walk(
+    listdir_function: Callable[..., Generator[Any, None, None]],
+    path: str,
+    /,
+    *,
+    max_concurrency: int = 8,
+    onerror: Optional[Callable[[Exception], None]] = None,
+    **kwargs
+) -> Generator[WalkResult, None, None]:
+    kwargs = _walk_kwargs(kwargs)
+
+    def list_directory(dirpath: str) -> WalkResult:
+        dirs, files = [], []
+
+        for child in listdir_function(dirpath, **kwargs):
+            if child.type == "dir":
+                dirs.append(child)
+            else:
+                files.append(child)
+
+        return dirpath, dirs, files
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending: Set[Future] = {executor.submit(list_directory, path)}
+
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    try:
+                        dirpath, dirs, files = future.result()
+                    except Exception as e:
+                        if onerror is None:
+                            raise
+
+                        onerror(e)
+                        continue
+
+                    yield dirpath, dirs, files
+
+                    # Subdirectories are only expanded after the caller had a chance to prune them
+                    for directory in dirs:
+                        pending.add(executor.submit(list_directory, posixpath.join(dirpath, directory.name)))
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 class Client:
     """
         Implements access to Yandex.Disk REST API (provides synchronous API).
@@ -180,6 +395,8 @@ class Client:
 
         * **n_retries** - `int`, maximum number of retries for a request
         * **retry_interval** - `float`, delay between retries (in seconds)
+        * **retry_policy** - :any:`RetryPolicy` or `None`, computes delays between
+          retries (takes precedence over **retry_interval**)
         * **headers** - `dict` or `None`, additional request headers
         * **timeout** - `tuple` (:code:`(<connect timeout>, <read timeout>)`) or
           `float` (specifies both connect and read timeout), request timeout
@@ -207,6 +424,22 @@ class Client:
                           writing (:code:`open()` by default)
         :param session_factory: kept for compatibility, callable that returns an
                                 instance of :any:`Session`
+        :param link_cache: `None` or :any:`LinkCache`, if specified, upload and
+                           download links are reused by retries and repeated
+                           downloads of the same file
+        :param meta_cache: `None` or :any:`MetaCache`, if specified, results of
+                           :any:`Client.get_meta()` are cached and invalidated
+                           when this client modifies the resources
+        :param circuit_breakers: `None` or :any:`CircuitBreakers`, if specified, failing
+                                 endpoints are not retried and temporarily cut off
+        :param rate_limiter: `None` or :any:`RateLimiter`, if specified, API
+                             requests and transferred bytes are throttled, and
+                             :any:`TooManyRequestsError` is retried after slowing down
+        :param hedging: `None` or :any:`HedgingPolicy`, if specified, slow idempotent
+                        metadata requests are duplicated and the first response is used
+        :param pool_config: `None` or :any:`PoolConfig`, connection pool settings,
+                            passed to the session created by the client (can't be used
+                            together with an existing :code:`session` or :code:`session_factory`)
 
         :ivar id: `str`, application ID
         :ivar secret: `str`, application secret password
@@ -216,6 +449,13 @@ class Client:
         :ivar session: current session (:any:`Session` instance)
         :ivar open_file: function that opens a file for reading or writing
                          (:code:`open()` by default)
+        :ivar link_cache: :any:`LinkCache` or `None`, cache of upload/download links
+        :ivar meta_cache: :any:`MetaCache` or `None`, cache of resource metadata
+        :ivar rate_limiter: :any:`RateLimiter` or `None`, throttles requests and transfers
+        :ivar circuit_breakers: :any:`CircuitBreakers` or `None`, circuit breakers and retry budget
+        :ivar hedging: :any:`HedgingPolicy` or `None`, hedging of idempotent metadata requests
+        :ivar operation_poller: :any:`OperationPoller`, tracks operations passed
+                                to :any:`Client.track_operation()`
 
         The following exceptions may be raised by most API requests:
 
@@ -244,6 +484,12 @@ class Client:
     default_args: Dict[str, Any]
     session: Session
     open_file: OpenFileCallback
+    link_cache: Optional[LinkCache]
+    meta_cache: Optional[MetaCache]
+    rate_limiter: Optional[RateLimiter]
+    circuit_breakers: Optional[CircuitBreakers]
+    hedging: Optional[HedgingPolicy]
+    operation_poller: OperationPoller
 
     synchronous = True
 
@@ -252,27 +498,48 @@ class Client:
                  secret: str = "",
                  token:  str = "",
                  *,
-                 default_args:    Optional[Dict[str, Any]] = None,
-                 session:         Optional[Union[Session, SessionName]] = None,
-                 open_file:       Optional[OpenFileCallback] = None,
-                 session_factory: Optional[SessionFactory] = None) -> None:
+                 default_args:     Optional[Dict[str, Any]] = None,
+                 session:          Optional[Union[Session, SessionName]] = None,
+                 open_file:        Optional[OpenFileCallback] = None,
+                 session_factory:  Optional[SessionFactory] = None,
+                 link_cache:       Optional[LinkCache] = None,
+                 meta_cache:       Optional[MetaCache] = None,
+                 rate_limiter:     Optional[RateLimiter] = None,
+                 circuit_breakers: Optional[CircuitBreakers] = None,
+                 hedging:          Optional[HedgingPolicy] = None,
+                 pool_config:      Optional[PoolConfig] = None) -> None:
         self.id = id
         self.secret = secret
         self.token = ""
 
         self.default_args = {} if default_args is None else default_args
+        self.link_cache = link_cache
+        self.meta_cache = meta_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.hedging = hedging
+        self._known_dirs = _KnownDirectories()
+        self.operation_poller = OperationPoller(self)
 
         if open_file is None:
             open_file = open
 
         self.open_file = open_file
 
+        session_kwargs: Dict[str, Any] = {}
+
+        if pool_config is not None:
+            if (session is not None and not isinstance(session, str)) or session_factory is not None:
+                raise ValueError("pool_config can only be used when the client creates the session")
+
+            session_kwargs["pool_config"] = pool_config
+
         if session is None:
             if session_factory is not None:
                 session = session_factory()
             else:
                 try:
-                    session = import_session("requests")()
+                    session = import_session("requests")(**session_kwargs)
                 except ModuleNotFoundError as e:
                     if e.name == "requests":
                         raise ModuleNotFoundError(
@@ -282,7 +549,7 @@ class Client:
                     else:
                         raise
         elif isinstance(session, str):
-            session = import_session(session)()
+            session = import_session(session)(**session_kwargs)
 
         self.session = session
         self.token = token
@@ -295,23 +562,37 @@ class Client:
 
     def close(self) -> None:
         """
-            Closes the session.
+            Closes the session, stops :any:`Client.operation_poller` and
+            shuts down the thread pool of :any:`Client.hedging`.
             Do not call this method while there are other active threads using this object.
 
             This method can also be called implicitly by using the `with`
             statement.
         """
 
+        self.operation_poller.close()
+
+        if self.hedging is not None:
+            self.hedging.close()
+
         self.session.close()
 
+    def _invalidate_meta(self, *paths: str) -> None:
+        if self.meta_cache is None:
+            return
+
+        for path in paths:
+            self.meta_cache.invalidate(path)
+
     def _maybe_wait(
         self,
         request_class: Type[APIRequest],
         /,
         *args,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         **kwargs
     ) -> Any:
         request = request_class(self.session, *args, **kwargs)
@@ -332,6 +613,7 @@ class Client:
                     response.wait(
                         poll_interval=poll_interval,
                         poll_timeout=poll_timeout,
+                        resource_size=resource_size,
                         **kwargs
                     )
                 except RetriableYaDiskError as e:
@@ -509,6 +791,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -538,6 +821,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -575,6 +859,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -611,6 +896,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -650,6 +936,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -684,6 +971,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -723,6 +1011,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -759,6 +1048,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -782,7 +1072,31 @@ class Client:
         # This is for internal error handling
         _then = kwargs.pop("_then", None)
 
-        return GetMetaRequest(self.session, path, **kwargs).send(yadisk=self, then=_then)
+        if self.meta_cache is None:
+            return GetMetaRequest(self.session, path, **kwargs).send(yadisk=self, then=_then)
+
+        hit, resource_json = self.meta_cache.get(path, kwargs)
+
+        if hit:
+            if resource_json is None:
+                raise _make_not_found_error(path)
+
+            result = SyncResourceObject(resource_json, yadisk=self)
+
+            return _then(result) if _then is not None else result
+
+        request = GetMetaRequest(self.session, path, **kwargs)
+
+        # _then() runs within the retry scope of the request, same as without the cache
+        try:
+            return request.send(yadisk=self, then=_then)
+        except PathNotFoundError:
+            self.meta_cache.put(path, kwargs, None)
+            raise
+        finally:
+            # The response is cached even if it was rejected by _then()
+            if request.response_json is not None:
+                self.meta_cache.put(path, kwargs, request.response_json)
 
     def exists(self, path: str, /, **kwargs) -> bool:
         """
@@ -793,6 +1107,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -806,6 +1121,150 @@ class Client:
 
         return _exists(self.get_meta, path, **kwargs)
 
+    def get_meta_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        **kwargs
+    ) -> List[Union["SyncResourceObject", YaDiskError]]:
+        """
+            Get meta information about multiple files/directories at once.
+
+            Repeated paths are only requested once, the lookups are done
+            concurrently (in a thread pool). Errors do not interrupt the other lookups,
+            instead, the exception is put in place of the result.
+
+            If :code:`fields` is specified and at least :code:`sibling_threshold`
+            of the paths share the same parent directory, they are looked up by a
+            single :any:`Client.listdir()` of the parent instead. Listed children
+            don't contain their own children (:code:`embedded`), which is why
+            this requires :code:`fields` to be specified.
+
+            :param paths: iterable of paths to the resources
+            :param max_concurrency: `int`, maximum number of concurrent requests
+            :param sibling_threshold: `int` or `None`, minimum number of paths with a
+                                      common parent to list the parent instead,
+                                      `None` disables listing
+            :param fields: list of keys to be included in the response
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :returns: `list` of :any:`SyncResourceObject` or :any:`YaDiskError` (e.g.,
+                      :any:`PathNotFoundError`), in the order of :code:`paths`
+        """
+
+        if kwargs.get("fields") is None:
+            sibling_threshold = None
+
+        normalized, individual, batches = _plan_meta_lookups(paths, sibling_threshold)
+
+        results: Dict[str, Union["SyncResourceObject", YaDiskError]] = {}
+
+        def get_one(path: str) -> None:
+            try:
+                results[path] = self.get_meta(path, **kwargs)
+            except YaDiskError as e:
+                results[path] = e
+
+        def get_siblings(parent: str, children: List[str]) -> None:
+            remaining = {posixpath.basename(child): child for child in children}
+
+            try:
+                for child in self.listdir(parent, **_walk_kwargs(kwargs)):
+                    path = remaining.pop(child.name, None)  # type: ignore[arg-type]
+
+                    if path is not None:
+                        results[path] = child
+
+                    if not remaining:
+                        break
+            except PathNotFoundError as e:
+                # The parent doesn't exist, so its children don't either
+                for path in remaining.values():
+                    results[path] = e
+
+                return
+            except YaDiskError:
+                # E.g., the parent is a file, look up the children individually
+                pass
+            else:
+                for path in remaining.values():
+                    results[path] = _make_not_found_error(path)
+
+                return
+
+            for path in remaining.values():
+                get_one(path)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(get_one, path) for path in individual]
+            futures.extend(executor.submit(get_siblings, parent, children) for parent, children in batches.items())
+
+            for future in futures:
+                future.result()
+
+        return [results[path] for path in normalized]
+
+    def exists_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        **kwargs
+    ) -> List[Union[bool, YaDiskError]]:
+        """
+            Check whether multiple paths exist, see :any:`Client.get_meta_many()`.
+
+            :param paths: iterable of paths to the resources
+            :param max_concurrency: `int`, maximum number of concurrent requests
+            :param sibling_threshold: `int` or `None`, minimum number of paths with a
+                                      common parent to list the parent instead,
+                                      `None` disables listing
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :returns: `list` of `bool` or :any:`YaDiskError` (if the existence
+                      could not be determined), in the order of :code:`paths`
+        """
+
+        results = self.get_meta_many(
+            paths, max_concurrency=max_concurrency, sibling_threshold=sibling_threshold,
+            fields=["type"], **kwargs
+        )
+
+        exists: List[Union[bool, YaDiskError]] = []
+
+        for result in results:
+            if isinstance(result, PathNotFoundError):
+                exists.append(False)
+            elif isinstance(result, YaDiskError):
+                exists.append(result)
+            else:
+                exists.append(True)
+
+        return exists
+
     def get_type(self, path: str, /, **kwargs) -> str:
         """
             Get resource type.
@@ -815,6 +1274,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -838,6 +1298,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -863,6 +1324,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -885,6 +1347,10 @@ class Client:
 
             :param path: path to the directory
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param page_concurrency: `int` or `None`, if greater than 1, the pages
+                                     following the first one are requested concurrently
+                                     (at most :code:`page_concurrency` at a time), the
+                                     items are still returned in order
             :param limit: number of children resources to be included in the response
             :param offset: number of children resources to be skipped in the response
             :param preview_size: size of the file preview
@@ -894,6 +1360,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -909,6 +1376,54 @@ class Client:
 
         return _listdir(self.get_meta, path, **kwargs)
 
+    def walk(self, path: str, /, **kwargs) -> Generator[WalkResult, None, None]:
+        """
+            Recursively walk the directory tree, similar to :any:`os.walk`.
+
+            For every directory (starting from `path` itself) yields a tuple
+            :code:`(dirpath, dirs, files)`, where :code:`dirs` and :code:`files`
+            are lists of :any:`ResourceObject` for subdirectories and files.
+            Paths of subdirectories are obtained by joining :code:`dirpath`
+            and their names.
+
+            Directories are listed concurrently in a thread pool, so they are
+            yielded in the order their listings complete, though each directory
+            is always yielded before its subdirectories. Subdirectories are only
+            listed after their parent has been yielded, so the caller can
+            remove entries from :code:`dirs` in-place to skip them.
+
+            :param path: path to the top directory
+            :param max_concurrency: `int`, maximum number of directories
+                                    being listed at the same time (8 by default)
+            :param onerror: `None` or a function that takes an exception, if
+                            specified, it is called when a directory could not
+                            be listed and the directory is skipped, otherwise
+                            the exception is raised
+            :param limit: number of children resources to be queried in one request
+            :param page_concurrency: `int` or `None`, number of pages of a single
+                                     directory to be requested concurrently, see :any:`Client.listdir()`
+            :param fields: list of keys to be included in each child resource,
+                           :code:`name` and :code:`type` are always included
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises PathNotFoundError: resource was not found on Disk
+            :raises ForbiddenError: application doesn't have enough rights for this request
+            :raises WrongResourceTypeError: resource is not a directory
+
+            :returns: generator of :code:`(dirpath, dirs, files)` tuples
+        """
+
+        return _walk(self.listdir, path, **kwargs)
+
     def get_upload_link(
         self,
         path: str,
@@ -928,6 +1443,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -983,6 +1499,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1062,12 +1579,17 @@ class Client:
             elif iterator_factory is None:
                 n_retries, n_retries_for_upload_link = 0, n_retries
 
+            # Whether the link of the last attempt was taken from the cache
+            link_cached = False
+
             def attempt() -> None:
+                nonlocal link_cached
+
                 temp_kwargs = dict(kwargs)
                 temp_kwargs["n_retries"] = n_retries_for_upload_link
                 temp_kwargs["retry_interval"] = 0.0
 
-                link = get_upload_link_function(dst_path, **temp_kwargs)
+                link, link_cached = _get_link(get_upload_link_function, dst_path, **temp_kwargs)
 
                 # session.put() doesn't accept some of the passed parameters
                 _filter_request_kwargs(temp_kwargs)
@@ -1094,13 +1616,25 @@ class Client:
                     # To bypass this problem we pass the file as a generator instead.
                     payload = _read_file_as_generator(file)
 
+                if self.rate_limiter is not None and self.rate_limiter.bytes is not None:
+                    payload = _throttled_payload(payload, self.rate_limiter)
+
                 settings.logger.info(f"uploading file to {dst_path} at {link}")
 
                 with session.send_request("PUT", link, data=payload, **temp_kwargs) as response:
                     if response.status != 201:
-                        raise response.get_exception()
+                        raise _report_to_rate_limiter(self.rate_limiter, response.get_exception())
+
+                # Upload links can't be used more than once
+                _invalidate_link(get_upload_link_function, dst_path)
 
-            auto_retry(attempt, n_retries, retry_interval)
+            auto_retry(
+                _invalidating_link_on_error(attempt, get_upload_link_function, dst_path, lambda: link_cached),
+                n_retries, retry_interval,
+                retry_on=_get_rate_limiter_retry_on(self.rate_limiter),
+                retry_policy=kwargs.get("retry_policy"),
+                **_get_circuit_breaker_kwargs(self.circuit_breakers, "upload")
+            )
         finally:
             if close_file and file is not None:
                 file.close()
@@ -1127,6 +1661,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1145,10 +1680,150 @@ class Client:
 
         _apply_default_args(kwargs, self.default_args)
 
-        self._upload(self.get_upload_link, file_or_path, dst_path, **kwargs)
+        get_upload_link: Callable = self.get_upload_link
+
+        if self.link_cache is not None:
+            get_upload_link = _CachedLinkFunction(
+                self.get_upload_link, self.link_cache, "upload", kwargs.get("overwrite", False)
+            )
+
+        try:
+            self._upload(get_upload_link, file_or_path, dst_path, **kwargs)
+        finally:
+            self._invalidate_meta(dst_path)
+
+        if self.link_cache is not None:
+            # The file has changed, its download link might be outdated now
+            self.link_cache.invalidate(dst_path, operation="download")
 
         return SyncResourceLinkObject.from_path(dst_path, yadisk=self)
 
+    def upload_tree(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        overwrite: bool = False,
+        **kwargs
+    ) -> List[TransferResult]:
+        """
+            Upload a local directory tree to Disk.
+
+            Each remote directory is created exactly once (an existing directory
+            is not considered an error) and only after its parent, files are
+            uploaded as soon as their directory exists. Directories are
+            created and files are uploaded concurrently in a thread pool.
+
+            A failed upload doesn't stop the others, errors are reported in the
+            returned list instead. If a directory could not be created, all the
+            files inside of it are reported as failed with the same error.
+
+            :param local_dir: path to the local directory
+            :param remote_dir: path to the destination directory on Disk,
+                               it is created (recursively) if it doesn't exist
+            :param max_workers: `int`, maximum number of concurrent requests
+            :param overwrite: `bool`, if `True`, existing files will be overwritten,
+                              otherwise they are reported as failed
+            :param spoof_user_agent: `bool`, if `True` (default), the `User-Agent` header
+                will be set to a special value, which should allow bypassing of
+                Yandex.Disk's upload speed limit
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises NotADirectoryError: :code:`local_dir` is not a directory
+
+            :returns: `list` of :any:`TransferResult`, one for each local file
+        """
+
+        _apply_default_args(kwargs, self.default_args)
+
+        tree = _scan_local_tree(local_dir)
+
+        mkdir_kwargs = dict(kwargs)
+        mkdir_kwargs.pop("spoof_user_agent", None)
+
+        kwargs["overwrite"] = overwrite
+
+        get_upload_link: Callable = self.get_upload_link
+
+        if self.link_cache is not None:
+            get_upload_link = _CachedLinkFunction(self.get_upload_link, self.link_cache, "upload", overwrite)
+
+        def get_local_path(relpath: str) -> str:
+            return os.path.join(local_dir, *relpath.split("/"))
+
+        def get_remote_path(relpath: str) -> str:
+            return posixpath.join(remote_dir, relpath) if relpath else remote_dir
+
+        def create_directory(relpath: str) -> None:
+            try:
+                if relpath:
+                    self.mkdir(get_remote_path(relpath), **mkdir_kwargs)
+                else:
+                    self.makedirs(remote_dir, **mkdir_kwargs)
+            except DirectoryExistsError:
+                pass
+
+        def upload_file(relpath: str) -> None:
+            remote_path = get_remote_path(relpath)
+
+            try:
+                self._upload(get_upload_link, get_local_path(relpath), remote_path, **kwargs)
+            finally:
+                self._invalidate_meta(remote_path)
+
+            if self.link_cache is not None:
+                self.link_cache.invalidate(remote_path, operation="download")
+
+        results: Dict[str, TransferResult] = {}
+
+        def report(relpath: str, error: Optional[BaseException]) -> None:
+            results[relpath] = TransferResult(
+                get_local_path(relpath), get_remote_path(relpath),
+                "uploaded" if error is None else "failed", error
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Maps futures to relative paths and whether the path is a directory
+            pending: Dict[Future, Tuple[str, bool]] = {executor.submit(create_directory, ""): ("", True)}
+
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        relpath, is_dir = pending.pop(future)
+                        error = future.exception()
+
+                        if not is_dir:
+                            report(relpath, error)
+                        elif error is not None:
+                            for file_relpath in _iter_local_tree_files(tree, relpath):
+                                report(file_relpath, error)
+                        else:
+                            subdirs, files = tree[relpath]
+
+                            for subdir in subdirs:
+                                pending[executor.submit(create_directory, subdir)] = (subdir, True)
+
+                            for file_relpath in files:
+                                pending[executor.submit(upload_file, file_relpath)] = (file_relpath, False)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return [results[relpath] for relpath in _iter_local_tree_files(tree)]
+
     def upload_by_link(self,
                        file_or_path: FileOrPath,
                        link: str, /, **kwargs) -> None:
@@ -1164,6 +1839,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1186,6 +1862,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1260,43 +1937,276 @@ class Client:
             else:
                 n_retries, n_retries_for_download_link = 0, n_retries
 
+            # Number of bytes successfully written by previous attempts,
+            # retries continue from this point using range requests
+            written = 0
+
+            # Set to False if the server returned a wrong range
+            resume_enabled = True
+
+            # Whether the link of the last attempt was taken from the cache
+            link_cached = False
+
             def attempt() -> None:
+                nonlocal written, resume_enabled, link_cached
+
                 temp_kwargs = dict(kwargs)
                 temp_kwargs["n_retries"] = n_retries_for_download_link
                 temp_kwargs["retry_interval"] = 0.0
-                link = get_download_link_function(src_path, **temp_kwargs)
+                link, link_cached = _get_link(get_download_link_function, src_path, **temp_kwargs)
 
                 # session.get() doesn't accept some of the passed parameters
                 _filter_request_kwargs(temp_kwargs)
 
                 temp_kwargs.setdefault("stream", True)
 
+                resuming = written > 0 and resume_enabled and file.seekable()
+
+                if not resuming:
+                    written = 0
+
                 if file.seekable():
-                    file.seek(file_position)
+                    file.seek(file_position + written)
 
-                settings.logger.info(f"downloading file {src_path} from {link}")
+                if resuming:
+                    temp_kwargs["headers"] = CaseInsensitiveDict(temp_kwargs.get("headers") or {})
+                    temp_kwargs["headers"]["Range"] = f"bytes={written}-"
+
+                    settings.logger.info(f"resuming download of file {src_path} from {link} at byte {written}")
+                else:
+                    settings.logger.info(f"downloading file {src_path} from {link}")
 
                 with session.send_request("GET", link, **temp_kwargs) as response:
-                    # pycurl can't get status until the response is actually read
-                    # in that case, status will be set to 0
-                    if response.status == 0:
-                        def consume(chunk: bytes) -> None:
-                            if response.status not in (0, 200):
-                                return
+                    accepted: Optional[bool] = None
+
+                    def accept() -> bool:
+                        nonlocal accepted, written
+
+                        if accepted is not None:
+                            return accepted
+
+                        if resuming and _is_resumed_response(response.status, response.headers, written):
+                            accepted = True
+                        elif response.status == 200:
+                            if resuming:
+                                settings.logger.info("server ignored the Range header, restarting the download")
+
+                                file.seek(file_position)
+                                written = 0
+
+                            accepted = True
+                        else:
+                            accepted = False
+
+                        return accepted
+
+                    def consume(chunk: bytes) -> None:
+                        nonlocal written
+
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.wait_bytes(len(chunk))
+
+                        # pycurl can't get status until the response is actually read
+                        # in that case, status will be set to 0
+                        if response.status == 0 and not resuming:
+                            file.write(chunk)
+                            return
+
+                        if not accept():
+                            return
+
+                        file.write(chunk)
+                        written += len(chunk)
+
+                    def check_status() -> None:
+                        nonlocal resume_enabled
+
+                        if accept():
+                            return
+
+                        if response.status == 206:
+                            resume_enabled = False
+                            raise RequestError("Server returned an unexpected range, restarting the download")
 
+                        raise _report_to_rate_limiter(self.rate_limiter, response.get_exception())
+
+                    if response.status != 0:
+                        check_status()
+
+                    response.download(consume)
+
+                    check_status()
+
+            auto_retry(
+                _invalidating_link_on_error(attempt, get_download_link_function, src_path, lambda: link_cached),
+                n_retries, retry_interval,
+                retry_on=_get_rate_limiter_retry_on(self.rate_limiter),
+                retry_policy=kwargs.get("retry_policy"),
+                **_get_circuit_breaker_kwargs(self.circuit_breakers, "download")
+            )
+        finally:
+            if close_file and file is not None:
+                file.close()
+
+    def _download_segmented(
+        self,
+        get_download_link_function: Callable,
+        src_path: str,
+        file_or_path: FileOrPathDestination,
+        size: int,
+        /,
+        *,
+        parallel_segments: int,
+        segment_size: Optional[int] = None,
+        retry_cached_link: bool = True,
+        **kwargs
+    ) -> None:
+        if segment_size is None:
+            segment_size = settings.DEFAULT_DOWNLOAD_SEGMENT_SIZE
+
+        segments = _make_segments(size, segment_size)
+
+        n_retries = kwargs.get("n_retries")
+
+        if n_retries is None:
+            n_retries = settings.DEFAULT_N_RETRIES
+
+        retry_interval = kwargs.get("retry_interval")
+
+        if retry_interval is None:
+            retry_interval = settings.DEFAULT_RETRY_INTERVAL
+
+        retry_policy = kwargs.get("retry_policy")
+
+        timeout = kwargs.get("timeout", ...)
+
+        if timeout is ...:
+            timeout = settings.DEFAULT_TIMEOUT
+
+        kwargs["timeout"] = timeout
+
+        file: Any = None
+        close_file = False
+
+        session = self.session
+
+        try:
+            if isinstance(file_or_path, (str, bytes)):
+                close_file = True
+                file = self.open_file(file_or_path, "wb")
+            else:
+                close_file = False
+                file = file_or_path
+
+            # Segments can only be written at arbitrary offsets into seekable files
+            if len(segments) < 2 or not file.seekable():
+                return self._download(get_download_link_function, src_path, file, **kwargs)
+
+            file_position = file.tell()
+
+            link, link_cached = _get_link(get_download_link_function, src_path, **kwargs)
+
+            # Preallocate the destination file, but never shrink it
+            if file.seek(0, os.SEEK_END) < file_position + size:
+                try:
+                    file.truncate(file_position + size)
+                except OSError:
+                    pass
+
+            file_lock = threading.Lock()
+
+            request_kwargs = dict(kwargs)
+
+            # session.get() doesn't accept some of the passed parameters
+            _filter_request_kwargs(request_kwargs)
+
+            request_kwargs.setdefault("stream", True)
+
+            def download_segment(start: int, end: int) -> None:
+                def attempt() -> None:
+                    temp_kwargs = dict(request_kwargs)
+                    temp_kwargs["headers"] = CaseInsensitiveDict(temp_kwargs.get("headers") or {})
+                    temp_kwargs["headers"]["Range"] = f"bytes={start}-{end}"
+
+                    position = file_position + start
+
+                    def consume(chunk: bytes) -> None:
+                        nonlocal position
+
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.wait_bytes(len(chunk))
+
+                        # pycurl can't get status until the response is actually read
+                        # in that case, status will be set to 0
+                        if response.status not in (0, 206):
+                            return
+
+                        with file_lock:
+                            file.seek(position)
                             file.write(chunk)
 
+                        position += len(chunk)
+
+                    with session.send_request("GET", link, **temp_kwargs) as response:
+                        if response.status not in (0, 206):
+                            if response.status == 200:
+                                raise _RangeIgnoredError(msg="Server ignored the Range header")
+
+                            raise _report_to_rate_limiter(self.rate_limiter, response.get_exception())
+
                         response.download(consume)
 
-                        if response.status != 200:
-                            raise response.get_exception()
-                    else:
-                        if response.status != 200:
-                            raise response.get_exception()
+                        if response.status == 200:
+                            raise _RangeIgnoredError(msg="Server ignored the Range header")
+                        elif response.status != 206:
+                            raise _report_to_rate_limiter(self.rate_limiter, response.get_exception())
+
+                    received = position - file_position - start
+
+                    if received != end - start + 1:
+                        raise RequestError(f"Incomplete segment: expected {end - start + 1} bytes, got {received}")
 
-                        response.download(file.write)
+                auto_retry(
+                    attempt, n_retries, retry_interval,
+                    retry_on=_get_rate_limiter_retry_on(self.rate_limiter),
+                    retry_policy=retry_policy,
+                    **_get_circuit_breaker_kwargs(self.circuit_breakers, "download")
+                )
 
-            auto_retry(attempt, n_retries, retry_interval)
+            settings.logger.info(
+                f"downloading file {src_path} from {link} in {len(segments)} segments, "
+                f"using {parallel_segments} parallel connections"
+            )
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(parallel_segments, len(segments))) as executor:
+                    futures = [executor.submit(download_segment, start, end) for start, end in segments]
+
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                    finally:
+                        for future in futures:
+                            future.cancel()
+            except _RangeIgnoredError:
+                settings.logger.info("range requests are not supported, falling back to a regular download")
+
+                file.seek(file_position)
+                self._download(lambda *args, **kwargs: link, src_path, file, **kwargs)
+            except YaDiskError as e:
+                if not _invalidate_link(get_download_link_function, src_path, e, link_cached and retry_cached_link):
+                    raise
+
+                settings.logger.info("cached download link is no longer valid, requesting a new one")
+
+                file.seek(file_position)
+                self._download_segmented(
+                    get_download_link_function, src_path, file, size,
+                    parallel_segments=parallel_segments,
+                    segment_size=segment_size,
+                    retry_cached_link=False,
+                    **kwargs
+                )
         finally:
             if close_file and file is not None:
                 file.close()
@@ -1311,12 +2221,24 @@ class Client:
         """
             Download the file.
 
+            If :code:`parallel_segments` is greater than 1, the file is split
+            into segments of :code:`segment_size` bytes, which are downloaded
+            over several concurrent connections (using HTTP range requests)
+            and written directly at their offsets in the destination file.
+            This requires an extra request to get the size of the file and a
+            seekable destination, otherwise a regular download is performed.
+
             :param src_path: source path
             :param file_or_path: destination path or file-like object
+            :param parallel_segments: `int` or `None`, maximum number of segments
+                                      to be downloaded concurrently
+            :param segment_size: `int` or `None`, size of a single segment in bytes
+                                 (:any:`settings.DEFAULT_DOWNLOAD_SEGMENT_SIZE` by default)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1333,7 +2255,28 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        self._download(self.get_download_link, src_path, file_or_path, **kwargs)
+        parallel_segments = kwargs.pop("parallel_segments", None)
+        segment_size = kwargs.pop("segment_size", None)
+
+        get_download_link: Callable = self.get_download_link
+
+        if self.link_cache is not None:
+            get_download_link = _CachedLinkFunction(self.get_download_link, self.link_cache, "download")
+
+        if parallel_segments is not None and parallel_segments > 1:
+            resource = self.get_meta(src_path, fields=["type", "size"], **kwargs)
+
+            if resource.type == "file" and resource.size is not None:
+                self._download_segmented(
+                    get_download_link, src_path, file_or_path, resource.size,
+                    parallel_segments=parallel_segments,
+                    segment_size=segment_size,
+                    **kwargs
+                )
+
+                return SyncResourceLinkObject.from_path(src_path, yadisk=self)
+
+        self._download(get_download_link, src_path, file_or_path, **kwargs)
 
         return SyncResourceLinkObject.from_path(src_path, yadisk=self)
 
@@ -1353,6 +2296,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1364,6 +2308,209 @@ class Client:
 
         self._download(lambda *args, **kwargs: link, "", file_or_path, **kwargs)
 
+    def download_resource(
+        self,
+        resource: ResourceObject,
+        file_or_path: FileOrPathDestination,
+        /,
+        **kwargs
+    ) -> SyncResourceLinkObject:
+        """
+            Download a file described by a :any:`ResourceObject`, e.g., one
+            returned by :any:`Client.listdir()` or :any:`Client.get_files()`.
+
+            If the resource contains a download link (the :code:`file` attribute),
+            the file is downloaded directly from it, without requesting a new link.
+            A new link is only requested if that one turns out to be expired
+            (or if there is no link at all).
+
+            :param resource: :any:`ResourceObject` of the file to download,
+                             its :code:`path` is used to obtain a new link
+            :param file_or_path: destination path or file-like object
+            :param parallel_segments: `int` or `None`, see :any:`Client.download()`,
+                                      :code:`size` of the resource is used if available
+            :param segment_size: `int` or `None`, see :any:`Client.download()`
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises PathNotFoundError: resource was not found on Disk
+            :raises ForbiddenError: application doesn't have enough rights for this request
+            :raises ResourceIsLockedError: resource is locked by another request
+            :raises ValueError: the resource has neither a path nor a download link
+
+            :returns: :any:`SyncResourceLinkObject`, link to the source resource
+        """
+
+        if resource.path is None:
+            if resource.file is None:
+                raise ValueError("ResourceObject doesn't have a path")
+
+            # There is no way to obtain a new link
+            self.download_by_link(resource.file, file_or_path, **kwargs)
+
+            return SyncResourceLinkObject.from_path(resource.path, yadisk=self)
+
+        if resource.file is None:
+            return self.download(resource.path, file_or_path, **kwargs)
+
+        _apply_default_args(kwargs, self.default_args)
+
+        parallel_segments = kwargs.pop("parallel_segments", None)
+        segment_size = kwargs.pop("segment_size", None)
+
+        # The embedded link is treated as a cached one: it is used first and
+        # dropped in favor of a new link if the server rejects it as expired
+        embedded_links = LinkCache(max_size=1)
+        embedded_links.put(resource.path, False, "download", resource.file)
+
+        get_download_link = _CachedLinkFunction(self.get_download_link, embedded_links, "download")
+
+        if parallel_segments is not None and parallel_segments > 1 and resource.size is not None:
+            self._download_segmented(
+                get_download_link, resource.path, file_or_path, resource.size,
+                parallel_segments=parallel_segments,
+                segment_size=segment_size,
+                **kwargs
+            )
+        else:
+            self._download(get_download_link, resource.path, file_or_path, **kwargs)
+
+        return SyncResourceLinkObject.from_path(resource.path, yadisk=self)
+
+    def download_tree(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        check_md5: bool = False,
+        **kwargs
+    ) -> List[TransferResult]:
+        """
+            Download a directory tree from Disk.
+
+            The remote tree is walked with :any:`Client.walk()`, local
+            directories are created as they are discovered and files are
+            downloaded concurrently in a thread pool. A file is skipped if
+            a local copy with the same size and modification time (or MD5 hash,
+            if :code:`check_md5` is `True`) already exists. The modification time
+            of every downloaded file is set to the one reported by the API.
+
+            A failed download doesn't stop the others, errors are reported in
+            the returned list instead. Errors while listing directories are raised.
+
+            :param remote_dir: path to the directory on Disk
+            :param local_dir: path to the local destination directory,
+                              it is created if it doesn't exist
+            :param max_workers: `int`, maximum number of concurrent downloads
+                                (and directory listings)
+            :param check_md5: `bool`, compare MD5 hashes of existing local files
+                              instead of their modification time
+            :param fields: list of keys to be included in the directory listings,
+                           fields needed by this method are always included
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :raises PathNotFoundError: resource was not found on Disk
+            :raises ForbiddenError: application doesn't have enough rights for this request
+            :raises WrongResourceTypeError: resource is not a directory
+
+            :returns: `list` of :any:`TransferResult`, one for each remote file
+        """
+
+        _apply_default_args(kwargs, self.default_args)
+
+        # Only used for listing directories, downloads don't need it
+        fields = _get_download_tree_fields(kwargs.pop("fields", None))
+
+        download_kwargs = dict(kwargs)
+        _add_authorization_header(download_kwargs, self.token)
+
+        get_download_link: Callable = self.get_download_link
+
+        if self.link_cache is not None:
+            get_download_link = _CachedLinkFunction(self.get_download_link, self.link_cache, "download")
+
+        def download_file(resource: SyncResourceObject, remote_path: str, local_path: str) -> TransferStatus:
+            if _is_local_copy_up_to_date(local_path, resource, check_md5):
+                return "skipped"
+
+            self._download(get_download_link, remote_path, local_path, **download_kwargs)
+            _set_local_mtime(local_path, resource)
+
+            return "downloaded"
+
+        local_paths = {remote_dir: local_dir}
+        futures: List[Tuple[Future, str, str]] = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                tree = self.walk(
+                    remote_dir, max_concurrency=max_workers,
+                    fields=fields, **kwargs
+                )
+
+                for dirpath, dirs, files in tree:
+                    local_dirpath = local_paths.pop(dirpath)
+                    os.makedirs(local_dirpath, exist_ok=True)
+
+                    for directory in dirs:
+                        local_dirname = os.path.join(local_dirpath, directory.name)
+                        local_paths[posixpath.join(dirpath, directory.name)] = local_dirname
+
+                    for file in files:
+                        remote_path = posixpath.join(dirpath, file.name)
+                        local_path = os.path.join(local_dirpath, file.name)
+
+                        futures.append(
+                            (executor.submit(download_file, file, remote_path, local_path), local_path, remote_path)
+                        )
+            except BaseException:
+                for future, _, _ in futures:
+                    future.cancel()
+
+                raise
+
+        results = []
+
+        for future, local_path, remote_path in futures:
+            error = future.exception()
+            status: TransferStatus = "failed" if error is not None else future.result()
+
+            results.append(TransferResult(local_path, remote_path, status, error))
+
+        return results
+
+    def batch(self, max_concurrency: int = 64) -> Batch:
+        """
+            Create a :any:`Batch` to run many requests concurrently without
+            a thread per request. With :any:`PycURLSession` all the transfers
+            run on a single `CurlMulti` handle.
+
+            :param max_concurrency: `int`, maximum number of requests that are processed at once
+
+            :returns: :any:`Batch`
+        """
+
+        return Batch(self, max_concurrency)
+
     def remove(self, path: str, /, **kwargs) -> Optional["SyncOperationLinkObject"]:
         """
             Remove the resource.
@@ -1374,7 +2521,8 @@ class Client:
             :param md5: `str`, MD5 hash of the file to remove
             :param force_async: forces the operation to be executed asynchronously
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param fields: list of keys to be included in the response
@@ -1382,6 +2530,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1409,7 +2558,12 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return self._maybe_wait(DeleteRequest, path, **kwargs)
+        self._known_dirs.discard(path)
+
+        try:
+            return self._maybe_wait(DeleteRequest, path, **kwargs)
+        finally:
+            self._invalidate_meta(path)
 
     def mkdir(self, path: str, /, **kwargs) -> SyncResourceLinkObject:
         """
@@ -1421,6 +2575,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1444,19 +2599,39 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return MkdirRequest(self.session, path, **kwargs).send(yadisk=self)
+        try:
+            result = MkdirRequest(self.session, path, **kwargs).send(yadisk=self)
+        except DirectoryExistsError:
+            self._known_dirs.add(path)
+            raise
+        finally:
+            self._invalidate_meta(path)
+
+        self._known_dirs.add(path)
+
+        return result
 
     def makedirs(self, path: str, /, **kwargs) -> SyncResourceLinkObject:
         """
             Create a new directory at `path`. If its parent directory doesn't
             exist it will also be created recursively.
 
+            The client remembers directories that it has created or found to
+            exist. If the parent directory is missing, the deepest existing
+            ancestor is located with a binary search over the path depth and
+            only the missing directories are created. Intermediate directories
+            that are concurrently created by someone else are not treated as
+            an error.
+
             :param path: path to the directory to be created
+            :param exist_ok: `bool`, if `True`, do not raise :any:`DirectoryExistsError`
+                             when `path` already exists
             :param fields: list of keys to be included in the response
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1471,27 +2646,61 @@ class Client:
             :returns: :any:`SyncResourceLinkObject`
         """
 
-        while True:
+        exist_ok = kwargs.pop("exist_ok", False)
+
+        def create_target() -> SyncResourceLinkObject:
             try:
                 return self.mkdir(path, **kwargs)
-            except ParentNotFoundError as e:
-                # We first have to remove the schema, otherwise posixpath.split()
-                # may treat it as part of the path
-                schema, path_without_schema = remove_path_schema(path)
+            except DirectoryExistsError:
+                if not exist_ok:
+                    raise
 
-                # Extract the parent directory
-                head, tail = posixpath.split(path_without_schema)
-                head = head.strip("/")
+                return SyncResourceLinkObject.from_path(path, yadisk=self)
 
-                if head == "":
-                    # We should never find ourselves in this situation
-                    raise e from None
+        prefixes = _get_path_prefixes(path)
+        target = len(prefixes) - 1
+
+        # Index of the deepest directory that is known to exist
+        lo = self._known_dirs.get_deepest(prefixes[:-1])
+
+        try:
+            return create_target()
+        except ParentNotFoundError as e:
+            error = e
+
+        # Index of the deepest directory that is known to be missing
+        hi = target - 1
+
+        while hi > lo + 1 or hi <= lo:
+            if hi <= lo:
+                if lo == 0:
+                    raise error
+
+                # Some of the remembered directories have been removed since then
+                self._known_dirs.forget(prefixes[1:lo + 1])
+                lo = 0
+                continue
+
+            mid = (lo + hi) // 2
+
+            try:
+                self.mkdir(prefixes[mid], **kwargs)
+            except DirectoryExistsError:
+                pass
+            except ParentNotFoundError as e:
+                error, hi = e, mid - 1
+                continue
 
-                # Restore the schema
-                if schema:
-                    head = f"{schema}:/{head}"
+            lo = mid
+
+        for i in range(hi, target):
+            try:
+                self.mkdir(prefixes[i], **kwargs)
+            except DirectoryExistsError:
+                # Another worker has created it in the meantime
+                pass
 
-                self.makedirs(head, **kwargs)
+        return create_target()
 
     def get_trash_meta(self, path: str, /, **kwargs) -> "SyncTrashResourceObject":
         """
@@ -1508,6 +2717,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1542,6 +2752,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1574,13 +2785,17 @@ class Client:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1610,7 +2825,12 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return self._maybe_wait(CopyRequest, src_path, dst_path, **kwargs)
+        self._known_dirs.discard(dst_path)
+
+        try:
+            return self._maybe_wait(CopyRequest, src_path, dst_path, **kwargs)
+        finally:
+            self._invalidate_meta(dst_path)
 
     def restore_trash(
         self,
@@ -1629,13 +2849,15 @@ class Client:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1663,7 +2885,14 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return self._maybe_wait(RestoreTrashRequest, path, dst_path=dst_path, **kwargs)
+        try:
+            return self._maybe_wait(RestoreTrashRequest, path, dst_path=dst_path, **kwargs)
+        finally:
+            if dst_path is not None:
+                self._invalidate_meta(dst_path)
+            elif self.meta_cache is not None:
+                # The original location of the trash resource is unknown
+                self.meta_cache.clear()
 
     def move(
         self,
@@ -1681,13 +2910,17 @@ class Client:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1715,7 +2948,13 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return self._maybe_wait(MoveRequest, src_path, dst_path, **kwargs)
+        self._known_dirs.discard(src_path)
+        self._known_dirs.discard(dst_path)
+
+        try:
+            return self._maybe_wait(MoveRequest, src_path, dst_path, **kwargs)
+        finally:
+            self._invalidate_meta(src_path, dst_path)
 
     def rename(
         self,
@@ -1734,13 +2973,17 @@ class Client:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1794,13 +3037,15 @@ class Client:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1842,6 +3087,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1863,7 +3109,10 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return PublishRequest(self.session, path, **kwargs).send(yadisk=self)
+        try:
+            return PublishRequest(self.session, path, **kwargs).send(yadisk=self)
+        finally:
+            self._invalidate_meta(path)
 
     def unpublish(self, path: str, /, **kwargs) -> SyncResourceLinkObject:
         """
@@ -1875,6 +3124,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1896,7 +3146,10 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return UnpublishRequest(self.session, path, **kwargs).send(yadisk=self)
+        try:
+            return UnpublishRequest(self.session, path, **kwargs).send(yadisk=self)
+        finally:
+            self._invalidate_meta(path)
 
     def get_public_settings(self, path: str, /, **kwargs) -> PublicSettingsObject:
         """
@@ -1909,6 +3162,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1940,6 +3194,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1972,6 +3227,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2013,13 +3269,15 @@ class Client:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2048,7 +3306,16 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return self._maybe_wait(SaveToDiskRequest, public_key, **kwargs)
+        save_path = kwargs.get("save_path")
+
+        try:
+            return self._maybe_wait(SaveToDiskRequest, public_key, **kwargs)
+        finally:
+            if save_path is not None:
+                self._invalidate_meta(save_path)
+            elif self.meta_cache is not None:
+                # The resource is saved to the downloads directory, its path is unknown
+                self.meta_cache.clear()
 
     def get_public_meta(
         self,
@@ -2073,6 +3340,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2108,6 +3376,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2135,6 +3404,10 @@ class Client:
                          By specifying the key of the published folder in `public_key`,
                          you can request contents of any nested folder.
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param page_concurrency: `int` or `None`, if greater than 1, the pages
+                                     following the first one are requested concurrently
+                                     (at most :code:`page_concurrency` at a time), the
+                                     items are still returned in order
             :param limit: number of children resources to be included in the response
             :param offset: number of children resources to be skipped in the response
             :param preview_size: size of the file preview
@@ -2144,6 +3417,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2169,6 +3443,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2193,6 +3468,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2219,6 +3495,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2246,6 +3523,13 @@ class Client:
 
             :param path: path to the directory in the trash bin
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param page_concurrency: `int` or `None`, if greater than 1, the pages
+                                     following the first one are requested concurrently
+                                     (at most :code:`page_concurrency` at a time), the
+                                     items are still returned in order
+            :param prefetch: `int`, number of pages to request in the background
+                             ahead of the one currently being consumed (in a separate thread),
+                             `0` disables prefetching
             :param limit: number of children resources to be included in the response
             :param offset: number of children resources to be skipped in the response
             :param preview_size: size of the file preview
@@ -2255,6 +3539,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2279,6 +3564,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2302,6 +3588,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2327,6 +3614,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2357,6 +3645,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2382,12 +3671,16 @@ class Client:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
         **kwargs
     ) -> Generator[SyncPublicResourceObject, None, None]:
         """
             Get a list of all public resources.
 
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param prefetch: `int`, number of pages to request in the background
+                             ahead of the one currently being consumed (in a separate thread),
+                             `0` disables prefetching
             :param offset: offset from the beginning of the list
             :param limit: maximum number of elements in the list
             :param preview_size: size of the file preview
@@ -2398,6 +3691,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2414,34 +3708,19 @@ class Client:
             :returns: generator of :any:`SyncPublicResourceObject`
         """
 
-        if kwargs.get("offset") is None:
-            kwargs["offset"] = 0
-
-        if kwargs.get("limit") is None:
-            kwargs["limit"] = 100
+        offset = kwargs.pop("offset", None)
+        limit = kwargs.pop("limit", None)
 
-        remaining_items = max_items
+        if offset is None:
+            offset = 0
 
-        while True:
-            # Do not query more items than necessary
-            if remaining_items is not None:
-                kwargs["limit"] = min(remaining_items, kwargs["limit"])
+        if limit is None:
+            limit = 100
 
-            files = self.get_public_resources(**kwargs).items or []
-            file_count = len(files)
+        def get_page(offset: int, limit: int) -> List["SyncPublicResourceObject"]:
+            return self.get_public_resources(offset=offset, limit=limit, **kwargs).items or []
 
-            yield from files[:remaining_items]
-
-            if remaining_items is not None:
-                remaining_items -= file_count
-
-                if remaining_items <= 0:
-                    break
-
-            if file_count < kwargs["limit"]:
-                break
-
-            kwargs["offset"] += kwargs["limit"]
+        return _paginate(get_page, offset, limit, max_items=max_items, prefetch=prefetch)
 
     def patch(self, path: str, properties: dict, /, **kwargs) -> "SyncResourceObject":
         """
@@ -2454,6 +3733,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2475,7 +3755,10 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return PatchRequest(self.session, path, properties, **kwargs).send(yadisk=self)
+        try:
+            return PatchRequest(self.session, path, properties, **kwargs).send(yadisk=self)
+        finally:
+            self._invalidate_meta(path)
 
     def _get_files_some(self, **kwargs) -> List["SyncResourceObject"]:
         response: "SyncFilesResourceListObject" = FilesRequest(
@@ -2490,6 +3773,8 @@ class Client:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
+        parallel_partitions: bool = False,
         **kwargs
     ) -> Generator["SyncResourceObject", None, None]:
         """
@@ -2497,8 +3782,18 @@ class Client:
 
             :param offset: offset from the beginning of the list
             :param max_items: `int` or `None`, maximum number of returned items (`None` means unlimited)
+            :param prefetch: `int`, number of pages to request in the background
+                             ahead of the one currently being consumed (in a separate thread),
+                             `0` disables prefetching
             :param limit: number of list elements to be included in each response
             :param media_type: type of files to include in the list
+            :param parallel_partitions: `bool`, if `True`, the listing is split into
+                                        disjoint partitions by media type (:code:`media_type`
+                                        or :any:`settings.FILE_MEDIA_TYPES`), which are paged
+                                        concurrently (on a thread pool). Items of different partitions
+                                        are interleaved, :code:`sort` only applies within a
+                                        partition, :code:`prefetch` is ignored and :code:`offset`
+                                        is not supported
             :param sort: `str`, field to be used as a key to sort children resources
             :param preview_size: size of the file preview
             :param preview_crop: `bool`, cut the preview to the size specified in the `preview_size`
@@ -2507,6 +3802,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2526,34 +3822,30 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        if kwargs.get("offset") is None:
-            kwargs["offset"] = 0
+        offset = kwargs.pop("offset", None)
+        limit = kwargs.pop("limit", None)
 
-        if kwargs.get("limit") is None:
-            kwargs["limit"] = 200
+        if offset is None:
+            offset = 0
 
-        remaining_items = max_items
+        if limit is None:
+            limit = 200
 
-        while True:
-            # Do not query more items than necessary
-            if remaining_items is not None:
-                kwargs["limit"] = min(remaining_items, kwargs["limit"])
+        if parallel_partitions:
+            if offset:
+                raise ValueError("offset cannot be used together with parallel_partitions")
 
-            files = self._get_files_some(**kwargs)
-            file_count = len(files)
+            partitions = _get_partitions(kwargs.pop("media_type", None))
 
-            yield from files[:remaining_items]
-
-            if remaining_items is not None:
-                remaining_items -= file_count
+            def get_partition_page(media_type: str, offset: int, limit: int) -> List["SyncResourceObject"]:
+                return self._get_files_some(media_type=media_type, offset=offset, limit=limit, **kwargs)
 
-                if remaining_items <= 0:
-                    break
+            return _paginate_partitioned(get_partition_page, partitions, limit, max_items=max_items)
 
-            if file_count < kwargs["limit"]:
-                break
+        def get_page(offset: int, limit: int) -> List["SyncResourceObject"]:
+            return self._get_files_some(offset=offset, limit=limit, **kwargs)
 
-            kwargs["offset"] += kwargs["limit"]
+        return _paginate(get_page, offset, limit, max_items=max_items, prefetch=prefetch)
 
     def get_last_uploaded(self, **kwargs) -> List["SyncResourceObject"]:
         """
@@ -2568,6 +3860,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2611,13 +3904,15 @@ class Client:
             :param disable_redirects: `bool`, forbid redirects
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2647,7 +3942,10 @@ class Client:
         _apply_default_args(kwargs, self.default_args)
         _add_authorization_header(kwargs, self.token)
 
-        return self._maybe_wait(UploadURLRequest, url, path, **kwargs)
+        try:
+            return self._maybe_wait(UploadURLRequest, url, path, **kwargs)
+        finally:
+            self._invalidate_meta(path)
 
     def get_public_download_link(self, public_key: str, /, **kwargs) -> str:
         """
@@ -2659,6 +3957,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2701,6 +4000,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2731,6 +4031,7 @@ class Client:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2757,13 +4058,68 @@ class Client:
             self.session, operation_id, fields=["status"], **kwargs
         ).send(yadisk=self).status
 
+    def track_operation(
+        self,
+        operation: Union[str, SyncOperationLinkObject, SyncResourceLinkObject, None],
+        /,
+        *,
+        poll_timeout: Optional[float] = None,
+        **kwargs
+    ) -> "Future[None]":
+        """
+            Track an asynchronous operation without blocking the calling thread.
+            All tracked operations are polled by :any:`Client.operation_poller`,
+            with the interval between status queries growing over time.
+
+            This is meant to be used with methods like :any:`Client.copy()`,
+            :any:`Client.move()` and :any:`Client.remove()`, called with
+            :code:`wait=False`, so that many operations can be waited for at once.
+
+            :param operation: ID of the operation, a link or an object returned
+                              by one of the methods above. If it's not an
+                              operation link (the request completed synchronously),
+                              an already resolved future is returned
+            :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout)
+            :param timeout: `float` or `tuple`, request timeout
+            :param headers: `dict` or `None`, additional request headers
+            :param n_retries: `int`, maximum number of retries
+            :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
+            :param retry_on: `tuple`, additional exception classes to retry on
+            :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
+            :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
+            :param curl_options: `dict`, additional options for :any:`PycURLSession`
+            :param kwargs: any other parameters, accepted by :any:`Session.send_request()`
+
+            :returns: :any:`concurrent.futures.Future`, resolves to `None` when
+                      the operation succeeds, otherwise fails with
+                      :any:`AsyncOperationFailedError`,
+                      :any:`AsyncOperationPollingTimeoutError`,
+                      :any:`OperationNotFoundError`, etc.
+        """
+
+        if isinstance(operation, SyncOperationLinkObject):
+            if operation.href is None:
+                raise ValueError("OperationLinkObject has no link")
+
+            operation = operation.href
+
+        if not isinstance(operation, str):
+            future: "Future[None]" = Future()
+            future.set_result(None)
+
+            return future
+
+        return self.operation_poller.submit(operation, poll_timeout=poll_timeout, **kwargs)
+
     def wait_for_operation(
         self,
         operation_id: str,
         /,
         *,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         **kwargs
     ) -> None:
         """
@@ -2771,13 +4127,17 @@ class Client:
             exception is raised. Waiting is performed by calling :any:`time.sleep`.
 
             :param operation_id: ID of the operation or a link
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -2791,6 +4151,7 @@ class Client:
                                                        (when `poll_timeout` is not `None`)
         """
 
+        intervals = _iter_poll_intervals(poll_interval, resource_size)
         poll_start_time = time.monotonic()
 
         while (status := self.get_operation_status(operation_id, **kwargs)) == "in-progress":
@@ -2800,7 +4161,7 @@ class Client:
                 if total_poll_duration >= poll_timeout:
                     raise AsyncOperationPollingTimeoutError("Asynchronous operation did not complete in specified time")
 
-            time.sleep(poll_interval)
+            time.sleep(next(intervals))
 
         if status != "success":
             raise AsyncOperationFailedError("Asynchronous operation failed")
@@ -16,20 +16,31 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
+from concurrent.futures import Future
 from typing import Optional, Any, Union, Literal, overload
-from ._typing_compat import Dict, Generator, Iterable, List, Tuple, Type
-
+from ._typing_compat import Callable, Dict, Generator, Iterable, List, Tuple, Type
+
+from .batch import Batch
+from .bulk import TransferResult
+from .cache import LinkCache, MetaCache
+from .exceptions import YaDiskError
+from .polling import OperationPoller
+from .circuit import CircuitBreakers
+from .hedging import HedgingPolicy
+from .pool import PoolConfig
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .objects import (
     DeviceCodeObject, TokenObject, TokenRevokeStatusObject,
     DiskInfoObject, SyncResourceObject, SyncResourceLinkObject,
     SyncOperationLinkObject, SyncTrashResourceObject, SyncPublicResourceObject,
     SyncPublicResourcesListObject, SyncPublicResourceLinkObject,
-    ResourceUploadLinkObject, PublicSettingsObject, PublicAvailableSettingsObject
+    ResourceUploadLinkObject, PublicSettingsObject, PublicAvailableSettingsObject, ResourceObject
 )
 
 from .types import (
     FileOrPath, FileOrPathDestination, Headers, OperationStatus,
-    PublicSettings, Session, SessionName, SessionFactory, OpenFileCallback,
+    PollInterval, PublicSettings, Session, SessionName, SessionFactory, OpenFileCallback,
     TimeoutParameter
 )
 
@@ -42,6 +53,12 @@ class Client:
     default_args: Dict[str, Any]
     session: Session
     open_file: OpenFileCallback
+    link_cache: Optional[LinkCache]
+    meta_cache: Optional[MetaCache]
+    rate_limiter: Optional[RateLimiter]
+    circuit_breakers: Optional[CircuitBreakers]
+    hedging: Optional[HedgingPolicy]
+    operation_poller: OperationPoller
 
     synchronous = True
 
@@ -51,16 +68,23 @@ class Client:
         secret: str = "",
         token:  str = "",
         *,
-        default_args:    Optional[Dict[str, Any]] = None,
-        session:         Optional[Union[Session, SessionName]] = None,
-        open_file:       Optional[OpenFileCallback] = None,
-        session_factory: Optional[SessionFactory] = None
+        default_args:     Optional[Dict[str, Any]] = None,
+        session:          Optional[Union[Session, SessionName]] = None,
+        open_file:        Optional[OpenFileCallback] = None,
+        session_factory:  Optional[SessionFactory] = None,
+        link_cache:       Optional[LinkCache] = None,
+        meta_cache:       Optional[MetaCache] = None,
+        rate_limiter:     Optional[RateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedging:          Optional[HedgingPolicy] = None,
+        pool_config:      Optional[PoolConfig] = None
     ) -> None:
         ...
 
     def __enter__(self): ...
     def __exit__(self, *args, **kwargs) -> None: ...
     def close(self) -> None: ...
+    def _invalidate_meta(self, *paths: str) -> None: ...
 
     def get_auth_url(
         self,
@@ -105,6 +129,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -124,6 +149,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -143,6 +169,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -160,6 +187,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -177,6 +205,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -194,6 +223,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -211,6 +241,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -234,6 +265,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -251,6 +283,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -259,6 +292,52 @@ class Client:
     ) -> bool:
         ...
 
+    def get_meta_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        preview_size: Optional[str] = None,
+        preview_crop: Optional[bool] = None,
+        sort: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> List[Union[SyncResourceObject, YaDiskError]]:
+        ...
+
+    def exists_many(
+        self,
+        paths: Iterable[str],
+        /,
+        *,
+        max_concurrency: int = 8,
+        sibling_threshold: Optional[int] = 8,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> List[Union[bool, YaDiskError]]:
+        ...
+
     def get_type(
         self,
         path: str,
@@ -268,6 +347,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -285,6 +365,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -302,6 +383,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -316,6 +398,7 @@ class Client:
         /,
         *,
         max_items: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -326,6 +409,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -334,6 +418,32 @@ class Client:
     ) -> Generator[SyncResourceObject, None, None]:
         ...
 
+    def walk(
+        self,
+        path: str,
+        /,
+        *,
+        max_concurrency: int = 8,
+        onerror: Optional[Callable[[Exception], None]] = None,
+        limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        preview_size: Optional[str] = None,
+        preview_crop: Optional[bool] = None,
+        sort: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> Generator[Tuple[str, List[SyncResourceObject], List[SyncResourceObject]], None, None]:
+        ...
+
     def get_upload_link(
         self,
         path: str,
@@ -345,6 +455,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -365,6 +476,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -385,6 +497,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -393,6 +506,28 @@ class Client:
     ) -> SyncResourceLinkObject:
         ...
 
+    def upload_tree(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        overwrite: bool = False,
+        spoof_user_agent: bool = True,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> List[TransferResult]:
+        ...
+
     def upload_by_link(
         self,
         file_or_path: FileOrPath,
@@ -403,6 +538,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -420,6 +556,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -434,10 +571,13 @@ class Client:
         file_or_path: FileOrPathDestination,
         /,
         *,
+        parallel_segments: Optional[int] = None,
+        segment_size: Optional[int] = None,
         headers: Optional[Headers] = None,
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -456,6 +596,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -464,6 +605,50 @@ class Client:
     ) -> None:
         ...
 
+    def download_resource(
+        self,
+        resource: ResourceObject,
+        file_or_path: FileOrPathDestination,
+        /,
+        *,
+        parallel_segments: Optional[int] = None,
+        segment_size: Optional[int] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> SyncResourceLinkObject:
+        ...
+
+    def download_tree(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        /,
+        *,
+        max_workers: int = 8,
+        check_md5: bool = False,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> List[TransferResult]:
+        ...
+
+    def batch(self, max_concurrency: int = 64) -> Batch: ...
+
     @overload
     def remove(
         self,
@@ -471,7 +656,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         md5: Optional[str] = None,
         force_async: Literal[True],
@@ -480,6 +665,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -495,7 +681,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         md5: Optional[str] = None,
         force_async: bool = False,
@@ -504,6 +690,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -522,6 +709,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -540,6 +728,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -563,6 +752,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -580,6 +770,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -596,8 +787,9 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -605,6 +797,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -621,8 +814,9 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -630,6 +824,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -646,7 +841,7 @@ class Client:
         dst_path: Optional[str] = None,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: Literal[True],
@@ -655,6 +850,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -671,7 +867,7 @@ class Client:
         dst_path: Optional[str] = None,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: bool = False,
@@ -680,6 +876,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -696,8 +893,9 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -705,6 +903,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -721,8 +920,9 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -730,6 +930,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -746,8 +947,9 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -755,6 +957,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -771,8 +974,9 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -780,6 +984,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -795,7 +1000,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -803,6 +1008,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -818,7 +1024,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -826,6 +1032,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -846,6 +1053,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -864,6 +1072,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -881,6 +1090,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -897,6 +1107,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -914,6 +1125,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -929,7 +1141,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         name: Optional[str] = None,
         path: Optional[str] = None,
@@ -940,6 +1152,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -955,7 +1168,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         name: Optional[str] = None,
         path: Optional[str] = None,
@@ -966,6 +1179,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -990,6 +1204,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1014,6 +1229,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1029,6 +1245,7 @@ class Client:
         *,
         path: Optional[str] = None,
         max_items: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -1039,6 +1256,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1057,6 +1275,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1075,6 +1294,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1093,6 +1313,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1107,6 +1328,8 @@ class Client:
         /,
         *,
         max_items: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        prefetch: int = 0,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -1117,6 +1340,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1134,6 +1358,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1151,6 +1376,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1168,6 +1394,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1189,6 +1416,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1201,6 +1429,7 @@ class Client:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         preview_size: Optional[str] = None,
@@ -1211,6 +1440,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1230,6 +1460,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1242,6 +1473,8 @@ class Client:
         self,
         *,
         max_items: Optional[int] = None,
+        prefetch: int = 0,
+        parallel_partitions: bool = False,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         media_type: Optional[Union[str, Iterable[str]]] = None,
@@ -1253,6 +1486,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1273,6 +1507,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1288,7 +1523,7 @@ class Client:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         disable_redirects: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1296,6 +1531,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1313,6 +1549,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1332,6 +1569,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1349,6 +1587,7 @@ class Client:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1357,17 +1596,38 @@ class Client:
     ) -> OperationStatus:
         ...
 
+    def track_operation(
+        self,
+        operation: Union[str, SyncOperationLinkObject, SyncResourceLinkObject, None],
+        /,
+        *,
+        poll_timeout: Optional[float] = None,
+        headers: Optional[Headers] = None,
+        timeout: TimeoutParameter = ...,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        requests_args: Optional[Dict[str, Any]] = None,
+        httpx_args: Optional[Dict[str, Any]] = None,
+        curl_options: Optional[Dict[int, Any]] = None,
+        **kwargs
+    ) -> Future[None]:
+        ...
+
     def wait_for_operation(
         self,
         operation_id: str,
         /,
         *,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         headers: Optional[Headers] = None,
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
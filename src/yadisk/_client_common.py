@@ -16,27 +16,231 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+import hashlib
+import os
+import posixpath
+import re
+import threading
+
 from .utils import CaseInsensitiveDict
 
-from ._typing_compat import Dict, Generator
-from .exceptions import InvalidResponseError
+from ._typing_compat import (
+    AsyncGenerator, AsyncIterable, Awaitable, Callable, Dict, Generator, Iterable, List, Tuple, Type
+)
+from .exceptions import (
+    ForbiddenError, GoneError, InvalidResponseError, NotFoundError, PathNotFoundError, TooManyRequestsError,
+    UnauthorizedError, YaDiskError
+)
 from .objects import ResourceObject, LinkObject
+from ._common import ensure_path_has_schema, normalize_path, remove_path_schema
+from . import settings
+
+from typing import TYPE_CHECKING, Any, AnyStr, IO, Optional, Union
 
-from typing import Any, AnyStr, IO, Optional
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import LinkCache, LinkOperation
+    from .circuit import CircuitBreakers
+    from .ratelimit import RateLimiter
 
 __all__ = [
+    "_AsyncCachedLinkFunction",
+    "_CachedLinkFunction",
+    "_KnownDirectories",
+    "_RangeIgnoredError",
     "_add_authorization_header",
     "_add_spoof_user_agent_header",
     "_apply_default_args",
+    "_async_get_link",
+    "_async_invalidating_link_on_error",
+    "_async_throttled_payload",
     "_filter_request_kwargs",
+    "_get_circuit_breaker_kwargs",
+    "_get_download_tree_fields",
+    "_get_link",
+    "_get_partitions",
+    "_get_path_prefixes",
+    "_get_rate_limiter_retry_on",
+    "_get_remaining_pages",
+    "_invalidate_link",
+    "_invalidating_link_on_error",
+    "_is_local_copy_up_to_date",
+    "_is_resumed_response",
+    "_iter_local_tree_files",
+    "_make_not_found_error",
+    "_make_segments",
+    "_plan_meta_lookups",
     "_read_file_as_generator",
+    "_report_to_rate_limiter",
+    "_scan_local_tree",
     "_set_authorization_header",
+    "_set_local_mtime",
+    "_throttled_payload",
     "_validate_get_type_response",
     "_validate_link_response",
-    "_validate_listdir_response"
+    "_validate_listdir_response",
+    "_walk_kwargs"
 ]
 
 
+class _RangeIgnoredError(YaDiskError):
+    # Raised when the server responds to a range request with the full content
+    pass
+
+
+class _BaseCachedLinkFunction:
+    # Wraps get_upload_link()/get_download_link() to reuse links from a LinkCache
+    def __init__(self, link_cache: "LinkCache", operation: "LinkOperation", overwrite: bool = False) -> None:
+        self.link_cache = link_cache
+        self.operation = operation
+        self.overwrite = overwrite
+
+    def invalidate(self, path: str) -> None:
+        self.link_cache.invalidate(path, self.overwrite, self.operation)
+
+
+class _CachedLinkFunction(_BaseCachedLinkFunction):
+    def __init__(
+        self,
+        get_link_function: Callable[..., str],
+        link_cache: "LinkCache",
+        operation: "LinkOperation",
+        overwrite: bool = False
+    ) -> None:
+        super().__init__(link_cache, operation, overwrite)
+        self.get_link_function = get_link_function
+
+    def get(self, path: str, /, **kwargs) -> Tuple[str, bool]:
+        # Returns the link and whether it was taken from the cache
+        link = self.link_cache.get(path, self.overwrite, self.operation)
+
+        if link is not None:
+            return link, True
+
+        link = self.get_link_function(path, **kwargs)
+        self.link_cache.put(path, self.overwrite, self.operation, link)
+
+        return link, False
+
+    def __call__(self, path: str, /, **kwargs) -> str:
+        return self.get(path, **kwargs)[0]
+
+
+class _AsyncCachedLinkFunction(_BaseCachedLinkFunction):
+    def __init__(
+        self,
+        get_link_function: Callable[..., Awaitable[str]],
+        link_cache: "LinkCache",
+        operation: "LinkOperation",
+        overwrite: bool = False
+    ) -> None:
+        super().__init__(link_cache, operation, overwrite)
+        self.get_link_function = get_link_function
+
+    async def get(self, path: str, /, **kwargs) -> Tuple[str, bool]:
+        # Returns the link and whether it was taken from the cache
+        link = self.link_cache.get(path, self.overwrite, self.operation)
+
+        if link is not None:
+            return link, True
+
+        link = await self.get_link_function(path, **kwargs)
+        self.link_cache.put(path, self.overwrite, self.operation, link)
+
+        return link, False
+
+    async def __call__(self, path: str, /, **kwargs) -> str:
+        return (await self.get(path, **kwargs))[0]
+
+
+def _get_link(get_link_function: Callable[..., str], path: str, /, **kwargs) -> Tuple[str, bool]:
+    # Returns the link and whether it was taken from the cache.
+    # The result is per call, since concurrent transfers share the same function
+    if isinstance(get_link_function, _CachedLinkFunction):
+        return get_link_function.get(path, **kwargs)
+
+    return get_link_function(path, **kwargs), False
+
+
+async def _async_get_link(
+    get_link_function: Callable[..., Awaitable[str]],
+    path: str,
+    /,
+    **kwargs
+) -> Tuple[str, bool]:
+    if isinstance(get_link_function, _AsyncCachedLinkFunction):
+        return await get_link_function.get(path, **kwargs)
+
+    return await get_link_function(path, **kwargs), False
+
+
+def _invalidate_link(
+    get_link_function: Any,
+    path: str,
+    error: Optional[Exception] = None,
+    cached: bool = False
+) -> bool:
+    # Drops a cached link if the error shows that it is no longer valid
+    # (or unconditionally, if error is None).
+    # Returns True if the dropped link was taken from the cache (see cached),
+    # i.e. the failed attempt can be repeated with a fresh link
+    if not isinstance(get_link_function, _BaseCachedLinkFunction):
+        return False
+
+    if error is None or isinstance(error, (UnauthorizedError, ForbiddenError, NotFoundError, GoneError)):
+        get_link_function.invalidate(path)
+
+        return cached
+
+    return False
+
+
+def _invalidating_link_on_error(
+    attempt: Callable[[], None],
+    get_link_function: Any,
+    path: str,
+    is_link_cached: Callable[[], bool]
+) -> Callable[[], None]:
+    # Wraps an upload/download attempt, so that retries don't reuse a broken link.
+    # is_link_cached() tells whether the link used by the last attempt was taken from the cache
+    def wrapper() -> None:
+        free_retry = True
+
+        while True:
+            try:
+                return attempt()
+            except YaDiskError as e:
+                # An outdated link from the cache doesn't count as a failed attempt, but only once
+                if not _invalidate_link(get_link_function, path, e, is_link_cached()) or not free_retry:
+                    raise
+
+                free_retry = False
+
+    return wrapper
+
+
+def _async_invalidating_link_on_error(
+    attempt: Callable[[], Awaitable[None]],
+    get_link_function: Any,
+    path: str,
+    is_link_cached: Callable[[], bool]
+) -> Callable[[], Awaitable[None]]:
+    async def wrapper() -> None:
+        free_retry = True
+
+        while True:
+            try:
+                return await attempt()
+            except YaDiskError as e:
+                # An outdated link from the cache doesn't count as a failed attempt, but only once
+                if not _invalidate_link(get_link_function, path, e, is_link_cached()) or not free_retry:
+                    raise
+
+                free_retry = False
+
+    return wrapper
+
+
 def _apply_default_args(args: Dict[str, Any], default_args: Dict[str, Any]) -> None:
     new_args = dict(default_args)
     new_args.update(args)
@@ -46,7 +250,7 @@ def _apply_default_args(args: Dict[str, Any], default_args: Dict[str, Any]) -> N
 
 def _filter_request_kwargs(kwargs: Dict[str, Any]) -> None:
     # Remove some of the yadisk-specific arguments from kwargs
-    keys_to_remove = ("n_retries", "retry_interval", "retry_on", "fields", "overwrite", "path")
+    keys_to_remove = ("n_retries", "retry_interval", "retry_on", "retry_policy", "fields", "overwrite", "path")
 
     for key in keys_to_remove:
         kwargs.pop(key, None)
@@ -59,6 +263,277 @@ def _read_file_as_generator(input_file: IO[AnyStr]) -> Generator[AnyStr, None, N
         yield chunk
 
 
+def _throttled_payload(payload: Any, rate_limiter: "RateLimiter") -> Generator[Any, None, None]:
+    # Makes an upload payload consume tokens of the rate limiter's byte bucket
+    if hasattr(payload, "read"):
+        payload = _read_file_as_generator(payload)
+
+    for chunk in payload:
+        rate_limiter.wait_bytes(len(chunk))
+
+        yield chunk
+
+
+async def _async_throttled_payload(payload: AsyncIterable, rate_limiter: "RateLimiter") -> AsyncGenerator:
+    async for chunk in payload:
+        await rate_limiter.async_wait_bytes(len(chunk))
+
+        yield chunk
+
+
+def _report_to_rate_limiter(rate_limiter: Optional["RateLimiter"], exception: YaDiskError) -> YaDiskError:
+    if rate_limiter is not None:
+        rate_limiter.report(exception)
+
+    return exception
+
+
+def _get_rate_limiter_retry_on(rate_limiter: Optional["RateLimiter"]) -> Tuple[Type[Exception], ...]:
+    # Throttled requests are retried after the rate limiter slows down
+    return (TooManyRequestsError,) if rate_limiter is not None else ()
+
+
+def _get_circuit_breaker_kwargs(circuit_breakers: Optional["CircuitBreakers"], key: str) -> Dict[str, Any]:
+    # Arguments for auto_retry()/async_auto_retry()
+    if circuit_breakers is None:
+        return {}
+
+    return {"circuit_breaker": circuit_breakers.get(key), "retry_budget": circuit_breakers.retry_budget}
+
+
+def _is_resumed_response(status: int, headers: CaseInsensitiveDict, offset: int) -> bool:
+    # Checks whether a response to a "Range: bytes=<offset>-" request actually starts at offset
+    if status != 206:
+        return False
+
+    content_range = headers.get("Content-Range")
+
+    # Assume the range is right if the server didn't report it
+    if content_range is None:
+        return True
+
+    match = re.match(r"\s*bytes\s+(\d+)-", content_range)
+
+    return match is not None and int(match.group(1)) == offset
+
+
+def _get_partitions(media_type: Optional[Union[str, Iterable[str]]]) -> List[str]:
+    if media_type is None:
+        return list(settings.FILE_MEDIA_TYPES)
+
+    if isinstance(media_type, str):
+        media_type = media_type.split(",")
+
+    return list(dict.fromkeys(media_type))
+
+
+LocalTree = Dict[str, Tuple[List[str], List[str]]]
+
+
+def _scan_local_tree(local_dir: str) -> LocalTree:
+    # Maps relative POSIX paths of local directories ("" for the top one)
+    # to relative paths of their subdirectories and files
+    if not os.path.isdir(local_dir):
+        raise NotADirectoryError(f"{local_dir!r} is not a directory")
+
+    tree: LocalTree = {}
+
+    for dirpath, dirnames, filenames in os.walk(local_dir):
+        dirnames.sort()
+
+        relpath = os.path.relpath(dirpath, local_dir)
+        relpath = "" if relpath == os.curdir else relpath.replace(os.sep, "/")
+
+        tree[relpath] = (
+            [posixpath.join(relpath, name) for name in dirnames],
+            [posixpath.join(relpath, name) for name in sorted(filenames)]
+        )
+
+    # Symbolic links to directories are listed, but not walked into
+    for dirs, _ in tree.values():
+        dirs[:] = [d for d in dirs if d in tree]
+
+    return tree
+
+
+def _iter_local_tree_files(tree: LocalTree, relpath: str = "") -> Generator[str, None, None]:
+    dirs, files = tree[relpath]
+
+    yield from files
+
+    for d in dirs:
+        yield from _iter_local_tree_files(tree, d)
+
+
+def _get_download_tree_fields(fields: Optional[Iterable[str]]) -> List[str]:
+    # download_tree() needs these fields to compare and timestamp local copies, regardless of the requested fields
+    required = ["path", "size", "modified", "md5"]
+
+    if fields is None:
+        return required
+
+    fields = list(fields)
+
+    return fields + [field for field in required if field not in fields]
+
+
+def _is_local_copy_up_to_date(local_path: str, resource: ResourceObject, check_md5: bool) -> bool:
+    # Compares a local file with metadata of the remote one by size and either mtime or MD5
+    try:
+        stat = os.stat(local_path)
+    except FileNotFoundError:
+        return False
+
+    if resource.size is None or stat.st_size != resource.size:
+        return False
+
+    if check_md5:
+        if resource.md5 is None:
+            return False
+
+        md5 = hashlib.md5()
+
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024**2), b""):
+                md5.update(chunk)
+
+        return md5.hexdigest() == resource.md5
+
+    if resource.modified is None:
+        return False
+
+    # The API reports modification time with a precision of one second
+    return int(stat.st_mtime) == int(resource.modified.timestamp())
+
+
+def _set_local_mtime(local_path: str, resource: ResourceObject) -> None:
+    # Makes the local copy match the remote file for the next _is_local_copy_up_to_date() check
+    if resource.modified is not None:
+        os.utime(local_path, (os.stat(local_path).st_atime, resource.modified.timestamp()))
+
+
+def _plan_meta_lookups(
+    paths: Iterable[str],
+    sibling_threshold: Optional[int]
+) -> Tuple[List[str], List[str], Dict[str, List[str]]]:
+    # Splits paths for get_meta_many() into the ones that are looked up one by one
+    # and the ones that are looked up by listing their parent directory.
+    # Returns normalized paths (in input order), individual paths and parents mapped to their children
+    normalized = [ensure_path_has_schema(path) for path in paths]
+    siblings: Dict[str, List[str]] = {}
+    individual: List[str] = []
+
+    for path in dict.fromkeys(normalized):
+        schema, path_without_schema = remove_path_schema(path)
+        head, tail = posixpath.split(path_without_schema)
+
+        if not tail:
+            # The root directory or a path with a trailing slash
+            individual.append(path)
+        else:
+            siblings.setdefault(f"{schema}:/{head.strip('/')}", []).append(path)
+
+    batches: Dict[str, List[str]] = {}
+
+    for parent, children in siblings.items():
+        if sibling_threshold is not None and len(children) >= sibling_threshold:
+            batches[parent] = children
+        else:
+            individual.extend(children)
+
+    return normalized, individual, batches
+
+
+def _make_not_found_error(path: str) -> PathNotFoundError:
+    # Used when a resource is known not to exist without requesting it directly
+    return PathNotFoundError("DiskNotFoundError", f"Resource not found: {path}")
+
+
+def _get_path_prefixes(path: str) -> List[str]:
+    # "/a/b" -> ["disk:/", "disk:/a", "disk:/a/b"]
+    schema, _, path = normalize_path(path).partition(":/")
+    root = schema + ":/"
+    parts = [part for part in path.split("/") if part]
+
+    return [root] + [root + "/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+class _KnownDirectories:
+    # Bounded LRU set of directories that are known to exist, used by makedirs()
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._paths: OrderedDict[str, None] = OrderedDict()
+
+    def add(self, path: str) -> None:
+        path = normalize_path(path)
+
+        with self._lock:
+            self._paths[path] = None
+            self._paths.move_to_end(path)
+
+            while len(self._paths) > self.max_size:
+                self._paths.popitem(last=False)
+
+    def get_deepest(self, prefixes: List[str]) -> int:
+        # Returns the index of the deepest prefix that is known to exist,
+        # the root (index 0) always exists
+        with self._lock:
+            for i in range(len(prefixes) - 1, 0, -1):
+                if prefixes[i] in self._paths:
+                    self._paths.move_to_end(prefixes[i])
+                    return i
+
+        return 0
+
+    def forget(self, paths: Iterable[str]) -> None:
+        with self._lock:
+            for path in paths:
+                self._paths.pop(path, None)
+
+    def discard(self, path: str) -> None:
+        # Forget the directory and everything under it
+        path = normalize_path(path)
+        prefix = path if path.endswith("/") else path + "/"
+
+        with self._lock:
+            for known_path in list(self._paths.keys()):
+                if known_path == path or known_path.startswith(prefix):
+                    del self._paths[known_path]
+
+
+def _get_remaining_pages(
+    offset: int,
+    limit: int,
+    total: int,
+    remaining_items: Optional[int]
+) -> Generator[Tuple[int, int], None, None]:
+    # Yields (offset, limit) of the pages that follow the first page of a listing,
+    # remaining_items is the number of items still needed after the first page
+    while offset + limit < total:
+        page_limit = limit
+
+        if remaining_items is not None:
+            if remaining_items <= 0:
+                break
+
+            page_limit = min(remaining_items, limit)
+            remaining_items -= page_limit
+
+        offset += limit
+
+        yield offset, page_limit
+
+
+def _make_segments(size: int, segment_size: int) -> List[Tuple[int, int]]:
+    # Returns a list of inclusive byte ranges (as used by the Range header)
+    if segment_size <= 0:
+        raise ValueError("segment_size must be a positive integer")
+
+    return [(start, min(start + segment_size, size) - 1) for start in range(0, size, segment_size)]
+
+
 def _set_authorization_header(
     kwargs: Dict[str, Any],
     new_token: Optional[str] = None
@@ -121,3 +596,14 @@ def _validate_get_type_response(response: ResourceObject) -> ResourceObject:
         raise InvalidResponseError("Response did not contain the type field")
 
     return response
+
+
+def _walk_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # walk() needs to know names and types of the children, regardless of the requested fields
+    kwargs = dict(kwargs)
+    fields = kwargs.get("fields")
+
+    if fields is not None:
+        kwargs["fields"] = list(fields) + [field for field in ("name", "type") if field not in fields]
+
+    return kwargs
@@ -37,6 +37,7 @@ __all__ = [
     "is_operation_link",
     "is_public_resource_link",
     "is_resource_link",
+    "normalize_path",
     "remove_path_schema",
     "str_or_dict_or_error",
     "str_or_error",
@@ -151,6 +152,18 @@ def ensure_path_has_schema(path: str, default_schema: str = "disk") -> str:
     return default_schema + ":/" + path
 
 
+def normalize_path(path: str) -> str:
+    # Makes sure that equivalent paths have the same representation:
+    # "/a/" -> "disk:/a", but "disk:/" stays as is
+
+    path = ensure_path_has_schema(path)
+
+    while path.endswith("/") and not path.endswith(":/"):
+        path = path[:-1]
+
+    return path
+
+
 def remove_path_schema(path: str) -> Tuple[str, str]:
     """
         Remove schema from path.
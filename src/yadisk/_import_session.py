@@ -33,8 +33,9 @@ sessions = {
 }
 
 async_sessions = {
-    "aiohttp": ("sessions.aiohttp_session",     "AIOHTTPSession"),
-    "httpx":   ("sessions.async_httpx_session", "AsyncHTTPXSession")
+    "aiohttp": ("sessions.aiohttp_session",      "AIOHTTPSession"),
+    "httpx":   ("sessions.async_httpx_session",  "AsyncHTTPXSession"),
+    "pycurl":  ("sessions.async_pycurl_session", "AsyncPycURLSession")
 }
 
 
@@ -77,6 +78,7 @@ def import_async_session(name: "AsyncSessionName") -> Type["AsyncSession"]:
 
           * :code:`"aiohttp"` - :any:`AIOHTTPSession`
           * :code:`"httpx"` - :any:`AsyncHTTPXSession`
+          * :code:`"pycurl"` - :any:`AsyncPycURLSession`
 
         :raises ImportError: could not import module
         :raises ValueError: unknown name
@@ -18,8 +18,9 @@
 
 from typing import Optional, Any, TypeVar
 from .exceptions import YaDiskError
+from .pool import PoolStats
 from ._typing_compat import Dict
-from .utils import get_exception
+from .utils import CaseInsensitiveDict, get_exception
 from .objects import ErrorObject
 from .types import (
     ConsumeCallback, JSON, HTTPMethod, Headers, Payload, TimeoutParameter
@@ -36,16 +37,19 @@ class Response:
         derived from :any:`YaDiskError`.
 
         :ivar status: `int`, HTTP status code
+        :ivar headers: :any:`CaseInsensitiveDict`, response headers
     """
 
     _Self = TypeVar("_Self", bound="Response")
 
     status: int
+    headers: CaseInsensitiveDict
 
     def __init__(self) -> None:
         """Constructs a :any:`Response` object."""
 
         self.status = 0
+        self.headers = CaseInsensitiveDict()
 
     def json(self) -> JSON:
         """
@@ -151,6 +155,17 @@ class Session:
         """
         raise NotImplementedError
 
+    def get_pool_stats(self) -> PoolStats:
+        """
+            Returns statistics of the connection pool.
+
+            .. note::
+               This is an abstract method that needs to be implemented.
+
+            :returns: :any:`PoolStats`
+        """
+        raise NotImplementedError
+
     def close(self) -> None:
         """
             Closes the session.
@@ -23,6 +23,7 @@ __all__ = [
     "Awaitable",
     "Callable",
     "Coroutine",
+    "Deque",
     "Dict",
     "Generator",
     "Iterable",
@@ -48,7 +49,7 @@ if sys.version_info < (3, 10):
     from typing import (
         List, Dict, Set, Tuple, Callable, Iterable, Generator, AsyncGenerator,
         Coroutine, Awaitable, AsyncIterable, Iterator, AsyncIterator, Mapping,
-        Type
+        Type, Deque
     )
 else:
     from collections.abc import (
@@ -56,8 +57,10 @@ else:
         AsyncIterable, Iterator, AsyncIterator, Mapping
     )
 
+    from collections import deque
+
     if TYPE_CHECKING:  # pragma: no cover
-        from typing import List, Dict, Set, Tuple, Type
+        from typing import List, Dict, Set, Tuple, Type, Deque
     else:
         # mypy complains about this
         List = list
@@ -65,3 +68,4 @@ else:
         Set = set
         Tuple = tuple
         Type = type
+        Deque = deque
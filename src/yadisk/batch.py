@@ -0,0 +1,755 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import queue
+import time
+
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ._api import APIRequest, GetDownloadLinkRequest, GetMetaRequest, GetUploadLinkRequest
+from ._client_common import (
+    _add_authorization_header, _add_spoof_user_agent_header, _apply_default_args,
+    _filter_request_kwargs, _get_circuit_breaker_kwargs, _get_rate_limiter_retry_on,
+    _read_file_as_generator, _report_to_rate_limiter, _validate_link_response
+)
+from ._session import Response
+from ._typing_compat import Callable, Deque, Dict, Generator, List, Tuple
+from .objects import LinkObject, SyncResourceLinkObject
+from .utils import CaseInsensitiveDict, _RetryState
+from . import settings
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._client import Client
+    from ._session import Session
+    from .types import ConsumeCallback, FileOrPath, FileOrPathDestination, HTTPMethod
+
+__all__ = ["Batch", "BatchResult"]
+
+
+class BatchResult:
+    """
+        Outcome of a single request of a :any:`Batch`.
+
+        A failed request doesn't stop the rest of the batch, instead the error
+        is stored in :code:`error`.
+
+        :param result: return value of the request, `None` if it failed
+        :param error: `Exception` or `None`, the reason of a failure
+
+        :ivar result: return value of the request, `None` if it failed
+        :ivar error: `Exception` or `None`, the reason of a failure
+    """
+
+    result: Any
+    error: Optional[BaseException]
+
+    def __init__(self, result: Any = None, error: Optional[BaseException] = None) -> None:
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the request succeeded, `False` otherwise"""
+
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else "failed"
+
+        return f"<{self.__class__.__name__}: {status} result={self.result!r} error={self.error!r}>"
+
+
+BatchCallback = Callable[[BatchResult], None]
+
+
+class _BatchRequest:
+    # An HTTP request yielded by a batch job, the response is sent back into the job.
+    # If consume_callback is specified, the body of a successful (2xx) response
+    # is passed to it, otherwise the body is kept in the response
+
+    def __init__(
+        self,
+        method: "HTTPMethod",
+        url: str,
+        kwargs: Dict[str, Any],
+        consume_callback: Optional["ConsumeCallback"] = None
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        self.consume_callback = consume_callback
+
+
+# Jobs are generators that yield requests to be sent or delays (in seconds) to wait for
+_Job = Generator[Union[_BatchRequest, float], Optional[Response], Any]
+
+_TransferCallback = Callable[[Optional[Response], Optional[BaseException]], None]
+
+
+class _BatchTransport:
+    # Sends the requests of a batch. Sessions can provide their own
+    # implementation with _open_batch_transport(max_concurrency)
+
+    def start(self, request: _BatchRequest, callback: _TransferCallback) -> None:
+        # Starts sending the request, callback() must be called from wait()
+        # with either a fully received response or an exception
+        raise NotImplementedError
+
+    def wait(self, timeout: Optional[float]) -> None:
+        # Waits until at least one of the requests is finished (or until the timeout expires)
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class _ThreadedTransport(_BatchTransport):
+    # Fallback for sessions that can only send one request at a time
+
+    def __init__(self, session: "Session", max_workers: int) -> None:
+        self.session = session
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.completed: queue.Queue = queue.Queue()
+
+    def _send(self, request: _BatchRequest) -> Response:
+        kwargs = dict(request.kwargs)
+
+        if request.consume_callback is None:
+            kwargs["stream"] = False
+
+            return self.session.send_request(request.method, request.url, **kwargs)
+
+        kwargs["stream"] = True
+
+        response = self.session.send_request(request.method, request.url, **kwargs)
+
+        try:
+            if 200 <= response.status < 300:
+                response.download(request.consume_callback)
+        except BaseException:
+            response.close()
+            raise
+
+        return response
+
+    def start(self, request: _BatchRequest, callback: _TransferCallback) -> None:
+        def run() -> None:
+            try:
+                response = self._send(request)
+            except Exception as e:
+                self.completed.put((callback, None, e))
+            else:
+                self.completed.put((callback, response, None))
+
+        self.executor.submit(run)
+
+    def wait(self, timeout: Optional[float]) -> None:
+        try:
+            item = self.completed.get(timeout=timeout)
+        except queue.Empty:
+            return
+
+        while True:
+            callback, response, error = item
+            callback(response, error)
+
+            try:
+                item = self.completed.get_nowait()
+            except queue.Empty:
+                return
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+        while not self.completed.empty():
+            _, response, _ = self.completed.get_nowait()
+
+            if response is not None:
+                response.close()
+
+
+def _open_transport(session: "Session", max_concurrency: int) -> _BatchTransport:
+    open_transport = getattr(session, "_open_batch_transport", None)
+
+    if open_transport is not None:
+        return open_transport(max_concurrency)
+
+    return _ThreadedTransport(session, max_concurrency)
+
+
+def _api_attempt(request: APIRequest, client: "Client", then: Callable[[Any], Any]) -> _Job:
+    # Same as APIRequest._attempt(), except that nothing blocks
+    assert request.method is not None
+
+    rate_limiter = client.rate_limiter
+
+    if rate_limiter is not None:
+        delay = rate_limiter.requests.reserve()
+
+        if delay:
+            yield delay
+
+    response = yield _BatchRequest(request.method, request.url, request._prepare_send_args())
+    assert response is not None
+
+    return request._process_response(response, client, then)
+
+
+def _with_retries(attempt: Callable[[], _Job], **retry_kwargs) -> _Job:
+    # Same as auto_retry(), except that nothing blocks
+    state = _RetryState(**retry_kwargs)
+
+    while True:
+        state.before_attempt()
+
+        try:
+            result = yield from attempt()
+        except Exception as e:
+            delay = state.get_retry_delay(e)
+
+            if delay is None:
+                raise
+        except BaseException:
+            state.record_interrupt()
+            raise
+        else:
+            state.record_success()
+
+            return result
+
+        if delay:
+            yield delay
+
+
+def _api_job(request: APIRequest, client: "Client", then: Callable[[Any], Any]) -> _Job:
+    settings.logger.info(f"sending APIRequest {request.__class__.__name__} in a batch, {request.method} {request.url}")
+
+    return (yield from _with_retries(
+        lambda: _api_attempt(request, client, then),
+        n_retries=request.n_retries,
+        retry_interval=request.retry_interval,
+        **request._get_auto_retry_kwargs(client)
+    ))
+
+
+def _get_href(response: LinkObject) -> str:
+    href = _validate_link_response(response).href
+    assert href is not None
+
+    return href
+
+
+def _upload_job(
+    client: "Client",
+    link_request: APIRequest,
+    file_or_path: "FileOrPath",
+    dst_path: str,
+    kwargs: Dict[str, Any]
+) -> _Job:
+    n_retries = kwargs.get("n_retries")
+
+    if n_retries is None:
+        n_retries = settings.DEFAULT_N_RETRIES
+
+    retry_interval = kwargs.get("retry_interval")
+
+    if retry_interval is None:
+        retry_interval = settings.DEFAULT_UPLOAD_RETRY_INTERVAL
+
+    put_kwargs = dict(kwargs)
+    _filter_request_kwargs(put_kwargs)
+    put_kwargs.pop("spoof_user_agent", None)
+
+    headers = put_kwargs["headers"] = CaseInsensitiveDict(put_kwargs.get("headers") or {})
+
+    # Disable keep-alive by default, since the upload server is random
+    headers.setdefault("Connection", "close")
+    headers.setdefault("Content-Type", "application/octet-stream")
+
+    file: Any = None
+    close_file = False
+    file_position = 0
+    iterator_factory = None
+
+    try:
+        if isinstance(file_or_path, (str, bytes)):
+            close_file = True
+            file = client.open_file(file_or_path, "rb")
+        elif callable(file_or_path):
+            iterator_factory = file_or_path
+        else:
+            file = file_or_path
+
+        if file is not None and file.seekable():
+            file_position = file.tell()
+        elif iterator_factory is None:
+            # The file can't be read again
+            n_retries = 0
+
+        def attempt() -> _Job:
+            link = yield from _api_attempt(link_request, client, _get_href)
+
+            if iterator_factory is not None:
+                payload = iterator_factory()
+            elif file.seekable():
+                file.seek(file_position)
+                payload = file
+            else:
+                payload = _read_file_as_generator(file)
+
+            settings.logger.info(f"uploading file to {dst_path} at {link} in a batch")
+
+            response = yield _BatchRequest("PUT", link, dict(put_kwargs, data=payload))
+            assert response is not None
+
+            if response.status != 201:
+                raise _report_to_rate_limiter(client.rate_limiter, response.get_exception())
+
+        yield from _with_retries(
+            attempt,
+            n_retries=n_retries,
+            retry_interval=retry_interval,
+            retry_on=_get_rate_limiter_retry_on(client.rate_limiter),
+            retry_policy=kwargs.get("retry_policy"),
+            **_get_circuit_breaker_kwargs(client.circuit_breakers, "upload")
+        )
+    finally:
+        if close_file and file is not None:
+            file.close()
+
+        client._invalidate_meta(dst_path)
+
+    if client.link_cache is not None:
+        # The file has changed, its download link might be outdated now
+        client.link_cache.invalidate(dst_path, operation="download")
+
+    return SyncResourceLinkObject.from_path(dst_path, yadisk=client)
+
+
+def _download_job(
+    client: "Client",
+    link_request: APIRequest,
+    src_path: str,
+    file_or_path: "FileOrPathDestination",
+    kwargs: Dict[str, Any]
+) -> _Job:
+    n_retries = kwargs.get("n_retries")
+
+    if n_retries is None:
+        n_retries = settings.DEFAULT_N_RETRIES
+
+    get_kwargs = dict(kwargs)
+    _filter_request_kwargs(get_kwargs)
+
+    file: Any = None
+    close_file = False
+    file_position = 0
+
+    try:
+        if isinstance(file_or_path, (str, bytes)):
+            close_file = True
+            file = client.open_file(file_or_path, "wb")
+        else:
+            file = file_or_path
+
+        if file.seekable():
+            file_position = file.tell()
+        else:
+            # The received data can't be overwritten
+            n_retries = 0
+
+        def attempt() -> _Job:
+            link = yield from _api_attempt(link_request, client, _get_href)
+
+            # Every attempt starts from the beginning
+            if file.seekable():
+                file.seek(file_position)
+
+            settings.logger.info(f"downloading file {src_path} from {link} in a batch")
+
+            response = yield _BatchRequest("GET", link, get_kwargs, consume_callback=file.write)
+            assert response is not None
+
+            if response.status != 200:
+                raise _report_to_rate_limiter(client.rate_limiter, response.get_exception())
+
+        yield from _with_retries(
+            attempt,
+            n_retries=n_retries,
+            retry_interval=kwargs.get("retry_interval"),
+            retry_on=_get_rate_limiter_retry_on(client.rate_limiter),
+            retry_policy=kwargs.get("retry_policy"),
+            **_get_circuit_breaker_kwargs(client.circuit_breakers, "download")
+        )
+    finally:
+        if close_file and file is not None:
+            file.close()
+
+    return SyncResourceLinkObject.from_path(src_path, yadisk=client)
+
+
+class Batch:
+    """
+        Runs many requests of a :any:`Client` concurrently, from the calling
+        thread. Returned by :any:`Client.batch()`.
+
+        Requests are added with the methods of this class and are sent by
+        :any:`Batch.run()` (or at the end of the :code:`with` block), at most
+        :code:`max_concurrency` at a time. Each request is retried according
+        to the usual retry settings (:code:`n_retries`, :code:`retry_policy`,
+        rate limiter and circuit breakers of the client), waiting for a retry
+        doesn't hold back the other requests.
+
+        With :any:`PycURLSession` all the transfers are driven by a single
+        `CurlMulti` handle, other sessions send the requests from a thread pool.
+        Either way, callbacks are called and results are processed in the
+        thread that runs the batch.
+
+        Batches bypass hedging, the meta cache (though uploads still
+        invalidate it) and the link cache, the byte rate of the rate limiter
+        is not enforced. Interrupted transfers are restarted from the beginning.
+
+        :param client: :any:`Client`, the client whose session and settings are used
+        :param max_concurrency: `int`, maximum number of requests that are processed at once
+
+        :ivar client: :any:`Client`, the client whose session and settings are used
+        :ivar max_concurrency: `int`, maximum number of requests that are processed at once
+        :ivar results: `list` of :any:`BatchResult` of the last run, in the order the requests were added
+
+        Usage example:
+
+        .. code:: python
+
+           with client.batch(max_concurrency=100) as batch:
+               for path in paths:
+                   batch.get_meta(path, callback=print)
+
+           for result in batch.results:
+               if result.ok:
+                   print(result.result.size)
+    """
+
+    client: "Client"
+    max_concurrency: int
+    results: List[BatchResult]
+
+    def __init__(self, client: "Client", max_concurrency: int = 64) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.results = []
+
+        self._jobs: List[Tuple[Callable[[], _Job], Optional[BatchCallback]]] = []
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.run()
+
+    def _prepare_kwargs(self, kwargs: Dict[str, Any]) -> None:
+        _apply_default_args(kwargs, self.client.default_args)
+        _add_authorization_header(kwargs, self.client.token)
+
+    def _add_job(self, job: Callable[[], _Job], callback: Optional[BatchCallback]) -> int:
+        self._jobs.append((job, callback))
+
+        return len(self._jobs) - 1
+
+    def add(
+        self,
+        request: APIRequest,
+        /,
+        *,
+        callback: Optional[BatchCallback] = None,
+        then: Optional[Callable[[Any], Any]] = None
+    ) -> int:
+        """
+            Add a prepared API request (one of the request classes used by
+            :any:`Client`). The request is sent as is, e.g., the `Authorization`
+            header is not added.
+
+            :param request: `APIRequest`, the request to send
+            :param callback: function or `None`, called with the :any:`BatchResult` of the request
+            :param then: function or `None`, applied to the processed response
+                         (the result is the processed response otherwise)
+
+            :returns: `int`, index of the request's result in :code:`results`
+        """
+
+        return self._add_job(lambda: _api_job(request, self.client, then or (lambda x: x)), callback)
+
+    def get_meta(self, path: str, /, *, callback: Optional[BatchCallback] = None, **kwargs) -> int:
+        """
+            Add a request to get meta information about a file/directory,
+            see :any:`Client.get_meta()` for the supported parameters.
+
+            :param path: path to the resource
+            :param callback: function or `None`, called with the :any:`BatchResult` of the request
+
+            :returns: `int`, index of the request's result (:any:`SyncResourceObject`) in :code:`results`
+        """
+
+        self._prepare_kwargs(kwargs)
+
+        return self.add(GetMetaRequest(self.client.session, path, **kwargs), callback=callback)
+
+    def get_download_link(self, path: str, /, *, callback: Optional[BatchCallback] = None, **kwargs) -> int:
+        """
+            Add a request to get a download link for a file (or a directory),
+            see :any:`Client.get_download_link()` for the supported parameters.
+
+            :param path: path to the resource
+            :param callback: function or `None`, called with the :any:`BatchResult` of the request
+
+            :returns: `int`, index of the request's result (`str`) in :code:`results`
+        """
+
+        self._prepare_kwargs(kwargs)
+
+        request = GetDownloadLinkRequest(self.client.session, path, fields=["href"], **kwargs)
+
+        return self.add(request, callback=callback, then=_get_href)
+
+    def get_upload_link(
+        self,
+        path: str,
+        /,
+        *,
+        callback: Optional[BatchCallback] = None,
+        spoof_user_agent: bool = True,
+        **kwargs
+    ) -> int:
+        """
+            Add a request to get a link to upload the file,
+            see :any:`Client.get_upload_link()` for the supported parameters.
+
+            :param path: destination path
+            :param callback: function or `None`, called with the :any:`BatchResult` of the request
+            :param spoof_user_agent: `bool`, if `True` (default), the `User-Agent` header
+                will be set to a special value, which should allow bypassing of
+                Yandex.Disk's upload speed limit
+
+            :returns: `int`, index of the request's result (`str`) in :code:`results`
+        """
+
+        self._prepare_kwargs(kwargs)
+
+        if spoof_user_agent:
+            _add_spoof_user_agent_header(kwargs)
+
+        request = GetUploadLinkRequest(self.client.session, path, fields=["href"], **kwargs)
+
+        return self.add(request, callback=callback, then=_get_href)
+
+    def upload(
+        self,
+        file_or_path: "FileOrPath",
+        dst_path: str,
+        /,
+        *,
+        callback: Optional[BatchCallback] = None,
+        **kwargs
+    ) -> int:
+        """
+            Add an upload of a file, see :any:`Client.upload()` for the supported parameters.
+            Files given by path are only opened when their upload starts.
+
+            :param file_or_path: path, file-like object to be uploaded or
+                                 a function that returns an iterator (or generator)
+            :param dst_path: destination path
+            :param callback: function or `None`, called with the :any:`BatchResult` of the upload
+
+            :returns: `int`, index of the upload's result (:any:`SyncResourceLinkObject`) in :code:`results`
+        """
+
+        _apply_default_args(kwargs, self.client.default_args)
+
+        timeout = kwargs.get("timeout", ...)
+
+        if timeout is ...:
+            kwargs["timeout"] = settings.DEFAULT_UPLOAD_TIMEOUT
+
+        link_kwargs = dict(kwargs, n_retries=0, retry_interval=0.0)
+        link_kwargs["headers"] = CaseInsensitiveDict(kwargs.get("headers") or {})
+        _add_authorization_header(link_kwargs, self.client.token)
+
+        if link_kwargs.pop("spoof_user_agent", True):
+            _add_spoof_user_agent_header(link_kwargs)
+
+        link_request = GetUploadLinkRequest(self.client.session, dst_path, fields=["href"], **link_kwargs)
+
+        return self._add_job(lambda: _upload_job(self.client, link_request, file_or_path, dst_path, kwargs), callback)
+
+    def download(
+        self,
+        src_path: str,
+        file_or_path: "FileOrPathDestination",
+        /,
+        *,
+        callback: Optional[BatchCallback] = None,
+        **kwargs
+    ) -> int:
+        """
+            Add a download of a file, see :any:`Client.download()` for the supported parameters
+            (segmented downloads are not supported). Files given by path are
+            only opened when their download starts.
+
+            :param src_path: source path
+            :param file_or_path: destination path or file-like object
+            :param callback: function or `None`, called with the :any:`BatchResult` of the download
+
+            :returns: `int`, index of the download's result (:any:`SyncResourceLinkObject`) in :code:`results`
+        """
+
+        _apply_default_args(kwargs, self.client.default_args)
+
+        link_kwargs = dict(kwargs, n_retries=0, retry_interval=0.0)
+        link_kwargs["headers"] = CaseInsensitiveDict(kwargs.get("headers") or {})
+        _add_authorization_header(link_kwargs, self.client.token)
+
+        link_request = GetDownloadLinkRequest(self.client.session, src_path, fields=["href"], **link_kwargs)
+
+        return self._add_job(lambda: _download_job(self.client, link_request, src_path, file_or_path, kwargs), callback)
+
+    def run(self) -> List[BatchResult]:
+        """
+            Send all the added requests and wait for them to finish.
+            The batch is emptied afterwards, so it can be reused.
+
+            An exception raised by a callback stops the batch and is propagated.
+
+            :returns: `list` of :any:`BatchResult`, in the order the requests were added
+        """
+
+        jobs, self._jobs = self._jobs, []
+        results: List[Optional[BatchResult]] = [None] * len(jobs)
+
+        # Jobs that have been started, but haven't finished yet
+        running: Dict[int, _Job] = {}
+
+        # Jobs that can be resumed right away, with a value or an exception to send into them
+        ready: Deque[Tuple[int, Optional[Response], Optional[BaseException]]] = deque()
+
+        # Jobs that are waiting for a delay to expire: (deadline, index)
+        timers: List[Tuple[float, int]] = []
+
+        n_started = 0
+        n_sending = 0
+
+        transport = _open_transport(self.client.session, self.max_concurrency)
+
+        def make_callback(index: int) -> _TransferCallback:
+            def callback(response: Optional[Response], error: Optional[BaseException]) -> None:
+                nonlocal n_sending
+
+                n_sending -= 1
+                ready.append((index, response, error))
+
+            return callback
+
+        def finish(index: int, result: BatchResult) -> None:
+            del running[index]
+            results[index] = result
+
+            callback = jobs[index][1]
+
+            if callback is not None:
+                callback(result)
+
+        def resume(index: int, value: Optional[Response], error: Optional[BaseException]) -> None:
+            nonlocal n_sending
+
+            job = running[index]
+
+            try:
+                if error is not None:
+                    item = job.throw(error)
+                else:
+                    item = job.send(value)
+            except StopIteration as e:
+                finish(index, BatchResult(e.value))
+                return
+            except Exception as e:
+                finish(index, BatchResult(None, e))
+                return
+            finally:
+                if value is not None:
+                    value.close()
+
+            if isinstance(item, _BatchRequest):
+                n_sending += 1
+
+                try:
+                    transport.start(item, make_callback(index))
+                except Exception as e:
+                    n_sending -= 1
+                    ready.append((index, None, e))
+            elif item > 0:
+                heapq.heappush(timers, (time.monotonic() + item, index))
+            else:
+                ready.append((index, None, None))
+
+        try:
+            while True:
+                while n_started < len(jobs) and len(running) < self.max_concurrency:
+                    running[n_started] = jobs[n_started][0]()
+                    ready.append((n_started, None, None))
+                    n_started += 1
+
+                while ready:
+                    resume(*ready.popleft())
+
+                if n_started < len(jobs) and len(running) < self.max_concurrency:
+                    continue
+
+                if not running:
+                    break
+
+                timeout: Optional[float] = None
+
+                if timers:
+                    timeout = max(0.0, timers[0][0] - time.monotonic())
+
+                if n_sending:
+                    transport.wait(timeout)
+                elif timeout:
+                    time.sleep(timeout)
+
+                now = time.monotonic()
+
+                while timers and timers[0][0] <= now:
+                    ready.append((heapq.heappop(timers)[1], None, None))
+        finally:
+            for job in running.values():
+                job.close()
+
+            transport.close()
+
+        self.results = [result for result in results if result is not None]
+
+        return self.results
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+from typing import Optional
+
+from .types import TransferStatus
+
+__all__ = ["TransferResult"]
+
+
+class TransferResult:
+    """
+        Outcome of a transfer of a single file, reported by bulk operations,
+        such as :any:`Client.upload_tree()` and :any:`Client.download_tree()`.
+
+        Bulk operations do not stop at the first error, instead the error is
+        stored in :code:`error` and the rest of the files are still transferred.
+
+        :param local_path: `str`, path to the local file
+        :param remote_path: `str`, path to the file on Disk
+        :param status: `"uploaded"`, `"downloaded"`, `"skipped"` or `"failed"`
+        :param error: `Exception` or `None`, the reason of a failure
+
+        :ivar local_path: `str`, path to the local file
+        :ivar remote_path: `str`, path to the file on Disk
+        :ivar status: `"uploaded"`, `"downloaded"`, `"skipped"` or `"failed"`
+        :ivar error: `Exception` or `None`, the reason of a failure
+    """
+
+    local_path: str
+    remote_path: str
+    status: TransferStatus
+    error: Optional[BaseException]
+
+    def __init__(
+        self,
+        local_path: str,
+        remote_path: str,
+        status: TransferStatus,
+        error: Optional[BaseException] = None
+    ) -> None:
+        self.local_path = local_path
+        self.remote_path = remote_path
+        self.status = status
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the file was transferred or skipped, `False` otherwise"""
+
+        return self.status != "failed"
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self.status} "
+            f"local_path={self.local_path!r} remote_path={self.remote_path!r} error={self.error!r}>"
+        )
@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+import json
+import posixpath
+import sqlite3
+import threading
+import time
+
+from typing import Any, Literal, Optional
+
+from ._common import ensure_path_has_schema, normalize_path
+from ._typing_compat import Dict, List, Tuple
+from . import settings
+
+__all__ = [
+    "LinkCache",
+    "MemoryMetaCacheBackend",
+    "MetaCache",
+    "MetaCacheBackend",
+    "SQLiteMetaCacheBackend"
+]
+
+LinkOperation = Literal["upload", "download"]
+
+
+class LinkCache:
+    """
+        Thread-safe cache of upload and download links, returned by
+        :any:`Client.get_upload_link()` and :any:`Client.get_download_link()`
+        (or their async counterparts).
+
+        A cached link is leased for at most :code:`ttl` seconds and is dropped
+        as soon as a transfer using it fails with an error returned by the
+        server (e.g., 403, 404 or 410). Upload links are dropped after a
+        successful upload. Connection errors and timeouts do not invalidate
+        links, so retries can reuse the link without an extra API request.
+
+        The same instance can be shared by several clients, as long as they
+        use the same token.
+
+        :param ttl: `float` or `None`, lease duration in seconds
+                    (:any:`settings.DEFAULT_LINK_CACHE_TTL` by default)
+        :param max_size: `int`, maximum number of links stored in the cache
+
+        :ivar ttl: `float`, lease duration in seconds
+        :ivar max_size: `int`, maximum number of links stored in the cache
+    """
+
+    ttl: float
+    max_size: int
+
+    def __init__(self, ttl: Optional[float] = None, max_size: int = 1024) -> None:
+        if ttl is None:
+            ttl = settings.DEFAULT_LINK_CACHE_TTL
+
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._links: OrderedDict[Tuple[str, bool, str], Tuple[str, float]] = OrderedDict()
+
+    @staticmethod
+    def _make_key(path: str, overwrite: bool, operation: LinkOperation) -> Tuple[str, bool, str]:
+        return ensure_path_has_schema(path), bool(overwrite), operation
+
+    def get(self, path: str, overwrite: bool, operation: LinkOperation) -> Optional[str]:
+        """
+            Get a cached link.
+
+            :param path: path to the resource
+            :param overwrite: `bool`, value of the :code:`overwrite` parameter
+                              used to obtain the link (`False` for downloads)
+            :param operation: `"upload"` or `"download"`
+
+            :returns: `str` or `None` if the link is missing or has expired
+        """
+
+        key = self._make_key(path, overwrite, operation)
+
+        with self._lock:
+            entry = self._links.get(key)
+
+            if entry is None:
+                return None
+
+            link, expires_at = entry
+
+            if time.monotonic() >= expires_at:
+                del self._links[key]
+                return None
+
+            self._links.move_to_end(key)
+
+            return link
+
+    def put(self, path: str, overwrite: bool, operation: LinkOperation, link: str) -> None:
+        """
+            Put a link into the cache.
+
+            :param path: path to the resource
+            :param overwrite: `bool`, value of the :code:`overwrite` parameter
+                              used to obtain the link (`False` for downloads)
+            :param operation: `"upload"` or `"download"`
+            :param link: `str`, the link itself
+        """
+
+        key = self._make_key(path, overwrite, operation)
+
+        with self._lock:
+            self._links[key] = (link, time.monotonic() + self.ttl)
+            self._links.move_to_end(key)
+
+            while len(self._links) > self.max_size:
+                self._links.popitem(last=False)
+
+    def invalidate(
+        self,
+        path: str,
+        overwrite: Optional[bool] = None,
+        operation: Optional[LinkOperation] = None
+    ) -> None:
+        """
+            Remove links from the cache.
+
+            :param path: path to the resource
+            :param overwrite: `bool` or `None`, if `None`, links obtained with
+                              any value of :code:`overwrite` are removed
+            :param operation: `"upload"`, `"download"` or `None` (both)
+        """
+
+        path = ensure_path_has_schema(path)
+
+        with self._lock:
+            for key in list(self._links.keys()):
+                key_path, key_overwrite, key_operation = key
+
+                if key_path != path:
+                    continue
+
+                if overwrite is not None and key_overwrite != bool(overwrite):
+                    continue
+
+                if operation is not None and key_operation != operation:
+                    continue
+
+                del self._links[key]
+
+    def clear(self) -> None:
+        """Remove all links from the cache."""
+
+        with self._lock:
+            self._links.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._links)
+
+
+# Parameters of get_meta() that affect the returned resource
+_META_PARAMS = ("fields", "limit", "offset", "preview_crop", "preview_size", "sort")
+
+
+def _is_in_subtree(path: str, root: str) -> bool:
+    if path == root:
+        return True
+
+    prefix = root if root.endswith("/") else root + "/"
+
+    return path.startswith(prefix)
+
+
+def _get_ancestors(path: str) -> List[str]:
+    ancestors: List[str] = []
+
+    while True:
+        parent = posixpath.dirname(path)
+
+        # "disk:/a" -> "disk:" -> "disk:/"
+        if parent.endswith(":"):
+            parent += "/"
+
+        if parent == path or not parent:
+            return ancestors
+
+        ancestors.append(parent)
+        path = parent
+
+
+class MetaCacheBackend:
+    """
+        Storage backend for :any:`MetaCache`. Entries are opaque strings,
+        each of them is associated with the path it describes.
+
+        Backends must be safe to use from multiple threads.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """
+            Get an entry.
+
+            :param key: `str`, entry key
+
+            :returns: `str` or `None` if the entry is missing or has expired
+        """
+
+        raise NotImplementedError
+
+    def put(self, key: str, path: str, value: str, expires_at: float) -> None:
+        """
+            Store an entry, possibly evicting the least recently used ones.
+
+            :param key: `str`, entry key
+            :param path: `str`, normalized path of the resource
+            :param value: `str`, the entry itself
+            :param expires_at: `float`, UNIX timestamp after which the entry expires
+        """
+
+        raise NotImplementedError
+
+    def invalidate(self, path: str, ancestors: List[str]) -> None:
+        """
+            Remove all entries for :code:`path`, everything under it and its ancestors.
+
+            :param path: `str`, normalized path of the resource
+            :param ancestors: `list` of `str`, normalized paths of the ancestors
+        """
+
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryMetaCacheBackend(MetaCacheBackend):
+    """
+        In-process LRU storage for :any:`MetaCache`.
+
+        :param max_size: `int`, maximum number of entries
+
+        :ivar max_size: `int`, maximum number of entries
+    """
+
+    max_size: int
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[str, str, float]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            _, value, expires_at = entry
+
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def put(self, key: str, path: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (path, value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str, ancestors: List[str]) -> None:
+        ancestor_set = set(ancestors)
+
+        with self._lock:
+            for key, (entry_path, _, _) in list(self._entries.items()):
+                if entry_path in ancestor_set or _is_in_subtree(entry_path, path):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteMetaCacheBackend(MetaCacheBackend):
+    """
+        SQLite-based storage for :any:`MetaCache`. Several processes can
+        share the same database file, invalidations made by one of them
+        are immediately visible to the others. Entries are not keyed by the
+        token, so all of them must use the same token.
+
+        :param filename: `str`, path to the database file
+        :param max_size: `int`, maximum number of entries
+        :param timeout: `float`, how long to wait for a database lock held by
+                        another process (in seconds)
+
+        :ivar filename: `str`, path to the database file
+        :ivar max_size: `int`, maximum number of entries
+    """
+
+    filename: str
+    max_size: int
+
+    def __init__(self, filename: str, max_size: int = 100000, timeout: float = 30.0) -> None:
+        self.filename = filename
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            filename, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta_cache ("
+                "key TEXT PRIMARY KEY, path TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS meta_cache_path ON meta_cache (path)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS meta_cache_accessed_at ON meta_cache (accessed_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM meta_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+
+            if now >= expires_at:
+                self._connection.execute("DELETE FROM meta_cache WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute("UPDATE meta_cache SET accessed_at = ? WHERE key = ?", (now, key))
+
+            return value
+
+    def put(self, key: str, path: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta_cache (key, path, value, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, path, value, expires_at, time.time())
+                )
+                self._connection.execute(
+                    "DELETE FROM meta_cache WHERE key IN "
+                    "(SELECT key FROM meta_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,)
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+            self._connection.execute("COMMIT")
+
+    def invalidate(self, path: str, ancestors: List[str]) -> None:
+        prefix = path if path.endswith("/") else path + "/"
+        paths = [path, *ancestors]
+
+        with self._lock:
+            self._connection.execute(
+                f"DELETE FROM meta_cache WHERE substr(path, 1, ?) = ? "
+                f"OR path IN ({', '.join('?' for _ in paths)})",
+                (len(prefix), prefix, *paths)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM meta_cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM meta_cache").fetchone()[0]
+
+
+class MetaCache:
+    """
+        Cache of resource metadata, returned by :any:`Client.get_meta()`
+        (or :any:`AsyncClient.get_meta()`), including negative results
+        (:any:`PathNotFoundError`). Everything built on top of
+        :any:`Client.get_meta()`, like :any:`Client.exists()` or
+        :any:`Client.listdir()`, benefits from it as well.
+
+        Entries are keyed by the path and by the parameters that affect the
+        response (:code:`fields`, :code:`limit`, :code:`offset`, etc.),
+        negative entries are keyed by the path alone.
+        Every time the client modifies a resource (upload, mkdir, remove,
+        move, copy, rename, patch, restore or save from a public link),
+        entries for that resource, everything under it and all of its
+        ancestors are invalidated. If the destination is not known in advance
+        (:any:`Client.restore_trash()` without :code:`dst_path`,
+        :any:`Client.save_to_disk()` without :code:`save_path`), the whole
+        cache is cleared.
+        Changes made by other clients only become visible after
+        :code:`ttl` seconds.
+
+        Entries don't depend on the token, so the same instance (or the same
+        :any:`SQLiteMetaCacheBackend` database) can only be shared by clients
+        that use the same token, otherwise metadata of one account would be
+        returned to another.
+
+        :param ttl: `float` or `None`, lifetime of an entry in seconds
+                    (:any:`settings.DEFAULT_META_CACHE_TTL` by default)
+        :param backend: :any:`MetaCacheBackend` or `None`, storage backend
+                        (:any:`MemoryMetaCacheBackend` by default)
+        :param cache_not_found: `bool`, whether to cache :any:`PathNotFoundError`
+
+        :ivar ttl: `float`, lifetime of an entry in seconds
+        :ivar backend: :any:`MetaCacheBackend`, storage backend
+        :ivar cache_not_found: `bool`, whether to cache :any:`PathNotFoundError`
+        :ivar hits: `int`, number of lookups that were served from the cache
+        :ivar misses: `int`, number of lookups that were not
+    """
+
+    ttl: float
+    backend: MetaCacheBackend
+    cache_not_found: bool
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        backend: Optional[MetaCacheBackend] = None,
+        cache_not_found: bool = True
+    ) -> None:
+        if ttl is None:
+            ttl = settings.DEFAULT_META_CACHE_TTL
+
+        if backend is None:
+            backend = MemoryMetaCacheBackend()
+
+        self.ttl = ttl
+        self.backend = backend
+        self.cache_not_found = cache_not_found
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(path: str, params: Dict[str, Any]) -> str:
+        key_params = {}
+
+        for name in _META_PARAMS:
+            value = params.get(name)
+
+            if value is None:
+                continue
+
+            if name == "fields" and not isinstance(value, str):
+                value = ",".join(value)
+
+            key_params[name] = value
+
+        return json.dumps([path, key_params], sort_keys=True)
+
+    def get(self, path: str, params: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+            Look up the metadata of a resource.
+
+            :param path: path to the resource
+            :param params: `dict`, keyword arguments passed to :any:`Client.get_meta()`
+
+            :returns: `tuple` :code:`(hit, resource_json)`, :code:`resource_json`
+                      is `None` if the cache says that the resource does not exist
+        """
+
+        path = normalize_path(path)
+        value = self.backend.get(self._make_key(path, params))
+
+        if value is None and self.cache_not_found:
+            # Absence of a resource doesn't depend on the parameters
+            value = self.backend.get(self._make_key(path, {}))
+
+            if value is not None and json.loads(value) is not None:
+                value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if value is None:
+            return False, None
+
+        return True, json.loads(value)
+
+    def put(self, path: str, params: Dict[str, Any], resource_json: Optional[Dict[str, Any]]) -> None:
+        """
+            Store the metadata of a resource.
+
+            :param path: path to the resource
+            :param params: `dict`, keyword arguments passed to :any:`Client.get_meta()`
+            :param resource_json: `dict` or `None`, response of the API
+                                  (`None` means that the resource does not exist)
+        """
+
+        if resource_json is None and not self.cache_not_found:
+            return
+
+        path = normalize_path(path)
+
+        if resource_json is None:
+            params = {}
+
+        self.backend.put(
+            self._make_key(path, params), path, json.dumps(resource_json), time.time() + self.ttl
+        )
+
+    def invalidate(self, path: str) -> None:
+        """
+            Remove entries for a resource, everything under it and all of its ancestors.
+
+            :param path: path to the resource
+        """
+
+        path = normalize_path(path)
+
+        self.backend.invalidate(path, _get_ancestors(path))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+
+        self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self.backend)
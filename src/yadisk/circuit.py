@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+import threading
+import time
+
+from typing import Literal, Optional
+
+from .exceptions import CircuitBreakerOpenError
+from ._typing_compat import Deque, Dict
+
+__all__ = ["CircuitBreaker", "CircuitBreakers", "CircuitState", "RetryBudget"]
+
+CircuitState = Literal["closed", "open", "half-open"]
+
+
+class RetryBudget:
+    """
+        Limits retries to a fraction of recent requests, so that retries can't
+        multiply the load on a degraded service.
+
+        A retry is allowed if the number of retries within the last :code:`window`
+        seconds stays below :code:`min_retries + ratio * <number of requests>`.
+
+        :param ratio: `float`, maximum number of retries per request
+        :param min_retries: `int`, number of retries that are always allowed within the window
+        :param window: `float`, length of the window (in seconds)
+
+        :ivar ratio: `float`, maximum number of retries per request
+        :ivar min_retries: `int`, number of retries that are always allowed within the window
+        :ivar window: `float`, length of the window (in seconds)
+    """
+
+    ratio: float
+    min_retries: int
+    window: float
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] <= now - self.window:
+                timestamps.popleft()
+
+    @property
+    def requests(self) -> int:
+        """Number of requests within the window."""
+
+        with self._lock:
+            self._expire(time.monotonic())
+
+            return len(self._requests)
+
+    @property
+    def retries(self) -> int:
+        """Number of retries within the window."""
+
+        with self._lock:
+            self._expire(time.monotonic())
+
+            return len(self._retries)
+
+    def record_request(self) -> None:
+        """Record a new (not retried) request."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """
+            Spend a retry from the budget.
+
+            :returns: `bool`, :code:`False` if the budget is exhausted
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+
+            self._retries.append(now)
+
+            return True
+
+
+class CircuitBreaker:
+    """
+        Stops sending requests to a failing endpoint.
+
+        The breaker is :code:`"closed"` (requests are sent) until
+        :code:`failure_threshold` consecutive attempts fail with a retriable error.
+        Then it becomes :code:`"open"`, every request immediately fails with
+        :any:`CircuitBreakerOpenError`. After :code:`recovery_timeout` seconds
+        the breaker becomes :code:`"half-open"` and lets up to :code:`half_open_probes`
+        requests through: it is closed again if a probe succeeds and reopened if
+        a probe fails.
+
+        :param key: `str`, name of the endpoint
+        :param failure_threshold: `int`, number of consecutive failures that open the breaker
+        :param recovery_timeout: `float`, time (in seconds) before probing an open breaker
+        :param half_open_probes: `int`, maximum number of concurrent probes
+
+        :ivar key: `str`, name of the endpoint
+        :ivar failure_threshold: `int`, number of consecutive failures that open the breaker
+        :ivar recovery_timeout: `float`, time (in seconds) before probing an open breaker
+        :ivar half_open_probes: `int`, maximum number of concurrent probes
+    """
+
+    key: str
+    failure_threshold: int
+    recovery_timeout: float
+    half_open_probes: int
+
+    def __init__(
+        self,
+        key: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1
+    ) -> None:
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _update(self, now: float) -> None:
+        if self._state == "open" and now - self._opened_at >= self.recovery_timeout:
+            self._state = "half-open"
+            self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state: :code:`"closed"`, :code:`"open"` or :code:`"half-open"`."""
+
+        with self._lock:
+            self._update(time.monotonic())
+
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        """Number of consecutive failures."""
+
+        with self._lock:
+            return self._failures
+
+    def before_call(self) -> bool:
+        """
+            Must be called before every attempt.
+
+            :raises CircuitBreakerOpenError: the breaker is open or has
+                                             no more half-open probes available
+
+            :returns: `bool`, :code:`True` if the attempt is a half-open probe
+        """
+
+        with self._lock:
+            self._update(time.monotonic())
+
+            if self._state == "closed":
+                return False
+
+            if self._state == "half-open" and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+
+        raise CircuitBreakerOpenError(self.key)
+
+    def record_success(self) -> None:
+        """Record an attempt that reached the server and got a non-retriable response."""
+
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._probes = 0
+
+    def release_probe(self) -> None:
+        """
+            Release a half-open probe whose attempt was interrupted (e.g. cancelled)
+            before its outcome could be recorded.
+        """
+
+        with self._lock:
+            if self._state == "half-open" and self._probes > 0:
+                self._probes -= 1
+
+    def record_failure(self) -> None:
+        """Record an attempt that failed with a retriable error."""
+
+        with self._lock:
+            self._failures += 1
+
+            if self._state == "half-open" or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+
+class CircuitBreakers:
+    """
+        A group of :any:`CircuitBreaker` instances with a shared :any:`RetryBudget`.
+        It can be passed to :any:`Client` and :any:`AsyncClient` as :code:`circuit_breakers`.
+
+        Breakers are created on demand for every endpoint: API requests are keyed
+        by the request class and the host (e.g. :code:`"GetMetaRequest@cloud-api.yandex.net"`),
+        uploads and downloads use :code:`"upload"` and :code:`"download"`.
+
+        :param failure_threshold: `int`, see :any:`CircuitBreaker`
+        :param recovery_timeout: `float`, see :any:`CircuitBreaker`
+        :param half_open_probes: `int`, see :any:`CircuitBreaker`
+        :param retry_budget: :any:`RetryBudget` or `None`, budget shared by all endpoints
+
+        :ivar failure_threshold: `int`, see :any:`CircuitBreaker`
+        :ivar recovery_timeout: `float`, see :any:`CircuitBreaker`
+        :ivar half_open_probes: `int`, see :any:`CircuitBreaker`
+        :ivar retry_budget: :any:`RetryBudget` or `None`, budget shared by all endpoints
+    """
+
+    failure_threshold: int
+    recovery_timeout: float
+    half_open_probes: int
+    retry_budget: Optional[RetryBudget]
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        retry_budget: Optional[RetryBudget] = None
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.retry_budget = retry_budget
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        """
+            Get the breaker for an endpoint, creating it if necessary.
+
+            :param key: `str`, name of the endpoint
+
+            :returns: :any:`CircuitBreaker`
+        """
+
+        with self._lock:
+            breaker = self._breakers.get(key)
+
+            if breaker is None:
+                breaker = CircuitBreaker(key, self.failure_threshold, self.recovery_timeout, self.half_open_probes)
+                self._breakers[key] = breaker
+
+            return breaker
+
+    def get_states(self) -> Dict[str, CircuitState]:
+        """
+            Get the states of all breakers, useful for monitoring.
+
+            :returns: `dict`, maps keys to states
+        """
+
+        with self._lock:
+            breakers = list(self._breakers.values())
+
+        return {breaker.key: breaker.state for breaker in breakers}
@@ -23,6 +23,7 @@ __all__ = [
     "BadGatewayError",
     "BadRequestError",
     "BadVerificationCodeError",
+    "CircuitBreakerOpenError",
     "ConflictError",
     "DirectoryExistsError",
     "FieldValidationError",
@@ -151,6 +152,22 @@ class AsyncOperationPollingTimeoutError(YaDiskError):
         YaDiskError.__init__(self, None, msg, None)
 
 
+class CircuitBreakerOpenError(YaDiskError):
+    """
+        Raised instead of sending a request while the corresponding circuit
+        breaker is open (see :any:`CircuitBreaker`).
+
+        :ivar key: `str`, key of the circuit breaker
+    """
+
+    key: str
+
+    def __init__(self, key: str, msg: str = "") -> None:
+        YaDiskError.__init__(self, None, msg or f"Circuit breaker {key!r} is open", None)
+
+        self.key = key
+
+
 class UnknownYaDiskError(RetriableYaDiskError):
     """Thrown when the request failed but the response does not contain any error info."""
 
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import math
+import threading
+import time
+
+from typing import Any, Optional, TypeVar, Union, TYPE_CHECKING
+
+from . import settings
+from ._typing_compat import Awaitable, Callable, Deque, Dict, Set
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .ratelimit import RateLimiter
+
+__all__ = ["HedgingPolicy"]
+
+T = TypeVar("T")
+
+# Keeps references to the tasks closing discarded responses
+_closing_tasks: Set["asyncio.Future[Any]"] = set()
+
+
+def _discard_response(future: Union[Future, "asyncio.Future[Any]"]) -> None:
+    if future.exception() is None:
+        _close_response(future.result())
+
+
+def _close_response(response: Any) -> None:
+    try:
+        result = response.close()
+    except Exception:
+        return
+
+    # AsyncResponse.close() is a coroutine
+    if asyncio.iscoroutine(result):
+        task = asyncio.ensure_future(result)
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+
+
+def _start_thread(func: Callable[[], T]) -> "Future[T]":
+    # Runs func in a new thread, unlike a thread pool this never queues the call
+    future: "Future[T]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name="yadisk-hedging-request", daemon=True).start()
+
+    return future
+
+
+def _rate_limited(func: Callable[[], T], rate_limiter: Optional["RateLimiter"]) -> Callable[[], T]:
+    if rate_limiter is None:
+        return func
+
+    def wrapper() -> T:
+        rate_limiter.wait_request()
+
+        return func()
+
+    return wrapper
+
+
+class HedgingPolicy:
+    """
+        Hedging of idempotent metadata requests: if a response doesn't arrive
+        within a delay, a duplicate request is sent and whichever successful
+        response comes first is used, the other one is discarded.
+        It can be passed to :any:`Client` and :any:`AsyncClient` as :code:`hedging`.
+
+        Only requests that are safe to repeat are hedged
+        (:any:`APIRequest` subclasses with :code:`hedgeable = True`).
+
+        The delay is either fixed or a percentile of recently observed
+        latencies of the same request type. The number of hedged requests
+        within the last :code:`window` seconds is kept below
+        :code:`min_hedges + max_hedge_ratio * <number of requests>`.
+
+        :any:`Client` runs every request in a thread of its own and sends
+        duplicates through a thread pool of :code:`max_workers` threads,
+        :any:`AsyncClient` uses tasks. The thread pool is shut down
+        by :any:`Client.close()`. If the client has a :any:`RateLimiter`,
+        duplicate requests take a token from it as well.
+
+        :param delay: `float` or `None`, fixed delay (in seconds) before hedging,
+                      `None` means a latency percentile is used
+        :param percentile: `float`, percentile of latencies (0-100) to be used as the delay
+        :param initial_delay: `float`, delay until enough latencies are collected
+        :param min_samples: `int`, minimum number of latencies required to compute the percentile
+        :param max_samples: `int`, number of most recent latencies kept for each request type
+        :param max_hedge_ratio: `float`, maximum fraction of hedged requests
+        :param min_hedges: `int`, number of hedges that are always allowed within the window
+        :param window: `float`, length of the window (in seconds) for the hedge rate cap
+        :param max_workers: `int`, number of threads used by :any:`Client`
+
+        :ivar delay: `float` or `None`, fixed delay before hedging
+        :ivar percentile: `float`, percentile of latencies to be used as the delay
+        :ivar initial_delay: `float`, delay until enough latencies are collected
+        :ivar min_samples: `int`, minimum number of latencies required to compute the percentile
+        :ivar max_hedge_ratio: `float`, maximum fraction of hedged requests
+        :ivar min_hedges: `int`, number of hedges that are always allowed within the window
+        :ivar window: `float`, length of the window (in seconds) for the hedge rate cap
+        :ivar max_workers: `int`, number of threads used by :any:`Client`
+        :ivar n_hedged: `int`, total number of hedged requests
+        :ivar n_hedge_wins: `int`, number of hedged requests where the duplicate answered first
+    """
+
+    delay: Optional[float]
+    percentile: float
+    initial_delay: float
+    min_samples: int
+    max_hedge_ratio: float
+    min_hedges: int
+    window: float
+    max_workers: int
+    n_hedged: int
+    n_hedge_wins: int
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 95.0,
+        initial_delay: float = 0.5,
+        min_samples: int = 20,
+        max_samples: int = 1000,
+        max_hedge_ratio: float = 0.1,
+        min_hedges: int = 1,
+        window: float = 10.0,
+        max_workers: int = 16
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_hedges = min_hedges
+        self.window = window
+        self.max_workers = max_workers
+
+        self._max_samples = max_samples
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._requests: Deque[float] = deque()
+        self._hedges: Deque[float] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.n_hedged = 0
+        self.n_hedge_wins = 0
+
+    def close(self) -> None:
+        """Shut down the thread pool (it will be recreated if needed)."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="yadisk-hedging")
+
+            return self._executor
+
+    def _expire(self, now: float) -> None:
+        for timestamps in (self._requests, self._hedges):
+            while timestamps and timestamps[0] <= now - self.window:
+                timestamps.popleft()
+
+    def record_latency(self, key: str, latency: float) -> None:
+        """
+            Record the latency of a completed request.
+
+            :param key: `str`, request type
+            :param latency: `float`, latency in seconds
+        """
+
+        with self._lock:
+            latencies = self._latencies.get(key)
+
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self._max_samples)
+
+            latencies.append(latency)
+
+    def get_delay(self, key: str) -> float:
+        """
+            Get the delay before hedging a request.
+
+            :param key: `str`, request type
+
+            :returns: `float`, delay in seconds
+        """
+
+        if self.delay is not None:
+            return self.delay
+
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+
+        # Nearest-rank percentile
+        rank = max(1, math.ceil(self.percentile / 100.0 * len(latencies)))
+
+        return latencies[rank - 1]
+
+    def _record_request(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def _try_hedge(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+
+            if len(self._hedges) >= self.min_hedges + self.max_hedge_ratio * len(self._requests):
+                return False
+
+            self._hedges.append(now)
+            self.n_hedged += 1
+
+            return True
+
+    def _record_hedge_win(self) -> None:
+        with self._lock:
+            self.n_hedge_wins += 1
+
+    def _timed(self, key: str, func: Callable[[], T]) -> Callable[[], T]:
+        def wrapper() -> T:
+            start = time.monotonic()
+            result = func()
+            self.record_latency(key, time.monotonic() - start)
+
+            return result
+
+        return wrapper
+
+    def send(
+        self,
+        key: str,
+        func: Callable[[], Any],
+        rate_limiter: Optional["RateLimiter"] = None,
+        accept: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+            Call :code:`func` (which sends a request and returns a response),
+            hedging it if the response takes too long.
+
+            The original request runs in a thread of its own, so it is never
+            queued behind other requests, only the duplicate requests are
+            sent through the thread pool.
+
+            :param key: `str`, request type
+            :param func: function that sends the request
+            :param rate_limiter: :any:`RateLimiter` or `None`, the duplicate request
+                                 waits for a token from it
+            :param accept: function or `None`, tells whether a response is
+                           successful, unsuccessful responses only win if the
+                           other request fails as well
+
+            :returns: the first successful response
+        """
+
+        self._record_request()
+
+        primary = _start_thread(self._timed(key, func))
+
+        done, _ = wait([primary], timeout=self.get_delay(key))
+
+        if done or not self._try_hedge():
+            return primary.result()
+
+        settings.logger.info(f"hedging request {key}")
+
+        hedge = self._get_executor().submit(_rate_limited(self._timed(key, func), rate_limiter))
+        pending: Set[Future] = {primary, hedge}
+        fallback: Optional[Future] = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception() is not None or (accept is not None and not accept(future.result())):
+                    if fallback is None:
+                        fallback = future
+                    else:
+                        _discard_response(future)
+
+                    continue
+
+                if future is hedge:
+                    self._record_hedge_win()
+
+                # The slower response is discarded as soon as it arrives
+                for other in pending | done | {fallback}:
+                    if other is not None and other is not future:
+                        other.add_done_callback(_discard_response)
+
+                return future.result()
+
+        assert fallback is not None
+
+        return fallback.result()
+
+    async def async_send(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        rate_limiter: Optional["RateLimiter"] = None,
+        accept: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+            Await :code:`func()` (which sends a request and returns a response),
+            hedging it if the response takes too long.
+
+            :param key: `str`, request type
+            :param func: coroutine function that sends the request
+            :param rate_limiter: :any:`RateLimiter` or `None`, the duplicate request
+                                 waits for a token from it
+            :param accept: function or `None`, tells whether a response is
+                           successful, unsuccessful responses only win if the
+                           other request fails as well
+
+            :returns: the first successful response
+        """
+
+        async def timed(hedge: bool = False) -> Any:
+            if hedge and rate_limiter is not None:
+                await rate_limiter.async_wait_request()
+
+            start = time.monotonic()
+            result = await func()
+            self.record_latency(key, time.monotonic() - start)
+
+            return result
+
+        self._record_request()
+
+        primary = asyncio.ensure_future(timed())
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.get_delay(key))
+        except BaseException:
+            primary.cancel()
+            raise
+
+        if done or not self._try_hedge():
+            return await primary
+
+        settings.logger.info(f"hedging request {key}")
+
+        hedge = asyncio.ensure_future(timed(hedge=True))
+        pending = {primary, hedge}
+        fallback: Optional["asyncio.Future[Any]"] = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is not None or (accept is not None and not accept(task.result())):
+                        if fallback is None:
+                            fallback = task
+                        else:
+                            _discard_response(task)
+
+                        continue
+
+                    if task is hedge:
+                        self._record_hedge_win()
+
+                    # Another task might have completed at the same time
+                    for other in done | {fallback}:
+                        if other is not None and other is not task:
+                            _discard_response(other)
+
+                    return task.result()
+
+            assert fallback is not None
+
+            return fallback.result()
+        finally:
+            for task in pending:
+                task.cancel()
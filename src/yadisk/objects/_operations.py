@@ -89,6 +89,7 @@ class SyncOperationLinkObject(OperationLinkObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -116,13 +117,17 @@ class SyncOperationLinkObject(OperationLinkObject):
             Wait until an operation is completed. If the operation fails, an
             exception is raised. Waiting is performed by calling :any:`time.sleep`.
 
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -165,6 +170,7 @@ class AsyncOperationLinkObject(OperationLinkObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -191,13 +197,17 @@ class AsyncOperationLinkObject(OperationLinkObject):
             Wait until an operation is completed. If the operation fails, an
             exception is raised. Waiting is performed by calling :any:`asyncio.sleep`.
 
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
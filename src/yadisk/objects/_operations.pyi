@@ -22,7 +22,8 @@ from .._typing_compat import Dict, Tuple, Type
 from ._yadisk_object import YaDiskObject
 from ._link_object import LinkObject
 
-from ..types import OperationStatus, TimeoutParameter, Headers
+from ..retry import RetryPolicy
+from ..types import OperationStatus, PollInterval, TimeoutParameter, Headers
 
 __all__ = [
     "AsyncOperationLinkObject",
@@ -51,6 +52,7 @@ class SyncOperationLinkObject(OperationLinkObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -61,12 +63,14 @@ class SyncOperationLinkObject(OperationLinkObject):
     def wait(
         self,
         *,
-        poll_interval: float = ...,
+        poll_interval: PollInterval = ...,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         headers: Optional[Headers] = None,
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -84,6 +88,7 @@ class AsyncOperationLinkObject(OperationLinkObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -93,12 +98,14 @@ class AsyncOperationLinkObject(OperationLinkObject):
     async def wait(
         self,
         *,
-        poll_interval: float = ...,
+        poll_interval: PollInterval = ...,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         headers: Optional[Headers] = None,
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -417,6 +417,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -454,6 +455,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -486,6 +488,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -517,6 +520,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -549,6 +553,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -580,6 +585,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -621,6 +627,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -662,6 +669,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -699,6 +707,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -747,6 +756,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -790,6 +800,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -827,13 +838,15 @@ class ResourceObjectMethodsMixin:
             :param disable_redirects: `bool`, forbid redirects
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -875,6 +888,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -917,7 +931,8 @@ class ResourceObjectMethodsMixin:
             2. :code:`download(relative_path, dst_path_or_file, /, **kwargs)`
 
             If `relative_path` is empty or None (or not specified) this method
-            will try to use the `file` attribute as a download link.
+            will try to use the `file` attribute as a download link (a new link
+            is requested if it has expired).
 
             :param relative_path: `str` or `None`, source path relative to the resource
             :param dst_path_or_file: destination path or file-like object
@@ -925,6 +940,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -949,9 +965,8 @@ class ResourceObjectMethodsMixin:
             raise ValueError("This object is not bound to a YaDisk instance")
 
         if not relative_path and hasattr(self, "file") and self.file is not None:
-            self._yadisk.download_by_link(self.file, dst_path_or_file, **kwargs)
-
-            return SyncResourceLinkObject.from_path(self.path, yadisk=self._yadisk)
+            # Falls back to a new link if the one in the file attribute has expired
+            return self._yadisk.download_resource(self, dst_path_or_file, **kwargs)
 
         if self.path is None:
             raise ValueError("ResourceObject doesn't have a path")
@@ -985,6 +1000,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1033,6 +1049,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1067,6 +1084,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1106,6 +1124,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1143,6 +1162,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1183,6 +1203,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1224,6 +1245,7 @@ class ResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1260,11 +1282,14 @@ class ResourceObjectMethodsMixin:
             exist it will also be created recursively.
 
             :param relative_path: `str` or `None`, relative path to the directory to be created
+            :param exist_ok: `bool`, if `True`, do not raise :any:`DirectoryExistsError`
+                             when the directory already exists
             :param fields: list of keys to be included in the response
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1301,13 +1326,15 @@ class ResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1362,13 +1389,17 @@ class ResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1432,13 +1463,17 @@ class ResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1505,13 +1540,17 @@ class ResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -1570,6 +1609,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1606,6 +1646,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1637,6 +1678,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1667,6 +1709,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1698,6 +1741,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1728,6 +1772,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1768,6 +1813,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1809,6 +1855,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1843,6 +1890,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1890,6 +1938,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1936,6 +1985,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -1972,13 +2022,15 @@ class AsyncResourceObjectMethodsMixin:
             :param disable_redirects: `bool`, forbid redirects
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2019,6 +2071,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2068,7 +2121,8 @@ class AsyncResourceObjectMethodsMixin:
             2. :code:`download(relative_path, dst_path_or_file, /, **kwargs)`
 
             If `relative_path` is empty or None (or not specified) this method
-            will try to use the `file` attribute as a download link.
+            will try to use the `file` attribute as a download link (a new link
+            is requested if it has expired).
 
             :param relative_path: `str` or `None`, source path relative to the resource
             :param dst_path_or_file: destination path or file-like object
@@ -2076,6 +2130,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2099,9 +2154,8 @@ class AsyncResourceObjectMethodsMixin:
             raise ValueError("This object is not bound to a YaDisk instance")
 
         if not relative_path and hasattr(self, "file") and self.file is not None:
-            await self._yadisk.download_by_link(self.file, dst_path_or_file, **kwargs)
-
-            return AsyncResourceLinkObject.from_path(self.path, yadisk=self._yadisk)
+            # Falls back to a new link if the one in the file attribute has expired
+            return await self._yadisk.download_resource(self, dst_path_or_file, **kwargs)
 
         if self.path is None:
             raise ValueError("ResourceObject doesn't have a path")
@@ -2137,6 +2191,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2180,6 +2235,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2213,6 +2269,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2251,6 +2308,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2287,6 +2345,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2326,6 +2385,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2366,6 +2426,7 @@ class AsyncResourceObjectMethodsMixin:
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2401,11 +2462,14 @@ class AsyncResourceObjectMethodsMixin:
             exist it will also be created recursively.
 
             :param relative_path: `str` or `None`, relative path to the directory to be created
+            :param exist_ok: `bool`, if `True`, do not raise :any:`DirectoryExistsError`
+                             when the directory already exists
             :param fields: list of keys to be included in the response
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2441,13 +2505,15 @@ class AsyncResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2506,13 +2572,17 @@ class AsyncResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2575,13 +2645,17 @@ class AsyncResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -2652,13 +2726,17 @@ class AsyncResourceObjectMethodsMixin:
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
+            :param resource_size: `int` or `None`, size of the resource in bytes, used to
+                                  estimate the first delay (see :any:`ExponentialPollInterval`)
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -3546,6 +3624,7 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3578,6 +3657,7 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3609,6 +3689,7 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3641,6 +3722,7 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3672,6 +3754,7 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3713,6 +3796,7 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3745,13 +3829,15 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3807,13 +3893,15 @@ class SyncTrashResourceObject(TrashResourceObject):
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param requests_args: `dict`, additional parameters for :any:`RequestsSession`
             :param httpx_args: `dict`, additional parameters for :any:`HTTPXSession`
@@ -3915,6 +4003,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -3946,6 +4035,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -3976,6 +4066,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -4007,6 +4098,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -4037,6 +4129,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -4077,6 +4170,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -4109,13 +4203,15 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
@@ -4175,13 +4271,15 @@ class AsyncTrashResourceObject(TrashResourceObject):
             :param force_async: forces the operation to be executed asynchronously
             :param fields: list of keys to be included in the response
             :param wait: `bool`, if :code:`True`, the method will wait until the asynchronous operation is completed
-            :param poll_interval: `float`, interval in seconds between subsequent operation status queries
+            :param poll_interval: `float` or :any:`ExponentialPollInterval`, interval in seconds between
+                                  subsequent operation status queries
             :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout),
                                  if this timeout is exceeded, an exception is raised
             :param timeout: `float` or `tuple`, request timeout
             :param headers: `dict` or `None`, additional request headers
             :param n_retries: `int`, maximum number of retries
             :param retry_interval: delay between retries in seconds
+            :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries
             :param retry_on: `tuple`, additional exception classes to retry on
             :param aiohttp_args: `dict`, additional parameters for :any:`AIOHTTPSession`
             :param httpx_args: `dict`, additional parameters for :any:`AsyncHTTPXSession`
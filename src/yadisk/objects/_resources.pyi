@@ -26,9 +26,10 @@ from .._typing_compat import (
     Generator, Dict, List, AsyncGenerator, Iterable, Tuple, Type
 )
 
+from ..retry import RetryPolicy
 from ..types import (
     AsyncFileOrPath, AsyncFileOrPathDestination, FileOrPath,
-    FileOrPathDestination, Headers, TimeoutParameter, PublicSettings
+    FileOrPathDestination, Headers, TimeoutParameter, PollInterval, PublicSettings
 )
 
 import datetime
@@ -229,6 +230,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -251,6 +253,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -268,6 +271,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -285,6 +289,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -302,6 +307,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -319,6 +325,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -343,6 +350,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -366,6 +374,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -385,6 +394,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -404,6 +414,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -424,6 +435,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -444,6 +456,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -461,6 +474,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -479,6 +493,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -498,6 +513,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -516,6 +532,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -535,6 +552,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -555,6 +573,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -573,6 +592,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -590,6 +610,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -606,6 +627,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -625,6 +647,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -643,6 +666,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -661,6 +685,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -679,6 +704,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -694,7 +720,7 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -702,6 +728,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -717,7 +744,7 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -725,6 +752,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -740,8 +768,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -749,6 +778,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -764,8 +794,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -773,6 +804,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -789,8 +821,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -798,6 +831,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -814,8 +848,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -823,6 +858,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -838,8 +874,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -847,6 +884,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -862,8 +900,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -871,6 +910,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -887,8 +927,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -896,6 +937,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -912,8 +954,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -921,6 +964,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -936,8 +980,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -945,6 +990,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -960,8 +1006,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -969,6 +1016,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -985,8 +1033,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -994,6 +1043,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1010,8 +1060,9 @@ class ResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1019,6 +1070,7 @@ class ResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1044,6 +1096,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1065,6 +1118,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1081,6 +1135,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1097,6 +1152,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1113,6 +1169,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1129,6 +1186,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1152,6 +1210,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1176,6 +1235,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1196,6 +1256,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1215,6 +1276,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1234,6 +1296,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1248,7 +1311,7 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         disable_redirects: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1256,6 +1319,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1272,6 +1336,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1289,6 +1354,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1307,6 +1373,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1324,6 +1391,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1342,6 +1410,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1361,6 +1430,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1378,6 +1448,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1394,6 +1465,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1409,6 +1481,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1427,6 +1500,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1444,6 +1518,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1461,6 +1536,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1478,6 +1554,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1492,7 +1569,7 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1500,6 +1577,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1514,7 +1592,7 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1522,6 +1600,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1536,8 +1615,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1545,6 +1625,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1559,8 +1640,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1568,6 +1650,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1583,8 +1666,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1592,6 +1676,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1607,8 +1692,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1616,6 +1702,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1630,8 +1717,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1639,6 +1727,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1653,8 +1742,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1662,6 +1752,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1677,8 +1768,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1686,6 +1778,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1701,8 +1794,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1710,6 +1804,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1724,8 +1819,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1733,6 +1829,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1747,8 +1844,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1756,6 +1854,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1771,8 +1870,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -1780,6 +1880,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -1795,8 +1896,9 @@ class AsyncResourceObjectMethodsMixin:
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
+        resource_size: Optional[int] = None,
         overwrite: bool = False,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -1804,6 +1906,7 @@ class AsyncResourceObjectMethodsMixin:
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2041,6 +2144,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2058,6 +2162,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2075,6 +2180,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2092,6 +2198,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2109,6 +2216,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2133,6 +2241,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2148,7 +2257,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -2156,6 +2265,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2171,7 +2281,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -2179,6 +2289,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2194,7 +2305,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: Literal[True],
@@ -2203,6 +2314,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2218,7 +2330,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: bool = False,
@@ -2227,6 +2339,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2243,7 +2356,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: Literal[True],
@@ -2252,6 +2365,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2268,7 +2382,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: bool = False,
@@ -2277,6 +2391,7 @@ class SyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         requests_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2310,6 +2425,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2326,6 +2442,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2342,6 +2459,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2358,6 +2476,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2374,6 +2493,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2397,6 +2517,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2413,7 +2534,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: Literal[True],
         fields: Optional[Iterable[str]] = None,
@@ -2421,6 +2542,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2435,7 +2557,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         force_async: bool = False,
         fields: Optional[Iterable[str]] = None,
@@ -2443,6 +2565,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2457,7 +2580,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: Literal[True],
@@ -2466,6 +2589,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2480,7 +2604,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: bool = False,
@@ -2489,6 +2613,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2504,7 +2629,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: Literal[True],
@@ -2513,6 +2638,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
@@ -2528,7 +2654,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         /,
         *,
         wait: bool = True,
-        poll_interval: float = 1.0,
+        poll_interval: PollInterval = 1.0,
         poll_timeout: Optional[float] = None,
         overwrite: bool = False,
         force_async: bool = False,
@@ -2537,6 +2663,7 @@ class AsyncTrashResourceObject(TrashResourceObject):
         timeout: TimeoutParameter = ...,
         n_retries: Optional[int] = None,
         retry_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
         retry_on: Tuple[Type[Exception], ...] = tuple(),
         aiohttp_args: Optional[Dict[str, Any]] = None,
         httpx_args: Optional[Dict[str, Any]] = None,
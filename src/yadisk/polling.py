@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .exceptions import AsyncOperationFailedError, AsyncOperationPollingTimeoutError
+from ._typing_compat import Dict, Iterator, List, Set, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._client import Client
+    from ._async_client import AsyncClient
+    from .types import PollInterval
+
+__all__ = ["AsyncOperationPoller", "ExponentialPollInterval", "OperationPoller"]
+
+
+class ExponentialPollInterval:
+    """
+        Adaptive interval between subsequent operation status queries.
+        It can be passed as :code:`poll_interval` to :any:`Client.wait_for_operation()`,
+        :any:`Client.copy()`, :any:`Client.move()`, :any:`Client.remove()`,
+        etc. (and their async counterparts) instead of a constant.
+
+        The first query is repeated after :code:`initial` seconds, each
+        next delay is :code:`factor` times longer, up to :code:`max_interval`.
+        Every delay is randomly shortened by up to :code:`jitter` (a fraction
+        of the delay) to spread out queries of concurrent operations.
+
+        If :code:`bytes_per_second` is specified and the size of the resource
+        is known (see :code:`resource_size` of :any:`Client.copy()` and
+        :any:`Client.move()`), the first delay is at least as long as
+        transferring the resource at that rate would take, so large copies
+        don't waste status queries early on.
+
+        :param initial: `float`, first delay in seconds
+        :param factor: `float`, factor by which the delay grows
+        :param max_interval: `float`, maximum delay in seconds
+        :param jitter: `float`, maximum fraction of the delay to be randomly subtracted
+        :param bytes_per_second: `float` or `None`, estimated server-side copy rate
+
+        :ivar initial: `float`, first delay in seconds
+        :ivar factor: `float`, factor by which the delay grows
+        :ivar max_interval: `float`, maximum delay in seconds
+        :ivar jitter: `float`, maximum fraction of the delay to be randomly subtracted
+        :ivar bytes_per_second: `float` or `None`, estimated server-side copy rate
+    """
+
+    initial: float
+    factor: float
+    max_interval: float
+    jitter: float
+    bytes_per_second: Optional[float]
+
+    def __init__(
+        self,
+        initial: float = 0.1,
+        factor: float = 2.0,
+        max_interval: float = 10.0,
+        jitter: float = 0.2,
+        bytes_per_second: Optional[float] = None
+    ) -> None:
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.bytes_per_second = bytes_per_second
+
+    def iter_intervals(self, resource_size: Optional[int] = None) -> Iterator[float]:
+        """
+            Generate delays between subsequent status queries of a single operation.
+
+            :param resource_size: `int` or `None`, size of the resource in bytes (if known)
+
+            :returns: infinite iterator of `float`
+        """
+
+        interval = self.initial
+
+        if resource_size is not None and self.bytes_per_second:
+            interval = max(interval, resource_size / self.bytes_per_second)
+
+        while True:
+            interval = min(interval, self.max_interval)
+
+            yield interval * (1.0 - self.jitter * random.random())
+
+            interval *= self.factor
+
+
+def _iter_poll_intervals(poll_interval: "PollInterval", resource_size: Optional[int] = None) -> Iterator[float]:
+    if isinstance(poll_interval, ExponentialPollInterval):
+        return poll_interval.iter_intervals(resource_size)
+
+    return itertools.repeat(poll_interval)
+
+
+class _PendingOperation:
+    # State of a single operation tracked by a poller
+    def __init__(
+        self,
+        operation_id: str,
+        future: Union["Future[None]", "asyncio.Future[None]"],
+        interval: float,
+        poll_timeout: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> None:
+        self.operation_id = operation_id
+        self.future = future
+        self.interval = interval
+        self.deadline = None if poll_timeout is None else time.monotonic() + poll_timeout
+        self.kwargs = kwargs
+
+
+class _BaseOperationPoller:
+    initial_interval: float
+    max_interval: float
+    backoff_factor: float
+    max_workers: int
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        initial_interval: float = 0.25,
+        max_interval: float = 10.0,
+        backoff_factor: float = 1.5
+    ) -> None:
+        self.max_workers = max_workers
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+        # Min-heap of (next poll time, sequence number, operation)
+        self._queue: List[Tuple[float, int, _PendingOperation]] = []
+        self._counter = itertools.count()
+        self._closed = False
+
+    def _schedule(self, operation: _PendingOperation, delay: float) -> None:
+        heapq.heappush(self._queue, (time.monotonic() + delay, next(self._counter), operation))
+
+    def _handle_status(self, operation: _PendingOperation, status: str) -> bool:
+        # Resolves the future if the operation is done, returns True if it has to be polled again
+        if status == "success":
+            operation.future.set_result(None)
+            return False
+
+        if status != "in-progress":
+            operation.future.set_exception(AsyncOperationFailedError("Asynchronous operation failed"))
+            return False
+
+        if operation.deadline is not None and time.monotonic() >= operation.deadline:
+            operation.future.set_exception(
+                AsyncOperationPollingTimeoutError("Asynchronous operation did not complete in specified time")
+            )
+            return False
+
+        return True
+
+    def _next_interval(self, operation: _PendingOperation) -> float:
+        interval = operation.interval
+        operation.interval = min(interval * self.backoff_factor, self.max_interval)
+
+        return interval
+
+    def _get_pending_count(self) -> int:
+        return sum(1 for _, _, operation in self._queue if not operation.future.done())
+
+
+class OperationPoller(_BaseOperationPoller):
+    """
+        Tracks many asynchronous operations (returned by :any:`Client.copy()`,
+        :any:`Client.move()`, :any:`Client.remove()`, etc. with
+        :code:`wait=False`) at once. A single scheduler thread decides when
+        each operation has to be polled next and a small thread pool sends
+        the status requests. The first status query is sent immediately,
+        after that the interval grows by :code:`backoff_factor` with each
+        query, up to :code:`max_interval`.
+
+        The scheduler thread is only running while there are pending
+        operations.
+
+        :param client: :any:`Client`, client used to query the operation status
+        :param max_workers: `int`, maximum number of concurrent status requests
+        :param initial_interval: `float`, delay (in seconds) between the first and the second status query
+        :param max_interval: `float`, maximum delay (in seconds) between subsequent status queries
+        :param backoff_factor: `float`, factor by which the delay grows after each status query
+
+        :ivar client: :any:`Client`, client used to query the operation status
+        :ivar max_workers: `int`, maximum number of concurrent status requests
+        :ivar initial_interval: `float`, delay (in seconds) between the first and the second status query
+        :ivar max_interval: `float`, maximum delay (in seconds) between subsequent status queries
+        :ivar backoff_factor: `float`, factor by which the delay grows after each status query
+    """
+
+    client: "Client"
+
+    def __init__(self, client: "Client", **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.client = client
+
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+
+    def submit(self, operation_id: str, /, *, poll_timeout: Optional[float] = None, **kwargs) -> "Future[None]":
+        """
+            Start tracking an operation.
+
+            :param operation_id: ID of the operation or a link
+            :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout)
+            :param kwargs: parameters passed to :any:`Client.get_operation_status()`
+
+            :raises RuntimeError: the poller has been closed
+
+            :returns: :any:`concurrent.futures.Future`, resolves to `None` when
+                      the operation succeeds, otherwise fails with
+                      :any:`AsyncOperationFailedError`,
+                      :any:`AsyncOperationPollingTimeoutError` or the error
+                      raised by :any:`Client.get_operation_status()`.
+                      Cancelling the future stops the tracking.
+        """
+
+        future: "Future[None]" = Future()
+        operation = _PendingOperation(operation_id, future, self.initial_interval, poll_timeout, kwargs)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit an operation to a closed poller")
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+            self._schedule(operation, 0.0)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="yadisk-operation-poller", daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+        return future
+
+    @property
+    def pending(self) -> int:
+        """`int`, number of operations that are still being tracked"""
+
+        with self._condition:
+            return self._get_pending_count() + self._in_flight
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed or (not self._queue and not self._in_flight):
+                        self._thread = None
+                        return
+
+                    if self._queue:
+                        delay = self._queue[0][0] - time.monotonic()
+
+                        if delay <= 0:
+                            break
+
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+
+                _, _, operation = heapq.heappop(self._queue)
+
+                if operation.future.done():
+                    # Cancelled
+                    continue
+
+                assert self._executor is not None
+
+                self._in_flight += 1
+                self._executor.submit(self._poll, operation)
+
+    def _poll(self, operation: _PendingOperation) -> None:
+        poll_again = False
+
+        try:
+            status = self.client.get_operation_status(operation.operation_id, **operation.kwargs)
+            poll_again = self._handle_status(operation, status)
+        except InvalidStateError:
+            # The future was cancelled while the request was in flight
+            pass
+        except BaseException as e:
+            try:
+                operation.future.set_exception(e)
+            except InvalidStateError:
+                pass
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+
+                if poll_again:
+                    if self._closed:
+                        operation.future.cancel()
+                    else:
+                        self._schedule(operation, self._next_interval(operation))
+
+                self._condition.notify()
+
+    def close(self) -> None:
+        """
+            Stop polling and cancel futures of all pending operations.
+            Status requests that are already in flight are not interrupted.
+        """
+
+        with self._condition:
+            self._closed = True
+
+            for _, _, operation in self._queue:
+                operation.future.cancel()
+
+            self._queue.clear()
+            self._condition.notify()
+
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class AsyncOperationPoller(_BaseOperationPoller):
+    """
+        Tracks many asynchronous operations (returned by :any:`AsyncClient.copy()`,
+        :any:`AsyncClient.move()`, :any:`AsyncClient.remove()`, etc. with
+        :code:`wait=False`) at once. A single scheduler task decides when each
+        operation has to be polled next, at most :code:`max_workers` status
+        requests are sent concurrently. The first status query is sent
+        immediately, after that the interval grows by :code:`backoff_factor`
+        with each query, up to :code:`max_interval`.
+
+        The scheduler task is only running while there are pending operations.
+
+        :param client: :any:`AsyncClient`, client used to query the operation status
+        :param max_workers: `int`, maximum number of concurrent status requests
+        :param initial_interval: `float`, delay (in seconds) between the first and the second status query
+        :param max_interval: `float`, maximum delay (in seconds) between subsequent status queries
+        :param backoff_factor: `float`, factor by which the delay grows after each status query
+
+        :ivar client: :any:`AsyncClient`, client used to query the operation status
+        :ivar max_workers: `int`, maximum number of concurrent status requests
+        :ivar initial_interval: `float`, delay (in seconds) between the first and the second status query
+        :ivar max_interval: `float`, maximum delay (in seconds) between subsequent status queries
+        :ivar backoff_factor: `float`, factor by which the delay grows after each status query
+    """
+
+    client: "AsyncClient"
+
+    def __init__(self, client: "AsyncClient", **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.client = client
+
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._polls: Set["asyncio.Task[None]"] = set()
+
+    def submit(
+        self,
+        operation_id: str,
+        /,
+        *,
+        poll_timeout: Optional[float] = None,
+        **kwargs
+    ) -> "asyncio.Future[None]":
+        """
+            Start tracking an operation. Must be called from a running event loop.
+
+            :param operation_id: ID of the operation or a link
+            :param poll_timeout: `float` or `None`, total polling timeout (`None` means no timeout)
+            :param kwargs: parameters passed to :any:`AsyncClient.get_operation_status()`
+
+            :raises RuntimeError: the poller has been closed
+
+            :returns: :any:`asyncio.Future`, resolves to `None` when the
+                      operation succeeds, otherwise fails with
+                      :any:`AsyncOperationFailedError`,
+                      :any:`AsyncOperationPollingTimeoutError` or the error
+                      raised by :any:`AsyncClient.get_operation_status()`.
+                      Cancelling the future stops the tracking.
+        """
+
+        if self._closed:
+            raise RuntimeError("Cannot submit an operation to a closed poller")
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[None]" = loop.create_future()
+        operation = _PendingOperation(operation_id, future, self.initial_interval, poll_timeout, kwargs)
+
+        self._schedule(operation, 0.0)
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        else:
+            assert self._wakeup is not None
+            self._wakeup.set()
+
+        return future
+
+    @property
+    def pending(self) -> int:
+        """`int`, number of operations that are still being tracked"""
+
+        return self._get_pending_count() + len(self._polls)
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        while self._queue or self._polls:
+            if self._queue:
+                delay = self._queue[0][0] - time.monotonic()
+
+                if delay <= 0:
+                    _, _, operation = heapq.heappop(self._queue)
+
+                    if not operation.future.done():
+                        task = asyncio.ensure_future(self._poll(operation, semaphore))
+                        self._polls.add(task)
+                        task.add_done_callback(self._on_poll_done)
+
+                    continue
+            else:
+                delay = None
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+
+    def _on_poll_done(self, task: "asyncio.Task[None]") -> None:
+        self._polls.discard(task)
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _poll(self, operation: _PendingOperation, semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                if operation.future.done():
+                    return
+
+                status = await self.client.get_operation_status(operation.operation_id, **operation.kwargs)
+        except asyncio.CancelledError:
+            operation.future.cancel()
+            raise
+        except Exception as e:
+            if not operation.future.done():
+                operation.future.set_exception(e)
+
+            return
+
+        if operation.future.done():
+            return
+
+        if self._handle_status(operation, status):
+            if self._closed:
+                operation.future.cancel()
+            else:
+                self._schedule(operation, self._next_interval(operation))
+
+    async def close(self) -> None:
+        """Stop polling and cancel futures of all pending operations."""
+
+        self._closed = True
+
+        for _, _, operation in self._queue:
+            operation.future.cancel()
+
+        self._queue.clear()
+
+        tasks = list(self._polls)
+
+        if self._task is not None:
+            tasks.append(self._task)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import threading
+
+from typing import Optional
+
+__all__ = ["PoolConfig", "PoolStats"]
+
+
+class PoolConfig:
+    """
+        Connection pool configuration that doesn't depend on the HTTP library.
+        It can be passed to :any:`Client` and :any:`AsyncClient` as :code:`pool_config`
+        or directly to any session from :code:`yadisk.sessions`, which translates
+        it to the settings of the underlying library.
+
+        `None` means that the default of the library is used. Each session
+        supports only some of the settings, the rest are ignored:
+
+          * :any:`RequestsSession` (`urllib3`): :code:`max_connections_per_host`
+            (connections are shared by all threads) and :code:`tcp_nodelay`
+          * :any:`HTTPXSession` and :any:`AsyncHTTPXSession`: :code:`max_connections`
+            and :code:`keepalive_expiry`, TCP_NODELAY is always enabled
+          * :any:`AIOHTTPSession`: :code:`max_connections`, :code:`max_connections_per_host`
+            and :code:`keepalive_expiry`, TCP_NODELAY is always enabled
+          * :any:`PycURLSession`: :code:`max_connections` (size of the connection cache),
+            :code:`keepalive_expiry`, :code:`tcp_nodelay` and :code:`tls_session_reuse`
+
+        :param max_connections: `int` or `None`, maximum total number of connections
+        :param max_connections_per_host: `int` or `None`, maximum number of connections to a single host
+        :param keepalive_expiry: `float` or `None`, time (in seconds) after which idle connections are closed
+        :param tcp_nodelay: `bool`, whether to disable Nagle's algorithm
+        :param tls_session_reuse: `bool`, whether to resume TLS sessions for new connections
+
+        :ivar max_connections: `int` or `None`, maximum total number of connections
+        :ivar max_connections_per_host: `int` or `None`, maximum number of connections to a single host
+        :ivar keepalive_expiry: `float` or `None`, time (in seconds) after which idle connections are closed
+        :ivar tcp_nodelay: `bool`, whether to disable Nagle's algorithm
+        :ivar tls_session_reuse: `bool`, whether to resume TLS sessions for new connections
+    """
+
+    max_connections: Optional[int]
+    max_connections_per_host: Optional[int]
+    keepalive_expiry: Optional[float]
+    tcp_nodelay: bool
+    tls_session_reuse: bool
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        tcp_nodelay: bool = True,
+        tls_session_reuse: bool = True
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.tcp_nodelay = tcp_nodelay
+        self.tls_session_reuse = tls_session_reuse
+
+
+class PoolStats:
+    """
+        Connection pool statistics, returned by :any:`Session.get_pool_stats()`
+        and :any:`AsyncSession.get_pool_stats()`.
+
+        :param idle: `int` or `None`, number of idle connections
+        :param active: `int` or `None`, number of connections that are currently in use
+        :param reused: `int`, total number of requests sent over an existing connection
+        :param new: `int`, total number of established connections
+
+        :ivar idle: `int` or `None`, number of idle connections,
+                    `None` if the library doesn't report it
+        :ivar active: `int` or `None`, number of connections that are currently in use,
+                      `None` if the library doesn't report it
+        :ivar reused: `int`, total number of requests sent over an existing connection
+        :ivar new: `int`, total number of established connections
+    """
+
+    idle: Optional[int]
+    active: Optional[int]
+    reused: int
+    new: int
+
+    def __init__(self, idle: Optional[int], active: Optional[int], reused: int, new: int) -> None:
+        self.idle = idle
+        self.active = active
+        self.reused = reused
+        self.new = new
+
+    def __repr__(self) -> str:
+        return f"<PoolStats idle={self.idle} active={self.active} reused={self.reused} new={self.new}>"
+
+
+class _ConnectionCounter:
+    """Thread-safe counter of requests and established connections."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.new = 0
+        self._lock = threading.Lock()
+
+    @property
+    def reused(self) -> int:
+        with self._lock:
+            return max(0, self.requests - self.new)
+
+    def count_request(self, new_connection: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+
+            if new_connection:
+                self.new += 1
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.new += 1
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import threading
+import time
+
+from typing import Optional
+
+from .exceptions import ResourceDownloadLimitExceededError, TooManyRequestsError
+from .retry import get_retry_after
+
+__all__ = ["RateLimiter", "TokenBucket"]
+
+
+class TokenBucket:
+    """
+        Thread-safe token bucket with an adaptive rate.
+
+        Tokens are refilled at :code:`rate` tokens per second, up to :code:`capacity`.
+        A reservation always succeeds immediately, but may leave the bucket
+        in debt, the caller is then expected to wait until the debt is repaid.
+        This way concurrent callers are served in order of their reservations.
+
+        The rate follows the AIMD scheme: :any:`TokenBucket.decrease()` multiplies
+        it by :code:`decrease_factor` (down to :code:`min_rate`), after which it
+        grows by :code:`increase` tokens per second every second, back up to
+        :code:`max_rate`.
+
+        :param rate: `float`, maximum (and initial) number of tokens per second
+        :param capacity: `float` or `None`, maximum number of accumulated tokens,
+                         defaults to :code:`rate` (one second worth of tokens)
+        :param min_rate: `float` or `None`, minimum rate, defaults to 5% of :code:`rate`
+        :param increase: `float` or `None`, additive increase of the rate per second,
+                         defaults to 5% of :code:`rate`
+        :param decrease_factor: `float`, multiplicative decrease of the rate
+
+        :ivar max_rate: `float`, maximum number of tokens per second
+        :ivar min_rate: `float`, minimum number of tokens per second
+        :ivar capacity: `float`, maximum number of accumulated tokens
+        :ivar increase: `float`, additive increase of the rate per second
+        :ivar decrease_factor: `float`, multiplicative decrease of the rate
+    """
+
+    max_rate: float
+    min_rate: float
+    capacity: float
+    increase: float
+    decrease_factor: float
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease_factor: float = 0.5
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate * 0.05
+        self.capacity = capacity if capacity is not None else rate
+        self.increase = increase if increase is not None else rate * 0.05
+        self.decrease_factor = decrease_factor
+
+        self._rate = rate
+        self._tokens = self.capacity
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current number of tokens per second."""
+
+        with self._lock:
+            self._update(time.monotonic())
+
+            return self._rate
+
+    @property
+    def tokens(self) -> float:
+        """Number of currently available tokens (negative means debt)."""
+
+        with self._lock:
+            self._update(time.monotonic())
+
+            return self._tokens
+
+    def _update(self, now: float) -> None:
+        elapsed = now - self._last_update
+
+        if elapsed <= 0:
+            return
+
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+        self._rate = min(self.max_rate, self._rate + elapsed * self.increase)
+        self._last_update = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+            Take :code:`amount` tokens from the bucket.
+
+            :param amount: `float`, number of tokens
+
+            :returns: `float`, time in seconds the caller has to wait before proceeding
+        """
+
+        with self._lock:
+            self._update(time.monotonic())
+            self._tokens -= amount
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self._rate
+
+    def decrease(self, pause: Optional[float] = None) -> None:
+        """
+            Multiplicatively decrease the rate and drop the accumulated tokens.
+
+            :param pause: `float` or `None`, if specified, no tokens will be
+                          available for at least this many seconds
+        """
+
+        with self._lock:
+            self._update(time.monotonic())
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+
+            if pause is not None:
+                self._tokens = min(self._tokens, -pause * self._rate)
+
+
+class RateLimiter:
+    """
+        Client-side rate limiter for API requests and transferred bytes.
+        It can be passed to :any:`Client` and :any:`AsyncClient`
+        as :code:`rate_limiter` and can be shared between several clients,
+        threads and tasks.
+
+        Before sending an API request, the client waits for a token from the
+        request bucket. Downloaded and uploaded data consume tokens from the
+        byte bucket (if :code:`bytes_per_second` is specified).
+
+        Every :any:`TooManyRequestsError` reported to the limiter halves the
+        request rate, every :any:`ResourceDownloadLimitExceededError` halves
+        the byte rate (or the request rate if there is no byte bucket).
+        The `Retry-After` header is respected. Rates then recover gradually.
+        While a client has a rate limiter, :any:`TooManyRequestsError` is
+        retried like any other retriable error.
+
+        :param requests_per_second: `float`, maximum rate of API requests
+        :param bytes_per_second: `float` or `None`, maximum rate of transferred bytes,
+                                 `None` means no limit
+        :param burst: `float` or `None`, maximum number of requests that can be
+                      sent at once after a period of inactivity
+        :param decrease_factor: `float`, multiplicative decrease of rates on throttling
+
+        :ivar requests: :any:`TokenBucket`, bucket for API requests
+        :ivar bytes: :any:`TokenBucket` or `None`, bucket for transferred bytes
+    """
+
+    requests: TokenBucket
+    bytes: Optional[TokenBucket]
+
+    def __init__(
+        self,
+        requests_per_second: float = 10.0,
+        bytes_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        decrease_factor: float = 0.5
+    ) -> None:
+        self.requests = TokenBucket(requests_per_second, capacity=burst, decrease_factor=decrease_factor)
+
+        if bytes_per_second is not None:
+            self.bytes = TokenBucket(bytes_per_second, decrease_factor=decrease_factor)
+        else:
+            self.bytes = None
+
+    def wait_request(self) -> None:
+        """Block until the next API request can be sent."""
+
+        delay = self.requests.reserve()
+
+        if delay:
+            time.sleep(delay)
+
+    async def async_wait_request(self) -> None:
+        """Wait until the next API request can be sent."""
+
+        delay = self.requests.reserve()
+
+        if delay:
+            await asyncio.sleep(delay)
+
+    def wait_bytes(self, n: int) -> None:
+        """
+            Block until :code:`n` more bytes can be transferred.
+
+            :param n: `int`, number of bytes
+        """
+
+        if self.bytes is None:
+            return
+
+        delay = self.bytes.reserve(n)
+
+        if delay:
+            time.sleep(delay)
+
+    async def async_wait_bytes(self, n: int) -> None:
+        """
+            Wait until :code:`n` more bytes can be transferred.
+
+            :param n: `int`, number of bytes
+        """
+
+        if self.bytes is None:
+            return
+
+        delay = self.bytes.reserve(n)
+
+        if delay:
+            await asyncio.sleep(delay)
+
+    def report(self, exception: Exception) -> None:
+        """
+            Report a failed request, slows down on throttling errors.
+
+            :param exception: exception raised by the request
+        """
+
+        if not isinstance(exception, TooManyRequestsError):
+            return
+
+        bucket = self.requests
+
+        if isinstance(exception, ResourceDownloadLimitExceededError) and self.bytes is not None:
+            bucket = self.bytes
+
+        bucket.decrease(get_retry_after(exception))
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+from email.utils import parsedate_to_datetime
+import datetime
+import random
+
+from typing import Optional, Union
+
+from .exceptions import YaDiskError
+from ._typing_compat import Dict, Type
+
+__all__ = ["ConstantRetryPolicy", "ExponentialRetryPolicy", "RetryPolicy", "get_retry_after"]
+
+
+def get_retry_after(exception: Exception) -> Optional[float]:
+    """
+        Get the delay requested by the server with the `Retry-After` header
+        of the response that caused `exception`.
+
+        :param exception: an exception raised by a failed request
+
+        :returns: `float` (delay in seconds) or `None` if the header is absent or invalid
+    """
+
+    if not isinstance(exception, YaDiskError) or exception.response is None:
+        return None
+
+    value = exception.response.headers.get("Retry-After")
+
+    if not value:
+        return None
+
+    value = value.strip()
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+        Base class for retry policies, used by :any:`utils.auto_retry()`
+        and :any:`utils.async_auto_retry()` to compute delays between retries.
+
+        Subclasses must implement :any:`RetryPolicy.compute_delay()`.
+
+        :param overrides: `dict` or `None`, maps exception classes to policies
+                          that should be used instead of this one when such
+                          an exception is raised (the most specific class wins)
+
+        :ivar overrides: `dict`, maps exception classes to overriding policies
+    """
+
+    overrides: Dict[Type[Exception], "RetryPolicy"]
+
+    def __init__(self, overrides: Optional[Dict[Type[Exception], "RetryPolicy"]] = None) -> None:
+        self.overrides = dict(overrides) if overrides is not None else {}
+
+    def get_delay(self, attempt: int, exception: Exception) -> float:
+        """
+            Get the delay before the next retry, taking :code:`overrides` into account.
+
+            :param attempt: `int`, number of the failed attempt, starting from 0
+            :param exception: the exception raised by the failed attempt
+
+            :returns: `float`, delay in seconds
+        """
+
+        for cls in type(exception).__mro__:
+            policy = self.overrides.get(cls)
+
+            if policy is not None:
+                return policy.get_delay(attempt, exception)
+
+        return self.compute_delay(attempt, exception)
+
+    def compute_delay(self, attempt: int, exception: Exception) -> float:
+        """
+            Compute the delay before the next retry.
+
+            :param attempt: `int`, number of the failed attempt, starting from 0
+            :param exception: the exception raised by the failed attempt
+
+            :returns: `float`, delay in seconds
+        """
+
+        raise NotImplementedError
+
+
+class ConstantRetryPolicy(RetryPolicy):
+    """
+        Retry policy with the same delay before every retry.
+        This is the default behavior, matching :code:`retry_interval`.
+
+        :param interval: `int` or `float`, delay between retries (in seconds)
+        :param overrides: `dict` or `None`, see :any:`RetryPolicy`
+
+        :ivar interval: `float`, delay between retries (in seconds)
+    """
+
+    interval: float
+
+    def __init__(
+        self,
+        interval: Union[int, float] = 0.0,
+        overrides: Optional[Dict[Type[Exception], RetryPolicy]] = None
+    ) -> None:
+        super().__init__(overrides)
+
+        self.interval = float(interval)
+
+    def compute_delay(self, attempt: int, exception: Exception) -> float:
+        return self.interval
+
+
+class ExponentialRetryPolicy(RetryPolicy):
+    """
+        Retry policy with exponential backoff and full jitter: the delay before
+        retry number :code:`n` (starting from 0) is a random value between
+        0 and :code:`min(max_delay, base * factor ** n)`.
+        Randomization prevents many clients from retrying in lockstep.
+
+        If :code:`respect_retry_after` is :code:`True` and the failed response
+        contains the `Retry-After` header, the delay is at least as long
+        as requested by the server. No delay is longer than :code:`max_delay`.
+
+        :param base: `float`, upper bound of the first delay (in seconds)
+        :param factor: `float`, factor by which the upper bound grows
+        :param max_delay: `float`, maximum delay (in seconds)
+        :param jitter: `bool`, if :code:`False`, the upper bound is used as is
+        :param respect_retry_after: `bool`, whether to honor the `Retry-After` header
+        :param overrides: `dict` or `None`, see :any:`RetryPolicy`
+
+        :ivar base: `float`, upper bound of the first delay (in seconds)
+        :ivar factor: `float`, factor by which the upper bound grows
+        :ivar max_delay: `float`, maximum delay (in seconds)
+        :ivar jitter: `bool`, whether the delay is randomized
+        :ivar respect_retry_after: `bool`, whether to honor the `Retry-After` header
+    """
+
+    base: float
+    factor: float
+    max_delay: float
+    jitter: bool
+    respect_retry_after: bool
+
+    def __init__(
+        self,
+        base: float = 0.5,
+        factor: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        overrides: Optional[Dict[Type[Exception], RetryPolicy]] = None
+    ) -> None:
+        super().__init__(overrides)
+
+        self.base = base
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def compute_delay(self, attempt: int, exception: Exception) -> float:
+        try:
+            delay = min(self.max_delay, self.base * self.factor ** attempt)
+        except OverflowError:
+            delay = self.max_delay
+
+        if self.jitter:
+            delay *= random.random()
+
+        if self.respect_retry_after:
+            retry_after = get_retry_after(exception)
+
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+        return min(delay, self.max_delay)
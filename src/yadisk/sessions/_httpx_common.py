@@ -23,13 +23,21 @@ from ..exceptions import (
     RequestTimeoutError, YaDiskConnectionError
 )
 
+from ..pool import PoolConfig, PoolStats, _ConnectionCounter
 from ..types import TimeoutParameter
-from .._typing_compat import Dict, Tuple
+from .._typing_compat import Callable, Dict, Iterable, List, Tuple
 from .. import settings
 
 import httpx
 
-__all__ = ["convert_args_for_httpx", "convert_httpx_exception", "convert_timeout"]
+__all__ = [
+    "convert_args_for_httpx", "convert_httpx_exception", "convert_pool_config", "convert_timeout",
+    "get_httpx_pool_stats", "get_transfer_client_kwargs", "handle_trace_event"
+]
+
+# Defaults of httpx.Client and httpx.AsyncClient
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
 
 
 def convert_httpx_exception(exc: httpx.HTTPError) -> Union[RequestError, httpx.HTTPError]:
@@ -58,9 +66,63 @@ def convert_timeout(timeout: TimeoutParameter) -> Optional[httpx.Timeout]:
     return httpx.Timeout(connect=connect, pool=connect, read=read, write=read)
 
 
+def convert_pool_config(pool_config: PoolConfig) -> httpx.Limits:
+    max_connections = pool_config.max_connections
+
+    if max_connections is None:
+        max_connections = DEFAULT_MAX_CONNECTIONS
+
+    keepalive_expiry = pool_config.keepalive_expiry
+
+    if keepalive_expiry is None:
+        keepalive_expiry = DEFAULT_KEEPALIVE_EXPIRY
+
+    # By default httpx keeps only 20 idle connections, the rest are closed
+    # after every request and have to be established again
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry
+    )
+
+
+def handle_trace_event(counter: _ConnectionCounter, event_name: str) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        counter.count_connection()
+    elif event_name in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+        counter.count_request()
+
+
+def get_transfer_client_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # Uploads and downloads are faster over separate HTTP/1.1 connections,
+    # since they don't have to share flow control windows with other requests
+    return dict(kwargs, http1=True, http2=False)
+
+
+def get_httpx_pool_stats(
+    sessions: Iterable[Union[httpx.Client, httpx.AsyncClient, None]],
+    counter: _ConnectionCounter
+) -> PoolStats:
+    connections: List[Any] = []
+
+    for session in sessions:
+        if session is None:
+            continue
+
+        # httpx doesn't expose its connection pool
+        pool = getattr(getattr(session, "_transport", None), "_pool", None)
+        connections.extend(getattr(pool, "connections", []))
+
+    idle = sum(1 for connection in connections if connection.is_idle())
+    active = sum(1 for connection in connections if not connection.is_idle() and not connection.is_closed())
+
+    return PoolStats(idle=idle, active=active, reused=counter.reused, new=counter.new)
+
+
 def convert_args_for_httpx(
     session: Union[httpx.Client, httpx.AsyncClient],
-    kwargs: Dict[str, Any]
+    kwargs: Dict[str, Any],
+    trace: Optional[Callable[..., Any]] = None
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     request_kwargs = {
         "params": kwargs.get("params"),
@@ -69,6 +131,9 @@ def convert_args_for_httpx(
         "timeout": session.timeout
     }
 
+    if trace is not None:
+        request_kwargs["extensions"] = {"trace": trace}
+
     if "timeout" in kwargs:
         request_kwargs["timeout"] = convert_timeout(kwargs["timeout"])
 
@@ -81,6 +146,9 @@ def convert_args_for_httpx(
             if key in httpx_args:
                 send_kwargs[key] = httpx_args.pop(key)
 
+        if trace is not None and "extensions" in httpx_args:
+            httpx_args["extensions"] = {"trace": trace, **(httpx_args["extensions"] or {})}
+
         request_kwargs.update(httpx_args)
 
     return request_kwargs, send_kwargs
@@ -25,6 +25,7 @@ from ..exceptions import (
 
 from .._async_session import AsyncSession, AsyncResponse
 from .._common import is_async_func
+from ..pool import PoolConfig, PoolStats, _ConnectionCounter
 from ..utils import CaseInsensitiveDict
 from .._typing_compat import Dict
 from ..types import (
@@ -58,6 +59,7 @@ class AIOHTTPResponse(AsyncResponse):
 
         self._response = response
         self.status = response.status
+        self.headers = CaseInsensitiveDict(response.headers.items())
 
     async def json(self) -> JSON:
         try:
@@ -97,6 +99,21 @@ def convert_timeout(timeout: TimeoutParameter) -> Optional[aiohttp.ClientTimeout
     return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
 
 
+def convert_pool_config(pool_config: PoolConfig) -> aiohttp.TCPConnector:
+    connector_kwargs: Dict[str, Any] = {}
+
+    if pool_config.max_connections is not None:
+        connector_kwargs["limit"] = pool_config.max_connections
+
+    if pool_config.max_connections_per_host is not None:
+        connector_kwargs["limit_per_host"] = pool_config.max_connections_per_host
+
+    if pool_config.keepalive_expiry is not None:
+        connector_kwargs["keepalive_timeout"] = pool_config.keepalive_expiry
+
+    return aiohttp.TCPConnector(**connector_kwargs)
+
+
 DEFAULT_USER_AGENT = "Python/%s.%s aiohttp/%s" % (sys.version_info.major,
                                                   sys.version_info.minor,
                                                   aiohttp.__version__)
@@ -108,7 +125,10 @@ class AIOHTTPSession(AsyncSession):
 
         :any:`AsyncSession` implementation using the `aiohttp`_ library.
 
-        All arguments passed in the constructor are directly forwared to :any:`aiohttp.ClientSession`.
+        All arguments passed in the constructor (except :code:`pool_config`)
+        are directly forwared to :any:`aiohttp.ClientSession`.
+        :code:`pool_config` (:any:`PoolConfig`) is translated to :any:`aiohttp.TCPConnector`,
+        it can't be used together with :code:`connector`.
 
         :ivar aiohttp_session: underlying instance of :any:`aiohttp.ClientSession`
 
@@ -131,7 +151,7 @@ class AIOHTTPSession(AsyncSession):
                        }
                     )
     """
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, pool_config: Optional[PoolConfig] = None, **kwargs) -> None:
         headers = CaseInsensitiveDict({
             "User-Agent": DEFAULT_USER_AGENT,
             "Accept-Encoding": "gzip, deflate",
@@ -143,6 +163,20 @@ class AIOHTTPSession(AsyncSession):
 
         kwargs["headers"] = headers
 
+        if pool_config is not None:
+            if kwargs.get("connector") is not None:
+                raise ValueError("pool_config and connector cannot be specified at the same time")
+
+            kwargs["connector"] = convert_pool_config(pool_config)
+
+        self._counter = _ConnectionCounter()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+        kwargs["trace_configs"] = [*(kwargs.get("trace_configs") or []), trace_config]
+
         self._session = aiohttp.ClientSession(*args, **kwargs)
 
     @property
@@ -176,5 +210,20 @@ class AIOHTTPSession(AsyncSession):
         except aiohttp.ClientError as e:
             raise convert_aiohttp_exception(e) from e
 
+    async def _on_connection_create_end(self, session: aiohttp.ClientSession, context: Any, params: Any) -> None:
+        self._counter.count_request(new_connection=True)
+
+    async def _on_connection_reuseconn(self, session: aiohttp.ClientSession, context: Any, params: Any) -> None:
+        self._counter.count_request()
+
+    def get_pool_stats(self) -> PoolStats:
+        connector = self._session.connector
+
+        # aiohttp doesn't expose the state of its connection pool
+        idle = sum(len(connections) for connections in getattr(connector, "_conns", {}).values())
+        active = len(getattr(connector, "_acquired", ()))
+
+        return PoolStats(idle=idle, active=active, reused=self._counter.reused, new=self._counter.new)
+
     async def close(self) -> None:
         await self._session.close()
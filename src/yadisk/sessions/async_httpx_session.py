@@ -16,10 +16,12 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any
+from typing import Any, Optional
 
 from .._async_session import AsyncSession, AsyncResponse
+from ..pool import PoolConfig, PoolStats, _ConnectionCounter
 from ..types import JSON, AsyncConsumeCallback, HTTPMethod
+from ..utils import CaseInsensitiveDict
 from .._common import is_async_func
 
 from ._httpx_common import *
@@ -35,6 +37,7 @@ class AsyncHTTPXResponse(AsyncResponse):
 
         self._response = response
         self.status = response.status_code
+        self.headers = CaseInsensitiveDict(response.headers.items())
 
     async def json(self) -> JSON:
         try:
@@ -71,7 +74,13 @@ class AsyncHTTPXSession(AsyncSession):
 
         .. _httpx.AsyncClient: https://www.python-httpx.org/api/#asyncclient
 
-        All arguments passed in the constructor are directly forwared to `httpx.AsyncClient`_.
+        All arguments passed in the constructor (except :code:`http2` and :code:`pool_config`)
+        are directly forwared to `httpx.AsyncClient`_.
+        :code:`pool_config` (:any:`PoolConfig`) is translated to :code:`limits`.
+
+        If :code:`http2` is :code:`True`, API requests are multiplexed over HTTP/2
+        connections (requires the `h2` package, e.g. :code:`pip install httpx[http2]`).
+        Streamed requests (uploads and downloads) still use a separate HTTP/1.1 client.
 
         :ivar httpx_client: underlying instance of `httpx.AsyncClient`_
 
@@ -96,22 +105,45 @@ class AsyncHTTPXSession(AsyncSession):
                     )
     """
 
-    def __init__(self, *args, **kwargs):
-        self._session = httpx.AsyncClient(*args, **kwargs)
+    def __init__(self, *args, http2: bool = False, pool_config: Optional[PoolConfig] = None, **kwargs):
+        if pool_config is not None:
+            kwargs["limits"] = convert_pool_config(pool_config)
+
+        self._session = httpx.AsyncClient(*args, http2=http2, **kwargs)
         self._session.follow_redirects = True
+        self._transfer_client: Optional[httpx.AsyncClient] = None
+        self._counter = _ConnectionCounter()
+
+        if http2:
+            self._transfer_client = httpx.AsyncClient(*args, **get_transfer_client_kwargs(kwargs))
+            self._transfer_client.follow_redirects = True
 
     @property
     def httpx_session(self) -> httpx.AsyncClient:
         return self._session
 
     async def send_request(self, method: HTTPMethod, url: str, **kwargs) -> AsyncResponse:
-        request_kwargs, send_kwargs = convert_args_for_httpx(self._session, kwargs)
+        client = self._session
+
+        if self._transfer_client is not None and kwargs.get("stream", False):
+            client = self._transfer_client
+
+        request_kwargs, send_kwargs = convert_args_for_httpx(client, kwargs, self._trace)
 
         try:
-            request = self._session.build_request(method, url, **request_kwargs)
-            return AsyncHTTPXResponse(await self._session.send(request, **send_kwargs))
+            request = client.build_request(method, url, **request_kwargs)
+            return AsyncHTTPXResponse(await client.send(request, **send_kwargs))
         except httpx.HTTPError as e:
             raise convert_httpx_exception(e) from e
 
+    async def _trace(self, event_name: str, info: Any) -> None:
+        handle_trace_event(self._counter, event_name)
+
+    def get_pool_stats(self) -> PoolStats:
+        return get_httpx_pool_stats([self._session, self._transfer_client], self._counter)
+
     async def close(self) -> None:
         await self._session.aclose()
+
+        if self._transfer_client is not None:
+            await self._transfer_client.aclose()
@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024 Ivan Konovalov
+
+# This file is part of a Python library yadisk.
+
+# This library is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from collections import deque
+import json
+from typing import Any, Optional, Union
+
+from .._async_session import AsyncSession, AsyncResponse
+from .._common import is_async_func
+from ..pool import PoolConfig, PoolStats
+from .._typing_compat import AsyncIterator, Callable, Deque, Dict
+from ..types import JSON, AsyncConsumeCallback, AsyncPayload, HTTPMethod
+
+from .pycurl_session import PycURLSession, HeaderCollector, convert_curl_error
+
+import pycurl
+
+__all__ = ["AsyncPycURLSession"]
+
+# Streamed responses stop receiving data once this much is buffered
+# and not yet consumed by AsyncPycURLResponse.download()
+MAX_STREAM_BUFFER_SIZE = 256 * 1024
+
+_FinishCallback = Callable[[Optional[pycurl.error]], None]
+
+
+class _AsyncCurlMulti:
+    """Drives a `CurlMulti` handle from an asyncio event loop"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.multi = pycurl.CurlMulti()
+        self.multi.setopt(pycurl.M_SOCKETFUNCTION, self._on_socket)
+        self.multi.setopt(pycurl.M_TIMERFUNCTION, self._on_timer)
+
+        self.callbacks: Dict[pycurl.Curl, _FinishCallback] = {}
+
+        # Sockets watched by the event loop, maps file descriptors to pycurl.POLL_* flags
+        self.sockets: Dict[int, int] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, curl: pycurl.Curl, callback: _FinishCallback) -> None:
+        # The callback is called once the transfer is finished and the handle is removed
+        self.multi.add_handle(curl)
+        self.callbacks[curl] = callback
+
+    def remove(self, curl: pycurl.Curl) -> None:
+        # Removes the handle without calling its callback
+        if self.callbacks.pop(curl, None) is not None:
+            self.multi.remove_handle(curl)
+
+    def finish(self, curl: pycurl.Curl, error: Optional[pycurl.error]) -> None:
+        callback = self.callbacks.pop(curl, None)
+
+        if callback is None:
+            return
+
+        self.multi.remove_handle(curl)
+        callback(error)
+
+    def _on_socket(self, what: int, fd: int, multi: pycurl.CurlMulti, data: Any) -> None:
+        # libcurl tells which events of the socket it's interested in
+        events = 0 if what == pycurl.POLL_REMOVE else what
+        watched = self.sockets.pop(fd, 0)
+
+        if watched & pycurl.POLL_IN and not events & pycurl.POLL_IN:
+            self.loop.remove_reader(fd)
+        elif events & pycurl.POLL_IN and not watched & pycurl.POLL_IN:
+            self.loop.add_reader(fd, self._socket_action, fd, pycurl.CSELECT_IN)
+
+        if watched & pycurl.POLL_OUT and not events & pycurl.POLL_OUT:
+            self.loop.remove_writer(fd)
+        elif events & pycurl.POLL_OUT and not watched & pycurl.POLL_OUT:
+            self.loop.add_writer(fd, self._socket_action, fd, pycurl.CSELECT_OUT)
+
+        if events:
+            self.sockets[fd] = events
+
+    def _on_timer(self, timeout_ms: int) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        # -1 means the timer should be deleted
+        if timeout_ms >= 0:
+            # libcurl can't be called from its own callbacks, so even
+            # a zero timeout is handled on the next iteration of the loop
+            self.timer = self.loop.call_later(timeout_ms / 1000, self._on_timeout)
+
+    def _on_timeout(self) -> None:
+        self.timer = None
+        self._socket_action(pycurl.SOCKET_TIMEOUT, 0)
+
+    def _socket_action(self, fd: int, events: int) -> None:
+        try:
+            while True:
+                ret, _ = self.multi.socket_action(fd, events)
+
+                if ret != pycurl.E_CALL_MULTI_PERFORM:
+                    break
+        except pycurl.error as e:
+            # The multi handle is broken, no transfer is going to be finished normally
+            for curl in list(self.callbacks):
+                self.finish(curl, e)
+
+            return
+
+        while True:
+            n_queued, succeeded, failed = self.multi.info_read()
+
+            for curl in succeeded:
+                self.finish(curl, None)
+
+            for curl, code, message in failed:
+                self.finish(curl, pycurl.error(code, message))
+
+            if not n_queued:
+                return
+
+    def close(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        for curl in list(self.callbacks):
+            self.finish(curl, pycurl.error(pycurl.E_ABORTED_BY_CALLBACK, "The session has been closed"))
+
+        for fd, events in self.sockets.items():
+            if events & pycurl.POLL_IN:
+                self.loop.remove_reader(fd)
+
+            if events & pycurl.POLL_OUT:
+                self.loop.remove_writer(fd)
+
+        self.sockets.clear()
+        self.multi.close()
+
+
+class _AsyncTransfer:
+    # State of a single request sent by AsyncPycURLSession
+
+    def __init__(
+        self,
+        session: PycURLSession,
+        multi: _AsyncCurlMulti,
+        curl: pycurl.Curl,
+        header_collector: HeaderCollector,
+        stream: bool
+    ) -> None:
+        self.session = session
+        self.multi = multi
+        self.curl: Optional[pycurl.Curl] = curl
+        self.header_collector = header_collector
+
+        # If True, the transfer is paused when too much data is buffered
+        self.stream = stream
+        self.paused = False
+        self.finished = False
+
+        self.status = 0
+        self.chunks: Deque[bytes] = deque()
+        self.buffered = 0
+
+        # Either a converted cURL error or an exception raised by the request body iterator
+        self.error: Optional[BaseException] = None
+
+        # Set whenever the state of the transfer changes
+        self.event = asyncio.Event()
+
+        curl.setopt(pycurl.WRITEFUNCTION, self._write)
+
+    def start(self) -> None:
+        assert self.curl is not None
+
+        self.multi.add(self.curl, self._finish)
+
+        with self.session._lock:
+            self.session._active += 1
+
+    def _write(self, chunk: bytes) -> Optional[int]:
+        self.event.set()
+
+        if self.stream and self.buffered >= MAX_STREAM_BUFFER_SIZE:
+            # cURL will pass the same chunk again once the transfer is resumed
+            self.paused = True
+            return pycurl.WRITEFUNC_PAUSE
+
+        self.chunks.append(chunk)
+        self.buffered += len(chunk)
+
+        return None
+
+    def _finish(self, error: Optional[pycurl.error]) -> None:
+        assert self.curl is not None
+
+        self.finished = True
+        self.event.set()
+
+        with self.session._lock:
+            self.session._active -= 1
+
+        if self.error is not None:
+            return
+
+        if error is not None:
+            self.error = convert_curl_error(error)
+            return
+
+        self.status = self.curl.getinfo(pycurl.RESPONSE_CODE)
+        self.session._counter.count_request(new_connection=self.curl.getinfo(pycurl.NUM_CONNECTS) > 0)
+
+    def fail(self, error: BaseException) -> None:
+        # Aborts the transfer from outside of cURL callbacks
+        self.error = error
+
+        if self.curl is not None:
+            self.multi.finish(self.curl, None)
+
+    def resume(self) -> None:
+        self.paused = False
+
+        if self.finished or self.curl is None:
+            return
+
+        try:
+            self.curl.pause(pycurl.PAUSE_CONT)
+        except pycurl.error as e:
+            self.fail(convert_curl_error(e))
+
+    async def _wait_for(self, condition: Callable[[], bool]) -> None:
+        while not condition():
+            self.event.clear()
+            await self.event.wait()
+
+        if self.error is not None and not self.chunks:
+            raise self.error
+
+    async def wait_for_headers(self) -> None:
+        # Headers are received before the body, so they are complete once the body starts arriving
+        await self._wait_for(lambda: bool(self.chunks) or self.paused or self.finished)
+
+        if not self.finished:
+            self.status = self.header_collector.status
+
+    async def read(self) -> bytes:
+        # Returns the next chunk of the response body or b"" if there is nothing left
+        await self._wait_for(lambda: bool(self.chunks) or self.finished)
+
+        if not self.chunks:
+            return b""
+
+        chunk = self.chunks.popleft()
+        self.buffered -= len(chunk)
+
+        if self.paused and self.buffered < MAX_STREAM_BUFFER_SIZE:
+            self.resume()
+
+        return chunk
+
+    async def read_all(self) -> bytes:
+        self.stream = False
+
+        if self.paused:
+            self.resume()
+
+        await self._wait_for(lambda: self.finished)
+
+        if self.error is not None:
+            raise self.error
+
+        return b"".join(self.chunks)
+
+    def release(self) -> None:
+        curl, self.curl = self.curl, None
+
+        if curl is None:
+            return
+
+        if not self.finished:
+            self.finished = True
+            self.multi.remove(curl)
+
+            with self.session._lock:
+                self.session._active -= 1
+
+        self.session._release_handle(curl)
+
+
+class _AsyncReader:
+    """Feeds an async iterator to cURL, used as pycurl.READFUNCTION"""
+
+    def __init__(self, iterator: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop) -> None:
+        self.iterator = iterator
+        self.loop = loop
+        self.transfer: Optional[_AsyncTransfer] = None
+        self.chunk = b""
+        self.exhausted = False
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    def __call__(self, size: int) -> Union[bytes, int]:
+        assert self.transfer is not None
+
+        if self.transfer.error is not None:
+            return pycurl.READFUNC_ABORT
+
+        if self.chunk:
+            data, self.chunk = self.chunk[:size], self.chunk[size:]
+            return data
+
+        if self.exhausted:
+            return b""
+
+        # The next chunk can only be awaited outside of cURL callbacks,
+        # the transfer is paused until it's received
+        if self.task is None:
+            self.task = self.loop.create_task(self._next_chunk())
+
+        return pycurl.READFUNC_PAUSE
+
+    async def _next_chunk(self) -> None:
+        assert self.transfer is not None
+
+        try:
+            self.chunk = await self.iterator.__anext__()
+        except StopAsyncIteration:
+            self.exhausted = True
+        except Exception as e:
+            self.transfer.fail(e)
+            return
+        finally:
+            self.task = None
+
+        self.transfer.resume()
+
+    def cancel(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+
+class AsyncPycURLResponse(AsyncResponse):
+    def __init__(self, transfer: _AsyncTransfer) -> None:
+        super().__init__()
+
+        self._transfer = transfer
+        self._response: Optional[bytes] = None
+        self.status = transfer.status
+        self.headers = transfer.header_collector.headers
+
+    async def json(self) -> JSON:
+        if self._response is None:
+            try:
+                self._response = await self._transfer.read_all()
+            finally:
+                self._transfer.release()
+
+        return json.loads(self._response)
+
+    async def download(self, consume_callback: AsyncConsumeCallback) -> None:
+        callback: Any = consume_callback
+        is_async = is_async_func(consume_callback)
+
+        try:
+            while True:
+                chunk = await self._transfer.read()
+
+                if not chunk:
+                    break
+
+                if is_async:
+                    await callback(chunk)
+                else:
+                    callback(chunk)
+        finally:
+            self._transfer.release()
+
+    async def close(self) -> None:
+        self._transfer.release()
+
+
+class AsyncPycURLSession(AsyncSession):
+    """
+        .. _pycurl: https://pypi.org/project/pycurl
+
+        :any:`AsyncSession` implementation using the `pycurl`_ library.
+
+        All requests of the session are sent through a single `CurlMulti`
+        handle, which is driven by the running event loop: the sockets
+        used by cURL are watched with :code:`loop.add_reader()` and
+        :code:`loop.add_writer()`, its timeouts are scheduled with
+        :code:`loop.call_later()`. Therefore, this session requires
+        an event loop that supports these methods (on Windows, the default
+        proactor event loop does not).
+
+        Otherwise, the session behaves just like :any:`PycURLSession`:
+        :code:`pool_config` (:any:`PoolConfig`) is translated to cURL options,
+        easy handles are reused and share connections, DNS cache and TLS sessions.
+        :any:`AsyncPycURLSession.get_pool_stats()` doesn't report idle connections.
+
+        :param pool_config: `None` or :any:`PoolConfig`, connection pool settings
+        :param max_idle_handles: `int`, maximum number of idle easy handles kept for reuse
+
+        To pass `pycurl`-specific arguments from :any:`AsyncClient` use :code:`curl_options` keyword argument.
+
+        Usage example:
+
+        .. code:: python
+
+           import yadisk
+           import pycurl
+
+           async def main():
+               async with yadisk.AsyncClient(..., session="pycurl") as client:
+                   await client.get_meta(
+                       "/my_file.txt",
+                       n_retries=5,
+                       curl_options={
+                           pycurl.MAX_SEND_SPEED_LARGE: 5 * 1024**2,
+                           pycurl.MAX_RECV_SPEED_LARGE: 5 * 1024**2,
+                           pycurl.PROXY: "http://localhost:12345",
+                           pycurl.MAXREDIRS: 15
+                       }
+                    )
+    """
+
+    def __init__(self, pool_config: Optional[PoolConfig] = None, max_idle_handles: int = 32) -> None:
+        # Maintains the easy handles and the share
+        self._session = PycURLSession(pool_config=pool_config, max_idle_handles=max_idle_handles)
+        self._multi: Optional[_AsyncCurlMulti] = None
+
+    def _get_multi(self) -> _AsyncCurlMulti:
+        loop = asyncio.get_running_loop()
+
+        if self._multi is None or self._multi.loop is not loop:
+            if self._multi is not None:
+                self._multi.close()
+
+            self._multi = _AsyncCurlMulti(loop)
+
+        return self._multi
+
+    async def send_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        *,
+        data: Optional[AsyncPayload] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncResponse:
+        multi = self._get_multi()
+        session = self._session
+        curl = session._acquire_handle()
+        reader: Optional[_AsyncReader] = None
+
+        try:
+            if isinstance(data, AsyncIterator):
+                reader = _AsyncReader(data, multi.loop)
+                header_collector, _ = session._setup_handle(curl, method, url, **kwargs)
+
+                curl.setopt(pycurl.UPLOAD, True)
+                curl.setopt(pycurl.READFUNCTION, reader)
+            else:
+                header_collector, _ = session._setup_handle(curl, method, url, data=data, **kwargs)
+        except BaseException:
+            session._release_handle(curl)
+            raise
+
+        stream = stream and data is None
+        transfer = _AsyncTransfer(session, multi, curl, header_collector, stream)
+
+        if reader is not None:
+            reader.transfer = transfer
+
+        try:
+            transfer.start()
+
+            if stream:
+                await transfer.wait_for_headers()
+            else:
+                await transfer.read_all()
+        except BaseException:
+            transfer.release()
+            raise
+        finally:
+            if reader is not None:
+                reader.cancel()
+
+        response = AsyncPycURLResponse(transfer)
+
+        if not stream:
+            # The whole response has been received, the handle can be reused right away
+            transfer.release()
+
+        return response
+
+    def get_pool_stats(self) -> PoolStats:
+        return self._session.get_pool_stats()
+
+    async def close(self) -> None:
+        if self._multi is not None:
+            self._multi.close()
+            self._multi = None
+
+        self._session.close()
@@ -16,8 +16,12 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
+from typing import Any, Optional
+
 from .._session import Session, Response
+from ..pool import PoolConfig, PoolStats, _ConnectionCounter
 from ..types import JSON, ConsumeCallback, HTTPMethod
+from ..utils import CaseInsensitiveDict
 
 from ._httpx_common import *
 
@@ -32,6 +36,7 @@ class HTTPXResponse(Response):
 
         self._response = response
         self.status = response.status_code
+        self.headers = CaseInsensitiveDict(response.headers.items())
 
     def json(self) -> JSON:
         try:
@@ -62,7 +67,13 @@ class HTTPXSession(Session):
 
         .. _httpx.Client: https://www.python-httpx.org/api/#client
 
-        All arguments passed in the constructor are directly forwared to `httpx.Client`_.
+        All arguments passed in the constructor (except :code:`http2` and :code:`pool_config`)
+        are directly forwared to `httpx.Client`_.
+        :code:`pool_config` (:any:`PoolConfig`) is translated to :code:`limits`.
+
+        If :code:`http2` is :code:`True`, API requests are multiplexed over HTTP/2
+        connections (requires the `h2` package, e.g. :code:`pip install httpx[http2]`).
+        Streamed requests (uploads and downloads) still use a separate HTTP/1.1 client.
 
         :ivar httpx_client: underlying instance of `httpx.Client`_
 
@@ -85,22 +96,45 @@ class HTTPXSession(Session):
                    }
                 )
     """
-    def __init__(self, *args, **kwargs):
-        self._client = httpx.Client(*args, **kwargs)
+    def __init__(self, *args, http2: bool = False, pool_config: Optional[PoolConfig] = None, **kwargs):
+        if pool_config is not None:
+            kwargs["limits"] = convert_pool_config(pool_config)
+
+        self._client = httpx.Client(*args, http2=http2, **kwargs)
         self._client.follow_redirects = True
+        self._transfer_client: Optional[httpx.Client] = None
+        self._counter = _ConnectionCounter()
+
+        if http2:
+            self._transfer_client = httpx.Client(*args, **get_transfer_client_kwargs(kwargs))
+            self._transfer_client.follow_redirects = True
 
     @property
     def httpx_client(self) -> httpx.Client:
         return self._client
 
     def send_request(self, method: HTTPMethod, url: str, **kwargs) -> Response:
-        request_kwargs, send_kwargs = convert_args_for_httpx(self._client, kwargs)
+        client = self._client
+
+        if self._transfer_client is not None and kwargs.get("stream", False):
+            client = self._transfer_client
+
+        request_kwargs, send_kwargs = convert_args_for_httpx(client, kwargs, self._trace)
 
         try:
-            request = self._client.build_request(method, url, **request_kwargs)
-            return HTTPXResponse(self._client.send(request, **send_kwargs))
+            request = client.build_request(method, url, **request_kwargs)
+            return HTTPXResponse(client.send(request, **send_kwargs))
         except httpx.HTTPError as e:
             raise convert_httpx_exception(e) from e
 
+    def _trace(self, event_name: str, info: Any) -> None:
+        handle_trace_event(self._counter, event_name)
+
+    def get_pool_stats(self) -> PoolStats:
+        return get_httpx_pool_stats([self._client, self._transfer_client], self._counter)
+
     def close(self) -> None:
         self._client.close()
+
+        if self._transfer_client is not None:
+            self._transfer_client.close()
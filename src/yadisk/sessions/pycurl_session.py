@@ -18,7 +18,9 @@
 
 from io import BytesIO
 import json
-from typing import Any, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from ..exceptions import (
     RequestError, RequestTimeoutError,
@@ -26,7 +28,9 @@ from ..exceptions import (
 )
 
 from .._session import Session, Response
-from .._typing_compat import Iterator, Tuple, Dict
+from ..batch import _BatchTransport
+from ..pool import PoolConfig, PoolStats, _ConnectionCounter
+from .._typing_compat import Callable, Iterator, List, Tuple, Dict
 from ..utils import CaseInsensitiveDict
 from ..types import JSON, ConsumeCallback, HTTPMethod, Headers, Payload, TimeoutParameter
 from .. import settings
@@ -35,8 +39,13 @@ from urllib.parse import urlencode
 
 import pycurl
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ..batch import _BatchRequest, _TransferCallback
+
 __all__ = ["PycURLSession"]
 
+T = TypeVar("T")
+
 
 def convert_curl_error(error: pycurl.error) -> RequestError:
     code, msg = error.args
@@ -50,48 +59,114 @@ def convert_curl_error(error: pycurl.error) -> RequestError:
     return exc(msg)
 
 
+class HeaderCollector:
+    """Collects the status and headers of a response, used as pycurl.HEADERFUNCTION"""
+
+    def __init__(self) -> None:
+        self.status = 0
+        self.headers = CaseInsensitiveDict()
+
+    def __call__(self, line: bytes) -> None:
+        decoded_line = line.decode("iso-8859-1")
+
+        # Headers of every response (e.g. after following redirects) start with a status line
+        if decoded_line.startswith("HTTP/"):
+            self.headers.clear()
+
+            status_line = decoded_line.split(None, 2)
+
+            if len(status_line) >= 2 and status_line[1].isdigit():
+                self.status = int(status_line[1])
+
+            return
+
+        name, sep, value = decoded_line.partition(":")
+
+        if sep:
+            self.headers[name.strip()] = value.strip()
+
+
 # see PycurlResponse.download() implementation
 MAX_RESPONSE_BUFFER_SIZE = 128 * 1024
 
 
 class PycURLResponse(Response):
-    def __init__(self, curl: pycurl.Curl, response: bytes):
+    def __init__(
+        self,
+        curl: pycurl.Curl,
+        response: bytes,
+        header_collector: Optional[HeaderCollector] = None,
+        session: Optional["PycURLSession"] = None
+    ):
         super().__init__()
 
-        self._curl = curl
+        self._curl: Optional[pycurl.Curl] = curl
+        self._session = session
         self._response = response
+        self._header_collector = header_collector or HeaderCollector()
+        self.headers = self._header_collector.headers
 
         self._update_status()
 
+    def _get_curl(self) -> pycurl.Curl:
+        if self._curl is None:
+            raise RequestError("The response has already been received")
+
+        return self._curl
+
     def _update_status(self) -> None:
-        self.status = self._curl.getinfo(pycurl.RESPONSE_CODE)
+        self.status = self._get_curl().getinfo(pycurl.RESPONSE_CODE)
 
-    def _perform(self) -> None:
-        try:
-            self._curl.perform()
-        except pycurl.error as e:
-            raise convert_curl_error(e) from e
+    def _release(self) -> None:
+        # The handle is no longer needed once the transfer is finished
+        curl, self._curl = self._curl, None
 
-        self._update_status()
+        if curl is None:
+            return
+
+        if self._session is not None:
+            self._session._release_handle(curl)
+        else:
+            curl.close()
+
+    def _perform(self, perform: Callable[[pycurl.Curl], T]) -> T:
+        curl = self._get_curl()
 
-    def _perform_rb(self) -> None:
         try:
-            self._response = self._curl.perform_rb()
+            if self._session is not None:
+                result = self._session._track_perform(curl, lambda: perform(curl))
+            else:
+                result = perform(curl)
         except pycurl.error as e:
             raise convert_curl_error(e) from e
 
         self._update_status()
+        self._release()
+
+        return result
 
     def json(self) -> JSON:
         if not self.status:
-            self._perform_rb()
+            self._response = self._perform(lambda curl: curl.perform_rb())
 
         return json.loads(self._response)
 
     def download(self, consume_callback: ConsumeCallback) -> None:
+        if self._curl is None:
+            # The response body has already been received
+            if self._response:
+                consume_callback(self._response)
+
+            return
+
         buffer = BytesIO()
 
         def write_cb(chunk: bytes) -> int:
+            # The status is already known once the response body starts arriving,
+            # but getinfo() can't be called until perform() is finished
+            if not self.status:
+                self.status = self._header_collector.status
+
             # Write up to `MAX_RESPONSE_BUFFER_SIZE` bytes of data into an in-memory buffer
             # This is a hack to detect bad HTTP status codes to give
             # `consume_callback` an opportunity to check status before writing
@@ -112,7 +187,7 @@ class PycURLResponse(Response):
 
         self._curl.setopt(pycurl.WRITEFUNCTION, write_cb)
 
-        self._perform()
+        self._perform(lambda curl: curl.perform())
 
         # Write left over data from the buffer
         if buffer.tell():
@@ -120,7 +195,7 @@ class PycURLResponse(Response):
             consume_callback(buffer.read())
 
     def close(self) -> None:
-        self._curl.close()
+        self._release()
 
 
 class IterableReader:
@@ -198,12 +273,43 @@ def convert_timeout(timeout: TimeoutParameter) -> Tuple[float, float]:
 
     return connect_timeout, read_timeout
 
+
+def convert_pool_config(pool_config: PoolConfig) -> Dict[int, Any]:
+    curl_options: Dict[int, Any] = {
+        pycurl.TCP_NODELAY: pool_config.tcp_nodelay,
+        pycurl.SSL_SESSIONID_CACHE: pool_config.tls_session_reuse
+    }
+
+    if pool_config.max_connections is not None:
+        curl_options[pycurl.MAXCONNECTS] = pool_config.max_connections
+
+    if pool_config.keepalive_expiry is not None:
+        # 0 would mean the default of 118 seconds
+        curl_options[pycurl.MAXAGE_CONN] = max(1, int(pool_config.keepalive_expiry))
+
+    return curl_options
+
 class PycURLSession(Session):
     """
         .. _pycurl: https://pypi.org/project/pycurl
 
         :any:`Session` implementation using the `pycurl`_ library.
 
+        :code:`pool_config` (:any:`PoolConfig`) is translated to cURL options.
+        :any:`PycURLSession.get_pool_stats()` doesn't report idle connections.
+
+        Easy handles are reused: once a response is received (or closed),
+        its handle is reset and up to :code:`max_idle_handles` handles are
+        kept for subsequent requests. All handles share connections, DNS cache
+        and TLS sessions through a `CurlShare` object, `pycurl` protects
+        shared data with its own lock callbacks, so the session can be used
+        from multiple threads.
+
+        :param pool_config: `None` or :any:`PoolConfig`, connection pool settings
+        :param max_idle_handles: `int`, maximum number of idle easy handles kept for reuse
+
+        :ivar max_idle_handles: `int`, maximum number of idle easy handles kept for reuse
+
         To pass `pycurl`-specific arguments from :any:`Client` use :code:`curl_options` keyword argument.
 
         Usage example:
@@ -226,36 +332,98 @@ class PycURLSession(Session):
                 )
     """
 
-    def __init__(self) -> None:
+    max_idle_handles: int
+
+    def __init__(self, pool_config: Optional[PoolConfig] = None, max_idle_handles: int = 32) -> None:
+        self.max_idle_handles = max_idle_handles
+
         self._share = pycurl.CurlShare()
 
         self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_CONNECT)
         self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
-        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
 
-    def send_request(
+        if pool_config is None or pool_config.tls_session_reuse:
+            self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+
+        self._pool_options = convert_pool_config(pool_config) if pool_config is not None else {}
+        self._counter = _ConnectionCounter()
+        self._active = 0
+        self._handles: List[pycurl.Curl] = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _acquire_handle(self) -> pycurl.Curl:
+        with self._lock:
+            if self._handles:
+                # A reset handle is still attached to the share
+                return self._handles.pop()
+
+        curl = pycurl.Curl()
+        curl.setopt(pycurl.SHARE, self._share)
+
+        return curl
+
+    def _release_handle(self, curl: pycurl.Curl) -> None:
+        # Drops options, callbacks and references to request data,
+        # but keeps the share (and thus connections, DNS and TLS caches)
+        curl.reset()
+
+        with self._lock:
+            if not self._closed and len(self._handles) < self.max_idle_handles:
+                self._handles.append(curl)
+                return
+
+        curl.close()
+
+    def _track_perform(self, curl: pycurl.Curl, perform: Callable[[], T]) -> T:
+        with self._lock:
+            self._active += 1
+
+        try:
+            result = perform()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+        self._counter.count_request(new_connection=curl.getinfo(pycurl.NUM_CONNECTS) > 0)
+
+        return result
+
+    def get_pool_stats(self) -> PoolStats:
+        with self._lock:
+            active = self._active
+
+        # libcurl doesn't report the size of its connection cache
+        return PoolStats(idle=None, active=active, reused=self._counter.reused, new=self._counter.new)
+
+    def _open_batch_transport(self, max_concurrency: int) -> "_CurlMultiTransport":
+        return _CurlMultiTransport(self)
+
+    def _setup_handle(
         self,
+        curl: pycurl.Curl,
         method: HTTPMethod,
         url: str,
         *,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Payload] = None,
         headers: Optional[Headers] = None,
-        stream: bool = False,
         curl_options: Optional[Dict[int, Any]] = None,
         **kwargs
-    ) -> Response:
+    ) -> Tuple[HeaderCollector, bool]:
+        # Returns the header collector and whether there is a request body
         curl_headers = CaseInsensitiveDict({"connection": "keep-alive"})
         curl_headers.update(headers or {})
 
         if params:
             url = url + "?" + urlencode(params)
 
-        curl = pycurl.Curl()
         curl.setopt(pycurl.NOSIGNAL, True)
         curl.setopt(pycurl.FOLLOWLOCATION, True)
         curl.setopt(pycurl.URL, url)
-        curl.setopt(pycurl.SHARE, self._share)
+
+        header_collector = HeaderCollector()
+        curl.setopt(pycurl.HEADERFUNCTION, header_collector)
 
         if "timeout" in kwargs:
             connect_timeout, read_timeout = convert_timeout(kwargs["timeout"])
@@ -266,6 +434,8 @@ class PycURLSession(Session):
 
         curl.setopt(pycurl.HTTPHEADER, [f"{k}:{v}" for k, v in curl_headers.items() if k and v])
 
+        for option, value in self._pool_options.items():
+            curl.setopt(option, value)
 
         if curl_options is not None:
             for option, value in curl_options.items():
@@ -289,15 +459,182 @@ class PycURLSession(Session):
 
         curl.setopt(pycurl.CUSTOMREQUEST, method)
 
-        if not stream or uploading_file:
+        return header_collector, uploading_file
+
+    def send_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        *,
+        stream: bool = False,
+        **kwargs
+    ) -> Response:
+        curl = self._acquire_handle()
+
+        try:
+            header_collector, uploading_file = self._setup_handle(curl, method, url, **kwargs)
+
+            if stream and not uploading_file:
+                return PycURLResponse(curl, b"", header_collector, self)
+
             try:
-                response = curl.perform_rb()
+                response = self._track_perform(curl, curl.perform_rb)
             except pycurl.error as e:
                 raise convert_curl_error(e) from e
-        else:
-            response = b""
 
-        return PycURLResponse(curl, response)
+            result = PycURLResponse(curl, response, header_collector, self)
+        except BaseException:
+            self._release_handle(curl)
+            raise
+
+        # The whole response has been received, the handle can be reused right away
+        result._release()
+
+        return result
 
     def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            handles, self._handles = self._handles, []
+
+        for curl in handles:
+            curl.close()
+
         self._share.close()
+
+
+class _Transfer:
+    # State of a transfer of _CurlMultiTransport
+
+    def __init__(self, callback: "_TransferCallback", header_collector: HeaderCollector) -> None:
+        self.callback = callback
+        self.header_collector = header_collector
+        self.body = BytesIO()
+
+        # Exception raised by the consume callback, the transfer is aborted
+        self.error: Optional[Exception] = None
+
+
+class _CurlMultiTransport(_BatchTransport):
+    """Sends the requests of a batch (see :any:`Batch`) on a single `CurlMulti` handle"""
+
+    def __init__(self, session: PycURLSession) -> None:
+        self.session = session
+        self.multi = pycurl.CurlMulti()
+        self.transfers: Dict[pycurl.Curl, _Transfer] = {}
+
+    def start(self, request: "_BatchRequest", callback: "_TransferCallback") -> None:
+        kwargs = dict(request.kwargs)
+        kwargs.pop("stream", None)
+
+        session = self.session
+        curl = session._acquire_handle()
+
+        try:
+            header_collector, _ = session._setup_handle(curl, request.method, request.url, **kwargs)
+            transfer = _Transfer(callback, header_collector)
+            consume_callback = request.consume_callback
+
+            def write_cb(chunk: bytes) -> Optional[int]:
+                # Headers are received before the body, so the status is already known
+                if consume_callback is None or not 200 <= header_collector.status < 300:
+                    transfer.body.write(chunk)
+                    return None
+
+                try:
+                    consume_callback(chunk)
+                except Exception as e:
+                    transfer.error = e
+
+                    # Aborts the transfer
+                    return 0
+
+                return None
+
+            curl.setopt(pycurl.WRITEFUNCTION, write_cb)
+            self.multi.add_handle(curl)
+        except BaseException:
+            session._release_handle(curl)
+            raise
+
+        self.transfers[curl] = transfer
+
+        with session._lock:
+            session._active += 1
+
+    def _finish(self, curl: pycurl.Curl, error: Optional[Exception]) -> None:
+        session = self.session
+        transfer = self.transfers.pop(curl)
+
+        self.multi.remove_handle(curl)
+
+        with session._lock:
+            session._active -= 1
+
+        if transfer.error is not None:
+            error = transfer.error
+
+        if error is not None:
+            session._release_handle(curl)
+            transfer.callback(None, error)
+            return
+
+        session._counter.count_request(new_connection=curl.getinfo(pycurl.NUM_CONNECTS) > 0)
+
+        response = PycURLResponse(curl, transfer.body.getvalue(), transfer.header_collector, session)
+        response._release()
+
+        transfer.callback(response, None)
+
+    def _perform(self) -> int:
+        # Returns the number of finished transfers
+        while True:
+            ret, _ = self.multi.perform()
+
+            if ret != pycurl.E_CALL_MULTI_PERFORM:
+                break
+
+        n_finished = 0
+
+        while True:
+            n_queued, succeeded, failed = self.multi.info_read()
+
+            for curl in succeeded:
+                self._finish(curl, None)
+
+            for curl, code, message in failed:
+                self._finish(curl, convert_curl_error(pycurl.error(code, message)))
+
+            n_finished += len(succeeded) + len(failed)
+
+            if not n_queued:
+                return n_finished
+
+    def wait(self, timeout: Optional[float]) -> None:
+        if self._perform():
+            return
+
+        # libcurl might need to be called earlier, e.g. to handle its own timeouts
+        curl_timeout = self.multi.timeout()
+
+        if curl_timeout >= 0:
+            timeout = curl_timeout / 1000 if timeout is None else min(timeout, curl_timeout / 1000)
+        elif timeout is None:
+            timeout = 1.0
+
+        if self.multi.select(timeout) == -1:
+            # There are no sockets to wait for yet (e.g. the host name is being resolved)
+            time.sleep(min(timeout, 0.01))
+
+        self._perform()
+
+    def close(self) -> None:
+        for curl in list(self.transfers):
+            self.multi.remove_handle(curl)
+            self.session._release_handle(curl)
+
+            with self.session._lock:
+                self.session._active -= 1
+
+        self.transfers.clear()
+        self.multi.close()
@@ -22,8 +22,9 @@ from ..exceptions import (
 )
 
 from .._session import Session, Response
+from ..pool import PoolConfig, PoolStats
 from ..utils import CaseInsensitiveDict
-from .._typing_compat import Dict
+from .._typing_compat import Dict, List
 from ..types import JSON, ConsumeCallback, HTTPMethod, Headers, Payload
 
 from typing import Any, Optional, Union
@@ -31,6 +32,7 @@ from typing import Any, Optional, Union
 import threading
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, BaseAdapter, HTTPAdapter
 
 __all__ = ["RequestsSession"]
 
@@ -54,6 +56,7 @@ class RequestsResponse(Response):
 
         self._response = response
         self.status = self._response.status_code
+        self.headers = CaseInsensitiveDict(self._response.headers)
 
     def json(self) -> JSON:
         try:
@@ -72,13 +75,34 @@ class RequestsResponse(Response):
         self._response.close()
 
 
+class PoolHTTPAdapter(HTTPAdapter):
+    """:any:`requests.adapters.HTTPAdapter` with custom socket options."""
+
+    def __init__(self, socket_options: Optional[List[Any]] = None, **kwargs) -> None:
+        # Must be set before HTTPAdapter.__init__() calls init_poolmanager()
+        self._socket_options = socket_options
+
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        if self._socket_options is not None:
+            kwargs["socket_options"] = self._socket_options
+
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RequestsSession(Session):
     """
         .. _requests: https://pypi.org/project/requests
 
         :any:`Session` implementation using the `requests`_ library.
 
-        All arguments passed in the constructor are directly forwared to :any:`requests.Session`.
+        All arguments passed in the constructor (except :code:`pool_config`)
+        are directly forwared to :any:`requests.Session`.
+
+        If :code:`pool_config` (:any:`PoolConfig`) is specified, all thread-local
+        sessions share a single connection pool of :code:`max_connections_per_host`
+        connections per host.
 
         :ivar requests_session: underlying instance of :any:`requests.Session`
 
@@ -108,28 +132,83 @@ class RequestsSession(Session):
                 )
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, pool_config: Optional[PoolConfig] = None, **kwargs):
         self._args, self._kwargs = args, kwargs
         self._local = threading.local()
-        self._sessions = []
+        self._sessions: List[requests.Session] = []
+        self._adapter: Optional[PoolHTTPAdapter] = None
+
+        if pool_config is not None:
+            self._adapter = PoolHTTPAdapter(
+                # urllib3 enables TCP_NODELAY by default
+                socket_options=None if pool_config.tcp_nodelay else [],
+                pool_maxsize=pool_config.max_connections_per_host or DEFAULT_POOLSIZE
+            )
 
     @property
     def requests_session(self) -> requests.Session:
         if not hasattr(self._local, "session"):
             self._local.session = requests.Session(*self._args, **self._kwargs)
+
+            if self._adapter is not None:
+                self._local.session.mount("https://", self._adapter)
+                self._local.session.mount("http://", self._adapter)
+
             self._sessions.append(self._local.session)
 
         return self._local.session
 
+    def _close_session(self, session: requests.Session) -> None:
+        # The shared adapter must stay open for other threads
+        if self._adapter is not None:
+            for prefix, adapter in list(session.adapters.items()):
+                if adapter is self._adapter:
+                    del session.adapters[prefix]
+
+        session.close()
+
     def _close_local(self) -> None:
         if not hasattr(self._local, "session"):
             return
 
         session = self._local.session
 
-        session.close()
+        self._close_session(session)
         self._sessions.remove(session)
 
+    def get_pool_stats(self) -> PoolStats:
+        adapters: List[BaseAdapter]
+
+        if self._adapter is not None:
+            adapters = [self._adapter]
+        else:
+            adapters = [adapter for session in list(self._sessions) for adapter in session.adapters.values()]
+
+        idle = active = reused = new = 0
+
+        for adapter in adapters:
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+
+            pools = adapter.poolmanager.pools
+
+            for key in pools.keys():
+                pool = pools.get(key)
+
+                if pool is None or pool.pool is None:
+                    continue
+
+                # The queue initially contains maxsize placeholders (None),
+                # connections that are in use are taken out of the queue
+                with pool.pool.mutex:
+                    idle += sum(1 for conn in pool.pool.queue if conn is not None)
+                    active += pool.pool.maxsize - len(pool.pool.queue)
+
+                new += pool.num_connections
+                reused += max(0, pool.num_requests - pool.num_connections)
+
+        return PoolStats(idle=idle, active=active, reused=reused, new=new)
+
     def send_request(
         self,
         method: HTTPMethod,
@@ -168,4 +247,7 @@ class RequestsSession(Session):
     def close(self) -> None:
         while self._sessions:
             session = self._sessions.pop()
-            session.close()
+            self._close_session(session)
+
+        if self._adapter is not None:
+            self._adapter.close()
@@ -17,16 +17,26 @@
 # along with this library; if not, see <http://www.gnu.org/licenses/>.
 
 import logging
+from typing import TYPE_CHECKING, Optional
+from ._typing_compat import Tuple
 from .types import TimeoutParameter
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .retry import RetryPolicy
+
 __all__ = [
     "BASE_API_URL",
     "BASE_OAUTH_API_URL",
+    "DEFAULT_DOWNLOAD_SEGMENT_SIZE",
+    "DEFAULT_LINK_CACHE_TTL",
+    "DEFAULT_META_CACHE_TTL",
     "DEFAULT_N_RETRIES",
     "DEFAULT_RETRY_INTERVAL",
+    "DEFAULT_RETRY_POLICY",
     "DEFAULT_TIMEOUT",
     "DEFAULT_UPLOAD_RETRY_INTERVAL",
     "DEFAULT_UPLOAD_TIMEOUT",
+    "FILE_MEDIA_TYPES",
     "logger"
 ]
 
@@ -40,6 +50,12 @@ DEFAULT_N_RETRIES: int = 3
 #: `float`, default retry interval
 DEFAULT_RETRY_INTERVAL: float = 0.0
 
+#: :any:`RetryPolicy` or `None`, default policy for computing delays between retries.
+#: `None` means a constant delay of :code:`retry_interval` seconds
+#: (see :any:`ConstantRetryPolicy`), :any:`ExponentialRetryPolicy` can be used
+#: to spread out retries of many clients
+DEFAULT_RETRY_POLICY: Optional["RetryPolicy"] = None
+
 #: Analogous to :any:`settings.DEFAULT_TIMEOUT` but for
 #: :any:`Client.upload()`/:any:`AsyncClient.upload()` function
 DEFAULT_UPLOAD_TIMEOUT: TimeoutParameter = DEFAULT_TIMEOUT
@@ -48,6 +64,26 @@ DEFAULT_UPLOAD_TIMEOUT: TimeoutParameter = DEFAULT_TIMEOUT
 #: :any:`Client.upload()`/:any:`AsyncClient.upload()` function
 DEFAULT_UPLOAD_RETRY_INTERVAL: float = 0.0
 
+#: `int`, default size (in bytes) of a single segment for parallel segmented
+#: downloads (see :code:`parallel_segments` of :any:`Client.download()`/:any:`AsyncClient.download()`)
+DEFAULT_DOWNLOAD_SEGMENT_SIZE: int = 16 * 1024**2
+
+#: `float`, default time (in seconds) an upload/download link is kept in
+#: :any:`LinkCache`. Links returned by the API stay valid for at least several minutes
+DEFAULT_LINK_CACHE_TTL: float = 300.0
+
+#: `float`, default time (in seconds) a metadata entry is kept in :any:`MetaCache`
+DEFAULT_META_CACHE_TTL: float = 60.0
+
+#: `tuple` of `str`, all media types known to the API. Every file belongs to
+#: exactly one of them, so they are used as disjoint partitions by
+#: :any:`Client.get_files()`/:any:`AsyncClient.get_files()` with :code:`parallel_partitions=True`
+FILE_MEDIA_TYPES: Tuple[str, ...] = (
+    "audio", "backup", "book", "compressed", "data", "development",
+    "diskimage", "document", "encoded", "executable", "flash", "font",
+    "image", "settings", "spreadsheet", "text", "unknown", "video", "web"
+)
+
 #: Base URL for Yandex.Disk's REST API.
 #: Can be overriden for testing and other purposes
 BASE_API_URL: str = "https://cloud-api.yandex.net"
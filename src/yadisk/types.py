@@ -27,6 +27,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from ._async_session import AsyncSession, AsyncResponse
     from ._client import Client
     from ._async_client import AsyncClient
+    from .polling import ExponentialPollInterval
 
 __all__ = [
     "JSON",
@@ -53,11 +54,13 @@ __all__ = [
     "OperationStatus",
     "PasswordVerbose",
     "Payload",
+    "PollInterval",
     "PublicSettings",
     "PublicSettingsAccess",
     "SessionFactory",
     "SessionName",
     "TimeoutParameter",
+    "TransferStatus",
 ]
 
 #: JSON data (parsed)
@@ -93,6 +96,10 @@ AsyncPayload: TypeAlias = Union[bytes, Iterator[bytes], AsyncIterator[bytes]]
 #: streamed HTTP response body
 AsyncConsumeCallback: TypeAlias = Union[Callable[[bytes], None], Callable[[bytes], Awaitable[None]]]
 
+#: Interval (in seconds) between subsequent operation status queries,
+#: either a constant or an :any:`ExponentialPollInterval`
+PollInterval: TypeAlias = Union[float, "ExponentialPollInterval"]
+
 #: :any:`Response` or :any:`AsyncResponse`
 AnyResponse: TypeAlias = Union["Response", "AsyncResponse"]
 
@@ -260,11 +267,14 @@ HTTPMethod: TypeAlias = Union[
 SessionName: TypeAlias = Union[Literal["httpx"], Literal["pycurl"], Literal["requests"]]
 
 #: Valid asynchronous session name (see :doc:`/api_reference/sessions`)
-AsyncSessionName: TypeAlias = Union[Literal["aiohttp"], Literal["httpx"]]
+AsyncSessionName: TypeAlias = Union[Literal["aiohttp"], Literal["httpx"], Literal["pycurl"]]
 
 #: Yandex.Disk's asynchronous operation status
 OperationStatus: TypeAlias = Union[Literal["in-progress"], Literal["success"], Literal["failed"]]
 
+#: Outcome of a single file transfer in :any:`Client.upload_tree()`/:any:`Client.download_tree()`
+TransferStatus: TypeAlias = Union[Literal["uploaded"], Literal["downloaded"], Literal["skipped"], Literal["failed"]]
+
 
 class PublicSettings(TypedDict, total=False):
     """
@@ -23,6 +23,8 @@ import time
 
 from .objects import ErrorObject
 from .exceptions import *
+from .retry import ConstantRetryPolicy, RetryPolicy
+from .circuit import CircuitBreaker, RetryBudget
 from . import settings
 
 from typing import Any, Optional, Union, TypeVar
@@ -161,13 +163,112 @@ def get_exception(response: AnyResponse, error: Optional[ErrorObject]) -> YaDisk
 T = TypeVar("T")
 
 
+class _RetryState:
+    # Bookkeeping shared by auto_retry(), async_auto_retry() and batches (see yadisk.batch)
+
+    def __init__(
+        self,
+        n_retries: Optional[int] = None,
+        retry_interval: Optional[Union[int, float]] = None,
+        retry_on: Tuple[Type[Exception], ...] = tuple(),
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None
+    ) -> None:
+        if n_retries is None:
+            n_retries = settings.DEFAULT_N_RETRIES
+
+        if retry_interval is None:
+            retry_interval = settings.DEFAULT_RETRY_INTERVAL
+
+        if retry_policy is None:
+            retry_policy = settings.DEFAULT_RETRY_POLICY
+
+        if retry_policy is None:
+            retry_policy = ConstantRetryPolicy(retry_interval)
+
+        self.n_retries = n_retries
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.exceptions: Tuple[Type[Exception], ...] = (RequestError, RetriableYaDiskError, *retry_on)
+        self.attempt = 0
+        self.probing = False
+
+        if retry_budget is not None:
+            retry_budget.record_request()
+
+    def before_attempt(self) -> None:
+        if self.circuit_breaker is not None:
+            self.probing = self.circuit_breaker.before_call()
+
+    def record_success(self) -> None:
+        self.probing = False
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+
+    def record_interrupt(self) -> None:
+        # The attempt was interrupted by a BaseException (cancellation, KeyboardInterrupt,
+        # GeneratorExit), its outcome is unknown, so just give back the half-open probe
+        if self.probing and self.circuit_breaker is not None:
+            self.circuit_breaker.release_probe()
+
+        self.probing = False
+
+    def get_retry_delay(self, exception: Exception) -> Optional[float]:
+        # Returns the delay before the next attempt or None if the exception should be raised
+        if not isinstance(exception, self.exceptions):
+            # The server responded, even if with an error
+            self.record_success()
+            return None
+
+        self.probing = False
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+
+        i, n_retries, e = self.attempt, self.n_retries, exception
+
+        if i >= n_retries or (isinstance(e, YaDiskError) and e.disable_retry):
+            settings.logger.info(
+                f"not triggering an automatic retry: ({i + 1} out of {n_retries}), got {e.__class__.__name__}: {e}"
+            )
+
+            if i:
+                _add_exception_note(e, f"Got the error after {i} retry attempts")
+
+            return None
+
+        if self.retry_budget is not None and not self.retry_budget.try_retry():
+            settings.logger.info(
+                f"not triggering an automatic retry: retry budget exhausted, got {e.__class__.__name__}: {e}"
+            )
+
+            if i:
+                _add_exception_note(e, f"Got the error after {i} retry attempts")
+
+            return None
+
+        settings.logger.info(
+            f"automatic retry triggered: ({i + 1} out of {n_retries}), got {e.__class__.__name__}: {e}"
+        )
+
+        self.attempt += 1
+
+        return self.retry_policy.get_delay(i, e)
+
+
 def auto_retry(
     func: Callable[..., T],
     n_retries: Optional[int] = None,
     retry_interval: Optional[Union[int, float]] = None,
     args: Optional[Tuple] = None,
     kwargs: Optional[Dict[str, Any]] = None,
-    retry_on: Tuple[Type[Exception], ...] = tuple()
+    retry_on: Tuple[Type[Exception], ...] = tuple(),
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None
 ) -> T:
     """
         Attempt to perform a request with automatic retries.
@@ -180,47 +281,47 @@ def auto_retry(
         :param args: `tuple` or `None`, additional arguments for `func`
         :param kwargs: `dict` or `None`, additional keyword arguments for `func`
         :param retry_on: `tuple`, additional exception classes to retry on
+        :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries,
+                             takes precedence over `retry_interval`, defaults to
+                             :any:`settings.DEFAULT_RETRY_POLICY`
+        :param circuit_breaker: :any:`CircuitBreaker` or `None`, consulted before
+                                every attempt and updated after it
+        :param retry_budget: :any:`RetryBudget` or `None`, retries are only
+                             performed while the budget allows them
+
+        :raises CircuitBreakerOpenError: `circuit_breaker` is open
 
         :returns: return value of func()
     """
 
-    if n_retries is None:
-        n_retries = settings.DEFAULT_N_RETRIES
-
-    if retry_interval is None:
-        retry_interval = settings.DEFAULT_RETRY_INTERVAL
-
     if args is None:
         args = tuple()
 
     if kwargs is None:
         kwargs = {}
 
-    exceptions: Tuple[Type[Exception], ...] = (RequestError, RetriableYaDiskError, *retry_on)
+    state = _RetryState(n_retries, retry_interval, retry_on, retry_policy, circuit_breaker, retry_budget)
 
-    for i in range(n_retries + 1):
-        try:
-            return func(*args, **kwargs)
-        except exceptions as e:
-            if i == n_retries or (isinstance(e, YaDiskError) and e.disable_retry):
-                settings.logger.info(
-                    f"not triggering an automatic retry: ({i + 1} out of {n_retries}), got {e.__class__.__name__}: {e}"
-                )
+    while True:
+        state.before_attempt()
 
-                if i:
-                    _add_exception_note(e, f"Got the error after {i} retry attempts")
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            delay = state.get_retry_delay(e)
 
+            if delay is None:
                 raise
+        except BaseException:
+            state.record_interrupt()
+            raise
+        else:
+            state.record_success()
 
-            settings.logger.info(
-                f"automatic retry triggered: ({i + 1} out of {n_retries}), got {e.__class__.__name__}: {e}"
-            )
-
-        if retry_interval:
-            time.sleep(retry_interval)
+            return result
 
-    # This should never be reachable
-    raise AssertionError()
+        if delay:
+            time.sleep(delay)
 
 
 async def async_auto_retry(
@@ -229,7 +330,10 @@ async def async_auto_retry(
     retry_interval: Optional[Union[int, float]] = None,
     args: Optional[Tuple] = None,
     kwargs: Optional[Dict[str, Any]] = None,
-    retry_on: Tuple[Type[Exception], ...] = tuple()
+    retry_on: Tuple[Type[Exception], ...] = tuple(),
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None
 ) -> Any:
     """
         Attempt to perform a request with automatic retries.
@@ -242,16 +346,19 @@ async def async_auto_retry(
         :param args: `tuple` or `None`, additional arguments for `func`
         :param kwargs: `dict` or `None`, additional keyword arguments for `func`
         :param retry_on: `tuple`, additional exception classes to retry on
+        :param retry_policy: :any:`RetryPolicy` or `None`, computes delays between retries,
+                             takes precedence over `retry_interval`, defaults to
+                             :any:`settings.DEFAULT_RETRY_POLICY`
+        :param circuit_breaker: :any:`CircuitBreaker` or `None`, consulted before
+                                every attempt and updated after it
+        :param retry_budget: :any:`RetryBudget` or `None`, retries are only
+                             performed while the budget allows them
+
+        :raises CircuitBreakerOpenError: `circuit_breaker` is open
 
         :returns: return value of func()
     """
 
-    if n_retries is None:
-        n_retries = settings.DEFAULT_N_RETRIES
-
-    if retry_interval is None:
-        retry_interval = settings.DEFAULT_RETRY_INTERVAL
-
     if args is None:
         args = tuple()
 
@@ -263,34 +370,31 @@ async def async_auto_retry(
     # Suppress false type hint errors
     callback: Any = func
 
-    exceptions: Tuple[Type[Exception], ...] = (RequestError, RetriableYaDiskError, *retry_on)
+    state = _RetryState(n_retries, retry_interval, retry_on, retry_policy, circuit_breaker, retry_budget)
+
+    while True:
+        state.before_attempt()
 
-    for i in range(n_retries + 1):
         try:
             if is_coro:
-                return await callback(*args, **kwargs)
+                result = await callback(*args, **kwargs)
             else:
-                return callback(*args, **kwargs)
-        except exceptions as e:
-            if i == n_retries or (isinstance(e, YaDiskError) and e.disable_retry):
-                settings.logger.info(
-                    f"not triggering an automatic retry: ({i + 1} out of {n_retries}), got {e.__class__.__name__}: {e}"
-                )
-
-                if i:
-                    _add_exception_note(e, f"Got the error after {i} retry attempts")
+                result = callback(*args, **kwargs)
+        except Exception as e:
+            delay = state.get_retry_delay(e)
 
+            if delay is None:
                 raise
+        except BaseException:
+            state.record_interrupt()
+            raise
+        else:
+            state.record_success()
 
-            settings.logger.info(
-                f"automatic retry triggered: ({i + 1} out of {n_retries}), got {e.__class__.__name__}: {e}"
-            )
-
-        if retry_interval:
-            await asyncio.sleep(retry_interval)
+            return result
 
-    # This should never be reachable
-    raise AssertionError()
+        if delay:
+            await asyncio.sleep(delay)
 
 
 class CaseInsensitiveDict(dict):
@@ -822,7 +822,7 @@ class TestAsyncClient:
         output = BytesIO()
 
         with pytest.raises((yadisk.exceptions.GoneError, yadisk.exceptions.InternalServerError)):
-            await async_client.download_by_link(link, output)
+            await async_client.download_by_link(link, output, n_retries=0)
 
         output.seek(0)
         assert output.read() == b""
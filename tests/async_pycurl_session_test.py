@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from yadisk.exceptions import RequestError
+from yadisk.sessions.async_pycurl_session import AsyncPycURLSession, MAX_STREAM_BUFFER_SIZE
+from yadisk._typing_compat import AsyncGenerator, Generator, List
+
+LARGE_BODY = bytes(range(256)) * 16 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            # The client has given up on the response
+            pass
+
+    def do_GET(self) -> None:
+        if self.path == "/slow":
+            time.sleep(0.5)
+
+        self._send(200, LARGE_BODY if self.path == "/large" else b"{}")
+
+    def do_PUT(self) -> None:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            data = b""
+
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                data += self.rfile.read(size)
+                self.rfile.readline()
+
+                if not size:
+                    break
+        else:
+            data = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        self._send(201, json.dumps({"size": len(data), "text": data[:16].decode()}).encode())
+
+    def log_message(self, *args, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.anyio
+async def test_streamed_download(server_url: str) -> None:
+    chunks: List[bytes] = []
+    max_buffered = 0
+    n_resumed = 0
+
+    async with AsyncPycURLSession() as session:
+        async with await session.send_request("GET", f"{server_url}/large", stream=True) as response:
+            assert response.status == 200
+
+            transfer: Any = response._transfer  # type: ignore[attr-defined]
+            resume = transfer.resume
+
+            def count_resume() -> None:
+                nonlocal n_resumed
+
+                n_resumed += 1
+                resume()
+
+            transfer.resume = count_resume
+
+            async def consume(chunk: bytes) -> None:
+                nonlocal max_buffered
+
+                max_buffered = max(max_buffered, transfer.buffered)
+                chunks.append(chunk)
+
+                # Let the transfer get ahead of the consumer
+                await asyncio.sleep(0.001)
+
+            await response.download(consume)
+
+        # The response has already been received
+        async with await session.send_request("GET", f"{server_url}/large") as response:
+            assert response.status == 200
+            assert session.get_pool_stats().active == 0
+
+            consumed: List[bytes] = []
+            await response.download(consumed.append)
+
+        stats = session.get_pool_stats()
+
+    assert b"".join(chunks) == LARGE_BODY
+    assert b"".join(consumed) == LARGE_BODY
+
+    # The transfer is paused while too much data is waiting to be consumed
+    assert n_resumed > 0
+    assert max_buffered < 2 * MAX_STREAM_BUFFER_SIZE < len(LARGE_BODY)
+
+    assert stats.new == 1
+    assert stats.reused == 1
+    assert stats.active == 0
+
+
+@pytest.mark.anyio
+async def test_upload(server_url: str) -> None:
+    async def generate() -> AsyncGenerator[bytes, None]:
+        for i in range(100):
+            await asyncio.sleep(0)
+            yield str(i % 10).encode() * 1000
+
+    async with AsyncPycURLSession() as session:
+        payloads: List[Any] = [b"x" * 5000, iter([b"y" * 10, b"y" * 10]), generate()]
+        results = []
+
+        for data in payloads:
+            async with await session.send_request("PUT", f"{server_url}/upload", data=data) as response:
+                assert response.status == 201
+                results.append(await response.json())
+
+    assert results == [
+        {"size": 5000, "text": "x" * 16},
+        {"size": 20, "text": "y" * 16},
+        {"size": 100000, "text": "0" * 16}
+    ]
+
+
+@pytest.mark.anyio
+async def test_upload_error(server_url: str) -> None:
+    async def generate() -> AsyncGenerator[bytes, None]:
+        yield b"data"
+        raise ValueError("the source failed")
+
+    async with AsyncPycURLSession() as session:
+        with pytest.raises(ValueError):
+            await session.send_request("PUT", f"{server_url}/upload", data=generate())
+
+        assert session.get_pool_stats().active == 0
+
+        # The session is still usable
+        async with await session.send_request("GET", f"{server_url}/") as response:
+            assert await response.json() == {}
+
+
+@pytest.mark.anyio
+async def test_cancel_and_close(server_url: str) -> None:
+    session = AsyncPycURLSession()
+
+    task = asyncio.ensure_future(session.send_request("GET", f"{server_url}/slow"))
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert session.get_pool_stats().active == 0
+
+    task = asyncio.ensure_future(session.send_request("GET", f"{server_url}/slow"))
+    await asyncio.sleep(0.1)
+    await session.close()
+
+    with pytest.raises(RequestError):
+        await task
+
+    assert session.get_pool_stats().active == 0
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+import threading
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import yadisk
+from yadisk.batch import Batch, BatchResult
+from yadisk.exceptions import PathNotFoundError, UnavailableError
+from yadisk._typing_compat import Generator, List, Tuple
+
+from .fake_session import DOWNLOAD_BASE_URL, UPLOAD_BASE_URL, FakeDisk
+
+# Prefixes of the local server's paths and the URLs they stand for
+URL_PREFIXES = [
+    ("/api", "https://cloud-api.yandex.net"),
+    ("/downloader", DOWNLOAD_BASE_URL.rsplit("/", 1)[0]),
+    ("/uploader", UPLOAD_BASE_URL.rsplit("/", 1)[0])
+]
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/a.txt", b"a" * 5000)
+    disk.add_file("/b.txt", b"b" * 7000)
+
+    return disk
+
+
+class _FakeDiskHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    disk: FakeDisk
+    base_url: str
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        chunks = []
+
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+            if not size:
+                return b"".join(chunks)
+
+    def _handle(self) -> None:
+        data = self._read_body() if self.command == "PUT" else None
+
+        url = self.path
+
+        for prefix, real_url in URL_PREFIXES:
+            if self.path.startswith(prefix + "/"):
+                url = real_url + self.path[len(prefix):]
+
+        params = {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+
+        method: Any = self.command
+        status, headers, body = self.disk.handle(method, url, params, dict(self.headers), data)
+
+        for prefix, real_url in URL_PREFIXES:
+            body = body.replace(real_url.encode(), f"{self.base_url}{prefix}".encode())
+
+        self.send_response(status)
+
+        for name, value in headers.items():
+            if name.lower() != "content-length":
+                self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_PUT = _handle
+
+    def log_message(self, *args, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url(disk: FakeDisk, monkeypatch: pytest.MonkeyPatch) -> Generator[str, None, None]:
+    handler: Any = type("Handler", (_FakeDiskHandler,), {"disk": disk})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    handler.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    monkeypatch.setattr(yadisk.settings, "BASE_API_URL", f"{handler.base_url}/api")
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield handler.base_url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_results_in_order(fake_client: yadisk.Client) -> None:
+    completed: List[BatchResult] = []
+
+    with fake_client.batch(max_concurrency=2) as batch:
+        assert batch.get_meta("/a.txt", callback=completed.append) == 0
+        batch.get_meta("/missing.txt", callback=completed.append)
+        batch.get_download_link("/b.txt", callback=completed.append)
+        batch.get_upload_link("/c.txt", callback=completed.append)
+
+        assert len(batch) == 4
+
+    results = batch.results
+
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert results[0].result.path == "disk:/a.txt"
+    assert isinstance(results[1].error, PathNotFoundError)
+    assert results[2].result.startswith(DOWNLOAD_BASE_URL)
+    assert results[3].result.startswith(UPLOAD_BASE_URL)
+
+    assert sorted(completed, key=results.index) == results
+    assert len(batch) == 0
+
+
+def test_retries(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    disk.failing_requests = 2
+
+    batch = fake_client.batch()
+    batch.get_meta("/a.txt", n_retries=2, retry_interval=0.01)
+
+    assert batch.run()[0].result.path == "disk:/a.txt"
+    assert disk.count("/v1/disk/resources") == 3
+
+    disk.failing_requests = 2
+
+    batch.get_meta("/a.txt", n_retries=1, retry_interval=0.0)
+
+    assert isinstance(batch.run()[0].error, UnavailableError)
+
+
+def test_upload_and_download(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    buffers = [BytesIO() for _ in range(2)]
+
+    disk.interrupt_after = 2048
+
+    with fake_client.batch() as batch:
+        batch.upload(BytesIO(b"c" * 3000), "/c.txt")
+        batch.upload(lambda: iter([b"d" * 10, b"d" * 10]), "/d.txt")
+        batch.download("/a.txt", buffers[0], retry_interval=0.0)
+        batch.download("/b.txt", buffers[1], retry_interval=0.0)
+
+    assert all(r.ok for r in batch.results)
+    assert batch.results[0].result.path == "disk:/c.txt"
+
+    assert disk.files["disk:/c.txt"] == b"c" * 3000
+    assert disk.files["disk:/d.txt"] == b"d" * 20
+
+    # The interrupted download was restarted
+    assert [b.getvalue() for b in buffers] == [b"a" * 5000, b"b" * 7000]
+
+
+def test_callback_error_stops_batch(fake_client: yadisk.Client) -> None:
+    def callback(result: BatchResult) -> None:
+        raise RuntimeError("stop")
+
+    batch = Batch(fake_client, max_concurrency=1)
+    batch.get_meta("/a.txt", callback=callback)
+    batch.get_meta("/b.txt")
+
+    with pytest.raises(RuntimeError):
+        batch.run()
+
+    with pytest.raises(ValueError):
+        fake_client.batch(max_concurrency=0)
+
+
+@pytest.mark.parametrize("session_name", ["requests", "httpx", "pycurl"])
+def test_batch_over_http(
+    server_url: str,
+    disk: FakeDisk,
+    session_name: yadisk.types.SessionName,
+    tmp_path: Any
+) -> None:
+    paths: List[Tuple[str, str]] = []
+
+    with yadisk.Client(token="fake", session=session_name) as client:
+        with client.batch(max_concurrency=8) as batch:
+            for i in range(10):
+                local_path = str(tmp_path / f"{i}.txt")
+
+                with open(local_path, "wb") as f:
+                    f.write(str(i).encode() * 1000)
+
+                batch.upload(local_path, f"/{i}.txt")
+                paths.append((local_path, f"/{i}.txt"))
+
+            batch.get_meta("/missing.txt")
+
+        assert [r.ok for r in batch.results] == [True] * 10 + [False]
+
+        for i, (_, remote_path) in enumerate(paths):
+            batch.download(remote_path, str(tmp_path / f"{i}.downloaded"))
+            batch.get_meta(remote_path)
+
+        results = batch.run()
+
+        if session_name == "pycurl":
+            from yadisk.sessions.pycurl_session import _CurlMultiTransport
+
+            transport = yadisk.batch._open_transport(client.session, 1)
+            transport.close()
+
+            assert isinstance(transport, _CurlMultiTransport)
+            assert client.session.get_pool_stats().active == 0
+
+    assert all(r.ok for r in results)
+
+    for i, (local_path, remote_path) in enumerate(paths):
+        with open(local_path, "rb") as f:
+            content = f.read()
+
+        assert disk.files[f"disk:{remote_path}"] == content
+        assert (tmp_path / f"{i}.downloaded").read_bytes() == content
+        assert results[2 * i + 1].result.size == len(content)
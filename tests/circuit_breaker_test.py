@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+import yadisk
+from yadisk.circuit import CircuitBreaker, CircuitBreakers, RetryBudget
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(yadisk.circuit.time, "monotonic", clock)
+
+    return clock
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/file.txt", b"content")
+
+    return disk
+
+
+def test_circuit_breaker_states(clock: _Clock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=10.0)
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    with pytest.raises(yadisk.exceptions.CircuitBreakerOpenError):
+        breaker.before_call()
+
+    clock.now += 10.0
+    assert breaker.state == "half-open"
+
+    # Only one probe at a time
+    breaker.before_call()
+
+    with pytest.raises(yadisk.exceptions.CircuitBreakerOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 10.0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+@pytest.mark.anyio
+async def test_cancelled_probe_is_released() -> None:
+    # The clock fixture would also freeze the event loop, use a zero timeout instead
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.0)
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == "half-open"
+
+    async def hang() -> None:
+        await asyncio.sleep(60.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(yadisk.utils.async_auto_retry(hang, 0, circuit_breaker=breaker), 0.01)
+
+    # The probe slot is free again, the next call is let through
+    assert breaker.state == "half-open"
+
+    async def succeed() -> str:
+        return "ok"
+
+    assert await yadisk.utils.async_auto_retry(succeed, 0, circuit_breaker=breaker) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_interrupted_probe_is_released(clock: _Clock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10.0)
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    clock.now += 10.0
+
+    def interrupt() -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        yadisk.utils.auto_retry(interrupt, 0, circuit_breaker=breaker)
+
+    assert breaker.before_call()
+
+
+def test_retry_budget(clock: _Clock) -> None:
+    budget = RetryBudget(ratio=0.5, min_retries=1, window=10.0)
+
+    for _ in range(4):
+        budget.record_request()
+
+    assert [budget.try_retry() for _ in range(4)] == [True, True, True, False]
+    assert budget.retries == 3
+
+    clock.now += 10.0
+
+    assert budget.requests == 0
+    assert budget.retries == 0
+    assert budget.try_retry()
+
+
+def test_auto_retry_with_breaker() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=60.0)
+    attempts = 0
+
+    def func() -> None:
+        nonlocal attempts
+        attempts += 1
+
+        raise yadisk.exceptions.UnavailableError()
+
+    with pytest.raises(yadisk.exceptions.CircuitBreakerOpenError):
+        yadisk.utils.auto_retry(func, 5, circuit_breaker=breaker)
+
+    assert attempts == 2
+
+    with pytest.raises(yadisk.exceptions.CircuitBreakerOpenError):
+        yadisk.utils.auto_retry(func, 5, circuit_breaker=breaker)
+
+    assert attempts == 2
+
+
+def test_auto_retry_with_budget() -> None:
+    budget = RetryBudget(ratio=0.0, min_retries=1)
+    attempts = 0
+
+    def func() -> None:
+        nonlocal attempts
+        attempts += 1
+
+        raise yadisk.exceptions.UnavailableError()
+
+    with pytest.raises(yadisk.exceptions.UnavailableError):
+        yadisk.utils.auto_retry(func, 5, retry_budget=budget)
+
+    assert attempts == 2
+
+
+def test_client_circuit_breakers(disk: FakeDisk) -> None:
+    breakers = CircuitBreakers(failure_threshold=3, recovery_timeout=60.0)
+    client = yadisk.Client(token="fake", session=FakeSession(disk), circuit_breakers=breakers)
+
+    disk.failing_requests = 100
+
+    with pytest.raises(yadisk.exceptions.CircuitBreakerOpenError):
+        client.get_meta("/file.txt", n_retries=5)
+
+    assert disk.count("/v1/disk/resources") == 3
+    assert breakers.get_states() == {"GetMetaRequest@cloud-api.yandex.net": "open"}
+
+    # Other endpoints are not affected
+    disk.failing_requests = 0
+    assert client.get_download_link("/file.txt")
+
+    # Non-retriable errors don't open the breaker
+    for _ in range(5):
+        with pytest.raises(yadisk.exceptions.PathNotFoundError):
+            client.get_download_link("/missing.txt")
+
+    assert breakers.get("GetDownloadLinkRequest@cloud-api.yandex.net").state == "closed"
+
+
+@pytest.mark.anyio
+async def test_async_client_circuit_breakers(disk: FakeDisk) -> None:
+    breakers = CircuitBreakers(failure_threshold=10, retry_budget=RetryBudget(ratio=0.0, min_retries=2))
+    client = yadisk.AsyncClient(token="fake", session=AsyncFakeSession(disk), circuit_breakers=breakers)
+
+    disk.failing_requests = 100
+
+    with pytest.raises(yadisk.exceptions.UnavailableError):
+        await client.get_meta("/file.txt", n_retries=5)
+
+    # The budget allowed only 2 retries
+    assert disk.count("/v1/disk/resources") == 3
+    assert breakers.get_states() == {"GetMetaRequest@cloud-api.yandex.net": "closed"}
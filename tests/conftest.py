@@ -4,11 +4,14 @@ import inspect
 import posixpath
 import os
 
+from typing import Any
+
 from .test_session import TestSession, AsyncTestSession
 from .disk_gateway import BackgroundGatewayThread
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
 
 import yadisk
-from yadisk._typing_compat import Generator, AsyncGenerator
+from yadisk._typing_compat import Dict, Generator, AsyncGenerator
 
 import pytest
 
@@ -188,7 +191,7 @@ def client(
         yield client
 
 
-@pytest.fixture(scope="class", params=["aiohttp", "httpx"])
+@pytest.fixture(scope="class", params=["aiohttp", "httpx", "pycurl"])
 async def async_client(
     request: pytest.FixtureRequest,
     gateway_host: str,
@@ -248,3 +251,26 @@ def async_client_test(record_or_replay, async_disk_cleanup) -> None:
 @pytest.fixture
 def poll_interval(replay_enabled: bool) -> float:
     return 0.0 if replay_enabled else 1.0
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    return FakeDisk()
+
+
+@pytest.fixture
+def fake_client_kwargs() -> Dict[str, Any]:
+    # Additional arguments for fake_client and fake_async_client, test modules can override this
+    return {}
+
+
+@pytest.fixture
+def fake_client(disk: FakeDisk, fake_client_kwargs: Dict[str, Any]) -> Generator[yadisk.Client, None, None]:
+    # A client backed by the in-memory FakeDisk, test modules override disk to populate it
+    with yadisk.Client(token="fake", session=FakeSession(disk), **fake_client_kwargs) as client:
+        yield client
+
+
+@pytest.fixture
+def fake_async_client(disk: FakeDisk, fake_client_kwargs: Dict[str, Any]) -> yadisk.AsyncClient:
+    return yadisk.AsyncClient(token="fake", session=AsyncFakeSession(disk), **fake_client_kwargs)
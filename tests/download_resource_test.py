@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+CONTENT = os.urandom(50 * 1024)
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/dir/file.bin", CONTENT)
+
+    return disk
+
+
+def test_download_resource_uses_embedded_link(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    [resource] = fake_client.listdir("/dir")
+    buffer = io.BytesIO()
+
+    fake_client.download_resource(resource, buffer)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 0
+
+
+def test_download_resource_expired_link(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    [resource] = fake_client.listdir("/dir")
+    buffer = io.BytesIO()
+    disk.link_generation += 1
+
+    fake_client.download_resource(resource, buffer, n_retries=0)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 1
+
+
+def test_download_resource_segmented(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    [resource] = fake_client.listdir("/dir")
+    buffer = io.BytesIO()
+
+    resource.download(buffer, parallel_segments=4, segment_size=16 * 1024)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 0
+    assert disk.count("download") == 4
+
+
+def test_download_resource_without_link(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    resource = yadisk.objects.SyncResourceObject({"type": "file", "path": "disk:/dir/file.bin"}, yadisk=fake_client)
+    buffer = io.BytesIO()
+
+    fake_client.download_resource(resource, buffer)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 1
+
+
+@pytest.mark.anyio
+async def test_async_download_resource_expired_link(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    resources = [r async for r in fake_async_client.listdir("/dir")]
+    buffer = io.BytesIO()
+
+    await fake_async_client.download_resource(resources[0], buffer)
+
+    assert disk.count("/v1/disk/resources/download") == 0
+
+    disk.link_generation += 1
+    buffer = io.BytesIO()
+
+    await resources[0].download(buffer, n_retries=0)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 1
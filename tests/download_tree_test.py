@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from typing import Iterator
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+FILES = {
+    "a.txt": b"a",
+    "sub/b.txt": b"bb",
+    "sub/deeper/c.txt": b"ccc",
+    "other/d.txt": b"dddd"
+}
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+
+    for relpath, content in FILES.items():
+        disk.add_file(f"/project/{relpath}", content)
+
+    disk.add_dir("/project/empty")
+
+    return disk
+
+
+@pytest.fixture
+def local_dir() -> Iterator[str]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "restored")
+
+
+def check_downloaded(local_dir: str, results: list) -> None:
+    assert sorted(r.remote_path for r in results) == sorted(f"/project/{p}" for p in FILES)
+    assert all(r.status == "downloaded" for r in results)
+
+    for relpath, content in FILES.items():
+        with open(os.path.join(local_dir, *relpath.split("/")), "rb") as f:
+            assert f.read() == content
+
+    assert os.path.isdir(os.path.join(local_dir, "empty"))
+
+
+def test_download_tree(fake_client: yadisk.Client, disk: FakeDisk, local_dir: str) -> None:
+    results = fake_client.download_tree("/project", local_dir, max_workers=4)
+
+    check_downloaded(local_dir, results)
+    assert disk.count("download") == len(FILES)
+
+
+def test_download_tree_skips_unchanged(fake_client: yadisk.Client, disk: FakeDisk, local_dir: str) -> None:
+    fake_client.download_tree("/project", local_dir)
+
+    disk.add_file("/project/sub/b.txt", b"changed")
+    results = {r.remote_path: r for r in fake_client.download_tree("/project", local_dir)}
+
+    assert results["/project/sub/b.txt"].status == "downloaded"
+    assert [r.status for p, r in results.items() if p != "/project/sub/b.txt"] == ["skipped"] * 3
+    assert disk.count("download") == len(FILES) + 1
+
+    with open(os.path.join(local_dir, "sub", "b.txt"), "rb") as f:
+        assert f.read() == b"changed"
+
+
+def test_download_tree_check_md5(fake_client: yadisk.Client, disk: FakeDisk, local_dir: str) -> None:
+    fake_client.download_tree("/project", local_dir)
+
+    # Same size, different content
+    with open(os.path.join(local_dir, "a.txt"), "wb") as f:
+        f.write(b"x")
+
+    results = {r.remote_path: r.status for r in fake_client.download_tree("/project", local_dir, check_md5=True)}
+
+    assert results["/project/a.txt"] == "downloaded"
+    assert results["/project/sub/b.txt"] == "skipped"
+
+
+def test_download_tree_not_found(fake_client: yadisk.Client, local_dir: str) -> None:
+    with pytest.raises(yadisk.exceptions.PathNotFoundError):
+        fake_client.download_tree("/missing", local_dir)
+
+
+@pytest.mark.anyio
+async def test_async_download_tree(fake_async_client: yadisk.AsyncClient, disk: FakeDisk, local_dir: str) -> None:
+    results = await fake_async_client.download_tree("/project", local_dir, max_workers=4)
+
+    check_downloaded(local_dir, results)
+
+    results = await fake_async_client.download_tree("/project", local_dir, check_md5=True)
+
+    assert all(r.status == "skipped" for r in results)
+
+
+def test_download_tree_with_fields(fake_client: yadisk.Client, local_dir: str) -> None:
+    results = fake_client.download_tree("/project", local_dir, fields=["name", "md5"])
+
+    check_downloaded(local_dir, results)
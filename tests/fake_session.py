@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import posixpath
+import re
+import threading
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse, quote, unquote
+
+import yadisk
+from yadisk._typing_compat import Dict, List, Set, Tuple
+from yadisk.types import HTTPMethod
+
+__all__ = ["AsyncFakeSession", "FakeDisk", "FakeSession"]
+
+MEDIA_TYPES = {".txt": "text", ".jpg": "image", ".mp4": "video", ".doc": "document"}
+
+DOWNLOAD_BASE_URL = "https://downloader.disk.yandex.ru/disk"
+UPLOAD_BASE_URL = "https://uploader.disk.yandex.net/upload-target"
+
+
+def _error(status: int, error: str) -> Tuple[int, Dict[str, str], bytes]:
+    body = json.dumps({"error": error, "message": error, "description": error}).encode("utf8")
+
+    return status, {"Content-Type": "application/json"}, body
+
+
+def _json(js: Any, status: int = 200) -> Tuple[int, Dict[str, str], bytes]:
+    return status, {"Content-Type": "application/json"}, json.dumps(js).encode("utf8")
+
+
+def _parent(path: str) -> str:
+    parent = posixpath.dirname(path)
+
+    return "disk:/" if parent == "disk:" else parent
+
+
+class FakeDisk:
+    """
+        A tiny in-memory model of the parts of the REST API that are needed to
+        test the client logic without recorded traffic.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+        self.dirs: Set[str] = {"disk:/"}
+        self.support_ranges = True
+
+        # Number of bytes after which the next download will be interrupted
+        self.interrupt_after: Optional[int] = None
+
+        # Download links with a different generation are considered expired
+        self.link_generation = 0
+        self.upload_links: Dict[str, str] = {}
+
+        # Statuses returned by subsequent queries, the last one is repeated
+        self.operations: Dict[str, List[str]] = {}
+
+        # Number of subsequent API requests that will be rejected with code 429
+        self.throttled_requests = 0
+
+        # Number of subsequent API requests that will fail with code 503
+        self.failing_requests = 0
+
+        # Removed resources: trash path -> (original path, files, dirs)
+        self.trash: Dict[str, Tuple[str, Dict[str, bytes], Set[str]]] = {}
+
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self.lock = threading.Lock()
+
+    def add_dir(self, path: str) -> None:
+        path = yadisk._common.ensure_path_has_schema(path)
+
+        while path not in self.dirs:
+            self.dirs.add(path)
+            path = _parent(path)
+
+    def add_file(self, path: str, content: bytes) -> None:
+        path = yadisk._common.ensure_path_has_schema(path)
+
+        self.add_dir(_parent(path))
+        self.files[path] = content
+
+    def resource(self, path: str) -> Dict[str, Any]:
+        name = posixpath.basename(path) or "disk"
+
+        if path in self.files:
+            return {
+                "type": "file",
+                "name": name,
+                "path": path,
+                "size": len(self.files[path]),
+                "md5": hashlib.md5(self.files[path]).hexdigest(),
+                "media_type": MEDIA_TYPES.get(posixpath.splitext(path)[1], "unknown"),
+                "file": self.download_link(path),
+                "modified": "2024-01-01T00:00:00+00:00"
+            }
+
+        return {"type": "dir", "name": name, "path": path}
+
+    def add_operation(self, *statuses: str) -> str:
+        operation_id = str(len(self.operations) + 1)
+        self.operations[operation_id] = list(statuses)
+
+        return f"https://cloud-api.yandex.net/v1/disk/operations/{operation_id}"
+
+    def download_link(self, path: str) -> str:
+        return f"{DOWNLOAD_BASE_URL}/{quote(path)}?gen={self.link_generation}"
+
+    def children(self, path: str) -> List[str]:
+        return sorted(p for p in self.files.keys() | self.dirs if p != path and _parent(p) == path)
+
+    def count(self, endpoint: str, method: Optional[str] = None) -> int:
+        with self.lock:
+            return sum(1 for m, e, _ in self.requests if e == endpoint and method in (None, m))
+
+    def handle(
+        self,
+        method: HTTPMethod,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        data: Any = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        parsed = urlparse(url)
+        params = params or {}
+        headers = yadisk.utils.CaseInsensitiveDict(headers)
+
+        if url.startswith(DOWNLOAD_BASE_URL):
+            endpoint = "download"
+        elif url.startswith(UPLOAD_BASE_URL):
+            endpoint = "upload"
+        else:
+            endpoint = parsed.path
+
+        with self.lock:
+            self.requests.append((method, endpoint, dict(headers)))
+
+        if endpoint == "download":
+            if parse_qs(parsed.query).get("gen") != [str(self.link_generation)]:
+                return _error(410, "GoneError")
+
+            return self._download(unquote(parsed.path[len("/disk/"):]), headers)
+
+        if endpoint == "upload":
+            upload_path = self.upload_links.pop(url, None)
+
+            if upload_path is None:
+                return _error(404, "NotFoundError")
+
+            self.add_file(upload_path, _read_payload(data))
+
+            return 201, {}, b""
+
+        if endpoint.startswith("/v1/"):
+            with self.lock:
+                throttled, self.throttled_requests = self.throttled_requests > 0, max(0, self.throttled_requests - 1)
+
+            if throttled:
+                error_status, error_headers, body = _error(429, "TooManyRequestsError")
+                error_headers["Retry-After"] = "0"
+
+                return error_status, error_headers, body
+
+            with self.lock:
+                failing, self.failing_requests = self.failing_requests > 0, max(0, self.failing_requests - 1)
+
+            if failing:
+                return _error(503, "UnavailableError")
+
+        if endpoint.startswith("/v1/disk/operations/") and method == "GET":
+            with self.lock:
+                statuses = self.operations.get(endpoint.rpartition("/")[2])
+
+                if statuses is None:
+                    return _error(404, "DiskOperationNotFoundError")
+
+                status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+
+            return _json({"status": status})
+
+        path = params.get("path", "")
+
+        if endpoint == "/v1/disk/resources" and method == "GET":
+            if path not in self.files and path not in self.dirs:
+                return _error(404, "DiskNotFoundError")
+
+            resource = self.resource(path)
+
+            if resource["type"] == "dir":
+                children = self.children(path)
+                offset, limit = int(params.get("offset", 0)), int(params.get("limit", 20))
+
+                resource["_embedded"] = {
+                    "items": [self.resource(child) for child in children[offset:offset + limit]],
+                    "offset": offset,
+                    "limit": limit,
+                    "total": len(children),
+                    "path": path
+                }
+
+            return _json(resource)
+
+        if endpoint == "/v1/disk/resources" and method == "PUT":
+            if path in self.files or path in self.dirs:
+                return _error(409, "DiskPathPointsToExistentDirectoryError")
+
+            if _parent(path) not in self.dirs:
+                return _error(409, "DiskPathDoesntExistsError")
+
+            with self.lock:
+                self.dirs.add(path)
+
+            return _json({"href": f"https://cloud-api.yandex.net/v1/disk/resources?path={quote(path)}"}, 201)
+
+        if endpoint == "/v1/disk/resources" and method == "DELETE":
+            if path not in self.files and path not in self.dirs:
+                return _error(404, "DiskNotFoundError")
+
+            with self.lock:
+                files: Dict[str, bytes] = {}
+                dirs: Set[str] = set()
+
+                for p in [p for p in self.files.keys() | self.dirs if p == path or p.startswith(path + "/")]:
+                    if p in self.files:
+                        files[p] = self.files.pop(p)
+                    else:
+                        dirs.add(p)
+                        self.dirs.discard(p)
+
+                if params.get("permanently") != "true":
+                    self.trash["trash:/" + posixpath.basename(path)] = (path, files, dirs)
+
+            return 204, {}, b""
+
+        if endpoint == "/v1/disk/trash/resources/restore" and method == "PUT":
+            with self.lock:
+                if path not in self.trash:
+                    return _error(404, "DiskNotFoundError")
+
+                src_path, files, dirs = self.trash.pop(path)
+                dst_path = yadisk._common.ensure_path_has_schema(params.get("name", src_path))
+
+                self.files.update({dst_path + p[len(src_path):]: content for p, content in files.items()})
+                self.dirs.update(dst_path + p[len(src_path):] for p in dirs)
+
+            return _json({"href": f"https://cloud-api.yandex.net/v1/disk/resources?path={quote(dst_path)}"}, 201)
+
+        if endpoint == "/v1/disk/resources/files" and method == "GET":
+            offset, limit = int(params.get("offset", 0)), int(params.get("limit", 20))
+            files = [self.resource(p) for p in sorted(self.files)]
+
+            if "media_type" in params:
+                media_types = params["media_type"].split(",")
+                files = [f for f in files if f["media_type"] in media_types]
+
+            return _json({"items": files[offset:offset + limit], "offset": offset, "limit": limit})
+
+        if endpoint == "/v1/disk/resources/download" and method == "GET":
+            if path not in self.files:
+                return _error(404, "DiskNotFoundError")
+
+            return _json({"href": self.download_link(path), "method": "GET", "templated": False})
+
+        if endpoint == "/v1/disk/resources/upload" and method == "GET":
+            if _parent(path) not in self.dirs:
+                return _error(409, "DiskPathDoesntExistsError")
+
+            if path in self.files and params.get("overwrite") != "true":
+                return _error(409, "DiskResourceAlreadyExistsError")
+
+            with self.lock:
+                href = f"{UPLOAD_BASE_URL}/{len(self.requests)}/{quote(path)}"
+                self.upload_links[href] = path
+
+            return _json({"href": href, "method": "PUT", "templated": False, "operation_id": "1"})
+
+        return _error(400, "BadRequestError")
+
+    def _download(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        if path not in self.files:
+            return _error(404, "DiskNotFoundError")
+
+        content = self.files[path]
+
+        range_header = headers.get("Range")
+
+        if range_header is None or not self.support_ranges:
+            return 200, {"Content-Length": str(len(content))}, content
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header)
+        assert match is not None, f"Unexpected Range header: {range_header}"
+
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else len(content) - 1
+        end = min(end, len(content) - 1)
+
+        return 206, {"Content-Range": f"bytes {start}-{end}/{len(content)}"}, content[start:end + 1]
+
+    def take_interruption(self) -> Optional[int]:
+        with self.lock:
+            interrupt_after, self.interrupt_after = self.interrupt_after, None
+
+        return interrupt_after
+
+
+def _read_payload(data: Any) -> bytes:
+    if data is None:
+        return b""
+
+    if isinstance(data, bytes):
+        return data
+
+    if hasattr(data, "read"):
+        return data.read()
+
+    return b"".join(data)
+
+
+class FakeResponse(yadisk.Response):
+    def __init__(self, disk: FakeDisk, status: int, headers: Dict[str, str], body: bytes) -> None:
+        super().__init__()
+
+        self._disk = disk
+        self._body = body
+        self.status = status
+        self.headers = yadisk.utils.CaseInsensitiveDict(headers)
+
+    def json(self) -> Any:
+        return json.loads(self._body)
+
+    def download(self, consume_callback) -> None:
+        interrupt_after = self._disk.take_interruption() if self.status in (200, 206) else None
+
+        for i in range(0, len(self._body), 1024):
+            if interrupt_after is not None and i >= interrupt_after:
+                raise yadisk.exceptions.YaDiskConnectionError("connection reset")
+
+            consume_callback(self._body[i:i + 1024])
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncFakeResponse(yadisk.AsyncResponse):
+    def __init__(self, disk: FakeDisk, status: int, headers: Dict[str, str], body: bytes) -> None:
+        super().__init__()
+
+        self._response = FakeResponse(disk, status, headers, body)
+        self.status = status
+        self.headers = self._response.headers
+
+    async def json(self) -> Any:
+        return self._response.json()
+
+    async def download(self, consume_callback) -> None:
+        chunks: List[bytes] = []
+
+        try:
+            self._response.download(chunks.append)
+        finally:
+            for chunk in chunks:
+                if yadisk._common.is_async_func(consume_callback):
+                    await consume_callback(chunk)
+                else:
+                    consume_callback(chunk)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeSession(yadisk.Session):
+    __test__ = False
+
+    def __init__(self, disk: FakeDisk) -> None:
+        self.disk = disk
+
+    def send_request(self, method: HTTPMethod, url: str, **kwargs) -> yadisk.Response:
+        status, headers, body = self.disk.handle(
+            method, url, kwargs.get("params"), kwargs.get("headers") or {}, kwargs.get("data")
+        )
+
+        return FakeResponse(self.disk, status, headers, body)
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncFakeSession(yadisk.AsyncSession):
+    __test__ = False
+
+    def __init__(self, disk: FakeDisk) -> None:
+        self.disk = disk
+
+    async def send_request(self, method: HTTPMethod, url: str, **kwargs) -> yadisk.AsyncResponse:
+        data: Any = kwargs.get("data")
+
+        if hasattr(data, "__aiter__"):
+            data = [chunk async for chunk in data]
+
+        status, headers, body = self.disk.handle(
+            method, url, kwargs.get("params"), kwargs.get("headers") or {}, data
+        )
+
+        return AsyncFakeResponse(self.disk, status, headers, body)
+
+    async def close(self) -> None:
+        pass
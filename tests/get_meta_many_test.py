@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import yadisk
+from yadisk.exceptions import PathNotFoundError
+
+from .fake_session import FakeDisk
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+
+    for i in range(10):
+        disk.add_file(f"/dir/file{i}.txt", b"x" * i)
+
+    disk.add_file("/other.txt", b"")
+
+    return disk
+
+
+def test_get_meta_many(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    results = fake_client.get_meta_many(["/dir/file1.txt", "/missing", "disk:/dir/file1.txt", "/other.txt"])
+
+    paths = [getattr(r, "path", None) for r in results]
+
+    assert paths == ["disk:/dir/file1.txt", None, "disk:/dir/file1.txt", "disk:/other.txt"]
+    assert isinstance(results[1], PathNotFoundError)
+    assert disk.count("/v1/disk/resources", "GET") == 3
+
+
+def test_get_meta_many_siblings(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    paths = [f"/dir/file{i}.txt" for i in range(0, 10, 2)] + ["/dir/missing.txt", "/other.txt"]
+    results = fake_client.get_meta_many(paths, fields=["type", "size"], sibling_threshold=3)
+
+    assert [getattr(r, "size", None) for r in results] == [0, 2, 4, 6, 8, None, 0]
+    assert isinstance(results[5], PathNotFoundError)
+    # One listing of /dir and one request for /other.txt
+    assert disk.count("/v1/disk/resources", "GET") == 2
+
+
+def test_get_meta_many_missing_parent(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    results = fake_client.get_meta_many([f"/nowhere/{i}" for i in range(5)], fields=["type"], sibling_threshold=2)
+
+    assert all(isinstance(r, PathNotFoundError) for r in results)
+    assert disk.count("/v1/disk/resources", "GET") == 1
+
+
+def test_exists_many(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    paths = ["/dir/file3.txt", "/dir/nope", "/dir/file4.txt", "/dir", "/nope"]
+
+    assert fake_client.exists_many(paths, sibling_threshold=2) == [True, False, True, True, False]
+
+
+@pytest.mark.anyio
+async def test_async_get_meta_many(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    paths = [f"/dir/file{i}.txt" for i in range(10)] + ["/dir/missing.txt", "/dir/file0.txt"]
+    results = await fake_async_client.get_meta_many(paths, fields=["size"], sibling_threshold=None, max_concurrency=3)
+
+    assert [getattr(r, "size", None) for r in results] == [*range(10), None, 0]
+    assert disk.count("/v1/disk/resources", "GET") == 11
+
+
+@pytest.mark.anyio
+async def test_async_exists_many(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    paths = ["/dir/file3.txt", "/dir/nope", "/dir/file4.txt", "/other.txt"]
+
+    assert await fake_async_client.exists_many(paths, sibling_threshold=3) == [True, False, True, True]
+    assert disk.count("/v1/disk/resources", "GET") == 2
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+import pytest
+
+import yadisk
+from yadisk.hedging import HedgingPolicy
+from yadisk.ratelimit import RateLimiter
+from yadisk.types import HTTPMethod
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(yadisk.hedging.time, "monotonic", clock)
+
+    return clock
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/file.txt", b"content")
+
+    return disk
+
+
+class SlowFakeSession(FakeSession):
+    """The first request hangs until :code:`release` is set."""
+
+    def __init__(self, disk: FakeDisk) -> None:
+        super().__init__(disk)
+
+        self.release = threading.Event()
+        self.n_requests = 0
+        self.lock = threading.Lock()
+
+    def send_request(self, method: HTTPMethod, url: str, **kwargs) -> yadisk.Response:
+        with self.lock:
+            self.n_requests += 1
+            first = self.n_requests == 1
+
+        if first:
+            self.release.wait(5.0)
+
+        return super().send_request(method, url, **kwargs)
+
+
+class AsyncSlowFakeSession(AsyncFakeSession):
+    def __init__(self, disk: FakeDisk) -> None:
+        super().__init__(disk)
+
+        self.n_requests = 0
+
+    async def send_request(self, method: HTTPMethod, url: str, **kwargs) -> yadisk.AsyncResponse:
+        self.n_requests += 1
+
+        if self.n_requests == 1:
+            await asyncio.sleep(5.0)
+
+        return await super().send_request(method, url, **kwargs)
+
+
+def test_get_delay() -> None:
+    policy = HedgingPolicy(percentile=90.0, initial_delay=0.25, min_samples=10)
+
+    assert policy.get_delay("GetMetaRequest") == 0.25
+
+    for i in range(100, 0, -1):
+        policy.record_latency("GetMetaRequest", i / 100)
+
+    assert policy.get_delay("GetMetaRequest") == 0.9
+    assert policy.get_delay("FilesRequest") == 0.25
+
+    assert HedgingPolicy(delay=0.1).get_delay("GetMetaRequest") == 0.1
+
+
+def test_hedge_rate_cap(clock: _Clock) -> None:
+    policy = HedgingPolicy(max_hedge_ratio=0.5, min_hedges=1, window=10.0)
+
+    for _ in range(4):
+        policy._record_request()
+
+    assert [policy._try_hedge() for _ in range(4)] == [True, True, True, False]
+    assert policy.n_hedged == 3
+
+    clock.now += 10.0
+
+    assert policy._try_hedge()
+
+
+def test_client_hedging(disk: FakeDisk) -> None:
+    session = SlowFakeSession(disk)
+    hedging = HedgingPolicy(delay=0.01)
+    client = yadisk.Client(token="fake", session=session, hedging=hedging)
+
+    try:
+        assert client.get_meta("/file.txt").path == "disk:/file.txt"
+    finally:
+        session.release.set()
+        hedging.close()
+
+    assert hedging.n_hedged == 1
+    assert hedging.n_hedge_wins == 1
+    assert session.n_requests == 2
+
+
+def test_client_close_shuts_down_pool(disk: FakeDisk) -> None:
+    session = SlowFakeSession(disk)
+    hedging = HedgingPolicy(delay=0.01)
+
+    try:
+        with yadisk.Client(token="fake", session=session, hedging=hedging) as client:
+            client.get_meta("/file.txt")
+            assert hedging._executor is not None
+    finally:
+        session.release.set()
+
+    assert hedging._executor is None
+
+
+def test_client_requests_are_not_queued(disk: FakeDisk) -> None:
+    # Requests would deadlock if they had to go through a pool of 1 thread
+    barrier = threading.Barrier(4, timeout=5.0)
+
+    class BarrierSession(FakeSession):
+        def send_request(self, method: HTTPMethod, url: str, **kwargs) -> yadisk.Response:
+            barrier.wait()
+
+            return super().send_request(method, url, **kwargs)
+
+    hedging = HedgingPolicy(delay=10.0, max_workers=1)
+    client = yadisk.Client(token="fake", session=BarrierSession(disk), hedging=hedging)
+
+    threads = [threading.Thread(target=client.get_meta, args=("/file.txt",)) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+    assert disk.count("/v1/disk/resources") == 4
+    assert hedging._executor is None
+
+
+def test_client_fast_error_doesnt_win(disk: FakeDisk) -> None:
+    session = SlowFakeSession(disk)
+    hedging = HedgingPolicy(delay=0.01)
+    client = yadisk.Client(token="fake", session=session, hedging=hedging)
+
+    # The duplicate request fails immediately, the original one succeeds later
+    disk.failing_requests = 1
+    threading.Timer(0.1, session.release.set).start()
+
+    try:
+        assert client.get_meta("/file.txt", n_retries=0).path == "disk:/file.txt"
+    finally:
+        hedging.close()
+
+    assert hedging.n_hedged == 1
+    assert hedging.n_hedge_wins == 0
+
+
+def test_client_hedge_takes_rate_limiter_token(disk: FakeDisk) -> None:
+    session = SlowFakeSession(disk)
+    hedging = HedgingPolicy(delay=0.01)
+    rate_limiter = RateLimiter(requests_per_second=1.0, burst=10.0)
+    client = yadisk.Client(token="fake", session=session, hedging=hedging, rate_limiter=rate_limiter)
+
+    try:
+        client.get_meta("/file.txt")
+    finally:
+        session.release.set()
+        hedging.close()
+
+    assert hedging.n_hedged == 1
+    assert rate_limiter.requests.tokens < 9.0
+
+
+def test_client_hedging_disabled_by_cap(disk: FakeDisk) -> None:
+    session = SlowFakeSession(disk)
+    hedging = HedgingPolicy(delay=0.01, max_hedge_ratio=0.0, min_hedges=0)
+    client = yadisk.Client(token="fake", session=session, hedging=hedging)
+
+    threading.Timer(0.1, session.release.set).start()
+
+    try:
+        assert client.get_download_link("/file.txt")
+    finally:
+        hedging.close()
+
+    assert hedging.n_hedged == 0
+    assert disk.count("/v1/disk/resources/download") == 1
+
+
+def test_client_doesnt_hedge_non_idempotent_requests(disk: FakeDisk) -> None:
+    session = SlowFakeSession(disk)
+    hedging = HedgingPolicy(delay=0.0)
+    client = yadisk.Client(token="fake", session=session, hedging=hedging)
+
+    threading.Timer(0.1, session.release.set).start()
+
+    client.mkdir("/dir")
+
+    assert hedging.n_hedged == 0
+    assert disk.count("/v1/disk/resources", "PUT") == 1
+
+
+@pytest.mark.anyio
+async def test_async_client_hedging(disk: FakeDisk) -> None:
+    hedging = HedgingPolicy(delay=0.01)
+    client = yadisk.AsyncClient(token="fake", session=AsyncSlowFakeSession(disk), hedging=hedging)
+
+    assert (await client.get_meta("/file.txt")).path == "disk:/file.txt"
+
+    assert hedging.n_hedged == 1
+    assert hedging.n_hedge_wins == 1
+
+    # The slow request was cancelled
+    assert disk.count("/v1/disk/resources") == 1
+
+
+@pytest.mark.anyio
+async def test_async_client_hedge_takes_rate_limiter_token(disk: FakeDisk) -> None:
+    hedging = HedgingPolicy(delay=0.01)
+    rate_limiter = RateLimiter(requests_per_second=1.0, burst=10.0)
+    client = yadisk.AsyncClient(
+        token="fake", session=AsyncSlowFakeSession(disk), hedging=hedging, rate_limiter=rate_limiter
+    )
+
+    await client.get_meta("/file.txt")
+
+    assert hedging.n_hedged == 1
+    assert rate_limiter.requests.tokens < 9.0
+
+
+@pytest.mark.anyio
+async def test_async_client_fast_error_doesnt_win(disk: FakeDisk) -> None:
+    class Session(AsyncFakeSession):
+        n_requests = 0
+
+        async def send_request(self, method: HTTPMethod, url: str, **kwargs) -> yadisk.AsyncResponse:
+            self.n_requests += 1
+
+            if self.n_requests == 1:
+                await asyncio.sleep(0.1)
+
+            return await super().send_request(method, url, **kwargs)
+
+    hedging = HedgingPolicy(delay=0.01)
+    client = yadisk.AsyncClient(token="fake", session=Session(disk), hedging=hedging)
+
+    disk.failing_requests = 1
+
+    assert (await client.get_meta("/file.txt", n_retries=0)).path == "disk:/file.txt"
+
+    assert hedging.n_hedged == 1
+    assert hedging.n_hedge_wins == 0
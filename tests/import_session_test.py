@@ -32,7 +32,7 @@ def test_import_session(
 
 @pytest.mark.parametrize(
     "name, expected_class_name",
-    [("aiohttp", "AIOHTTPSession"), ("httpx", "AsyncHTTPXSession")]
+    [("aiohttp", "AIOHTTPSession"), ("httpx", "AsyncHTTPXSession"), ("pycurl", "AsyncPycURLSession")]
 )
 def test_import_async_session(
     name: yadisk.types.AsyncSessionName,
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+import io
+
+import pytest
+
+import yadisk
+from yadisk._client_common import _CachedLinkFunction, _get_link, _invalidating_link_on_error
+from yadisk.cache import LinkCache
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/file.txt", b"content")
+
+    return disk
+
+
+def test_link_cache() -> None:
+    cache = LinkCache(ttl=60.0, max_size=2)
+
+    cache.put("/a", False, "download", "link-a")
+    cache.put("disk:/a", True, "upload", "link-a-upload")
+
+    assert cache.get("a", False, "download") == "link-a"
+    assert cache.get("/a", False, "upload") is None
+    assert cache.get("/a", True, "upload") == "link-a-upload"
+
+    cache.put("/b", False, "download", "link-b")
+
+    # The least recently used link gets evicted
+    assert len(cache) == 2
+    assert cache.get("/a", False, "download") is None
+
+    cache.invalidate("/a", operation="upload")
+    assert cache.get("/a", True, "upload") is None
+    assert cache.get("/b", False, "download") == "link-b"
+
+
+def test_link_cache_expiration() -> None:
+    cache = LinkCache(ttl=0.0)
+    cache.put("/a", False, "download", "link-a")
+
+    assert cache.get("/a", False, "download") is None
+
+
+def test_download_reuses_link(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk), link_cache=LinkCache())
+
+    for _ in range(3):
+        buffer = io.BytesIO()
+        client.download("/file.txt", buffer)
+
+        assert buffer.getvalue() == b"content"
+
+    assert disk.count("/v1/disk/resources/download") == 1
+
+
+def test_expired_link_is_replaced(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk), link_cache=LinkCache())
+
+    client.download("/file.txt", io.BytesIO())
+
+    disk.link_generation += 1
+
+    buffer = io.BytesIO()
+    client.download("/file.txt", buffer, retry_interval=0.0)
+
+    assert buffer.getvalue() == b"content"
+    assert disk.count("/v1/disk/resources/download") == 2
+
+
+def test_upload_invalidates_links(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk), link_cache=LinkCache())
+
+    client.download("/file.txt", io.BytesIO())
+    client.upload(io.BytesIO(b"new content"), "/file.txt", overwrite=True)
+    client.upload(io.BytesIO(b"newer content"), "/file.txt", overwrite=True)
+
+    buffer = io.BytesIO()
+    client.download("/file.txt", buffer)
+
+    assert buffer.getvalue() == b"newer content"
+    assert disk.count("/v1/disk/resources/upload") == 2
+    assert disk.count("/v1/disk/resources/download") == 2
+
+
+@pytest.mark.anyio
+async def test_async_download_reuses_link(disk: FakeDisk) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk), link_cache=LinkCache())
+
+    await client.download("/file.txt", io.BytesIO())
+
+    disk.link_generation += 1
+
+    buffer = io.BytesIO()
+    await client.download("/file.txt", buffer, retry_interval=0.0)
+    await client.download("/file.txt", io.BytesIO())
+
+    assert buffer.getvalue() == b"content"
+    assert disk.count("/v1/disk/resources/download") == 2
+
+
+@pytest.mark.anyio
+async def test_async_upload_invalidates_links(disk: FakeDisk) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk), link_cache=LinkCache())
+
+    await client.download("/file.txt", io.BytesIO())
+    await client.upload(io.BytesIO(b"new content"), "/file.txt", overwrite=True)
+
+    buffer = io.BytesIO()
+    await client.download("/file.txt", buffer)
+
+    assert buffer.getvalue() == b"new content"
+    assert disk.count("/v1/disk/resources/download") == 2
+
+
+def test_segmented_download_replaces_expired_link(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk), link_cache=LinkCache())
+    disk.add_file("/file.txt", b"0123456789" * 1000)
+
+    client.download("/file.txt", io.BytesIO(), parallel_segments=4, segment_size=1000)
+
+    disk.link_generation += 1
+
+    buffer = io.BytesIO()
+    client.download("/file.txt", buffer, parallel_segments=4, segment_size=1000, n_retries=0)
+
+    assert buffer.getvalue() == b"0123456789" * 1000
+    assert disk.count("/v1/disk/resources/download") == 2
+
+
+def test_cached_link_provenance_is_per_call() -> None:
+    get_link = _CachedLinkFunction(lambda path, **kwargs: f"link-{path}", LinkCache(), "download")
+
+    assert _get_link(get_link, "/a") == ("link-/a", False)
+    assert _get_link(get_link, "/b") == ("link-/b", False)
+    assert _get_link(get_link, "/a") == ("link-/a", True)
+    assert _get_link(lambda path, **kwargs: "link", "/a") == ("link", False)
+
+
+def test_cached_link_is_retried_only_once() -> None:
+    get_link = _CachedLinkFunction(lambda path, **kwargs: "link", LinkCache(), "download")
+    attempts = 0
+
+    def attempt() -> None:
+        nonlocal attempts
+        attempts += 1
+
+        raise yadisk.exceptions.GoneError()
+
+    # Even if the link is always reported as cached, the failed attempt is repeated only once
+    with pytest.raises(yadisk.exceptions.GoneError):
+        _invalidating_link_on_error(attempt, get_link, "/file.txt", lambda: True)()
+
+    assert attempts == 2
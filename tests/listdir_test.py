@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import yadisk
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+
+    for i in range(103):
+        disk.add_file(f"/dir/file{i:03}.txt", b"")
+
+    return disk
+
+
+@pytest.mark.parametrize("max_items", [None, 1, 10, 25, 103, 1000])
+def test_listdir_page_concurrency(disk: FakeDisk, max_items) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+
+    expected = [item.name for item in client.listdir("/dir", limit=10, max_items=max_items)]
+    requests_sequential = disk.count("/v1/disk/resources")
+
+    names = [item.name for item in client.listdir("/dir", limit=10, max_items=max_items, page_concurrency=4)]
+
+    assert names == expected
+    assert disk.count("/v1/disk/resources") == 2 * requests_sequential
+
+
+def test_listdir_page_concurrency_early_exit(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+
+    listing = client.listdir("/dir", limit=10, page_concurrency=4)
+
+    for _ in range(15):
+        next(listing)
+
+    listing.close()
+
+    # The first page and a bounded number of the following ones
+    assert disk.count("/v1/disk/resources") <= 1 + 5
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_items", [None, 7, 103])
+async def test_async_listdir_page_concurrency(disk: FakeDisk, max_items) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk))
+
+    names = [item.name async for item in client.listdir("/dir", limit=10, max_items=max_items, page_concurrency=3)]
+
+    assert names == [f"file{i:03}.txt" for i in range(103)][:max_items]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+DEEP_PATH = "/a/b/c/d/e/f/g/h/i/j"
+
+
+def test_makedirs_deep(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    fake_client.makedirs(DEEP_PATH)
+
+    assert "disk:" + DEEP_PATH in disk.dirs
+    # The target, a few probes and exactly one mkdir per missing directory
+    assert disk.count("/v1/disk/resources", "PUT") <= 10 + 4
+
+
+def test_makedirs_partially_existing(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    disk.add_dir("/a/b/c/d/e/f/g")
+
+    fake_client.makedirs(DEEP_PATH)
+
+    assert "disk:" + DEEP_PATH in disk.dirs
+    assert disk.count("/v1/disk/resources", "PUT") <= 3 + 4
+
+
+def test_makedirs_remembers_directories(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    fake_client.makedirs(DEEP_PATH)
+    n_requests = disk.count("/v1/disk/resources", "PUT")
+
+    fake_client.makedirs(DEEP_PATH + "/sibling1")
+    fake_client.makedirs(DEEP_PATH + "/sibling2")
+
+    assert disk.count("/v1/disk/resources", "PUT") == n_requests + 2
+
+
+def test_makedirs_exists(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    disk.add_dir(DEEP_PATH)
+
+    with pytest.raises(yadisk.exceptions.DirectoryExistsError):
+        fake_client.makedirs(DEEP_PATH)
+
+    assert fake_client.makedirs(DEEP_PATH, exist_ok=True).path == "disk:" + DEEP_PATH
+
+
+def test_makedirs_after_remove(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    fake_client.makedirs(DEEP_PATH)
+    fake_client.remove("/a/b")
+
+    fake_client.makedirs(DEEP_PATH)
+
+    assert "disk:" + DEEP_PATH in disk.dirs
+
+
+def test_makedirs_forgets_removed_directories(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    fake_client.makedirs(DEEP_PATH)
+
+    # Removed by someone else
+    disk.dirs = {"disk:/", "disk:/a"}
+
+    fake_client.makedirs(DEEP_PATH + "/k")
+
+    assert "disk:" + DEEP_PATH + "/k" in disk.dirs
+
+
+@pytest.mark.anyio
+async def test_async_makedirs(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    disk.add_dir("/a/b/c")
+
+    await fake_async_client.makedirs(DEEP_PATH)
+    await fake_async_client.makedirs(DEEP_PATH + "/sibling", exist_ok=True)
+
+    assert "disk:" + DEEP_PATH + "/sibling" in disk.dirs
+    assert disk.count("/v1/disk/resources", "PUT") <= 8 + 4
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import tempfile
+from typing import Any
+
+import pytest
+
+import yadisk
+from yadisk._typing_compat import Dict
+from yadisk.cache import MemoryMetaCacheBackend, MetaCache, SQLiteMetaCacheBackend
+
+from .fake_session import FakeDisk, FakeSession
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/dir/file.txt", b"content")
+
+    return disk
+
+
+@pytest.fixture
+def fake_client_kwargs() -> Dict[str, Any]:
+    return {"meta_cache": MetaCache()}
+
+
+def test_get_meta_cached(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    assert fake_client.get_meta("/dir/file.txt").size == 7
+    assert fake_client.get_meta("disk:/dir/file.txt").size == 7
+    assert fake_client.is_file("/dir/file.txt")
+
+    assert disk.count("/v1/disk/resources", "GET") == 2
+    assert fake_client.meta_cache is not None
+    assert fake_client.meta_cache.hits == 1
+    assert fake_client.meta_cache.misses == 2
+
+
+def test_not_found_cached(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    assert not fake_client.exists("/missing")
+    assert not fake_client.exists("/missing")
+
+    with pytest.raises(yadisk.exceptions.PathNotFoundError):
+        fake_client.get_meta("/missing")
+
+    assert disk.count("/v1/disk/resources", "GET") == 1
+
+
+def test_listdir_cached(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    assert [item.name for item in fake_client.listdir("/dir")] == ["file.txt"]
+    assert [item.name for item in fake_client.listdir("/dir")] == ["file.txt"]
+
+    assert disk.count("/v1/disk/resources", "GET") == 1
+
+    with pytest.raises(yadisk.exceptions.WrongResourceTypeError):
+        list(fake_client.listdir("/dir/file.txt"))
+
+
+def test_then_runs_within_retries(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    calls = 0
+
+    def then(resource: yadisk.objects.SyncResourceObject) -> yadisk.objects.SyncResourceObject:
+        nonlocal calls
+        calls += 1
+
+        if calls == 1:
+            raise yadisk.exceptions.RequestError("retry me")
+
+        return resource
+
+    assert fake_client.get_meta("/dir/file.txt", _then=then, n_retries=1, retry_interval=0.0).size == 7
+    assert fake_client.get_meta("/dir/file.txt", _then=then).size == 7
+
+    assert calls == 3
+    assert disk.count("/v1/disk/resources", "GET") == 2
+
+
+def test_invalidated_by_mkdir(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    assert not fake_client.exists("/dir/subdir")
+    assert len(list(fake_client.listdir("/dir"))) == 1
+
+    fake_client.mkdir("/dir/subdir")
+
+    assert fake_client.is_dir("/dir/subdir")
+    assert len(list(fake_client.listdir("/dir"))) == 2
+
+
+def test_invalidated_by_upload(fake_client: yadisk.Client) -> None:
+    assert not fake_client.exists("/dir/new.txt")
+
+    fake_client.upload(io.BytesIO(b"new content"), "/dir/new.txt")
+
+    assert fake_client.get_meta("/dir/new.txt").size == 11
+
+
+def test_invalidated_by_remove(fake_client: yadisk.Client) -> None:
+    assert fake_client.exists("/dir/file.txt")
+    assert fake_client.exists("/dir")
+
+    fake_client.remove("/dir")
+
+    assert not fake_client.exists("/dir")
+    assert not fake_client.exists("/dir/file.txt")
+
+
+def test_invalidated_by_restore_trash(fake_client: yadisk.Client) -> None:
+    fake_client.remove("/dir/file.txt")
+    assert not fake_client.exists("/dir/file.txt")
+
+    fake_client.restore_trash("trash:/file.txt", dst_path="/dir/file.txt")
+    assert fake_client.exists("/dir/file.txt")
+
+    fake_client.remove("/dir/file.txt")
+    assert not fake_client.exists("/dir/file.txt")
+
+    # Restoring to the original location clears the whole cache
+    fake_client.restore_trash("trash:/file.txt")
+    assert fake_client.exists("/dir/file.txt")
+
+
+def test_sqlite_backend_shared(disk: FakeDisk) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "meta.sqlite")
+
+        backend1 = SQLiteMetaCacheBackend(filename)
+        backend2 = SQLiteMetaCacheBackend(filename)
+
+        client1 = yadisk.Client(token="fake", session=FakeSession(disk), meta_cache=MetaCache(backend=backend1))
+        client2 = yadisk.Client(token="fake", session=FakeSession(disk), meta_cache=MetaCache(backend=backend2))
+
+        try:
+            assert client1.get_meta("/dir/file.txt").md5 == client2.get_meta("/dir/file.txt").md5
+            assert disk.count("/v1/disk/resources", "GET") == 1
+
+            client1.remove("/dir/file.txt")
+
+            assert not client2.exists("/dir/file.txt")
+            assert disk.count("/v1/disk/resources", "GET") == 2
+        finally:
+            backend1.close()
+            backend2.close()
+
+
+@pytest.mark.parametrize("backend_factory", [
+    lambda filename: MemoryMetaCacheBackend(max_size=2),
+    lambda filename: SQLiteMetaCacheBackend(filename, max_size=2)
+])
+def test_backend_lru_and_ttl(backend_factory) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = backend_factory(os.path.join(tmpdir, "meta.sqlite"))
+
+        backend.put("a", "disk:/a", "1", float("inf"))
+        backend.put("b", "disk:/b", "2", float("inf"))
+        assert backend.get("a") == "1"
+
+        backend.put("c", "disk:/c", "3", float("inf"))
+        backend.put("d", "disk:/d", "4", 0.0)
+
+        assert backend.get("b") is None
+        assert backend.get("d") is None
+        assert backend.get("c") == "3"
+
+        backend.invalidate("disk:/c", ["disk:/"])
+        assert backend.get("c") is None
+
+        if isinstance(backend, SQLiteMetaCacheBackend):
+            backend.close()
+
+
+def test_cache_keyed_by_fields() -> None:
+    cache = MetaCache()
+
+    cache.put("/a", {"fields": ["name"]}, {"name": "a"})
+
+    assert cache.get("disk:/a/", {"fields": "name"}) == (True, {"name": "a"})
+    assert cache.get("/a", {}) == (False, None)
+
+    cache.invalidate("/a/b")
+
+    assert cache.get("/a", {"fields": ["name"]}) == (False, None)
+
+
+@pytest.mark.anyio
+async def test_async_meta_cache(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    assert await fake_async_client.is_file("/dir/file.txt")
+    assert await fake_async_client.is_file("/dir/file.txt")
+    assert not await fake_async_client.exists("/dir/new.txt")
+
+    assert disk.count("/v1/disk/resources", "GET") == 2
+
+    await fake_async_client.upload(io.BytesIO(b"new content"), "/dir/new.txt")
+
+    assert (await fake_async_client.get_meta("/dir/new.txt")).size == 11
+    assert fake_async_client.meta_cache is not None
+    assert fake_async_client.meta_cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_async_invalidated_by_restore_trash(fake_async_client: yadisk.AsyncClient) -> None:
+    await fake_async_client.remove("/dir/file.txt")
+    assert not await fake_async_client.exists("/dir/file.txt")
+
+    await fake_async_client.restore_trash("trash:/file.txt", dst_path="/dir/file.txt")
+    assert await fake_async_client.exists("/dir/file.txt")
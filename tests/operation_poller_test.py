@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import CancelledError, wait
+
+import pytest
+
+import yadisk
+from yadisk.polling import AsyncOperationPoller, OperationPoller
+
+from .fake_session import FakeDisk
+
+
+@pytest.fixture
+def fake_client(fake_client: yadisk.Client) -> yadisk.Client:
+    fake_client.operation_poller = OperationPoller(fake_client, initial_interval=0.01, max_interval=0.05)
+
+    return fake_client
+
+
+@pytest.fixture
+def fake_async_client(fake_async_client: yadisk.AsyncClient) -> yadisk.AsyncClient:
+    fake_async_client.operation_poller = AsyncOperationPoller(
+        fake_async_client, initial_interval=0.01, max_interval=0.05
+    )
+
+    return fake_async_client
+
+
+def test_track_many_operations(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    links = [disk.add_operation(*["in-progress"] * (i % 5), "success") for i in range(50)]
+
+    futures = [fake_client.track_operation(link) for link in links]
+    done, not_done = wait(futures, timeout=10.0)
+
+    assert not not_done
+    assert all(future.result() is None for future in done)
+    # Every operation was polled exactly until it succeeded
+    assert disk.count("/v1/disk/operations/1") == 1
+    assert disk.count("/v1/disk/operations/5") == 5
+    assert fake_client.operation_poller.pending == 0
+
+
+def test_track_operation_errors(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    failed = fake_client.track_operation(disk.add_operation("in-progress", "failed"))
+    missing = fake_client.track_operation("https://cloud-api.yandex.net/v1/disk/operations/missing")
+    timed_out = fake_client.track_operation(disk.add_operation("in-progress"), poll_timeout=0.05)
+
+    with pytest.raises(yadisk.exceptions.AsyncOperationFailedError):
+        failed.result(timeout=10.0)
+
+    with pytest.raises(yadisk.exceptions.OperationNotFoundError):
+        missing.result(timeout=10.0)
+
+    with pytest.raises(yadisk.exceptions.AsyncOperationPollingTimeoutError):
+        timed_out.result(timeout=10.0)
+
+
+def test_track_operation_object(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    operation = yadisk.objects.SyncOperationLinkObject({"href": disk.add_operation("success")}, yadisk=fake_client)
+
+    assert fake_client.track_operation(operation).result(timeout=10.0) is None
+    assert fake_client.track_operation(None).done()
+
+
+def test_track_operation_cancel(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    fake_client.operation_poller.initial_interval = 60.0
+
+    future = fake_client.track_operation(disk.add_operation("in-progress"))
+
+    while disk.count("/v1/disk/operations/1") == 0:
+        pass
+
+    future.cancel()
+
+    with pytest.raises(CancelledError):
+        future.result(timeout=10.0)
+
+
+def test_close_cancels_pending(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    fake_client.operation_poller.initial_interval = 60.0
+
+    future = fake_client.track_operation(disk.add_operation("in-progress"))
+
+    while disk.count("/v1/disk/operations/1") == 0:
+        pass
+
+    fake_client.close()
+
+    with pytest.raises(CancelledError):
+        future.result(timeout=10.0)
+
+    with pytest.raises(RuntimeError):
+        fake_client.track_operation(disk.add_operation("success"))
+
+
+@pytest.mark.anyio
+async def test_async_track_many_operations(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    links = [disk.add_operation(*["in-progress"] * (i % 4), "success") for i in range(30)]
+    failed = fake_async_client.track_operation(disk.add_operation("in-progress", "failed"))
+
+    await asyncio.wait_for(asyncio.gather(*(fake_async_client.track_operation(link) for link in links)), 10.0)
+
+    with pytest.raises(yadisk.exceptions.AsyncOperationFailedError):
+        await asyncio.wait_for(failed, 10.0)
+
+    assert disk.count("/v1/disk/operations/4") == 4
+    assert fake_async_client.operation_poller.pending == 0
+
+    assert fake_async_client.track_operation(None).done()
+
+
+@pytest.mark.anyio
+async def test_async_close_cancels_pending(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    fake_async_client.operation_poller.initial_interval = 60.0
+
+    future = fake_async_client.track_operation(disk.add_operation("in-progress"))
+
+    while disk.count("/v1/disk/operations/1") == 0:
+        await asyncio.sleep(0.01)
+
+    await fake_async_client.close()
+
+    assert future.cancelled()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+
+    for i in range(7):
+        disk.add_file(f"/photos/{i}.jpg", b"")
+
+    for i in range(3):
+        disk.add_file(f"/videos/{i}.mp4", b"")
+
+    for i in range(5):
+        disk.add_file(f"/misc/{i}.bin", b"")
+
+    return disk
+
+
+def test_get_files_parallel_partitions(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    paths = [str(f.path) for f in fake_client.get_files(limit=2, parallel_partitions=True)]
+
+    assert sorted(paths) == sorted(disk.files)
+    assert len(paths) == len(disk.files)
+
+
+def test_get_files_parallel_partitions_media_type(fake_client: yadisk.Client) -> None:
+    files = list(fake_client.get_files(limit=2, media_type=["image", "video"], parallel_partitions=True))
+
+    assert len(files) == 10
+    assert {f.media_type for f in files} == {"image", "video"}
+
+
+def test_get_files_parallel_partitions_max_items(fake_client: yadisk.Client) -> None:
+    files = list(fake_client.get_files(limit=2, max_items=5, media_type="image,unknown", parallel_partitions=True))
+
+    assert len(files) == 5
+
+
+def test_get_files_parallel_partitions_offset(fake_client: yadisk.Client) -> None:
+    with pytest.raises(ValueError):
+        fake_client.get_files(offset=10, parallel_partitions=True)
+
+
+@pytest.mark.anyio
+async def test_async_get_files_parallel_partitions(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    paths = [str(f.path) async for f in fake_async_client.get_files(limit=2, parallel_partitions=True)]
+
+    assert sorted(paths) == sorted(disk.files)
+    assert len(paths) == len(disk.files)
+
+
+@pytest.mark.anyio
+async def test_async_get_files_parallel_partitions_max_items(fake_async_client: yadisk.AsyncClient) -> None:
+    files = [
+        f async for f in fake_async_client.get_files(limit=2, max_items=4, media_type="video", parallel_partitions=True)
+    ]
+
+    assert [f.media_type for f in files] == ["video"] * 3
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+import time
+
+import pytest
+
+import yadisk
+from yadisk.polling import ExponentialPollInterval
+
+from .fake_session import FakeDisk
+
+
+def test_exponential_poll_interval_growth() -> None:
+    policy = ExponentialPollInterval(initial=0.5, factor=2.0, max_interval=5.0, jitter=0.0)
+
+    assert list(itertools.islice(policy.iter_intervals(), 6)) == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_exponential_poll_interval_jitter() -> None:
+    policy = ExponentialPollInterval(initial=1.0, factor=1.0, max_interval=1.0, jitter=0.25)
+
+    intervals = list(itertools.islice(policy.iter_intervals(), 100))
+
+    assert all(0.75 <= interval <= 1.0 for interval in intervals)
+    assert len(set(intervals)) > 1
+
+
+def test_exponential_poll_interval_resource_size() -> None:
+    policy = ExponentialPollInterval(initial=0.1, max_interval=10.0, jitter=0.0, bytes_per_second=1000.0)
+
+    assert next(policy.iter_intervals()) == 0.1
+    assert next(policy.iter_intervals(50)) == 0.1
+    assert next(policy.iter_intervals(3000)) == 3.0
+    assert next(policy.iter_intervals(10 ** 9)) == 10.0
+
+
+def test_wait_for_operation_exponential(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    link = disk.add_operation(*["in-progress"] * 4, "success")
+    policy = ExponentialPollInterval(initial=0.001, factor=2.0, max_interval=0.004, jitter=0.5)
+
+    fake_client.wait_for_operation(link, poll_interval=policy)
+
+    assert disk.count("/v1/disk/operations/1") == 5
+
+
+def test_operation_wait_resource_size(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    operation = yadisk.objects.SyncOperationLinkObject(
+        {"href": disk.add_operation("in-progress", "success")}, yadisk=fake_client
+    )
+    policy = ExponentialPollInterval(initial=0.001, jitter=0.0, bytes_per_second=1000.0)
+
+    start = time.monotonic()
+    operation.wait(poll_interval=policy, resource_size=100)
+
+    assert time.monotonic() - start >= 0.1
+    assert disk.count("/v1/disk/operations/1") == 2
+
+
+def test_wait_for_operation_exponential_timeout(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    policy = ExponentialPollInterval(initial=0.001, max_interval=0.01)
+
+    with pytest.raises(yadisk.exceptions.AsyncOperationPollingTimeoutError):
+        fake_client.wait_for_operation(disk.add_operation("in-progress"), poll_interval=policy, poll_timeout=0.05)
+
+
+@pytest.mark.anyio
+async def test_async_wait_for_operation_exponential(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    operation = yadisk.objects.AsyncOperationLinkObject(
+        {"href": disk.add_operation(*["in-progress"] * 4, "failed")}, yadisk=fake_async_client
+    )
+    policy = ExponentialPollInterval(initial=0.001, factor=2.0, max_interval=0.004)
+
+    with pytest.raises(yadisk.exceptions.AsyncOperationFailedError):
+        await operation.wait(poll_interval=policy, resource_size=1024)
+
+    assert disk.count("/v1/disk/operations/1") == 5
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import Any
+
+import pytest
+
+import yadisk
+from yadisk.pool import PoolConfig
+from yadisk._typing_compat import Generator, List
+
+from .fake_session import FakeDisk, FakeSession
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("session_name", ["requests", "httpx", "pycurl"])
+def test_pool_stats(server_url: str, session_name: yadisk.types.SessionName) -> None:
+    pool_config = PoolConfig(max_connections=4, max_connections_per_host=4, keepalive_expiry=30.0)
+
+    session_class: Any = yadisk.import_session(session_name)
+
+    with session_class(pool_config=pool_config) as session:
+        for _ in range(3):
+            with session.send_request("GET", server_url) as response:
+                assert response.json() == {"ok": True}
+
+        stats = session.get_pool_stats()
+
+    assert stats.new == 1
+    assert stats.reused == 2
+    assert stats.active == 0
+    assert stats.idle in (1, None)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("session_name", ["aiohttp", "httpx", "pycurl"])
+async def test_async_pool_stats(server_url: str, session_name: yadisk.types.AsyncSessionName) -> None:
+    pool_config = PoolConfig(max_connections=4, max_connections_per_host=4, keepalive_expiry=30.0)
+
+    session_class: Any = yadisk.import_async_session(session_name)
+
+    async with session_class(pool_config=pool_config) as session:
+        for _ in range(3):
+            async with await session.send_request("GET", server_url) as response:
+                assert await response.json() == {"ok": True}
+
+        stats = session.get_pool_stats()
+
+    assert stats.new == 1
+    assert stats.reused == 2
+    assert stats.active == 0
+
+    # libcurl doesn't report the size of its connection cache
+    assert stats.idle == (None if session_name == "pycurl" else 1)
+
+
+def test_requests_session_shares_pool(server_url: str) -> None:
+    from yadisk.sessions.requests_session import RequestsSession
+
+    with RequestsSession(pool_config=PoolConfig(max_connections_per_host=32)) as session:
+        def send() -> None:
+            with session.send_request("GET", server_url) as response:
+                assert response.status == 200
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        thread.join()
+
+        send()
+
+        stats = session.get_pool_stats()
+
+    # The connection established by the other thread is reused
+    assert stats.new == 1
+    assert stats.reused == 1
+
+
+def test_client_pool_config(disk: FakeDisk) -> None:
+    pool_config = PoolConfig(max_connections=64)
+
+    with yadisk.Client(session="httpx", pool_config=pool_config) as client:
+        assert client.session.get_pool_stats().new == 0
+
+    with pytest.raises(ValueError):
+        yadisk.Client(session=FakeSession(disk), pool_config=pool_config)
+
+    with pytest.raises(ValueError):
+        yadisk.Client(session_factory=lambda: FakeSession(disk), pool_config=pool_config)
+
+
+def test_httpx_http2_transfers_use_http11(server_url: str) -> None:
+    pytest.importorskip("h2")
+
+    from yadisk.sessions.httpx_session import HTTPXSession
+
+    with HTTPXSession(http2=True) as session:
+        for stream in (False, True, False, True):
+            with session.send_request("GET", server_url, stream=stream) as response:
+                assert response.json() == {"ok": True}
+
+        stats = session.get_pool_stats()
+
+    # Streamed requests go through a separate client
+    assert stats.new == 2
+    assert stats.reused == 2
+
+
+@pytest.mark.anyio
+async def test_async_httpx_http2_transfers_use_http11(server_url: str) -> None:
+    pytest.importorskip("h2")
+
+    from yadisk.sessions.async_httpx_session import AsyncHTTPXSession
+
+    async with AsyncHTTPXSession(http2=True) as session:
+        for stream in (False, True, False, True):
+            async with await session.send_request("GET", server_url, stream=stream) as response:
+                assert await response.json() == {"ok": True}
+
+        stats = session.get_pool_stats()
+
+    assert stats.new == 2
+    assert stats.reused == 2
+
+
+def test_pycurl_reuses_handles(server_url: str) -> None:
+    from yadisk.sessions.pycurl_session import PycURLSession
+
+    with PycURLSession(max_idle_handles=2) as session:
+        for _ in range(3):
+            with session.send_request("GET", server_url) as response:
+                assert response.json() == {"ok": True}
+
+        assert len(session._handles) == 1
+        handle = session._handles[0]
+
+        # Streamed responses hold the handle until they are received
+        response = session.send_request("GET", server_url, stream=True)
+        assert session._handles == []
+
+        chunks: List[bytes] = []
+        response.download(chunks.append)
+        response.close()
+
+        assert b"".join(chunks) == b'{"ok": true}'
+        assert session._handles == [handle]
+
+        stats = session.get_pool_stats()
+
+    assert stats.new == 1
+    assert stats.reused == 3
+
+
+def test_pycurl_handles_in_threads(server_url: str) -> None:
+    from yadisk.sessions.pycurl_session import PycURLSession
+
+    errors: List[BaseException] = []
+
+    with PycURLSession(max_idle_handles=4) as session:
+        def send() -> None:
+            try:
+                for _ in range(20):
+                    with session.send_request("GET", server_url) as response:
+                        assert response.json() == {"ok": True}
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=send) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len(session._handles) <= 4
+        stats = session.get_pool_stats()
+
+    assert errors == []
+    assert stats.new + stats.reused == 160
+    assert stats.active == 0
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+
+    for i in range(25):
+        disk.add_file(f"/dir/file{i:02}.txt", b"")
+
+    return disk
+
+
+def expected_paths(disk: FakeDisk) -> list:
+    return sorted(disk.files)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_get_files_prefetch(fake_client: yadisk.Client, disk: FakeDisk, prefetch: int) -> None:
+    paths = [f.path for f in fake_client.get_files(limit=4, prefetch=prefetch)]
+
+    assert paths == expected_paths(disk)
+    # Every prefetched page past the last incomplete one is wasted
+    assert 7 <= disk.count("/v1/disk/resources/files") <= 7 + prefetch
+
+
+def test_get_files_prefetch_max_items(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    paths = [f.path for f in fake_client.get_files(limit=4, max_items=10, prefetch=2)]
+
+    assert paths == expected_paths(disk)[:10]
+    assert disk.count("/v1/disk/resources/files") == 3
+
+
+def test_get_files_prefetch_close(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    files = fake_client.get_files(limit=4, prefetch=2)
+
+    assert next(files).path == expected_paths(disk)[0]
+
+    files.close()
+
+    assert disk.count("/v1/disk/resources/files") <= 3
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_async_get_files_prefetch(fake_async_client: yadisk.AsyncClient, disk: FakeDisk, prefetch: int) -> None:
+    paths = [f.path async for f in fake_async_client.get_files(limit=4, prefetch=prefetch)]
+
+    assert paths == expected_paths(disk)
+    assert 7 <= disk.count("/v1/disk/resources/files") <= 7 + prefetch
+
+
+@pytest.mark.anyio
+async def test_async_get_files_prefetch_max_items(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    paths = [f.path async for f in fake_async_client.get_files(limit=4, max_items=10, prefetch=2)]
+
+    assert paths == expected_paths(disk)[:10]
+    assert disk.count("/v1/disk/resources/files") == 3
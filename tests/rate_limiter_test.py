@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+
+import pytest
+
+import yadisk
+from yadisk.ratelimit import RateLimiter, TokenBucket
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeResponse, FakeSession
+
+CONTENT = os.urandom(50 * 1024)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(yadisk.ratelimit.time, "monotonic", clock)
+
+    return clock
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/file.bin", CONTENT)
+
+    return disk
+
+
+def test_token_bucket_reserve(clock: _Clock) -> None:
+    bucket = TokenBucket(10.0, capacity=2.0)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    clock.now += 10.0
+
+    assert bucket.tokens == 2.0
+
+
+def test_token_bucket_aimd(clock: _Clock) -> None:
+    bucket = TokenBucket(10.0, min_rate=2.0, increase=1.0)
+
+    bucket.decrease()
+    assert bucket.rate == 5.0
+    assert bucket.tokens == 0.0
+
+    bucket.decrease()
+    bucket.decrease()
+    assert bucket.rate == 2.0
+
+    clock.now += 3.0
+    assert bucket.rate == 5.0
+
+    clock.now += 100.0
+    assert bucket.rate == 10.0
+
+
+def test_rate_limiter_report(clock: _Clock) -> None:
+    limiter = RateLimiter(requests_per_second=10.0, bytes_per_second=1000.0)
+
+    def throttled(exc_type, headers):
+        return exc_type("", "", FakeResponse(FakeDisk(), 429, headers, b""))
+
+    limiter.report(yadisk.exceptions.PathNotFoundError())
+    assert limiter.requests.rate == 10.0
+
+    limiter.report(throttled(yadisk.exceptions.TooManyRequestsError, {"Retry-After": "2"}))
+    assert limiter.requests.rate == 5.0
+    assert limiter.requests.reserve() == pytest.approx(2.2)
+
+    assert limiter.bytes is not None
+    limiter.report(throttled(yadisk.exceptions.ResourceDownloadLimitExceededError, {}))
+    assert limiter.bytes.rate == 500.0
+    assert limiter.requests.rate == 5.0
+
+
+def test_client_retries_throttled_requests(disk: FakeDisk) -> None:
+    limiter = RateLimiter(requests_per_second=1000.0)
+    client = yadisk.Client(token="fake", session=FakeSession(disk), rate_limiter=limiter)
+
+    disk.throttled_requests = 2
+
+    assert client.get_meta("/file.bin").size == len(CONTENT)
+    assert disk.count("/v1/disk/resources") == 3
+    assert limiter.requests.rate < 1000.0
+
+
+def test_client_without_rate_limiter(disk: FakeDisk) -> None:
+    client = yadisk.Client(token="fake", session=FakeSession(disk))
+
+    disk.throttled_requests = 1
+
+    with pytest.raises(yadisk.exceptions.TooManyRequestsError):
+        client.get_meta("/file.bin")
+
+
+def test_transfers_consume_bytes(disk: FakeDisk) -> None:
+    limiter = RateLimiter(bytes_per_second=10 ** 6)
+    client = yadisk.Client(token="fake", session=FakeSession(disk), rate_limiter=limiter)
+
+    assert limiter.bytes is not None
+
+    buffer = io.BytesIO()
+    client.download("/file.bin", buffer)
+    client.upload(io.BytesIO(CONTENT), "/copy.bin")
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.files["disk:/copy.bin"] == CONTENT
+    # Two transfers took 2 * 50 KiB of the 1 MB, which refills at 1 MB/s
+    assert limiter.bytes.tokens < 10 ** 6 - 50 * 1024
+
+
+@pytest.mark.anyio
+async def test_async_client_retries_throttled_requests(disk: FakeDisk) -> None:
+    limiter = RateLimiter(requests_per_second=1000.0, bytes_per_second=10 ** 6)
+    client = yadisk.AsyncClient(token="fake", session=AsyncFakeSession(disk), rate_limiter=limiter)
+
+    disk.throttled_requests = 1
+
+    buffer = io.BytesIO()
+    await client.download("/file.bin", buffer)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 2
+    assert limiter.requests.rate < 1000.0
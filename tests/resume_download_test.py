@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+
+import pytest
+
+import yadisk
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
+
+CONTENT = os.urandom(50 * 1024 + 17)
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/file.bin", CONTENT)
+    disk.interrupt_after = 20 * 1024
+
+    return disk
+
+
+def get_range_headers(disk: FakeDisk):
+    return [headers.get("range") for _, endpoint, headers in disk.requests if endpoint == "download"]
+
+
+def test_download_resumes(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+    buffer = io.BytesIO(b"prefix")
+    buffer.seek(0, io.SEEK_END)
+
+    client.download("/file.bin", buffer, retry_interval=0.0)
+
+    assert buffer.getvalue() == b"prefix" + CONTENT
+    assert get_range_headers(disk) == [None, f"bytes={20 * 1024}-"]
+
+
+def test_download_restarts_if_range_is_ignored(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+    buffer = io.BytesIO()
+    disk.support_ranges = False
+
+    client.download("/file.bin", buffer, retry_interval=0.0)
+
+    assert buffer.getvalue() == CONTENT
+    assert get_range_headers(disk) == [None, f"bytes={20 * 1024}-"]
+
+
+@pytest.mark.anyio
+async def test_async_download_resumes(disk: FakeDisk) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk))
+    buffer = io.BytesIO()
+
+    await client.download("/file.bin", buffer, retry_interval=0.0)
+
+    assert buffer.getvalue() == CONTENT
+    assert get_range_headers(disk) == [None, f"bytes={20 * 1024}-"]
+
+
+@pytest.mark.anyio
+async def test_async_download_restarts_if_range_is_ignored(disk: FakeDisk) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk))
+    buffer = io.BytesIO()
+    disk.support_ranges = False
+
+    await client.download("/file.bin", buffer, retry_interval=0.0)
+
+    assert buffer.getvalue() == CONTENT
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+from email.utils import formatdate
+import time
+
+import pytest
+
+import yadisk
+from yadisk._typing_compat import List, Tuple, Type
+from yadisk.retry import ConstantRetryPolicy, ExponentialRetryPolicy, RetryPolicy, get_retry_after
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeResponse, FakeSession
+
+
+def _unavailable(headers=None) -> yadisk.exceptions.UnavailableError:
+    response = FakeResponse(FakeDisk(), 503, headers or {}, b"")
+
+    return yadisk.exceptions.UnavailableError("", "unavailable", response)
+
+
+class _RecordingPolicy(RetryPolicy):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.calls: List[Tuple[int, Type[Exception]]] = []
+
+    def compute_delay(self, attempt: int, exception: Exception) -> float:
+        self.calls.append((attempt, type(exception)))
+
+        return 0.0
+
+
+def test_get_retry_after() -> None:
+    assert get_retry_after(_unavailable({"Retry-After": "3"})) == 3.0
+    assert get_retry_after(_unavailable({"Retry-After": "-5"})) == 0.0
+    assert get_retry_after(_unavailable({"Retry-After": "garbage"})) is None
+    assert get_retry_after(_unavailable()) is None
+    assert get_retry_after(ValueError()) is None
+
+    delay = get_retry_after(_unavailable({"Retry-After": formatdate(time.time() + 100, usegmt=True)}))
+    assert delay is not None and 90.0 <= delay <= 100.0
+
+
+def test_exponential_retry_policy() -> None:
+    policy = ExponentialRetryPolicy(base=1.0, factor=2.0, max_delay=5.0, jitter=False)
+    error = _unavailable()
+
+    assert [policy.get_delay(i, error) for i in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert policy.get_delay(10000, error) == 5.0
+
+    policy.jitter = True
+
+    assert all(0.0 <= policy.get_delay(2, error) <= 4.0 for _ in range(100))
+
+
+def test_exponential_retry_policy_retry_after() -> None:
+    policy = ExponentialRetryPolicy(base=0.1, max_delay=10.0)
+
+    assert policy.get_delay(0, _unavailable({"Retry-After": "3"})) >= 3.0
+    assert policy.get_delay(0, _unavailable({"Retry-After": "60"})) == 10.0
+
+    policy.respect_retry_after = False
+
+    assert policy.get_delay(0, _unavailable({"Retry-After": "3"})) <= 0.1
+
+
+def test_retry_policy_overrides() -> None:
+    policy = ConstantRetryPolicy(
+        1.0,
+        overrides={
+            yadisk.exceptions.RetriableYaDiskError: ConstantRetryPolicy(2.0),
+            yadisk.exceptions.UnavailableError: ConstantRetryPolicy(3.0)
+        }
+    )
+
+    assert policy.get_delay(0, _unavailable()) == 3.0
+    assert policy.get_delay(0, yadisk.exceptions.GatewayTimeoutError()) == 2.0
+    assert policy.get_delay(0, yadisk.exceptions.RequestError()) == 1.0
+
+
+def test_auto_retry_uses_policy() -> None:
+    policy = _RecordingPolicy()
+    attempts: List[None] = []
+
+    def func() -> None:
+        attempts.append(None)
+
+        raise _unavailable()
+
+    with pytest.raises(yadisk.exceptions.UnavailableError):
+        yadisk.utils.auto_retry(func, 2, retry_policy=policy)
+
+    assert len(attempts) == 3
+    assert policy.calls == [(0, yadisk.exceptions.UnavailableError), (1, yadisk.exceptions.UnavailableError)]
+
+
+def test_auto_retry_default_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    policy = _RecordingPolicy()
+    monkeypatch.setattr(yadisk.settings, "DEFAULT_RETRY_POLICY", policy)
+
+    def func() -> None:
+        raise yadisk.exceptions.RequestError()
+
+    with pytest.raises(yadisk.exceptions.RequestError):
+        yadisk.utils.auto_retry(func, 1)
+
+    assert policy.calls == [(0, yadisk.exceptions.RequestError)]
+
+
+def test_client_retry_policy() -> None:
+    disk = FakeDisk()
+    client = yadisk.Client(token="fake", session=FakeSession(disk))
+    policy = _RecordingPolicy()
+
+    with pytest.raises(yadisk.exceptions.PathNotFoundError):
+        client.get_meta(
+            "/missing", n_retries=2, retry_on=(yadisk.exceptions.PathNotFoundError,), retry_policy=policy
+        )
+
+    assert disk.count("/v1/disk/resources") == 3
+    assert len(policy.calls) == 2
+
+
+@pytest.mark.anyio
+async def test_async_client_retry_policy() -> None:
+    disk = FakeDisk()
+    client = yadisk.AsyncClient(token="fake", session=AsyncFakeSession(disk))
+    policy = _RecordingPolicy(overrides={yadisk.exceptions.PathNotFoundError: ConstantRetryPolicy(0.0)})
+
+    with pytest.raises(yadisk.exceptions.PathNotFoundError):
+        await client.get_meta(
+            "/missing", n_retries=2, retry_on=(yadisk.exceptions.PathNotFoundError,), retry_policy=policy
+        )
+
+    assert disk.count("/v1/disk/resources") == 3
+    # The override took over
+    assert policy.calls == []
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import tempfile
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+CONTENT = os.urandom(100 * 1024 + 123)
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+    disk.add_file("/file.bin", CONTENT)
+
+    return disk
+
+
+def test_segmented_download(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    buffer = io.BytesIO()
+
+    fake_client.download("/file.bin", buffer, parallel_segments=4, segment_size=16 * 1024)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 1
+    assert disk.count("download") == 7
+
+
+def test_segmented_download_to_path(fake_client: yadisk.Client) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.bin")
+
+        fake_client.download("/file.bin", path, parallel_segments=3, segment_size=10000)
+
+        with open(path, "rb") as f:
+            assert f.read() == CONTENT
+
+
+def test_segmented_download_retries_segment(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    buffer = io.BytesIO()
+    disk.interrupt_after = 4096
+
+    fake_client.download("/file.bin", buffer, parallel_segments=2, segment_size=32 * 1024, retry_interval=0.0)
+
+    assert buffer.getvalue() == CONTENT
+
+
+def test_segmented_download_range_ignored(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    buffer = io.BytesIO(b"prefix")
+    buffer.seek(0, io.SEEK_END)
+    disk.support_ranges = False
+
+    fake_client.download("/file.bin", buffer, parallel_segments=4, segment_size=16 * 1024)
+
+    assert buffer.getvalue() == b"prefix" + CONTENT
+
+
+def test_segmented_download_single_segment(fake_client: yadisk.Client, disk: FakeDisk) -> None:
+    buffer = io.BytesIO()
+
+    fake_client.download("/file.bin", buffer, parallel_segments=4, segment_size=len(CONTENT))
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("download") == 1
+
+
+@pytest.mark.anyio
+async def test_async_segmented_download(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    buffer = io.BytesIO()
+
+    await fake_async_client.download("/file.bin", buffer, parallel_segments=4, segment_size=16 * 1024)
+
+    assert buffer.getvalue() == CONTENT
+    assert disk.count("/v1/disk/resources/download") == 1
+    assert disk.count("download") == 7
+
+
+@pytest.mark.anyio
+async def test_async_segmented_download_in_flight_limit(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.bin")
+        disk.interrupt_after = 2048
+
+        await fake_async_client.download(
+            "/file.bin", path,
+            parallel_segments=8, segment_size=10000, max_in_flight_bytes=25000, retry_interval=0.0
+        )
+
+        with open(path, "rb") as f:
+            assert f.read() == CONTENT
+
+
+@pytest.mark.anyio
+async def test_async_segmented_download_range_ignored(fake_async_client: yadisk.AsyncClient, disk: FakeDisk) -> None:
+    buffer = io.BytesIO()
+    disk.support_ranges = False
+
+    await fake_async_client.download("/file.bin", buffer, parallel_segments=4, segment_size=16 * 1024)
+
+    assert buffer.getvalue() == CONTENT
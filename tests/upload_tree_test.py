@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from typing import Iterator
+
+import pytest
+
+import yadisk
+
+from .fake_session import FakeDisk
+
+FILES = {
+    "a.txt": b"a",
+    "sub/b.txt": b"bb",
+    "sub/deeper/c.txt": b"ccc",
+    "other/d.txt": b"dddd"
+}
+
+
+@pytest.fixture
+def local_dir() -> Iterator[str]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for relpath, content in FILES.items():
+            path = os.path.join(tmpdir, *relpath.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            with open(path, "wb") as f:
+                f.write(content)
+
+        os.makedirs(os.path.join(tmpdir, "empty"))
+
+        yield tmpdir
+
+
+def check_uploaded(disk: FakeDisk, results: list) -> None:
+    assert sorted(r.remote_path for r in results) == sorted(f"/backup/{p}" for p in FILES)
+    assert all(r.ok and r.status == "uploaded" for r in results)
+
+    for relpath, content in FILES.items():
+        assert disk.files[f"disk:/backup/{relpath}"] == content
+
+    assert "disk:/backup/empty" in disk.dirs
+    # /backup, sub, sub/deeper, other and empty
+    assert disk.count("/v1/disk/resources", "PUT") == 5
+
+
+def test_upload_tree(fake_client: yadisk.Client, disk: FakeDisk, local_dir: str) -> None:
+    results = fake_client.upload_tree(local_dir, "/backup", max_workers=4)
+
+    check_uploaded(disk, results)
+
+
+def test_upload_tree_existing(fake_client: yadisk.Client, disk: FakeDisk, local_dir: str) -> None:
+    disk.add_file("/backup/a.txt", b"old")
+    disk.add_dir("/backup/sub")
+
+    results = {r.remote_path: r for r in fake_client.upload_tree(local_dir, "/backup")}
+
+    assert results["/backup/a.txt"].status == "failed"
+    assert isinstance(results["/backup/a.txt"].error, yadisk.exceptions.PathExistsError)
+    assert results["/backup/sub/b.txt"].status == "uploaded"
+    assert disk.files["disk:/backup/a.txt"] == b"old"
+
+    results = {r.remote_path: r for r in fake_client.upload_tree(local_dir, "/backup", overwrite=True)}
+
+    assert all(r.ok for r in results.values())
+    assert disk.files["disk:/backup/a.txt"] == b"a"
+
+
+def test_upload_tree_not_a_directory(fake_client: yadisk.Client, local_dir: str) -> None:
+    with pytest.raises(NotADirectoryError):
+        fake_client.upload_tree(os.path.join(local_dir, "a.txt"), "/backup")
+
+
+@pytest.mark.anyio
+async def test_async_upload_tree(fake_async_client: yadisk.AsyncClient, disk: FakeDisk, local_dir: str) -> None:
+    results = await fake_async_client.upload_tree(local_dir, "/backup", max_workers=4)
+
+    check_uploaded(disk, results)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+import posixpath
+
+import pytest
+
+import yadisk
+from yadisk._typing_compat import List
+
+from .fake_session import AsyncFakeSession, FakeDisk, FakeSession
+
+
+@pytest.fixture
+def disk() -> FakeDisk:
+    disk = FakeDisk()
+
+    for i in range(3):
+        disk.add_file(f"/root/file{i}.txt", b"")
+
+        for j in range(3):
+            disk.add_file(f"/root/dir{i}/subdir{j}/file.txt", b"")
+
+    disk.add_dir("/root/dir0/empty")
+
+    return disk
+
+
+def expected_tree(disk: FakeDisk):
+    return {
+        path: (
+            sorted(posixpath.basename(c) for c in disk.children(path) if c in disk.dirs),
+            sorted(posixpath.basename(c) for c in disk.children(path) if c in disk.files)
+        )
+        for path in disk.dirs if path.startswith("disk:/root")
+    }
+
+
+def test_walk(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+
+    tree = {}
+    seen = set()
+
+    for dirpath, dirs, files in client.walk("disk:/root", max_concurrency=4, limit=2, fields=["path"]):
+        # Parents always come first
+        assert dirpath == "disk:/root" or posixpath.dirname(dirpath) in seen
+        seen.add(dirpath)
+
+        tree[dirpath] = (sorted(str(d.name) for d in dirs), sorted(str(f.name) for f in files))
+
+    assert tree == expected_tree(disk)
+
+
+def test_walk_pruning(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+
+    visited = []
+
+    for dirpath, dirs, _ in client.walk("/root"):
+        visited.append(dirpath)
+        dirs[:] = [d for d in dirs if d.name == "dir1"]
+
+    assert sorted(visited) == ["/root", "/root/dir1"]
+
+
+def test_walk_onerror(disk: FakeDisk) -> None:
+    client = yadisk.Client(session=FakeSession(disk))
+    errors: List[Exception] = []
+
+    assert list(client.walk("/nonexistent", onerror=errors.append)) == []
+    assert len(errors) == 1
+    assert isinstance(errors[0], yadisk.exceptions.PathNotFoundError)
+
+    with pytest.raises(yadisk.exceptions.PathNotFoundError):
+        list(client.walk("/nonexistent"))
+
+
+@pytest.mark.anyio
+async def test_async_walk(disk: FakeDisk) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk))
+
+    tree = {}
+
+    async for dirpath, dirs, files in client.walk("disk:/root", max_concurrency=3, limit=2):
+        tree[dirpath] = (sorted(str(d.name) for d in dirs), sorted(str(f.name) for f in files))
+
+    assert tree == expected_tree(disk)
+
+
+@pytest.mark.anyio
+async def test_async_walk_pruning(disk: FakeDisk) -> None:
+    client = yadisk.AsyncClient(session=AsyncFakeSession(disk))
+
+    visited = []
+
+    async for dirpath, dirs, _ in client.walk("/root"):
+        visited.append(dirpath)
+        dirs.clear()
+
+    assert visited == ["/root"]
+    assert disk.count("/v1/disk/resources") == 1